@@ -50,6 +50,8 @@ MAT_VIEW_NAMES = {
     "analysis_data_view",
     "usda_census_view",
     "usda_survey_view",
+    "usda_census_latest_view",
+    "usda_survey_latest_view",
     "billion_ton_tileset_view",
     "analysis_average_view",
 }
@@ -0,0 +1,51 @@
+"""Add usda_census_latest_view and usda_survey_latest_view.
+
+Revision ID: a3e5c7f9b2d4
+Revises: f1c3b5d7e9a2
+Create Date: 2026-05-04 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects.postgresql import dialect as pg_dialect
+
+from ca_biositing.datamodels.views import (
+    VIEW_SCHEMA,
+    LATEST_RECORD_VIEWS,
+    LATEST_RECORD_VIEW_INDEXES,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "a3e5c7f9b2d4"
+down_revision: Union[str, Sequence[str], None] = "f1c3b5d7e9a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_view(view_name: str, view_query) -> None:
+    compiled = view_query.compile(
+        dialect=pg_dialect(), compile_kwargs={"literal_binds": True}
+    )
+    op.execute(f"CREATE MATERIALIZED VIEW {VIEW_SCHEMA}.{view_name} AS {compiled}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for view_name, view_query in LATEST_RECORD_VIEWS:
+        _create_view(view_name, view_query)
+        op.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{view_name}_id "
+            f"ON {VIEW_SCHEMA}.{view_name} (id)"
+        )
+
+    for idx_name, view_name, columns in LATEST_RECORD_VIEW_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {idx_name} ON {VIEW_SCHEMA}.{view_name} "
+            f"({', '.join(columns)})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for view_name, _ in reversed(LATEST_RECORD_VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {VIEW_SCHEMA}.{view_name} CASCADE")
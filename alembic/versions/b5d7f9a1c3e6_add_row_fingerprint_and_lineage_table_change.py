@@ -0,0 +1,54 @@
+"""Add row_fingerprint and lineage_table_change tables
+
+Revision ID: b5d7f9a1c3e6
+Revises: a3e5c7f9b2d4
+Create Date: 2026-05-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d7f9a1c3e6'
+down_revision: Union[str, Sequence[str], None] = 'a3e5c7f9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-row content hashes and per-table load change counts."""
+    op.create_table(
+        'row_fingerprint',
+        sa.Column('table_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('row_key', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('row_hash', sa.BigInteger(), nullable=False),
+        sa.Column('etl_run_id', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['etl_run_id'], ['etl_run.id'], ),
+        sa.PrimaryKeyConstraint('table_name', 'row_key'),
+    )
+    op.create_table(
+        'lineage_table_change',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('etl_run_id', sa.Integer(), nullable=True),
+        sa.Column('lineage_group_id', sa.Integer(), nullable=True),
+        sa.Column('table_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('inserted', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('unchanged', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['etl_run_id'], ['etl_run.id'], ),
+        sa.ForeignKeyConstraint(['lineage_group_id'], ['lineage_group.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_lineage_table_change_etl_run_id'), 'lineage_table_change', ['etl_run_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop row_fingerprint and lineage_table_change tables."""
+    op.drop_index(op.f('ix_lineage_table_change_etl_run_id'), table_name='lineage_table_change')
+    op.drop_table('lineage_table_change')
+    op.drop_table('row_fingerprint')
@@ -0,0 +1,46 @@
+"""Add natural-key unique constraint to billion_ton2023_record
+
+Revision ID: c7e9a1b3d5f7
+Revises: b5d7f9a1c3e6
+Create Date: 2026-05-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e9a1b3d5f7'
+down_revision: Union[str, Sequence[str], None] = 'b5d7f9a1c3e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NATURAL_KEY = [
+    'dataset_id',
+    'geoid',
+    'resource_id',
+    'model_name',
+    'scenario_name',
+    'price_offered_usd',
+    'land_source',
+]
+
+
+def upgrade() -> None:
+    """Remove duplicate loads (keeping the newest row) and enforce the natural key."""
+    same_key = " AND ".join(f"a.{c} IS NOT DISTINCT FROM b.{c}" for c in NATURAL_KEY)
+    op.execute(
+        f"DELETE FROM billion_ton2023_record a USING billion_ton2023_record b "
+        f"WHERE a.id < b.id AND {same_key}"
+    )
+    op.create_unique_constraint(
+        'billion_ton2023_record_natural_key',
+        'billion_ton2023_record',
+        NATURAL_KEY,
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the natural-key unique constraint."""
+    op.drop_constraint('billion_ton2023_record_natural_key', 'billion_ton2023_record', type_='unique')
@@ -0,0 +1,51 @@
+"""Add etl_task_metric table
+
+Revision ID: d9f1b3c5e7a9
+Revises: c7e9a1b3d5f7
+Create Date: 2026-05-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f1b3c5e7a9'
+down_revision: Union[str, Sequence[str], None] = 'c7e9a1b3d5f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-task performance metrics of ETL runs."""
+    op.create_table(
+        'etl_task_metric',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('etl_run_id', sa.Integer(), nullable=True),
+        sa.Column('run_id', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('task_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('stage', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('wall_seconds', sa.Float(), nullable=True),
+        sa.Column('cpu_seconds', sa.Float(), nullable=True),
+        sa.Column('peak_rss_delta_bytes', sa.BigInteger(), nullable=True),
+        sa.Column('rows_in', sa.Integer(), nullable=True),
+        sa.Column('rows_out', sa.Integer(), nullable=True),
+        sa.Column('bytes_read', sa.BigInteger(), nullable=True),
+        sa.Column('db_round_trips', sa.Integer(), nullable=True),
+        sa.Column('rows_written', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['etl_run_id'], ['etl_run.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_etl_task_metric_etl_run_id'), 'etl_task_metric', ['etl_run_id'], unique=False)
+    op.create_index(op.f('ix_etl_task_metric_run_id'), 'etl_task_metric', ['run_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the etl_task_metric table."""
+    op.drop_index(op.f('ix_etl_task_metric_run_id'), table_name='etl_task_metric')
+    op.drop_index(op.f('ix_etl_task_metric_etl_run_id'), table_name='etl_task_metric')
+    op.drop_table('etl_task_metric')
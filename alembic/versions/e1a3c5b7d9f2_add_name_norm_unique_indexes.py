@@ -0,0 +1,66 @@
+"""Make name_norm the unique key of name-keyed tables
+
+Revision ID: e1a3c5b7d9f2
+Revises: d9f1b3c5e7a9
+Create Date: 2026-05-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from ca_biositing.datamodels.models.base import normalized_text
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a3c5b7d9f2'
+down_revision: Union[str, Sequence[str], None] = 'd9f1b3c5e7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose rows are identified by a normalized name; the ETL upserts them
+# in batches with name_norm as the conflict target.
+NAME_KEYED_TABLES = ("resource", "primary_ag_product", "analysis_type")
+# resource.name_norm already exists (f1c3b5d7e9a2) with a non-unique index
+EXISTING_NAME_NORM = ("resource",)
+
+
+def upgrade() -> None:
+    """Make name_norm a unique key of each name-keyed table."""
+    conn = op.get_bind()
+    for table in NAME_KEYED_TABLES:
+        if table not in EXISTING_NAME_NORM:
+            op.add_column(
+                table,
+                sa.Column(
+                    "name_norm",
+                    sa.Text(),
+                    sa.Computed(normalized_text(sa.literal_column("name")), persisted=True),
+                    nullable=True,
+                ),
+            )
+        # Rows differing only in case or spacing are referenced by foreign keys
+        # elsewhere, so they are reported for a manual merge rather than deleted here.
+        duplicates = conn.execute(sa.text(
+            f"SELECT name_norm, array_agg(id ORDER BY id) FROM {table} "
+            f"WHERE name_norm IS NOT NULL GROUP BY name_norm HAVING count(*) > 1"
+        )).all()
+        if duplicates:
+            listed = ", ".join(f"{name!r} (ids {ids})" for name, ids in duplicates[:20])
+            raise RuntimeError(
+                f"{table} has {len(duplicates)} names differing only in case or spacing; "
+                f"merge them before upgrading: {listed}"
+            )
+        if table in EXISTING_NAME_NORM:
+            op.drop_index(op.f(f"ix_{table}_name_norm"), table_name=table)
+        op.create_index(op.f(f"ix_{table}_name_norm"), table, ["name_norm"], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the unique name_norm indexes and the columns this revision added."""
+    for table in reversed(NAME_KEYED_TABLES):
+        op.drop_index(op.f(f"ix_{table}_name_norm"), table_name=table)
+        if table in EXISTING_NAME_NORM:
+            op.create_index(op.f(f"ix_{table}_name_norm"), table, ["name_norm"], unique=False)
+        else:
+            op.drop_column(table, "name_norm")
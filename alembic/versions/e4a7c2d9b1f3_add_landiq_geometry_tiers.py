@@ -0,0 +1,86 @@
+"""Add pre-simplified geometry tiers to polygon and the LandIQ views.
+
+Revision ID: e4a7c2d9b1f3
+Revises: d2b6b2a7c9d1
+Create Date: 2026-04-20 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+from sqlalchemy.dialects.postgresql import dialect as pg_dialect
+
+from ca_biositing.datamodels.models.external_data.polygon import GEOMETRY_TIERS
+from ca_biositing.datamodels.views import (
+    VIEW_SCHEMA,
+    LANDIQ_RECORD_VIEW,
+    LANDIQ_RECORD_VIEW_V1,
+    LANDIQ_TILESET_VIEW,
+    LANDIQ_TILESET_VIEW_V1,
+    SPATIAL_VIEW_INDEXES,
+    SPATIAL_VIEW_TIER_INDEXES,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7c2d9b1f3"
+down_revision: Union[str, Sequence[str], None] = "d2b6b2a7c9d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LANDIQ_VIEW_NAMES = ("landiq_record_view", "landiq_tileset_view")
+
+
+def _create_view(view_name: str, view_query) -> None:
+    compiled = view_query.compile(
+        dialect=pg_dialect(), compile_kwargs={"literal_binds": True}
+    )
+    op.execute(f"CREATE MATERIALIZED VIEW {VIEW_SCHEMA}.{view_name} AS {compiled}")
+
+
+def _create_spatial_indexes(indexes) -> None:
+    for idx_name, view_name, column in indexes:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {idx_name} ON {VIEW_SCHEMA}.{view_name} "
+            f"USING GIST ({column})"
+        )
+
+
+def _drop_landiq_views() -> None:
+    for view_name in LANDIQ_VIEW_NAMES:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {VIEW_SCHEMA}.{view_name} CASCADE")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in GEOMETRY_TIERS:
+        op.add_column(
+            "polygon",
+            sa.Column(column, geoalchemy2.types.Geometry(spatial_index=False), nullable=True),
+        )
+
+    # Backfill existing polygons; new loads compute the tiers in the pipeline.
+    for column, tolerance in GEOMETRY_TIERS.items():
+        op.execute(
+            f"UPDATE polygon SET {column} = ST_SimplifyPreserveTopology(geom, {tolerance}) "
+            f"WHERE geom IS NOT NULL"
+        )
+
+    # View definitions change (new columns), so drop/create is required.
+    _drop_landiq_views()
+    _create_view("landiq_record_view", LANDIQ_RECORD_VIEW)
+    _create_view("landiq_tileset_view", LANDIQ_TILESET_VIEW)
+    _create_spatial_indexes(SPATIAL_VIEW_INDEXES)
+    _create_spatial_indexes(SPATIAL_VIEW_TIER_INDEXES)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_landiq_views()
+    _create_view("landiq_record_view", LANDIQ_RECORD_VIEW_V1)
+    _create_view("landiq_tileset_view", LANDIQ_TILESET_VIEW_V1)
+    _create_spatial_indexes(SPATIAL_VIEW_INDEXES)
+
+    for column in reversed(list(GEOMETRY_TIERS)):
+        op.drop_column("polygon", column)
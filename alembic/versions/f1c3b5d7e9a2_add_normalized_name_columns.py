@@ -0,0 +1,124 @@
+"""Add stored normalized-name columns and indexed parameter_norm to feedstock views.
+
+The feedstock API matched names with lower(trim(replace(...))) applied to the
+column inside WHERE clauses, which no index can serve. Resource, parameter and
+usda_commodity now carry generated, indexed *_norm columns, and the analysis and
+USDA views materialize parameter_norm, so lookups become indexed equality.
+
+Revision ID: f1c3b5d7e9a2
+Revises: e4a7c2d9b1f3
+Create Date: 2026-04-27 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import dialect as pg_dialect
+
+from ca_biositing.datamodels.models.base import normalized_text
+from ca_biositing.datamodels.views import (
+    VIEW_SCHEMA,
+    ANALYSIS_AVERAGE_VIEW_SQL,
+    ANALYSIS_DATA_VIEW,
+    NORMALIZED_NAME_VIEW_INDEXES,
+    USDA_CENSUS_VIEW,
+    USDA_SURVEY_VIEW,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c3b5d7e9a2"
+down_revision: Union[str, Sequence[str], None] = "e4a7c2d9b1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, normalized column, source column)
+NORMALIZED_COLUMNS = [
+    ("resource", "name_norm", "name"),
+    ("parameter", "name_norm", "name"),
+    ("usda_commodity", "name_norm", "name"),
+    ("usda_commodity", "api_name_norm", "api_name"),
+]
+
+FEEDSTOCK_VIEWS = [
+    ("analysis_data_view", ANALYSIS_DATA_VIEW),
+    ("usda_census_view", USDA_CENSUS_VIEW),
+    ("usda_survey_view", USDA_SURVEY_VIEW),
+]
+
+
+def _without_parameter_norm(view_query):
+    return view_query.with_only_columns(
+        *[c for c in view_query.selected_columns if c.name != "parameter_norm"]
+    )
+
+
+def _create_view(view_name: str, view_query) -> None:
+    compiled = view_query.compile(
+        dialect=pg_dialect(), compile_kwargs={"literal_binds": True}
+    )
+    op.execute(f"CREATE MATERIALIZED VIEW {VIEW_SCHEMA}.{view_name} AS {compiled}")
+
+
+def _drop_feedstock_views() -> None:
+    op.execute(
+        f"DROP MATERIALIZED VIEW IF EXISTS {VIEW_SCHEMA}.analysis_average_view CASCADE"
+    )
+    for view_name, _ in FEEDSTOCK_VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {VIEW_SCHEMA}.{view_name} CASCADE")
+
+
+def _create_analysis_average_view() -> None:
+    op.execute(
+        f"CREATE MATERIALIZED VIEW {VIEW_SCHEMA}.analysis_average_view AS "
+        f"{ANALYSIS_AVERAGE_VIEW_SQL}"
+    )
+
+
+def _create_analysis_data_view_indexes() -> None:
+    # Dropped along with the view; recreate as earlier view rebuilds do
+    op.execute(f"CREATE INDEX IF NOT EXISTS idx_analysis_data_view_resource ON {VIEW_SCHEMA}.analysis_data_view (resource)")
+    op.execute(f"CREATE INDEX IF NOT EXISTS idx_analysis_data_view_geoid ON {VIEW_SCHEMA}.analysis_data_view (geoid)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated columns are computed for existing rows when added and kept in
+    # sync by Postgres on every insert/update, so no ETL changes are needed.
+    for table, column, source in NORMALIZED_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(
+                column,
+                sa.Text(),
+                sa.Computed(normalized_text(sa.literal_column(source)), persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+
+    # View definitions change (new column), so drop/create is required.
+    _drop_feedstock_views()
+    for view_name, view_query in FEEDSTOCK_VIEWS:
+        _create_view(view_name, view_query)
+    _create_analysis_average_view()
+    _create_analysis_data_view_indexes()
+
+    for idx_name, view_name, columns in NORMALIZED_NAME_VIEW_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {idx_name} ON {VIEW_SCHEMA}.{view_name} "
+            f"({', '.join(columns)})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_feedstock_views()
+    for view_name, view_query in FEEDSTOCK_VIEWS:
+        _create_view(view_name, _without_parameter_norm(view_query))
+    _create_analysis_average_view()
+    _create_analysis_data_view_indexes()
+
+    for table, column, _ in reversed(NORMALIZED_COLUMNS):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+        op.drop_column(table, column)
@@ -0,0 +1,77 @@
+"""Add a stored natural key to location_address with a unique index
+
+The field-sample ETL matched addresses by loading the whole table into
+Python. location_address now carries address_key, a generated column over
+(geography_id, address_line1, city, zip) trimmed and lower-cased, with a
+unique index, so the loader upserts a batch with one
+INSERT ... ON CONFLICT (address_key) statement.
+
+Existing rows sharing a key are merged into the lowest id: references are
+repointed before the duplicates are deleted.
+
+Revision ID: f3b5d7e9a1c4
+Revises: e1a3c5b7d9f2
+Create Date: 2026-05-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from ca_biositing.datamodels.models.places.location_address import address_key_expression
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b5d7e9a1c4'
+down_revision: Union[str, Sequence[str], None] = 'e1a3c5b7d9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Foreign keys referencing location_address.id, as (table, column)
+ADDRESS_REFERENCES = (
+    ("field_sample", "sampling_location_id"),
+    ("field_sample", "field_storage_location_id"),
+    ("field_sample", "field_sample_storage_location_id"),
+    ("facility_record", "location_id"),
+    ("location_soil_type", "location_id"),
+    ("usda_market_report", "office_city_id"),
+    ("equipment", "equipment_location_id"),
+    ("experiment", "exper_location_id"),
+)
+
+
+def upgrade() -> None:
+    """Add address_key, merge rows sharing a key, and index it."""
+    op.add_column(
+        "location_address",
+        sa.Column(
+            "address_key",
+            sa.Text(),
+            sa.Computed(address_key_expression(), persisted=True),
+            nullable=True,
+        ),
+    )
+
+    op.execute(
+        "CREATE TEMPORARY TABLE location_address_merge AS "
+        "SELECT id, keep_id FROM ("
+        "  SELECT id, min(id) OVER (PARTITION BY address_key) AS keep_id FROM location_address"
+        ") AS ranked WHERE id <> keep_id"
+    )
+    for table, column in ADDRESS_REFERENCES:
+        op.execute(
+            f"UPDATE {table} SET {column} = m.keep_id "
+            f"FROM location_address_merge AS m WHERE {table}.{column} = m.id"
+        )
+    op.execute("DELETE FROM location_address USING location_address_merge AS m WHERE location_address.id = m.id")
+    op.execute("DROP TABLE location_address_merge")
+
+    op.create_index(
+        "location_address_address_key", "location_address", ["address_key"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Drop address_key; merged rows are not restored."""
+    op.drop_index("location_address_address_key", table_name="location_address")
+    op.drop_column("location_address", "address_key")
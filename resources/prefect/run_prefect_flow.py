@@ -1,7 +1,10 @@
+import os
 import sys
+import time
 import traceback
 from prefect import flow, get_run_logger, task
 from prefect.utilities.importtools import import_object
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 # A dictionary mapping flow names to their import paths
 AVAILABLE_FLOWS = {
@@ -22,6 +25,50 @@ AVAILABLE_FLOWS = {
     "thermochem": "ca_biositing.pipeline.flows.thermochem_etl.thermochem_etl_flow",
 }
 
+# Upstream flows each flow must run after. Flows with no path between them
+# run concurrently. The Aim 1/Aim 2 analysis flows all write observations and
+# create shared parameter/unit lookup rows, so they are chained rather than
+# racing on the same get-or-create inserts. qualitative, static_resource_info
+# and billion_ton all create Place rows; they run concurrently because each
+# inserts Place with ON CONFLICT (geoid) DO NOTHING.
+FLOW_DEPENDENCIES = {
+    "resource_information": [],
+    "qualitative": ["resource_information"],
+    "static_resource_info": ["resource_information"],
+    "samples": ["resource_information"],
+    "field_sample": ["samples"],
+    "analysis_records": ["samples"],
+    "aim2_bioconversion": ["analysis_records"],
+    "thermochem": ["aim2_bioconversion"],
+    "county_ag_report": ["resource_information"],
+    "usda_etl": ["resource_information"],
+    "landiq": ["resource_information"],
+    "billion_ton": ["resource_information"],
+}
+
+# Maximum number of sub-flows running at once; 1 runs them serially.
+MAX_CONCURRENT_FLOWS = int(os.getenv("ETL_MAX_CONCURRENT_FLOWS", "4"))
+
+
+def _load_flow(flow_name, flow_path):
+    """Import a sub-flow, returning a callable that re-raises if the import failed."""
+    try:
+        print(f"DEBUG: Attempting to import {flow_path}")
+        # Split the path to import the module first
+        module_path, obj_name = flow_path.rsplit(".", 1)
+        import importlib
+        mod = importlib.import_module(module_path)
+        print(f"DEBUG: Module {module_path} imported")
+        return getattr(mod, obj_name)
+    except Exception as e:
+        traceback.print_exc()
+        error = e
+
+        def _import_failed():
+            raise RuntimeError(f"Could not import flow '{flow_name}'") from error
+
+        return _import_failed
+
 @task(name="Refresh materialized views", retries=3, retry_delay_seconds=30)
 def refresh_materialized_views_task():
     """Refreshes all materialized views once ETL data loads are complete."""
@@ -37,35 +84,84 @@ def refresh_materialized_views_task():
         engine.dispose()
     logger.info("Materialized views refresh completed.")
 
+def _log_task_metrics(logger, metrics):
+    """Log per-task metrics of this run next to the previous run of each task."""
+    from sqlalchemy.orm import Session
+    from ca_biositing.pipeline.utils.engine import engine
+    from ca_biositing.pipeline.utils.task_metrics import previous_wall_seconds, summarize_task_metrics
+
+    previous = {}
+    try:
+        with Session(engine) as session:
+            previous = previous_wall_seconds(
+                session, {m.task_name for m in metrics}, {m.run_id for m in metrics}
+            )
+    except Exception as e:
+        logger.warning(f"Could not load previous task metrics: {e}")
+    for line in summarize_task_metrics(metrics, previous):
+        logger.info(f"Task metrics: {line}")
+
 @flow(name="Master ETL Flow", log_prints=True)
+@supports_dry_run
 def master_flow():
     """
     A master flow to orchestrate all ETL pipelines.
-    This flow dynamically imports and runs sub-flows, allowing it to continue
-    even if some sub-flows fail to import or run.
+    Sub-flows are imported up front and run as a DAG following
+    FLOW_DEPENDENCIES, up to MAX_CONCURRENT_FLOWS at a time. A flow that fails
+    to import or run only skips the flows downstream of it. Per-task metrics
+    (see utils/task_metrics.py) are summarized once the sub-flows finish.
+
+    With ``dry_run=True`` every sub-flow runs transform-only against the
+    reference snapshot and materializes its stages (see utils/dry_run.py);
+    the view refresh and snapshot export are skipped.
     """
+    from ca_biositing.pipeline.utils.dry_run import active as active_dry_run
+    from ca_biositing.pipeline.utils.flow_dag import run_dag, summarize_runs
+    from ca_biositing.pipeline.utils.lineage import create_etl_run_record
+    from ca_biositing.pipeline.utils.task_metrics import recorded_metrics, summarize_task_metrics
+
     logger = get_run_logger()
     logger.info("Running master ETL flow...")
-    for flow_name, flow_path in AVAILABLE_FLOWS.items():
-        try:
-            logger.info(f"--- Running sub-flow: {flow_name} ---")
-            print(f"DEBUG: Attempting to import {flow_path}")
-            # Split the path to import the module first
-            module_path, obj_name = flow_path.rsplit(".", 1)
-            import importlib
-            print(f"DEBUG: Importing module {module_path}")
-            mod = importlib.import_module(module_path)
-            print(f"DEBUG: Module {module_path} imported")
-            flow_func = getattr(mod, obj_name)
-            print(f"DEBUG: Successfully got attribute {obj_name}")
-
-            logger.info(f"Executing {flow_name} as sub-flow")
-            # We must call the flow function. If it's a Prefect flow object,
-            # calling it will trigger the orchestration.
-            result = flow_func()
-        except Exception:
-            logger.exception(f"Flow '{flow_name}' failed")
+    # The master run; stamped on the view snapshot manifest as the export run
+    etl_run_id = create_etl_run_record(pipeline_name="Master ETL Flow")
+    flows = {name: _load_flow(name, path) for name, path in AVAILABLE_FLOWS.items()}
+    metrics_before = len(recorded_metrics())
+
+    started = time.perf_counter()
+    runs = run_dag(flows, FLOW_DEPENDENCIES, max_workers=MAX_CONCURRENT_FLOWS)
+    summary = summarize_runs(runs, FLOW_DEPENDENCIES, time.perf_counter() - started)
+
+    for run in runs.values():
+        detail = f" ({run.error})" if run.error else ""
+        logger.info(f"Sub-flow {run.name}: {run.status} in {run.duration:.1f}s{detail}")
+    logger.info(
+        f"Sub-flows finished in {summary['wall_seconds']:.1f}s wall vs "
+        f"{summary['serial_seconds']:.1f}s serial ({summary['saved_seconds']:.1f}s saved, "
+        f"max {MAX_CONCURRENT_FLOWS} concurrent)"
+    )
+    logger.info(
+        f"Critical path ({summary['critical_path_seconds']:.1f}s): "
+        + " -> ".join(summary["critical_path"])
+    )
+    if summary["failed"] or summary["skipped"]:
+        logger.warning(f"Failed: {summary['failed']}; skipped downstream: {summary['skipped']}")
+    run = active_dry_run()
+    if run is not None:
+        for line in summarize_task_metrics(recorded_metrics()[metrics_before:]):
+            logger.info(f"Task metrics: {line}")
+        logger.info(f"Dry run: stages materialized to {run.materialize_dir}")
+        return
+    _log_task_metrics(logger, recorded_metrics()[metrics_before:])
+
     refresh_materialized_views_task()
+
+    # Publish Parquet/GeoParquet snapshots of the refreshed views
+    try:
+        from ca_biositing.pipeline.etl.export.view_snapshots import export_view_snapshots_task
+
+        export_view_snapshots_task(etl_run_id=etl_run_id)
+    except Exception:
+        logger.exception("View snapshot export failed")
     logger.info("Master ETL flow completed.")
 
 if __name__ == "__main__":
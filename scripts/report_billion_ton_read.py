@@ -0,0 +1,68 @@
+"""Compare read time and peak memory of the Billion Ton extract, before and after streaming.
+
+"before" reads the whole CSV with ``pd.read_csv`` and filters to California
+afterwards (the old extract + transform path); "after" streams it with
+``read_billion_ton_csv`` (projected columns, California rows only). Each
+reader runs in a fresh process so peak RSS is not shared between them.
+
+Usage:
+    pixi run python scripts/report_billion_ton_read.py path/to/billionton_23_agri_download.csv
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _read_before():
+    import pandas as pd
+
+    def read(path: str) -> int:
+        df = pd.read_csv(path)
+        df = df[df["state_name"].str.lower() == "california"].copy()
+        return len(df)
+
+    return read
+
+
+def _read_after():
+    from ca_biositing.pipeline.etl.extract.billion_ton import read_billion_ton_csv
+
+    return lambda path: len(read_billion_ton_csv(path))
+
+
+def _measure(make_reader, path, queue) -> None:
+    # Imports are done before measuring so only the read itself is counted.
+    reader = make_reader()
+    start_rss = _peak_rss_mib()
+    start = time.perf_counter()
+    rows = reader(path)
+    queue.put((rows, time.perf_counter() - start, _peak_rss_mib() - start_rss))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Billion Ton CSV file")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'reader':<8} | {'rows':>8} | {'seconds':>8} | {'peak RSS MiB':>12}")
+    print("-" * 46)
+    for name, reader in (("before", _read_before), ("after", _read_after)):
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_measure, args=(reader, args.path, queue))
+        proc.start()
+        rows, seconds, peak = queue.get()
+        proc.join()
+        print(f"{name:<8} | {rows:>8} | {seconds:>8.2f} | {peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
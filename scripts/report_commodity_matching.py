@@ -0,0 +1,93 @@
+"""Compare commodity matching time, full scan vs. ``CommodityMatchIndex``.
+
+"before" scores every commodity for every resource name with the weighted
+``SequenceMatcher`` / word-overlap score, as ``find_best_matches`` did before
+the index; "after" builds one ``CommodityMatchIndex`` (build time included)
+and asks it for the same top N. Commodity and resource names are drawn from a
+crop vocabulary, ``--commodities`` and ``--resources`` of them. The report
+also checks that both return the same matches and scores.
+
+Usage:
+    pixi run python scripts/report_commodity_matching.py --commodities 2000 --resources 300
+"""
+import argparse
+import random
+import time
+from difflib import SequenceMatcher
+
+VOCAB = [
+    "almonds", "walnuts", "hay", "alfalfa", "rice", "corn", "grain", "silage", "wheat",
+    "cotton", "tomatoes", "processing", "grapes", "wine", "oranges", "peaches", "barley",
+    "sorghum", "beans", "lettuce", "onions", "potatoes", "olives", "melons", "(dry)",
+]
+RESOURCE_WORDS = VOCAB + ["hulls", "shells", "pits", "stover", "prunings"]
+
+
+def _full_scan(resource_name, commodities, top_n):
+    """The weighted score of every commodity, as computed before the index existed."""
+    def ratio(a, b):
+        return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+
+    def words(value):
+        return set(value.lower().replace("-", " ").replace("_", " ").split())
+
+    resource_words = words(resource_name)
+    key_words = resource_words - {"for", "and", "the", "of", "all", "-", "processing"}
+    boost_words = [
+        w for w in resource_words
+        if len(w) > 3 and w not in {"hulls", "shells", "straw", "processing", "waste"}
+    ]
+    scored = []
+    for c in commodities:
+        name, desc = c["name"], c.get("description", c["name"])
+        name_words = words(name)
+        overlap = len(resource_words & name_words) / len(resource_words | name_words) if name_words else 0
+        commodity_key_words = name_words - {"for", "and", "the", "of", "all", "-"}
+        key = len(key_words & commodity_key_words) / len(key_words) if key_words and commodity_key_words else 0
+        score = ratio(resource_name, name) * 0.4 + ratio(resource_name, desc) * 0.2 + overlap * 0.3 + key * 0.1
+        if any(w in name.lower() or any(w in cw for cw in name_words) for w in boost_words):
+            score = max(score, 0.75)
+        scored.append((c["code"], score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:top_n]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commodities", type=int, default=2000)
+    parser.add_argument("--resources", type=int, default=300)
+    parser.add_argument("--top-n", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from ca_biositing.pipeline.utils.commodity_match_index import CommodityMatchIndex
+
+    rng = random.Random(args.seed)
+    commodities = [
+        {"code": str(i), "name": " ".join(rng.sample(VOCAB, rng.randint(1, 3))).upper()}
+        for i in range(args.commodities)
+    ]
+    resources = [" ".join(rng.sample(RESOURCE_WORDS, rng.randint(1, 3))) for _ in range(args.resources)]
+
+    start = time.perf_counter()
+    expected = [_full_scan(r, commodities, args.top_n) for r in resources]
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = CommodityMatchIndex(commodities)
+    actual = [
+        [(m["code"], m["score"]) for m in index.find_best_matches(r, top_n=args.top_n)]
+        for r in resources
+    ]
+    index_seconds = time.perf_counter() - start
+
+    print(f"{len(commodities)} commodities, {len(resources)} resources, top {args.top_n}")
+    print(f"{'matcher':<8} | {'seconds':>8} | {'ms/resource':>11}")
+    print("-" * 33)
+    for name, seconds in (("before", full_seconds), ("after", index_seconds)):
+        print(f"{name:<8} | {seconds:>8.2f} | {seconds / len(resources) * 1000:>11.2f}")
+    print(f"same matches: {actual == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Report storage overhead, payload size and fetch latency per LandIQ geometry tier.
+
+Compares the full-resolution ``polygon.geom`` column with the pre-simplified
+tiers (see GEOMETRY_TIERS) that tileset builds and exports select by zoom.
+
+Usage:
+    pixi run python scripts/report_landiq_geometry_tiers.py [--sample 5000]
+"""
+import argparse
+import os
+import time
+
+from sqlalchemy import text
+
+from ca_biositing.datamodels.database import get_engine
+from ca_biositing.datamodels.models.external_data.polygon import GEOMETRY_TIERS
+
+
+def _tier_stats(conn, column: str) -> dict:
+    row = conn.execute(
+        text(
+            f"SELECT count({column}) AS n, "
+            f"coalesce(sum(pg_column_size({column})), 0) AS stored_bytes, "
+            f"coalesce(sum(ST_NPoints({column})), 0) AS points "
+            f"FROM polygon"
+        )
+    ).one()
+    return {"rows": row.n, "stored_bytes": row.stored_bytes, "points": row.points}
+
+
+def _fetch_timing(conn, column: str, sample: int) -> dict:
+    start = time.perf_counter()
+    rows = conn.execute(
+        text(
+            f"SELECT ST_AsBinary({column}) AS wkb FROM polygon "
+            f"WHERE {column} IS NOT NULL ORDER BY id LIMIT :sample"
+        ),
+        {"sample": sample},
+    ).all()
+    elapsed = time.perf_counter() - start
+    payload = sum(len(r.wkb) for r in rows if r.wkb is not None)
+    return {"payload_bytes": payload, "fetch_seconds": elapsed}
+
+
+def report_landiq_geometry_tiers(sample: int = 5000):
+    if os.environ.get("POSTGRES_HOST") is None:
+        os.environ["POSTGRES_HOST"] = "localhost"
+
+    engine = get_engine()
+    columns = ["geom", *GEOMETRY_TIERS]
+
+    with engine.connect() as conn:
+        stats = {column: _tier_stats(conn, column) for column in columns}
+        # Warm the cache once so the first tier is not penalised
+        _fetch_timing(conn, "geom", sample)
+        for column in columns:
+            stats[column].update(_fetch_timing(conn, column, sample))
+
+    base = stats["geom"]
+    overhead = sum(stats[c]["stored_bytes"] for c in GEOMETRY_TIERS)
+    print(f"Full-resolution storage: {base['stored_bytes'] / 1e6:.1f} MB ({base['rows']} polygons)")
+    print(
+        f"Tier storage overhead:   {overhead / 1e6:.1f} MB "
+        f"({overhead / max(base['stored_bytes'], 1):.1%} of geom)\n"
+    )
+
+    header = f"{'column':<10} {'points':>12} {'stored MB':>10} {'payload MB':>11} {'payload %':>10} {'fetch s':>8} {'latency %':>10}"
+    print(f"Sample of {sample} polygons per tier")
+    print(header)
+    print("-" * len(header))
+    for column in columns:
+        s = stats[column]
+        payload_pct = s["payload_bytes"] / max(base["payload_bytes"], 1)
+        latency_pct = s["fetch_seconds"] / max(base["fetch_seconds"], 1e-9)
+        print(
+            f"{column:<10} {s['points']:>12} {s['stored_bytes'] / 1e6:>10.1f} "
+            f"{s['payload_bytes'] / 1e6:>11.2f} {payload_pct:>10.1%} "
+            f"{s['fetch_seconds']:>8.3f} {latency_pct:>10.1%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", type=int, default=5000, help="Polygons fetched per tier for timing")
+    args = parser.parse_args()
+    report_landiq_geometry_tiers(sample=args.sample)
@@ -0,0 +1,98 @@
+"""Compare combined lat/lon parsing time, per value vs. ``parse_latlon_pairs``.
+
+"before" is the old per-value parser (split on the first delimiter found,
+``float()`` each half) applied cell by cell, as ``split_combined_latlon`` used
+to do; it only handles plain decimal pairs. "after" is ``parse_latlon_pairs``
+on the whole column, which also parses the degrees/minutes/seconds and
+hemisphere-suffixed values. Both run on the same synthetic column: ``--rows``
+strings, ``--mixed`` of them (a fraction) not plain decimals. Each reader runs
+``--repeat`` times and the best time is reported.
+
+Usage:
+    pixi run python scripts/report_latlon_parsing.py --rows 1000000 --mixed 0.1
+"""
+import argparse
+import random
+import time
+
+
+def _sample_values(rows: int, mixed: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    values = []
+    for _ in range(rows):
+        lat = rng.uniform(32.5, 42.0)
+        lon = -rng.uniform(114.0, 124.5)
+        if rng.random() >= mixed:
+            values.append(f"{lat:.5f}, {lon:.5f}")
+        elif rng.random() < 0.5:
+            values.append(f"{lat:.4f}N {-lon:.4f}W")
+        else:
+            lat_min, lat_sec = divmod((lat % 1) * 3600, 60)
+            lon_min, lon_sec = divmod((-lon % 1) * 3600, 60)
+            values.append(
+                f"{int(lat)}°{int(lat_min)}'{lat_sec:.1f}\"N "
+                f"{int(-lon)}°{int(lon_min)}'{lon_sec:.1f}\"W"
+            )
+    return values
+
+
+def _parse_pair_per_value(value):
+    # The per-cell parser parse_latlon_pairs replaced
+    if not isinstance(value, str) or not value.strip():
+        return None, None
+    value = value.strip()
+    parts = None
+    for delimiter in [",", ";", "|", "\t"]:
+        if delimiter in value:
+            parts = [p.strip() for p in value.split(delimiter)]
+            break
+    if parts is None or len(parts) == 1:
+        parts = value.split()
+    if len(parts) >= 2:
+        try:
+            return float(parts[0]), float(parts[1])
+        except ValueError:
+            return None, None
+    return None, None
+
+
+def _parse_before(values) -> int:
+    import pandas as pd
+
+    pairs = pd.Series(values).apply(_parse_pair_per_value)
+    lat = pd.to_numeric(pairs.str[0], errors="coerce")
+    return int(lat.notna().sum())
+
+
+def _parse_after(values) -> int:
+    import numpy as np
+    import pandas as pd
+
+    from ca_biositing.pipeline.utils.cleaning_functions import parse_latlon_pairs
+
+    lat, _ = parse_latlon_pairs(pd.Series(values))
+    return int(np.isfinite(lat).sum())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="strings to parse")
+    parser.add_argument("--mixed", type=float, default=0.1, help="fraction of DMS/suffixed values")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per parser; the best is reported")
+    args = parser.parse_args()
+
+    values = _sample_values(args.rows, args.mixed)
+    print(f"{'parser':<8} | {'rows':>9} | {'parsed':>9} | {'seconds':>8}")
+    print("-" * 44)
+    for name, parse in (("before", _parse_before), ("after", _parse_after)):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parsed = parse(values)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        print(f"{name:<8} | {args.rows:>9} | {parsed:>9} | {best:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
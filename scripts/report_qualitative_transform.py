@@ -0,0 +1,78 @@
+"""Time the qualitative records and observations transforms on a replicated sheet.
+
+A small synthetic qualitative sheet (forward-filled resources, ranges with
+dashes, ``to``, currency and accounting negatives, trends and use cases that
+need the enum mapping) is replicated ``--factors`` times and run through
+``transform_qualitative_records`` and ``transform_qualitative_observations``.
+The name -> id lookup (``normalize_dataframes``) needs a database and is
+replaced by fixed ids, so only the transforms themselves are timed. Output
+should grow linearly with the replication factor, and so should the time.
+
+Usage:
+    pixi run python scripts/report_qualitative_transform.py --factors 1 10 50
+"""
+import argparse
+import inspect
+import time
+from unittest.mock import patch
+
+SHEET = {
+    "resource": ["Almond Hull", None, "Walnut Shells", None, "Rice Straw", None],
+    "use_case": ["Animal Feed", "Bioenergy/cogeneration", "Mulch", "compost", "Bedding", "Animal Feed"],
+    "resource_use_perc_range": ["10-20", "50 - 70 %", "n/a", "5", "20 to 30", "5–9"],
+    "resource_value_usd_per_ton_delivered_range": ["($0-$40)", "$5 to $8", "", "1,000-2,000", "($10)", "40-30"],
+    "resource_value_multiplier": ["1.2-1.8", "", "2", "x", "1", "0.5-1"],
+    "resource_use_trend": ["increasing", "steady", "", "unknown", "decreasing", "flat"],
+    "storage_description": ["covered pile", "", "bins", "", "bales", ""],
+    "transport_description": ["truck", "", "truck", "", "rail", ""],
+}
+USE_CASE_ENUM = {
+    "original_set_of_unique_use_case_names": ["Bioenergy/cogeneration"],
+    "use_case_name": ["Onsite Combined Heat and Power (CHP)"],
+}
+
+
+def _with_fixed_ids(frame, _columns):
+    return [frame.assign(resource_id=1, use_case_id=1, parameter_id=1, unit_id=1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 10, 50], help="sheet replication factors")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per factor; the best is reported")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    from ca_biositing.pipeline.etl.transform.analysis import qualitative
+
+    sheet = pd.DataFrame(SHEET)
+    enum_raw = pd.DataFrame(USE_CASE_ENUM)
+    # Unwrapped from @task and @task_metrics, so no metrics are stored
+    transforms = (
+        ("records", inspect.unwrap(qualitative.transform_qualitative_records.fn)),
+        ("observations", inspect.unwrap(qualitative.transform_qualitative_observations.fn)),
+    )
+
+    print(f"{'transform':<12} | {'factor':>6} | {'rows in':>8} | {'rows out':>8} | {'seconds':>8} | {'us/row':>7}")
+    print("-" * 66)
+    with patch.object(qualitative, "normalize_dataframes", side_effect=_with_fixed_ids):
+        for factor in args.factors:
+            replicated = pd.concat([sheet] * factor, ignore_index=True)
+            for name, transform in transforms:
+                best = None
+                for _ in range(args.repeat):
+                    data_sources = {"qualitative_data": replicated.copy(), "use_case_enum": enum_raw}
+                    start = time.perf_counter()
+                    result = transform(data_sources, "report", 1)
+                    seconds = time.perf_counter() - start
+                    best = seconds if best is None else min(best, seconds)
+                rows_out = sum(len(df) for df in result.values()) if isinstance(result, dict) else len(result)
+                print(
+                    f"{name:<12} | {factor:>6} | {len(replicated):>8} | {rows_out:>8} | "
+                    f"{best:>8.3f} | {best / len(replicated) * 1e6:>7.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
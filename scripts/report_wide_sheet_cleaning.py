@@ -0,0 +1,66 @@
+"""Time ``standard_clean`` and float coercion on a wide Aim 1-shaped sheet.
+
+The synthetic sheet has ``--rows`` rows and ``--columns`` columns split evenly
+between text (with blank and whitespace-only cells), numeric values stored as
+object with ~20% empty strings, and integer counts, like the Aim 1 analysis
+sheets. ``standard_clean`` runs on the raw sheet, then ``coerce_columns``
+turns the value and count columns into floats. Each step runs ``--repeat``
+times and the best time is reported.
+
+Usage:
+    pixi run python scripts/report_wide_sheet_cleaning.py --rows 5000 --columns 120
+"""
+import argparse
+import time
+
+
+def _wide_sheet(rows: int, columns: int, seed: int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    per_kind = max(columns // 3, 1)
+    data = {}
+    for i in range(per_kind):
+        data[f"Text {i}"] = rng.choice(["Almond Hulls", "  ", "Walnut", "", "Rice Straw"], rows).astype(object)
+    for i in range(per_kind):
+        values = pd.Series(rng.random(rows) * 100).round(2).astype(object)
+        data[f"Value {i}"] = values.where(rng.random(rows) > 0.2, "")
+    for i in range(per_kind):
+        data[f"Count {i}"] = rng.integers(0, 100, rows)
+    return pd.DataFrame(data)
+
+
+def _best_of(repeat: int, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per step; the best is reported")
+    args = parser.parse_args()
+
+    from ca_biositing.pipeline.utils.cleaning_functions import coerce_columns, standard_clean
+
+    sheet = _wide_sheet(args.rows, args.columns)
+    clean_seconds, cleaned = _best_of(args.repeat, lambda: standard_clean(sheet.copy()))
+    value_cols = [c for c in cleaned.columns if c.startswith(("value", "count"))]
+    coerce_seconds, _ = _best_of(args.repeat, lambda: coerce_columns(cleaned.copy(), float_cols=value_cols))
+
+    print(f"sheet: {len(sheet)} rows x {len(sheet.columns)} columns")
+    print(f"{'step':<16} | {'seconds':>8}")
+    print("-" * 27)
+    print(f"{'standard_clean':<16} | {clean_seconds:>8.3f}")
+    print(f"{'coerce floats':<16} | {coerce_seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
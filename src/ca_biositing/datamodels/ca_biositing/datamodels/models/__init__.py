@@ -11,7 +11,7 @@ from .aim1_records import CalorimetryRecord, CompositionalRecord, FtnirRecord, I
 from .aim2_records import AutoclaveRecord, FermentationRecord, GasificationRecord, PretreatmentRecord, Strain
 
 # Core
-from .core import EntityLineage, EtlRun, LineageGroup
+from .core import EntityLineage, EtlRun, EtlTaskMetric, LineageGroup, LineageTableChange, RowFingerprint
 
 # Data Sources Metadata
 from .data_sources_metadata import DataSource, DataSourceType, FileObjectMetadata, LocationResolution, SourceType
@@ -8,9 +8,41 @@ They replace the concrete BaseEntity and LookupBase tables from the LinkML-gener
 from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
+from sqlalchemy import Column, Computed, Text, func, literal_column
 from sqlmodel import Field, SQLModel
 
 
+def normalized_text(column):
+    """
+    SQL expression normalizing a name for case-, space-, and underscore-insensitive
+    exact matching: underscores become spaces, whitespace runs (up to 8 spaces) are
+    collapsed, and the result is trimmed and lower-cased.
+
+    Only immutable string functions are used, so the expression is valid in
+    generated columns and materialized views on PostgreSQL as well as on SQLite.
+    """
+    normalized = func.replace(column, "_", " ")
+    for _ in range(3):
+        normalized = func.replace(normalized, "  ", " ")
+    return func.lower(func.trim(normalized))
+
+
+def normalized_name_column(source: str = "name", unique: bool = False) -> Column:
+    """
+    Stored generated column holding ``normalized_text(source)``, indexed for
+    equality lookups. The database keeps it in sync on every insert/update.
+
+    ``unique`` makes it the natural key of tables whose rows are identified by
+    name alone, used as the conflict target of the batch name upserts.
+    """
+    return Column(
+        Text,
+        Computed(normalized_text(literal_column(source)), persisted=True),
+        index=True,
+        unique=unique,
+    )
+
+
 class BaseEntity(SQLModel):
     """
     Mixin for all main entity tables. Provides id, timestamps, lineage.
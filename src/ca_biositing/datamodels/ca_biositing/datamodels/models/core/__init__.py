@@ -1,3 +1,6 @@
 from .lineage import EntityLineage
 from .etl_run import EtlRun
+from .etl_task_metric import EtlTaskMetric
 from .lineage import LineageGroup
+from .lineage import LineageTableChange
+from .row_fingerprint import RowFingerprint
@@ -0,0 +1,28 @@
+from datetime import datetime
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+from typing import Optional
+
+
+class EtlTaskMetric(SQLModel, table=True):
+    """
+    Resource use of one extract, transform or load task run: time, memory,
+    row counts, bytes read and database traffic.
+    """
+    __tablename__ = "etl_task_metric"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    etl_run_id: Optional[int] = Field(default=None, foreign_key="etl_run.id", index=True)
+    run_id: Optional[str] = Field(default=None, index=True)
+    task_name: str = Field(nullable=False)
+    stage: Optional[str] = Field(default=None)
+    status: Optional[str] = Field(default=None)
+    started_at: Optional[datetime] = Field(default=None)
+    wall_seconds: Optional[float] = Field(default=None)
+    cpu_seconds: Optional[float] = Field(default=None)
+    peak_rss_delta_bytes: Optional[int] = Field(default=None, sa_type=sa.BigInteger)
+    rows_in: Optional[int] = Field(default=None)
+    rows_out: Optional[int] = Field(default=None)
+    bytes_read: Optional[int] = Field(default=None, sa_type=sa.BigInteger)
+    db_round_trips: Optional[int] = Field(default=None)
+    rows_written: Optional[int] = Field(default=None)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
 from typing import Optional
 
@@ -21,3 +22,17 @@ class EntityLineage(SQLModel, table=True):
     source_table: Optional[str] = Field(default=None)
     source_row_id: Optional[str] = Field(default=None)
     note: Optional[str] = Field(default=None)
+
+
+class LineageTableChange(SQLModel, table=True):
+    """Per-table counts of rows inserted, updated and left unchanged by a load."""
+    __tablename__ = "lineage_table_change"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    etl_run_id: Optional[int] = Field(default=None, foreign_key="etl_run.id", index=True)
+    lineage_group_id: Optional[int] = Field(default=None, foreign_key="lineage_group.id")
+    table_name: str = Field(nullable=False)
+    inserted: int = Field(default=0)
+    updated: int = Field(default=0)
+    unchanged: int = Field(default=0)
+    created_at: Optional[datetime] = Field(default=None)
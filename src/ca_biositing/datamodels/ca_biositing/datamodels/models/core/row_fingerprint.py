@@ -0,0 +1,18 @@
+from datetime import datetime
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+from typing import Optional
+
+
+class RowFingerprint(SQLModel, table=True):
+    """
+    Content hash of the business columns of a loaded row, keyed by table and
+    natural key. Loaders compare incoming rows against it to skip unchanged ones.
+    """
+    __tablename__ = "row_fingerprint"
+
+    table_name: str = Field(primary_key=True)
+    row_key: str = Field(primary_key=True)
+    row_hash: int = Field(nullable=False, sa_type=sa.BigInteger)
+    etl_run_id: Optional[int] = Field(default=None, foreign_key="etl_run.id")
+    updated_at: Optional[datetime] = Field(default=None)
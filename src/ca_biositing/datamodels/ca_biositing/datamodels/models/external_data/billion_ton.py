@@ -8,8 +8,28 @@ from sqlmodel import Field, Relationship, SQLModel
 from ..base import BaseEntity
 
 
+# One row per county, resource, model scenario, offered price and land source
+# within a dataset.
+BILLION_TON_NATURAL_KEY = (
+    "dataset_id",
+    "geoid",
+    "resource_id",
+    "model_name",
+    "scenario_name",
+    "price_offered_usd",
+    "land_source",
+)
+
+
 class BillionTon2023Record(BaseEntity, table=True):
     __tablename__ = "billion_ton2023_record"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            *BILLION_TON_NATURAL_KEY,
+            name="billion_ton2023_record_natural_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
 
     dataset_id: Optional[int] = Field(default=None, foreign_key="dataset.id")
     subclass_id: Optional[int] = Field(default=None, foreign_key="resource_subclass.id")
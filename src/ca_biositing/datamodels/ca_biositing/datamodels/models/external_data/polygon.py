@@ -6,6 +6,15 @@ from geoalchemy2 import Geometry
 from typing import Any, Optional
 
 
+# Pre-simplified geometry tiers stored alongside ``geom``, keyed by column name.
+# Tolerances are in the units of the source CRS (metres for LandIQ) and are
+# applied with topology-preserving simplification.
+GEOMETRY_TIERS = {
+    "geom_1m": 1.0,
+    "geom_10m": 10.0,
+    "geom_100m": 100.0,
+}
+
 class Polygon(BaseEntity, table=True):
     """Geographic polygon with MD5-based unique constraint on geometry."""
     __tablename__ = "polygon"
@@ -17,5 +26,10 @@ class Polygon(BaseEntity, table=True):
     geom: Optional[Any] = Field(default=None, sa_column=Column(Geometry(spatial_index=False)))
     dataset_id: Optional[int] = Field(default=None, foreign_key="dataset.id")
 
+    # Simplified geometry tiers (see GEOMETRY_TIERS)
+    geom_1m: Optional[Any] = Field(default=None, sa_column=Column(Geometry(spatial_index=False)))
+    geom_10m: Optional[Any] = Field(default=None, sa_column=Column(Geometry(spatial_index=False)))
+    geom_100m: Optional[Any] = Field(default=None, sa_column=Column(Geometry(spatial_index=False)))
+
     # Relationships
     dataset: Optional["Dataset"] = Relationship()
@@ -1,4 +1,4 @@
-from ..base import BaseEntity, LookupBase
+from ..base import BaseEntity, LookupBase, normalized_name_column
 from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
 from typing import Optional
@@ -10,6 +10,8 @@ class UsdaCommodity(LookupBase, table=True):
     usda_source: Optional[str] = Field(default=None)
     usda_code: Optional[str] = Field(default=None)
     api_name: Optional[str] = Field(default=None)
+    name_norm: Optional[str] = Field(default=None, sa_column=normalized_name_column("name"))
+    api_name_norm: Optional[str] = Field(default=None, sa_column=normalized_name_column("api_name"))
     created_at: Optional[datetime] = Field(default=None)
     updated_at: Optional[datetime] = Field(default=None)
     parent_commodity_id: Optional[int] = Field(default=None, foreign_key="usda_commodity.id")
@@ -1,7 +1,9 @@
-from ..base import LookupBase
+from ..base import LookupBase, normalized_name_column
 from sqlmodel import Field, SQLModel
 from typing import Optional
 
 
 class AnalysisType(LookupBase, table=True):
     __tablename__ = "analysis_type"
+
+    name_norm: Optional[str] = Field(default=None, sa_column=normalized_name_column("name", unique=True))
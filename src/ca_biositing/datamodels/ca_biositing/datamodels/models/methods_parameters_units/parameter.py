@@ -1,4 +1,4 @@
-from ..base import BaseEntity, LookupBase
+from ..base import BaseEntity, LookupBase, normalized_name_column
 from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
 from typing import Optional
@@ -32,6 +32,7 @@ class Parameter(BaseEntity, table=True):
     __tablename__ = "parameter"
 
     name: Optional[str] = Field(default=None)
+    name_norm: Optional[str] = Field(default=None, sa_column=normalized_name_column("name"))
     standard_unit_id: Optional[int] = Field(default=None, foreign_key="unit.id")
     calculated: Optional[bool] = Field(default=None)
     description: Optional[str] = Field(default=None)
@@ -1,11 +1,45 @@
 from ..base import BaseEntity
 from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Column, Computed, Index, Text, func, literal_column
 from typing import Optional
 
 
+# Columns forming the natural key of an address, in key order
+ADDRESS_KEY_COLUMNS = ("geography_id", "address_line1", "city", "zip")
+
+
+def address_key_expression():
+    """
+    SQL expression for the natural key of an address: the trimmed, lower-cased
+    ``ADDRESS_KEY_COLUMNS`` joined with ``|``, NULLs as empty strings.
+
+    Only immutable functions are used, so it can back a stored generated column
+    on PostgreSQL as well as on SQLite.
+    """
+    parts = [
+        func.lower(func.trim(func.coalesce(literal_column(c, Text), "")))
+        for c in ADDRESS_KEY_COLUMNS
+    ]
+    key = parts[0]
+    for part in parts[1:]:
+        key = key + "|" + part
+    return key
+
+
+def address_key(geography_id, address_line1, city, zip) -> str:
+    """Python mirror of ``address_key_expression`` for values about to be loaded."""
+    return "|".join(
+        "" if v is None else str(v).strip(" ").lower()
+        for v in (geography_id, address_line1, city, zip)
+    )
+
+
 class LocationAddress(BaseEntity, table=True):
     __tablename__ = "location_address"
+    __table_args__ = (
+        Index("location_address_address_key", "address_key", unique=True),
+    )
 
     geography_id: Optional[str] = Field(default=None, foreign_key="place.geoid")
     address_line1: Optional[str] = Field(default=None)
@@ -15,6 +49,11 @@ class LocationAddress(BaseEntity, table=True):
     lat: Optional[float] = Field(default=None)
     lon: Optional[float] = Field(default=None)
     is_anonymous: Optional[bool] = Field(default=None)
+    # Natural key kept in sync by the database; batch loads upsert on it
+    address_key: Optional[str] = Field(
+        default=None,
+        sa_column=Column(Text, Computed(address_key_expression(), persisted=True)),
+    )
 
     # Relationships
     geography: Optional["Place"] = Relationship()
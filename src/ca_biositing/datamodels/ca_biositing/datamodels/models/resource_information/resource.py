@@ -1,4 +1,4 @@
-from ..base import BaseEntity, LookupBase
+from ..base import BaseEntity, LookupBase, normalized_name_column
 from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
 from typing import Optional
@@ -19,6 +19,7 @@ class Resource(BaseEntity, table=True):
     __tablename__ = "resource"
 
     name: Optional[str] = Field(default=None)
+    name_norm: Optional[str] = Field(default=None, sa_column=normalized_name_column("name", unique=True))
     primary_ag_product_id: Optional[int] = Field(default=None, foreign_key="primary_ag_product.id")
     resource_class_id: Optional[int] = Field(default=None, foreign_key="resource_class.id")
     resource_subclass_id: Optional[int] = Field(default=None, foreign_key="resource_subclass.id")
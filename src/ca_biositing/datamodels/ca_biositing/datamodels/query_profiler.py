@@ -0,0 +1,192 @@
+"""
+Opt-in SQL query profiler with N+1 detection.
+
+``profile_queries`` collects every statement executed on any SQLAlchemy
+engine in the current context (a pipeline task, an API request, a test) into
+a ``QueryProfile``. Statements are grouped by fingerprint — the SQL with
+literals, bound parameters and ``IN``/``VALUES`` lists collapsed — with their
+count, total time and rows. A fingerprint executed ``n_plus_one_threshold``
+or more times is flagged as a likely N+1: a query issued once per item inside
+a Python loop instead of once per batch.
+
+The cursor-event listeners are only installed the first time a profile is
+started, so code that never profiles pays nothing.
+
+Usage:
+    with profile_queries("load_resource") as profile:
+        load_resource.fn(df)
+    print(profile.report())
+
+``query_budget`` is the assertion form used by tests:
+    with query_budget(max_queries=3, max_repeats=1):
+        AnalysisService.get_by_resource(session, "almond_hulls", "06001", "ash")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Executions of one fingerprint, per profile, that count as a likely N+1
+N_PLUS_ONE_THRESHOLD = 10
+
+_active: contextvars.ContextVar[tuple["QueryProfile", ...]] = contextvars.ContextVar(
+    "query_profiles", default=()
+)
+_install_lock = threading.Lock()
+_installed = False
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES = re.compile(r"\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize ``statement`` so executions differing only in values compare equal."""
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (?...)", sql)
+    sql = _VALUES.sub(r"VALUES \1 ...", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    """Executions of one statement fingerprint."""
+
+    fingerprint: str
+    count: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+
+
+class QueryProfile:
+    """Statements executed while a profile was active, grouped by fingerprint."""
+
+    def __init__(self, name: str, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.name = name
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.stats: dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float, rows: int) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = QueryStats(key)
+            stats.count += 1
+            stats.seconds += seconds
+            stats.rows += max(rows, 0)
+
+    @property
+    def total_queries(self) -> int:
+        return sum(s.count for s in self.stats.values())
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(s.seconds for s in self.stats.values())
+
+    @property
+    def max_repeats(self) -> int:
+        """Executions of the most repeated fingerprint."""
+        return max((s.count for s in self.stats.values()), default=0)
+
+    def n_plus_one(self) -> list[QueryStats]:
+        """Fingerprints executed at least ``n_plus_one_threshold`` times, most repeated first."""
+        suspects = [s for s in self.stats.values() if s.count >= self.n_plus_one_threshold]
+        return sorted(suspects, key=lambda s: s.count, reverse=True)
+
+    def report(self, limit: int = 10, width: int = 160) -> str:
+        """Totals, likely N+1 fingerprints and the ``limit`` slowest fingerprints."""
+        lines = [
+            f"{self.name}: {self.total_queries} queries, {len(self.stats)} distinct, "
+            f"{self.total_seconds * 1000:.1f} ms"
+        ]
+        for s in self.n_plus_one():
+            lines.append(f"  likely N+1 ({s.count}x, {s.seconds * 1000:.1f} ms): {s.fingerprint[:width]}")
+        slowest = sorted(self.stats.values(), key=lambda s: s.seconds, reverse=True)[:limit]
+        for s in slowest:
+            lines.append(
+                f"  {s.count:>6}x {s.seconds * 1000:>9.1f} ms {s.rows:>8} rows  {s.fingerprint[:width]}"
+            )
+        return "\n".join(lines)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active.get() and context is not None:
+        context._query_profiler_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profiles = _active.get()
+    started = getattr(context, "_query_profiler_start", None)
+    if not profiles or started is None:
+        return
+    seconds = time.perf_counter() - started
+    rows = getattr(cursor, "rowcount", -1)
+    for profile in profiles:
+        profile.record(statement, seconds, rows)
+
+
+def _install() -> None:
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = True
+
+
+def current_profiles() -> tuple[QueryProfile, ...]:
+    """Profiles active in this context, outermost first."""
+    return _active.get()
+
+
+@contextlib.contextmanager
+def profile_queries(
+    name: str, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD
+) -> Iterator[QueryProfile]:
+    """Collect the statements executed in the enclosed block; profiles nest."""
+    _install()
+    profile = QueryProfile(name, n_plus_one_threshold)
+    token = _active.set(_active.get() + (profile,))
+    try:
+        yield profile
+    finally:
+        _active.reset(token)
+
+
+@contextlib.contextmanager
+def query_budget(
+    max_queries: int, max_repeats: Optional[int] = None, name: str = "query budget"
+) -> Iterator[QueryProfile]:
+    """
+    Fail with AssertionError if the enclosed block runs more than ``max_queries``
+    statements, or any one fingerprint more than ``max_repeats`` times.
+    """
+    with profile_queries(name) as profile:
+        yield profile
+    if profile.total_queries > max_queries:
+        raise AssertionError(
+            f"{name}: {profile.total_queries} queries over the budget of {max_queries}\n{profile.report()}"
+        )
+    if max_repeats is not None and profile.max_repeats > max_repeats:
+        raise AssertionError(
+            f"{name}: a statement ran {profile.max_repeats} times, over the limit of "
+            f"{max_repeats}\n{profile.report()}"
+        )
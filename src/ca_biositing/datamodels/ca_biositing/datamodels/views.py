@@ -7,13 +7,17 @@ This module defines all 7 materialized views for the ca_biositing schema:
 - analysis_data_view: Aim1 analytical records union with spatial joins
 - usda_census_view: USDA Census records with commodity and place joins
 - usda_survey_view: USDA Survey records with commodity and place joins
+- usda_census_latest_view / usda_survey_latest_view: observations of the newest
+  USDA record per commodity and geoid
 - billion_ton_tileset_view: Billion Ton 2023 records with spatial joins
 - analysis_average_view: Aggregated analysis statistics (raw SQL)
 
 Views are created via Alembic migrations and can be refreshed via refresh_all_views().
 """
 
-from sqlalchemy import cast, func, literal, literal_column, select, text, String, Float
+import math
+
+from sqlalchemy import cast, column, func, literal, literal_column, select, table, text, String, Float
 from sqlalchemy.orm import aliased
 
 # Import all models needed for view definitions
@@ -51,18 +55,45 @@ from .models import (
     Resource,
     Place,
 )
+from .models.base import normalized_text
+from .models.external_data.polygon import GEOMETRY_TIERS
 
 # Schema for all materialized views
 VIEW_SCHEMA = "ca_biositing"
 
 # Raw column reference for geometry — bypasses GeoAlchemy2's ST_AsEWKB wrapping
 _geom_col = literal_column("polygon.geom").label("geom")
+_geom_tier_cols = [
+    literal_column(f"polygon.{column}").label(column) for column in GEOMETRY_TIERS
+]
+
+# Ground resolution of a 256px web-mercator tile at zoom 0, at the equator
+WEB_MERCATOR_METERS_PER_PIXEL_Z0 = 156543.03392
 
 # --- 1. landiq_record_view ---
+# V1: original view exposing only full-resolution geometry (see migration
+# 9c5c72c6d059). Simplified geometry tiers are added in migration e4a7c2d9b1f3
+# via LANDIQ_RECORD_VIEW.
+LANDIQ_RECORD_VIEW_V1 = (
+    select(
+        LandiqRecord.record_id,
+        _geom_col,
+        Polygon.geoid,
+        PrimaryAgProduct.name.label("crop_name"),
+        LandiqRecord.acres,
+        LandiqRecord.irrigated,
+        LandiqRecord.confidence,
+        LandiqRecord.dataset_id,
+    )
+    .join(Polygon, LandiqRecord.polygon_id == Polygon.id)
+    .join(PrimaryAgProduct, LandiqRecord.main_crop == PrimaryAgProduct.id)
+)
+
 LANDIQ_RECORD_VIEW = (
     select(
         LandiqRecord.record_id,
         _geom_col,
+        *_geom_tier_cols,
         Polygon.geoid,
         PrimaryAgProduct.name.label("crop_name"),
         LandiqRecord.acres,
@@ -75,10 +106,26 @@ LANDIQ_RECORD_VIEW = (
 )
 
 # --- 2. landiq_tileset_view ---
+# V1: see LANDIQ_RECORD_VIEW_V1 note above.
+LANDIQ_TILESET_VIEW_V1 = (
+    select(
+        LandiqRecord.id,
+        _geom_col,
+        PrimaryAgProduct.name.label("main_crop"),
+        LandiqRecord.acres,
+        LandiqRecord.county,
+        Polygon.geoid,
+        LandiqRecord.dataset_id.label("tileset_id"),
+    )
+    .join(Polygon, LandiqRecord.polygon_id == Polygon.id)
+    .join(PrimaryAgProduct, LandiqRecord.main_crop == PrimaryAgProduct.id)
+)
+
 LANDIQ_TILESET_VIEW = (
     select(
         LandiqRecord.id,
         _geom_col,
+        *_geom_tier_cols,
         PrimaryAgProduct.name.label("main_crop"),
         LandiqRecord.acres,
         LandiqRecord.county,
@@ -89,6 +136,66 @@ LANDIQ_TILESET_VIEW = (
     .join(PrimaryAgProduct, LandiqRecord.main_crop == PrimaryAgProduct.id)
 )
 
+
+def geometry_tier_for_resolution(meters_per_pixel: float) -> str:
+    """Return the LandIQ geometry column best suited to a map resolution.
+
+    Picks the coarsest simplified tier whose tolerance does not exceed the
+    ground size of one pixel, so the simplification is never visible. Falls
+    back to the full-resolution ``geom`` column for sub-metre resolutions.
+
+    Args:
+        meters_per_pixel: Ground resolution of the requested map or export.
+
+    Returns:
+        Column name on landiq_record_view / landiq_tileset_view.
+    """
+    best_column, best_tolerance = "geom", 0.0
+    for tier, tolerance in GEOMETRY_TIERS.items():
+        if best_tolerance < tolerance <= meters_per_pixel:
+            best_column, best_tolerance = tier, tolerance
+    return best_column
+
+
+def geometry_tier_for_zoom(zoom: float, latitude: float = 37.0) -> str:
+    """Return the LandIQ geometry column for a web-mercator zoom level.
+
+    Args:
+        zoom: Web-mercator (256px tile) zoom level.
+        latitude: Reference latitude for the ground resolution; defaults to
+            the middle of California.
+
+    Returns:
+        Column name on landiq_record_view / landiq_tileset_view.
+    """
+    meters_per_pixel = (
+        WEB_MERCATOR_METERS_PER_PIXEL_Z0 * math.cos(math.radians(latitude)) / (2 ** zoom)
+    )
+    return geometry_tier_for_resolution(meters_per_pixel)
+
+
+def landiq_tileset_query(zoom: float, latitude: float = 37.0):
+    """Select landiq_tileset_view for a tile build at a web-mercator zoom level.
+
+    Only the geometry tier matching ``zoom`` (see geometry_tier_for_zoom) is
+    read, exposed as ``geom``; the other tiers are left out.
+
+    Args:
+        zoom: Web-mercator (256px tile) zoom level.
+        latitude: Reference latitude for the ground resolution.
+
+    Returns:
+        A select over the materialized landiq_tileset_view.
+    """
+    tier = geometry_tier_for_zoom(zoom, latitude)
+    names = [c.name for c in LANDIQ_TILESET_VIEW.selected_columns]
+    view = table("landiq_tileset_view", *[column(name) for name in names], schema=VIEW_SCHEMA)
+    return select(*[
+        view.c[tier].label("geom") if name == "geom" else view.c[name]
+        for name in names
+        if name not in GEOMETRY_TIERS
+    ])
+
 # --- 3. analysis_data_view ---
 AnalysisDimensionUnit = aliased(Unit, name="analysis_du")
 ANALYSIS_DATA_VIEW = (
@@ -105,6 +212,7 @@ ANALYSIS_DATA_VIEW = (
         func.lower(DimensionType.name).label("dimension"),
         Observation.dimension_value,
         func.lower(AnalysisDimensionUnit.name).label("dimension_unit"),
+        normalized_text(Parameter.name).label("parameter_norm"),
     )
     .join(Parameter, Observation.parameter_id == Parameter.id)
     .join(Unit, Observation.unit_id == Unit.id)
@@ -246,6 +354,7 @@ USDA_CENSUS_VIEW = (
         UsdaCommodity.id.label("commodity_id"),
         UsdaCensusRecord.id.label("source_record_id"),
         UsdaCensusRecord.year.label("record_year"),
+        normalized_text(Parameter.name).label("parameter_norm"),
     )
     .join(
         UsdaCensusRecord,
@@ -306,6 +415,7 @@ USDA_SURVEY_VIEW = (
         UsdaSurveyRecord.survey_period,
         UsdaSurveyRecord.reference_month,
         UsdaSurveyRecord.seasonal_flag,
+        normalized_text(Parameter.name).label("parameter_norm"),
     )
     .join(
         UsdaSurveyRecord,
@@ -320,6 +430,31 @@ USDA_SURVEY_VIEW = (
     .outerjoin(DimensionUnit, Observation.dimension_unit_id == DimensionUnit.id)
 )
 
+# --- usda_census_latest_view / usda_survey_latest_view ---
+# Only the observations of the newest record (by year, then record id) for each
+# commodity × geoid, so the feedstock API can answer get/list requests with a
+# single index lookup instead of first searching for the latest record.
+def _latest_record_observations(usda_view, name: str):
+    source = usda_view.subquery(f"{name}_source")
+    ranked = select(
+        *source.c,
+        func.dense_rank()
+        .over(
+            partition_by=(source.c.commodity_id, source.c.geoid),
+            order_by=(
+                source.c.record_year.is_(None),
+                source.c.record_year.desc(),
+                source.c.source_record_id.desc(),
+            ),
+        )
+        .label("record_rank"),
+    ).subquery(f"{name}_ranked")
+    return select(*[ranked.c[c.name] for c in source.c]).where(ranked.c.record_rank == 1)
+
+
+USDA_CENSUS_LATEST_VIEW = _latest_record_observations(USDA_CENSUS_VIEW, "census")
+USDA_SURVEY_LATEST_VIEW = _latest_record_observations(USDA_SURVEY_VIEW, "survey")
+
 # --- 6. usda_resource_commodity_view ---
 # Lightweight view: maps each resource name to its USDA commodity ID.
 # Used by discovery endpoints to list queryable resources without service-layer joins.
@@ -365,13 +500,15 @@ ANALYSIS_AVERAGE_VIEW_SQL = """
 """
 
 # Ordered list for creation (respects inter-view dependencies).
+# LandIQ views use the V1 definitions (full-resolution geometry only) for the
+# same reason: the geometry tier columns are added in migration e4a7c2d9b1f3.
 # USDA views use the V1 definitions (UsdaCommodity.name) because this list is
 # used by the initial migration (9c5c72c6d059), before api_name is added in
 # a085cd4a462e. Migration b6aa2fc6cd42 updates them to use api_name directly
 # via USDA_CENSUS_VIEW / USDA_SURVEY_VIEW.
 VIEW_DEFINITIONS = [
-    ("landiq_record_view", LANDIQ_RECORD_VIEW),
-    ("landiq_tileset_view", LANDIQ_TILESET_VIEW),
+    ("landiq_record_view", LANDIQ_RECORD_VIEW_V1),
+    ("landiq_tileset_view", LANDIQ_TILESET_VIEW_V1),
     ("analysis_data_view", ANALYSIS_DATA_VIEW),
     ("usda_census_view", USDA_CENSUS_VIEW_V1),
     ("usda_survey_view", USDA_SURVEY_VIEW_V1),
@@ -379,12 +516,39 @@ VIEW_DEFINITIONS = [
     # analysis_average_view is last (depends on analysis_data_view)
 ]
 
+# B-tree indexes serving the feedstock API's parameter lookups, which filter on
+# the normalized parameter name (migration f1c3b5d7e9a2)
+NORMALIZED_NAME_VIEW_INDEXES = [
+    ("idx_analysis_data_view_lookup", "analysis_data_view", ("resource_id", "geoid", "parameter_norm")),
+    ("idx_usda_census_view_lookup", "usda_census_view", ("commodity_id", "geoid", "parameter_norm")),
+    ("idx_usda_survey_view_lookup", "usda_survey_view", ("commodity_id", "geoid", "parameter_norm")),
+]
+
+# Latest-record views (migration a3e5c7f9b2d4): one row per observation, looked
+# up by commodity × geoid (optionally × parameter)
+LATEST_RECORD_VIEWS = [
+    ("usda_census_latest_view", USDA_CENSUS_LATEST_VIEW),
+    ("usda_survey_latest_view", USDA_SURVEY_LATEST_VIEW),
+]
+
+LATEST_RECORD_VIEW_INDEXES = [
+    (f"idx_{view_name}_lookup", view_name, ("commodity_id", "geoid", "parameter_norm"))
+    for view_name, _ in LATEST_RECORD_VIEWS
+]
+
 # Views requiring GIST spatial indexes
 SPATIAL_VIEW_INDEXES = [
     ("idx_landiq_record_view_geom", "landiq_record_view", "geom"),
     ("idx_landiq_tileset_view_geom", "landiq_tileset_view", "geom"),
 ]
 
+# GIST indexes on the simplified geometry tiers (migration e4a7c2d9b1f3)
+SPATIAL_VIEW_TIER_INDEXES = [
+    (f"idx_{view_name}_{column}", view_name, column)
+    for view_name in ("landiq_record_view", "landiq_tileset_view")
+    for column in GEOMETRY_TIERS
+]
+
 
 def refresh_all_views(engine):
     """Refresh all materialized views in dependency order.
@@ -403,6 +567,8 @@ def refresh_all_views(engine):
         # 1. Refresh ca_biositing schema views
         for view_name, _ in VIEW_DEFINITIONS:
             conn.execute(text(f"REFRESH MATERIALIZED VIEW {VIEW_SCHEMA}.{view_name}"))
+        for view_name, _ in LATEST_RECORD_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW {VIEW_SCHEMA}.{view_name}"))
         conn.execute(text(f"REFRESH MATERIALIZED VIEW {VIEW_SCHEMA}.usda_resource_commodity_view"))
         conn.execute(text(f"REFRESH MATERIALIZED VIEW {VIEW_SCHEMA}.analysis_average_view"))
 
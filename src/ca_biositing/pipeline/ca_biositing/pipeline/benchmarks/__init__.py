@@ -0,0 +1,8 @@
+"""
+ETL benchmarks on synthetic inputs.
+
+``synthetic`` generates LandIQ, USDA QuickStats, Aim 1 and Billion Ton inputs
+at a configurable scale; ``suite`` runs each flow's extract, transform and load
+on them against a scratch PostgreSQL/PostGIS database and compares the results
+with a stored baseline. Run it with ``python -m ca_biositing.pipeline.benchmarks``.
+"""
@@ -0,0 +1,6 @@
+import sys
+
+from ca_biositing.pipeline.benchmarks.suite import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,493 @@
+"""
+End-to-end ETL benchmarks on synthetic inputs.
+
+Each benchmark generates its input (see ``synthetic.py``), then runs the
+flow's extract, transform and load steps against a scratch PostgreSQL/PostGIS
+database inside a Prefect flow run, in a fresh process so its peak RSS is its
+own. Per stage it records wall and CPU time, rows in and out, throughput,
+peak RSS growth and the time and number of database statements. Results are
+written as JSON and compared with a stored baseline; a stage slower (or a
+benchmark larger) than ``threshold`` times its baseline is a regression.
+
+The database is rebuilt from the models on every benchmark (the ``public``
+schema is dropped), so never point ``BENCHMARK_DATABASE_URL`` at real data.
+It is created if missing.
+"""
+
+import contextlib
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_module
+import sys
+import tempfile
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ca_biositing.datamodels.query_profiler import profile_queries
+from ca_biositing.pipeline.benchmarks import synthetic
+from ca_biositing.pipeline.utils.task_metrics import count_rows, track_task
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL")
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "data/benchmarks")
+
+# How often the parent checks that a benchmark process is still alive
+RESULT_POLL_SECONDS = 5.0
+
+# A metric more than this many times its baseline value is a regression
+DEFAULT_THRESHOLD = 1.3
+
+# Increases below these are noise, whatever the ratio
+NOISE_FLOOR = {
+    "wall_seconds": 0.25,
+    "db_seconds": 0.25,
+    "db_queries": 10,
+    "peak_rss_bytes": 32 * 2**20,
+}
+
+STAGES = ("extract", "transform", "load")
+
+
+@dataclass
+class Scale:
+    """Input sizes of the benchmarks."""
+
+    landiq_polygons: int = 20_000
+    landiq_chunk_size: int = 10_000
+    usda_records: int = 5_000
+    aim1_samples: int = 300
+    billion_ton_rows: int = 50_000
+    seed: int = 0
+
+
+@dataclass
+class StageResult:
+    """One stage of a benchmark, summed over its calls (e.g. LandIQ chunks)."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    rows_per_second: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    db_seconds: float = 0.0
+    db_queries: int = 0
+
+
+class _Stages:
+    """Measures the stages of one benchmark."""
+
+    def __init__(self, benchmark: str):
+        self.benchmark = benchmark
+        self.results: Dict[str, StageResult] = {}
+
+    @contextlib.contextmanager
+    def stage(self, stage: str) -> Iterator[Any]:
+        """Measure the block as one call of ``stage``; set ``rows_in``/``rows_out`` on the yielded metrics."""
+        name = f"benchmark.{self.benchmark}.{stage}"
+        with profile_queries(name) as profile:
+            with track_task(name, stage, persist=False) as metrics:
+                yield metrics
+        result = self.results.setdefault(stage, StageResult())
+        result.calls += 1
+        result.wall_seconds += metrics.wall_seconds
+        result.cpu_seconds += metrics.cpu_seconds
+        result.rows_in += metrics.rows_in or 0
+        result.rows_out += metrics.rows_out or 0
+        result.peak_rss_delta_bytes += metrics.peak_rss_delta_bytes
+        result.db_seconds += profile.total_seconds
+        result.db_queries += profile.total_queries
+        rows = result.rows_in if stage == "load" else result.rows_out
+        result.rows_per_second = rows / result.wall_seconds if result.wall_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, dict]:
+        return {stage: asdict(self.results[stage]) for stage in STAGES if stage in self.results}
+
+
+def _peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _unwrapped(task) -> Callable:
+    """The function under a Prefect task and its ``task_metrics`` wrapper."""
+    return inspect.unwrap(task.fn)
+
+
+def _lineage(pipeline_name: str):
+    from ca_biositing.pipeline.utils.lineage import create_etl_run_record, create_lineage_group
+
+    etl_run_id = create_etl_run_record.fn(pipeline_name=pipeline_name)
+    return etl_run_id, create_lineage_group.fn(etl_run_id=etl_run_id, note=f"Benchmark: {pipeline_name}")
+
+
+def generate_inputs(name: str, scale: Scale, work_dir: str) -> Dict[str, Any]:
+    """Write the synthetic input of benchmark ``name`` under ``work_dir``."""
+    if name == "landiq":
+        path = os.path.join(work_dir, "landiq", "landiq.shp")
+        return {"path": synthetic.landiq_shapefile(path, scale.landiq_polygons, scale.seed)}
+    if name == "usda":
+        path = os.path.join(work_dir, "usda", "quickstats.json")
+        return {"path": synthetic.usda_quickstats_json(path, scale.usda_records, scale.seed)}
+    if name == "aim1":
+        return {"paths": synthetic.aim1_analysis_sheets(os.path.join(work_dir, "aim1"), scale.aim1_samples, scale.seed)}
+    if name == "billion_ton":
+        path = os.path.join(work_dir, "billion_ton", "billionton.csv")
+        return {"path": synthetic.billion_ton_csv(path, scale.billion_ton_rows, scale.seed)}
+    raise ValueError(f"Unknown benchmark: {name}")
+
+
+def _run_landiq(stages: _Stages, scale: Scale, inputs: Dict[str, Any]) -> None:
+    import pyogrio
+    from ca_biositing.pipeline.etl.load.landiq import load_landiq_record
+    from ca_biositing.pipeline.etl.transform.landiq.landiq_record import transform_landiq_record
+
+    transform, load = _unwrapped(transform_landiq_record), _unwrapped(load_landiq_record)
+    etl_run_id, lineage_group_id = _lineage("Land IQ ETL")
+    total = pyogrio.read_info(inputs["path"])["features"]
+    # Chunked like landiq_etl_flow
+    for skip in range(0, total, scale.landiq_chunk_size):
+        with stages.stage("extract") as m:
+            gdf = pyogrio.read_dataframe(inputs["path"], skip_features=skip, max_features=scale.landiq_chunk_size)
+            m.rows_out = len(gdf)
+        with stages.stage("transform") as m:
+            m.rows_in = len(gdf)
+            df = transform(gdf, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
+            m.rows_out = len(df)
+        with stages.stage("load") as m:
+            m.rows_in = len(df)
+            load(df)
+
+
+def _run_usda(stages: _Stages, scale: Scale, inputs: Dict[str, Any]) -> None:
+    import pandas as pd
+    from sqlmodel import Session
+    from ca_biositing.datamodels.models import UsdaCommodity
+    from ca_biositing.pipeline.etl.load.usda.usda_census_survey import load
+    from ca_biositing.pipeline.etl.transform.usda.usda_census_survey import transform
+    from ca_biositing.pipeline.utils.engine import engine
+
+    # The transform keeps only commodities mapped in usda_commodity
+    with Session(engine) as session:
+        session.add_all(
+            UsdaCommodity(name=name.lower(), api_name=name, usda_source="NASS")
+            for name in synthetic.USDA_COMMODITIES
+        )
+        session.commit()
+
+    transform, load = _unwrapped(transform), _unwrapped(load)
+    etl_run_id, lineage_group_id = _lineage("USDA ETL")
+    with stages.stage("extract") as m:
+        with open(inputs["path"]) as f:
+            raw = pd.DataFrame(json.load(f)["data"])
+        m.rows_out = len(raw)
+    with stages.stage("transform") as m:
+        m.rows_in = len(raw)
+        df = transform(data_sources={"usda": raw}, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
+        m.rows_out = count_rows(df)
+    with stages.stage("load") as m:
+        m.rows_in = count_rows(df)
+        load(transformed_df=df, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
+
+
+def _run_aim1(stages: _Stages, scale: Scale, inputs: Dict[str, Any]) -> None:
+    import pandas as pd
+    from ca_biositing.pipeline.etl.load.analysis.observation import load_observation
+    from ca_biositing.pipeline.etl.load.analysis.proximate_record import load_proximate_record
+    from ca_biositing.pipeline.etl.load.analysis.ultimate_record import load_ultimate_record
+    from ca_biositing.pipeline.etl.transform.analysis.observation import transform_observation
+    from ca_biositing.pipeline.etl.transform.analysis.proximate_record import transform_proximate_record
+    from ca_biositing.pipeline.etl.transform.analysis.ultimate_record import transform_ultimate_record
+
+    etl_run_id, lineage_group_id = _lineage("Analysis Records ETL")
+    lineage = {"etl_run_id": etl_run_id, "lineage_group_id": lineage_group_id}
+    with stages.stage("extract") as m:
+        # Google Sheets returns text, with empty cells as ""
+        sheets = {
+            analysis_type: pd.read_csv(path, dtype=str, keep_default_na=False)
+            for analysis_type, path in inputs["paths"].items()
+        }
+        m.rows_out = count_rows(sheets)
+    prox, ult = sheets["proximate analysis"], sheets["ultimate analysis"]
+    with stages.stage("transform") as m:
+        m.rows_in = count_rows(sheets)
+        transformed = {
+            "observation": _unwrapped(transform_observation)([prox.copy(), ult.copy()], **lineage),
+            "proximate": _unwrapped(transform_proximate_record)(prox, **lineage),
+            "ultimate": _unwrapped(transform_ultimate_record)(ult, **lineage),
+        }
+        m.rows_out = count_rows(transformed)
+    with stages.stage("load") as m:
+        m.rows_in = count_rows(transformed)
+        # Records before their observations, as in analysis_records_flow
+        _unwrapped(load_proximate_record)(transformed["proximate"])
+        _unwrapped(load_ultimate_record)(transformed["ultimate"])
+        _unwrapped(load_observation)(transformed["observation"])
+
+
+def _run_billion_ton(stages: _Stages, scale: Scale, inputs: Dict[str, Any]) -> None:
+    from ca_biositing.pipeline.etl.extract.billion_ton import read_billion_ton_csv
+    from ca_biositing.pipeline.etl.load.billion_ton import load
+    from ca_biositing.pipeline.etl.transform.billion_ton import transform
+
+    transform, load = _unwrapped(transform), _unwrapped(load)
+    etl_run_id, lineage_group_id = _lineage("Billion Ton ETL")
+    with stages.stage("extract") as m:
+        raw = read_billion_ton_csv(inputs["path"])
+        m.rows_out = len(raw)
+    with stages.stage("transform") as m:
+        m.rows_in = len(raw)
+        df = transform(data_sources={"billion_ton": raw}, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
+        m.rows_out = count_rows(df)
+    with stages.stage("load") as m:
+        m.rows_in = count_rows(df)
+        load(df)
+
+
+BENCHMARKS: Dict[str, Callable[[_Stages, Scale, Dict[str, Any]], None]] = {
+    "landiq": _run_landiq,
+    "usda": _run_usda,
+    "aim1": _run_aim1,
+    "billion_ton": _run_billion_ton,
+}
+
+
+def prepare_database(database_url: str) -> None:
+    """Create the benchmark database if missing and rebuild its schema from the models."""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.engine import make_url
+    from sqlmodel import SQLModel
+    import ca_biositing.datamodels.models  # noqa: F401  (registers every table)
+
+    url = make_url(database_url)
+    server = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with server.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    finally:
+        server.dispose()
+
+    engine = create_engine(url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("DROP SCHEMA IF EXISTS public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        SQLModel.metadata.create_all(engine)
+    finally:
+        engine.dispose()
+
+
+def _run_benchmark(name: str, scale: Scale, inputs: Dict[str, Any], database_url: str, queue) -> None:
+    """Child process entry point: run one benchmark and put its result on ``queue``."""
+    # Before any pipeline module builds its engine
+    os.environ["DATABASE_URL"] = database_url
+    result: Dict[str, Any] = {"status": "completed", "error": None}
+    started = time.perf_counter()
+    try:
+        from prefect import flow
+
+        prepare_database(database_url)
+        stages = _Stages(name)
+
+        @flow(name=f"Benchmark {name}", persist_result=False)
+        def benchmark_flow():
+            BENCHMARKS[name](stages, scale, inputs)
+
+        try:
+            benchmark_flow()
+        finally:
+            result["stages"] = stages.as_dict()
+    except Exception as e:
+        result.update(status="failed", error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+    result["wall_seconds"] = time.perf_counter() - started
+    result["peak_rss_bytes"] = _peak_rss_bytes()
+    queue.put(result)
+
+
+def _wait_for_result(proc, queue, poll_seconds: float = RESULT_POLL_SECONDS) -> Dict[str, Any]:
+    """
+    Result a benchmark process put on ``queue``, or a failure if it died first.
+
+    A child that is OOM-killed or crashes never puts a result, so the queue
+    is polled while the process is alive rather than read with a blocking get.
+    """
+    while True:
+        try:
+            return queue.get(timeout=poll_seconds)
+        except queue_module.Empty:
+            if proc.is_alive():
+                continue
+        # The child may have put its result just before exiting
+        try:
+            return queue.get(timeout=poll_seconds)
+        except queue_module.Empty:
+            proc.join()
+            return {
+                "status": "failed",
+                "error": f"benchmark process died without a result (exit code {proc.exitcode})",
+                "stages": {},
+            }
+
+
+def run_benchmarks(
+    names: Iterable[str],
+    scale: Scale,
+    database_url: str,
+    work_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run each benchmark in a fresh process and return the results document."""
+    ctx = multiprocessing.get_context("spawn")
+    results: Dict[str, Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "scale": asdict(scale),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": {},
+    }
+    with contextlib.ExitStack() as stack:
+        if work_dir is None:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="etl-benchmark-"))
+        for name in names:
+            inputs = generate_inputs(name, scale, work_dir)
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_benchmark, args=(name, scale, inputs, database_url, queue))
+            proc.start()
+            result = _wait_for_result(proc, queue)
+            proc.join()
+            results["benchmarks"][name] = result
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Regressions of ``results`` against ``baseline``, one line each.
+
+    Each stage's wall time, database time and statement count, and each
+    benchmark's peak RSS, is compared. Failed benchmarks are regressions;
+    benchmarks or stages missing from the baseline are not compared.
+    Raises ValueError if the baseline was recorded at another scale.
+    """
+    if baseline.get("scale") != results.get("scale"):
+        raise ValueError(
+            f"Baseline scale {baseline.get('scale')} differs from this run's {results.get('scale')}"
+        )
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        if current["status"] != "completed":
+            regressions.append(f"{name}: {current['status']} ({current.get('error')})")
+            continue
+        before = baseline.get("benchmarks", {}).get(name)
+        if not before or before.get("status") != "completed":
+            continue
+        checks = [(name, "peak_rss_bytes", current, before)]
+        for stage, values in current.get("stages", {}).items():
+            for metric in ("wall_seconds", "db_seconds", "db_queries"):
+                checks.append((f"{name}.{stage}", metric, values, before.get("stages", {}).get(stage)))
+        for label, metric, values, previous in checks:
+            if not previous or values.get(metric) is None or previous.get(metric) is None:
+                continue
+            now, then = values[metric], previous[metric]
+            if now > then * threshold and now - then > NOISE_FLOOR[metric]:
+                ratio = f"x{now / then:.2f}" if then else "new"
+                regressions.append(
+                    f"{label} {metric}: {now:.4g} vs baseline {then:.4g} ({ratio}, threshold x{threshold})"
+                )
+    return regressions
+
+
+def summarize(results: Dict[str, Any]) -> List[str]:
+    """One line per benchmark stage."""
+    lines = []
+    for name, benchmark in results["benchmarks"].items():
+        lines.append(
+            f"{name}: {benchmark['status']} in {benchmark.get('wall_seconds', 0):.1f}s, "
+            f"peak RSS {benchmark.get('peak_rss_bytes', 0) / 2**20:.0f} MiB"
+            + (f" ({benchmark['error']})" if benchmark.get("error") else "")
+        )
+        for stage, s in benchmark.get("stages", {}).items():
+            lines.append(
+                f"  {stage:<9} {s['wall_seconds']:>8.2f}s  {s['rows_per_second']:>10.0f} rows/s  "
+                f"{s['db_seconds']:>7.2f}s DB ({s['db_queries']} statements)  "
+                f"+{s['peak_rss_delta_bytes'] / 2**20:.0f} MiB"
+            )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    defaults = Scale()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--database-url", default=BENCHMARK_DATABASE_URL,
+                        help="scratch PostgreSQL/PostGIS database (default: $BENCHMARK_DATABASE_URL)")
+    for field, default in asdict(defaults).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "results.json"))
+    parser.add_argument("--baseline", default=os.path.join(BENCHMARK_DIR, "baseline.json"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the baseline instead of comparing")
+    parser.add_argument("--work-dir", help="keep the generated inputs here")
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("--database-url or BENCHMARK_DATABASE_URL is required")
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    scale = Scale(**{field: getattr(args, field) for field in asdict(defaults)})
+    results = run_benchmarks(args.benchmarks or list(BENCHMARKS), scale, args.database_url, args.work_dir)
+    for line in summarize(results):
+        print(line)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    failed = any(b["status"] != "completed" for b in results["benchmarks"].values())
+    if args.update_baseline:
+        if failed:
+            print("Not updating the baseline: a benchmark failed")
+            return 1
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; nothing compared")
+        return int(failed)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
@@ -0,0 +1,240 @@
+"""
+Synthetic ETL inputs at a configurable scale.
+
+Each generator writes a file shaped like the real source: the columns,
+value formats and quirks (suppressed USDA values, ``**`` percentages,
+national rows in the Billion Ton download) the transforms handle. Output is
+deterministic for a given ``seed``.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# California counties as (county FIPS code, name)
+COUNTIES = [
+    ("001", "Alameda"), ("007", "Butte"), ("011", "Colusa"), ("013", "Contra Costa"),
+    ("019", "Fresno"), ("029", "Kern"), ("031", "Kings"), ("039", "Madera"),
+    ("047", "Merced"), ("067", "Sacramento"), ("077", "San Joaquin"), ("083", "Santa Barbara"),
+    ("095", "Solano"), ("099", "Stanislaus"), ("101", "Sutter"), ("107", "Tulare"),
+    ("113", "Yolo"), ("115", "Yuba"),
+]
+
+OTHER_STATES = [("04", "Arizona"), ("32", "Nevada"), ("41", "Oregon"), ("53", "Washington")]
+
+# LandIQ crop codes (see etl/transform/landiq/crops_classification.csv)
+LANDIQ_CROPS = ["G2", "R1", "F1", "F16", "P1", "T4", "T12", "D12", "D13", "D14", "V", "C", "YP", "D1", "X"]
+
+# QuickStats commodity_desc values; seed usda_commodity with these api_names
+USDA_COMMODITIES = ["ALMONDS", "WALNUTS", "PISTACHIOS", "GRAPES", "RICE", "CORN", "WHEAT", "TOMATOES", "HAY", "COTTON"]
+
+USDA_STATISTICS = [
+    ("AREA HARVESTED", "ACRES"),
+    ("AREA BEARING", "ACRES"),
+    ("PRODUCTION", "TONS"),
+    ("YIELD", "TONS / ACRE"),
+    ("OPERATIONS", "OPERATIONS"),
+    ("SALES", "$"),
+]
+
+# Parameters and units of the Aim 1 analysis tabs
+AIM1_PARAMETERS = {
+    "proximate analysis": [("Moisture", "% total weight"), ("Ash", "% dry weight"), ("Volatile Solids", "% dry weight"), ("Fixed Carbon", "% dry weight")],
+    "ultimate analysis": [("Carbon", "% dry weight"), ("Hydrogen", "% dry weight"), ("Nitrogen", "% dry weight"), ("Sulfur", "% dry weight"), ("Oxygen", "% dry weight")],
+}
+
+AIM1_RESOURCES = ["Almond Hulls", "Almond Shells", "Walnut Shells", "Rice Straw", "Tomato Pomace", "Grape Pomace", "Corn Stover", "Wheat Straw"]
+
+BILLION_TON_RESOURCES = [
+    ("agricultural residues", "corn stover"), ("agricultural residues", "wheat straw"),
+    ("agricultural residues", "rice straw"), ("agricultural residues", "barley straw"),
+    ("energy crops", "switchgrass"), ("energy crops", "miscanthus"),
+    ("orchard and vineyard", "almond prunings"), ("orchard and vineyard", "vineyard prunings"),
+]
+
+
+def _rng(seed: int) -> np.random.Generator:
+    return np.random.default_rng(seed)
+
+
+def landiq_shapefile(path: str, n_polygons: int, seed: int = 0) -> str:
+    """
+    Write a LandIQ crop-mapping shapefile with ``n_polygons`` fields.
+
+    Fields are small irregular polygons in California Albers (EPSG:3310), with
+    the 2023 attribute columns the LandIQ transform reads.
+    """
+    import geopandas as gpd
+    import shapely
+
+    rng = _rng(seed)
+    x = rng.uniform(-370_000, 540_000, n_polygons)
+    y = rng.uniform(-600_000, 450_000, n_polygons)
+    vertices = 6
+    angles = np.sort(rng.uniform(0, 2 * np.pi, (n_polygons, vertices)), axis=1)
+    radii = rng.uniform(80, 600, (n_polygons, vertices))
+    ring = np.stack([x[:, None] + radii * np.cos(angles), y[:, None] + radii * np.sin(angles)], axis=-1)
+    ring = np.concatenate([ring, ring[:, :1]], axis=1).round(2)
+    geometry = shapely.polygons(ring)
+
+    def crops(share_missing):
+        values = rng.choice(LANDIQ_CROPS, n_polygons).astype(object)
+        values[rng.random(n_polygons) < share_missing] = "**"
+        return values
+
+    def percents():
+        values = rng.integers(0, 101, n_polygons).astype(str).astype(object)
+        values[rng.random(n_polygons) < 0.3] = "**"
+        return values
+
+    county_names = np.array([name for _, name in COUNTIES], dtype=object)
+    gdf = gpd.GeoDataFrame(
+        {
+            "UniqueID": [f"{seed}-{i:09d}" for i in range(n_polygons)],
+            "MAIN_CROP": rng.choice(LANDIQ_CROPS, n_polygons),
+            "CLASS1": crops(0.1),
+            "CLASS2": crops(0.5),
+            "CLASS3": crops(0.8),
+            "PCNT1": percents(),
+            "PCNT2": percents(),
+            "PCNT3": percents(),
+            "PCNT4": percents(),
+            "ACRES": (shapely.area(geometry) / 4046.86).round(2),
+            "COUNTY": rng.choice(county_names, n_polygons),
+            "IRR_TYP1PA": rng.choice(["Irrigated", "Non-irrigated", "**"], n_polygons, p=[0.8, 0.15, 0.05]),
+            "CONFIDENCE": rng.integers(1, 4, n_polygons),
+        },
+        geometry=geometry,
+        crs="EPSG:3310",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    gdf.to_file(path, engine="pyogrio")
+    return path
+
+
+def usda_quickstats_json(path: str, n_records: int, seed: int = 0) -> str:
+    """
+    Write a QuickStats API response (``{"data": [...]}``) with ``n_records`` county rows.
+
+    About 5% of values are the API's suppression codes (``(D)``, ``(Z)``).
+    """
+    rng = _rng(seed)
+    counties = [COUNTIES[i] for i in rng.integers(0, len(COUNTIES), n_records)]
+    statistics = [USDA_STATISTICS[i] for i in rng.integers(0, len(USDA_STATISTICS), n_records)]
+    values = rng.lognormal(8, 2, n_records)
+    suppressed = rng.random(n_records) < 0.05
+    census = rng.random(n_records) < 0.5
+    records = []
+    for i in range(n_records):
+        statistic, unit = statistics[i]
+        value = rng.choice(["(D)", "(Z)"]) if suppressed[i] else f"{values[i]:,.0f}"
+        records.append({
+            "source_desc": "CENSUS" if census[i] else "SURVEY",
+            "sector_desc": "CROPS",
+            "commodity_desc": USDA_COMMODITIES[int(rng.integers(len(USDA_COMMODITIES)))],
+            "statisticcat_desc": statistic,
+            "unit_desc": unit,
+            "short_desc": f"{statistic} - {unit}",
+            "agg_level_desc": "COUNTY",
+            "state_fips_code": "06",
+            "state_alpha": "CA",
+            "county_code": counties[i][0],
+            "county_name": counties[i][1].upper(),
+            "year": int(rng.integers(2017, 2025)),
+            "freq_desc": "ANNUAL",
+            "reference_period_desc": "YEAR",
+            "begin_code": "00",
+            "end_code": "00",
+            "Value": value,
+            "CV (%)": "" if census[i] else f"{rng.uniform(1, 40):.1f}",
+        })
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"data": records}, f)
+    return path
+
+
+def aim1_analysis_sheets(out_dir: str, n_samples: int, seed: int = 0) -> Dict[str, str]:
+    """
+    Write Aim 1 proximate and ultimate analysis tabs for ``n_samples`` prepared samples.
+
+    Each sample has three technical replicates of every parameter of the tab.
+    Values are written as text, as Google Sheets returns them. Returns a
+    mapping of analysis type to CSV path.
+    """
+    rng = _rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    samples = [f"PS-{i:06d}" for i in range(n_samples)]
+    resources = rng.choice(AIM1_RESOURCES, n_samples)
+    paths = {}
+    for analysis_type, parameters in AIM1_PARAMETERS.items():
+        prefix = analysis_type.split()[0][:4].upper()
+        rows: List[dict] = []
+        for s, sample in enumerate(samples):
+            for p, (parameter, unit) in enumerate(parameters):
+                for repl in range(1, 4):
+                    rows.append({
+                        "Record_ID": f"{prefix}-{s:06d}-{p:02d}-{repl}",
+                        "Resource": resources[s],
+                        "Prepared_sample": sample,
+                        "Preparation_method": "Oven dry 105C",
+                        "Repl_no": str(repl),
+                        "Parameter": parameter,
+                        "Value": f"{rng.uniform(0.1, 60):.2f}",
+                        "Unit": unit,
+                        "Analyst_email": f"analyst{s % 5}@example.org",
+                        "Provider_code": f"PROV{s % 20:02d}",
+                        "qc_result": "pass" if rng.random() > 0.02 else "fail",
+                        "Note": "",
+                        "analysis_type": analysis_type,
+                        "dataset": "biocirv",
+                    })
+        path = os.path.join(out_dir, f"{analysis_type.replace(' ', '_')}.csv")
+        pd.DataFrame(rows).to_csv(path, index=False)
+        paths[analysis_type] = path
+    return paths
+
+
+def billion_ton_csv(path: str, n_rows: int, seed: int = 0, california_share: float = 0.2) -> str:
+    """
+    Write a Billion Ton 2023 agricultural download with ``n_rows`` rows.
+
+    Only ``california_share`` of the rows are California counties, as in the
+    national file; the extra columns the extract skips are included.
+    """
+    rng = _rng(seed)
+    california = rng.random(n_rows) < california_share
+    county = rng.integers(0, len(COUNTIES), n_rows)
+    state = rng.integers(0, len(OTHER_STATES), n_rows)
+    resource = rng.integers(0, len(BILLION_TON_RESOURCES), n_rows)
+    state_fips = np.where(california, "06", [OTHER_STATES[i][0] for i in state])
+    county_fips = [COUNTIES[i][0] for i in county]
+    df = pd.DataFrame({
+        "type": "agriculture",
+        "class": "primary",
+        "subclass": [BILLION_TON_RESOURCES[i][0] for i in resource],
+        "resource": [BILLION_TON_RESOURCES[i][1] for i in resource],
+        "year": 2023,
+        # California FIPS lose their leading zero in the download
+        "fips": [f"{int(s + c)}" for s, c in zip(state_fips, county_fips)],
+        "county": [f"{COUNTIES[i][1]} County" for i in county],
+        "state_name": np.where(california, "California", [OTHER_STATES[i][1] for i in state]),
+        "usdaregion": "Pacific",
+        "County Square Miles": rng.uniform(300, 8000, n_rows).round(1),
+        "model_name": rng.choice(["POLYSYS", "ForSEAM"], n_rows),
+        "scenario_name": rng.choice(["mature market medium", "emerging market high"], n_rows),
+        "price_offered": rng.choice([40.0, 60.0, 80.0, 100.0], n_rows),
+        "production": rng.lognormal(8, 1.5, n_rows).round(0),
+        "production_unit": "dry ton",
+        "btu_ton": 15_000_000.0,
+        "production_energy_content": rng.lognormal(20, 1.5, n_rows).round(0),
+        "energy_content_unit": "btu",
+        "production_density_dtpersqmi": rng.uniform(0, 200, n_rows).round(3),
+        "landsource": rng.choice(["cropland", "pasture"], n_rows),
+    })
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    df.to_csv(path, index=False)
+    return path
@@ -0,0 +1,5 @@
+"""Export tasks for publishing database snapshots.
+
+Modules in this package read refreshed materialized views and write them to
+file-based snapshots (Parquet/GeoParquet) for analysts and frontend builds.
+"""
@@ -0,0 +1,384 @@
+"""
+Parquet/GeoParquet snapshots of the materialized views.
+
+After each refresh, every materialized view in the ``ca_biositing`` and
+``data_portal`` schemas is streamed out of Postgres with a server-side cursor,
+converted to Arrow record batches and written to a hive-partitioned Parquet
+dataset. Geometry columns are written as WKB with GeoParquet metadata.
+
+Views carrying the simplified LandIQ geometry tiers (``geom_1m``, ...) are
+exported with a single ``geom`` column: the tier that fits the requested
+ground resolution (``VIEW_SNAPSHOT_METERS_PER_PIXEL``), or the full-resolution
+geometry when none is requested.
+
+A ``manifest.json`` at the snapshot root lists, per view, the row count and a
+hash of the Arrow schema, so downstream jobs can skip views that did not
+change. Its ``etl_run_id`` is the run that exported the snapshot (the master
+ETL run); the sub-flows that loaded the rows record their own runs.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from prefect import task, get_run_logger
+from sqlalchemy import text
+
+from ca_biositing.datamodels.models.external_data.polygon import GEOMETRY_TIERS
+from ca_biositing.datamodels.views import geometry_tier_for_resolution
+
+VIEW_SNAPSHOT_URI = os.getenv("VIEW_SNAPSHOT_URI", "data/view_snapshots")
+# Ground resolution the snapshots are for; unset exports full-resolution geometry
+VIEW_SNAPSHOT_METERS_PER_PIXEL = os.getenv("VIEW_SNAPSHOT_METERS_PER_PIXEL")
+SNAPSHOT_SCHEMAS = ("ca_biositing", "data_portal")
+# First column present in a view is used as the hive partition key
+PARTITION_COLUMNS = ("dataset_id", "tileset_id", "geoid")
+DEFAULT_BATCH_SIZE = 50_000
+MANIFEST_NAME = "manifest.json"
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Postgres type (format_type output) -> (Arrow type, SQL cast or None)
+_PG_TYPE_MAP = {
+    "smallint": (pa.int64(), None),
+    "integer": (pa.int64(), None),
+    "bigint": (pa.int64(), None),
+    "real": (pa.float64(), "double precision"),
+    "double precision": (pa.float64(), None),
+    "numeric": (pa.float64(), "double precision"),
+    "boolean": (pa.bool_(), None),
+    "date": (pa.date32(), None),
+    "timestamp without time zone": (pa.timestamp("us"), None),
+    "timestamp with time zone": (pa.timestamp("us", tz="UTC"), None),
+}
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def list_materialized_views(conn, schemas: Iterable[str] = SNAPSHOT_SCHEMAS) -> list[tuple[str, str]]:
+    """Return (schema, view) pairs for all materialized views in ``schemas``."""
+    rows = conn.execute(
+        text(
+            "SELECT schemaname, matviewname FROM pg_matviews "
+            "WHERE schemaname = ANY(:schemas) ORDER BY schemaname, matviewname"
+        ),
+        {"schemas": list(schemas)},
+    ).all()
+    return [(row.schemaname, row.matviewname) for row in rows]
+
+
+def get_view_columns(conn, schema: str, view: str) -> list[tuple[str, str]]:
+    """Return (column name, Postgres type) pairs for a view, in column order."""
+    rows = conn.execute(
+        text(
+            "SELECT a.attname AS name, format_type(a.atttypid, a.atttypmod) AS pg_type "
+            "FROM pg_attribute a "
+            "JOIN pg_class c ON a.attrelid = c.oid "
+            "JOIN pg_namespace n ON c.relnamespace = n.oid "
+            "WHERE n.nspname = :schema AND c.relname = :view "
+            "AND a.attnum > 0 AND NOT a.attisdropped "
+            "ORDER BY a.attnum"
+        ),
+        {"schema": schema, "view": view},
+    ).all()
+    return [(row.name, row.pg_type) for row in rows]
+
+
+def build_snapshot_query(
+    schema: str, view: str, columns: list[tuple[str, str]], geometry_tier: str = "geom"
+) -> tuple[str, pa.Schema]:
+    """
+    Build the SELECT used to stream a view and the Arrow schema of its batches.
+
+    Geometry columns are selected as WKB; types without a native Arrow mapping
+    (text, varchar, tsvector, json, ...) are cast to text, and text arrays to
+    lists of strings. In views carrying the LandIQ geometry tiers, only
+    ``geometry_tier`` is read, exported under the name ``geom``.
+    """
+    names = {name for name, _ in columns}
+    source_geom = geometry_tier if geometry_tier in names else "geom"
+    select_list = []
+    fields = []
+    geometry_columns = []
+    for name, pg_type in columns:
+        if name in GEOMETRY_TIERS:
+            continue
+        ident = _quote_ident(name)
+        base_type = pg_type.split("(", 1)[0].strip()
+        if base_type in ("geometry", "geography"):
+            source = _quote_ident(source_geom) if name == "geom" else ident
+            select_list.append(f"ST_AsBinary({source}) AS {ident}")
+            fields.append(pa.field(name, pa.binary()))
+            geometry_columns.append(name)
+        elif pg_type.endswith("[]"):
+            select_list.append(f"{ident}::text[] AS {ident}")
+            fields.append(pa.field(name, pa.list_(pa.string())))
+        elif base_type in _PG_TYPE_MAP:
+            arrow_type, cast = _PG_TYPE_MAP[base_type]
+            select_list.append(f"{ident}::{cast} AS {ident}" if cast else ident)
+            fields.append(pa.field(name, arrow_type))
+        else:
+            select_list.append(f"{ident}::text AS {ident}")
+            fields.append(pa.field(name, pa.string()))
+
+    metadata = None
+    if geometry_columns:
+        geo = {
+            "version": "1.0.0",
+            "primary_column": geometry_columns[0],
+            "columns": {
+                name: {"encoding": "WKB", "geometry_types": [], "crs": None}
+                for name in geometry_columns
+            },
+        }
+        metadata = {b"geo": json.dumps(geo).encode("utf-8")}
+
+    query = f"SELECT {', '.join(select_list)} FROM {_quote_ident(schema)}.{_quote_ident(view)}"
+    return query, pa.schema(fields, metadata=metadata)
+
+
+def schema_hash(schema: pa.Schema) -> str:
+    """Stable hash of column names and Arrow types (metadata excluded)."""
+    payload = json.dumps([(field.name, str(field.type)) for field in schema])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stream_view_batches(conn, query: str, schema: pa.Schema, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pa.RecordBatch]:
+    """
+    Stream query results as Arrow record batches using a server-side cursor.
+
+    Only one batch of rows is held in memory at a time.
+    """
+    result = conn.execution_options(stream_results=True, max_row_buffer=batch_size).execute(text(query))
+    names = schema.names
+    for rows in result.partitions(batch_size):
+        columns = list(zip(*rows)) if rows else [[] for _ in names]
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+
+def resolve_output(output_uri: str) -> tuple[pafs.FileSystem, str]:
+    """Return the filesystem and root path for a local directory or bucket URI."""
+    if "://" in output_uri:
+        return pafs.FileSystem.from_uri(output_uri)
+    path = os.path.abspath(output_uri)
+    os.makedirs(path, exist_ok=True)
+    return pafs.LocalFileSystem(), path
+
+
+def _partition_dir(partition_column: str, value) -> str:
+    if value is None:
+        return f"{partition_column}={HIVE_NULL_PARTITION}"
+    return f"{partition_column}={quote(str(value), safe='')}"
+
+
+def _split_by_partition(batch: pa.RecordBatch, partition_column: str) -> Iterator[tuple[object, pa.RecordBatch]]:
+    keys = batch.column(partition_column)
+    data = batch.drop_columns([partition_column])
+    for value in pc.unique(keys).to_pylist():
+        mask = pc.is_null(keys) if value is None else pc.equal(keys, pa.scalar(value, keys.type))
+        yield value, data.filter(pc.fill_null(mask, False))
+
+
+def _replace_dir(filesystem: pafs.FileSystem, source: str, target: str) -> None:
+    """Swap ``source`` in for ``target``, keeping the old directory until the move lands."""
+    previous = f"{target}.old-{uuid.uuid4().hex}"
+    has_previous = filesystem.get_file_info(target).type == pafs.FileType.Directory
+    if has_previous:
+        filesystem.move(target, previous)
+    try:
+        filesystem.move(source, target)
+    except Exception:
+        if has_previous:
+            filesystem.move(previous, target)
+        raise
+    if has_previous:
+        filesystem.delete_dir(previous)
+
+
+def write_view_snapshot(
+    batches: Iterable[pa.RecordBatch],
+    schema: pa.Schema,
+    filesystem: pafs.FileSystem,
+    base_dir: str,
+    partition_column: Optional[str] = None,
+) -> dict:
+    """
+    Write record batches to a (hive-partitioned) Parquet dataset.
+
+    Batches are consumed in the calling thread (the source cursor is not
+    shared across threads) and written as they arrive with a single open
+    writer, which is rolled over whenever the partition value changes; feed
+    batches ordered by ``partition_column`` to get one file per partition
+    (a value that reappears starts a new ``part-N`` file). The dataset is
+    written to a sibling temporary directory and swapped in for ``base_dir``
+    only once every writer has closed, so a failed export leaves the previous
+    snapshot intact and stale partitions do not survive a successful one.
+    Returns the row count and the files written.
+    """
+    staging_dir = f"{base_dir}.tmp-{uuid.uuid4().hex}"
+    filesystem.create_dir(staging_dir, recursive=True)
+
+    file_schema = schema
+    if partition_column:
+        file_schema = schema.remove(schema.get_field_index(partition_column))
+
+    files = []
+    parts_per_dir = {}
+    current = {"key": None, "writer": None}
+
+    def close_current():
+        if current["writer"] is not None:
+            current["writer"].close()
+        current["key"], current["writer"] = None, None
+
+    def writer_for(directory):
+        if current["writer"] is None or current["key"] != directory:
+            close_current()
+            part = parts_per_dir.get(directory, 0)
+            parts_per_dir[directory] = part + 1
+            relative_path = f"{directory}/part-{part}.parquet" if directory else f"part-{part}.parquet"
+            path = f"{staging_dir}/{relative_path}"
+            filesystem.create_dir(path.rsplit("/", 1)[0], recursive=True)
+            current["key"] = directory
+            current["writer"] = pq.ParquetWriter(path, file_schema, filesystem=filesystem)
+            files.append(relative_path)
+        return current["writer"]
+
+    row_count = 0
+    try:
+        try:
+            for batch in batches:
+                row_count += batch.num_rows
+                if not partition_column:
+                    writer_for("").write_batch(batch)
+                    continue
+                for value, part in _split_by_partition(batch, partition_column):
+                    writer_for(_partition_dir(partition_column, value)).write_batch(part)
+            if not files:
+                writer_for("")
+        finally:
+            close_current()
+        size = sum(
+            info.size or 0
+            for info in filesystem.get_file_info([f"{staging_dir}/{f}" for f in files])
+        )
+        _replace_dir(filesystem, staging_dir, base_dir)
+    except BaseException:
+        filesystem.delete_dir(staging_dir)
+        raise
+
+    return {"row_count": row_count, "files": sorted(files), "bytes": size}
+
+
+def export_view_snapshots(
+    engine,
+    output_uri: str = VIEW_SNAPSHOT_URI,
+    etl_run_id: Optional[str] = None,
+    schemas: Iterable[str] = SNAPSHOT_SCHEMAS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    logger=None,
+    meters_per_pixel: Optional[float] = None,
+) -> dict:
+    """
+    Snapshot every materialized view in ``schemas`` and write the manifest.
+
+    ``meters_per_pixel`` is the ground resolution the snapshot is for; views
+    with LandIQ geometry tiers export the matching tier (see
+    geometry_tier_for_resolution), or full-resolution geometry when None.
+
+    Returns the manifest dictionary.
+    """
+    import logging
+
+    logger = logger or logging.getLogger(__name__)
+    filesystem, root = resolve_output(output_uri)
+    geometry_tier = "geom" if meters_per_pixel is None else geometry_tier_for_resolution(meters_per_pixel)
+
+    manifest = {
+        "etl_run_id": etl_run_id,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "views": {},
+    }
+
+    with engine.connect() as conn:
+        for schema, view in list_materialized_views(conn, schemas):
+            key = f"{schema}.{view}"
+            columns = get_view_columns(conn, schema, view)
+            query, arrow_schema = build_snapshot_query(schema, view, columns, geometry_tier)
+            tiered = any(name in GEOMETRY_TIERS for name, _ in columns)
+            partition_column = next(
+                (c for c in PARTITION_COLUMNS if c in arrow_schema.names), None
+            )
+            if partition_column:
+                # Clustered by partition key, so only one Parquet writer is open at a time
+                query += f" ORDER BY {_quote_ident(partition_column)}"
+
+            started = datetime.now(timezone.utc)
+            stats = write_view_snapshot(
+                stream_view_batches(conn, query, arrow_schema, batch_size),
+                arrow_schema,
+                filesystem,
+                f"{root}/{key}",
+                partition_column,
+            )
+            elapsed = (datetime.now(timezone.utc) - started).total_seconds()
+
+            manifest["views"][key] = {
+                "path": key,
+                "row_count": stats["row_count"],
+                "schema_hash": schema_hash(arrow_schema),
+                "partition_column": partition_column,
+                "geometry_columns": [
+                    f.name for f in arrow_schema if f.type == pa.binary()
+                ],
+                "geometry_tier": geometry_tier if tiered else None,
+                "files": stats["files"],
+                "bytes": stats["bytes"],
+                "etl_run_id": etl_run_id,
+            }
+            logger.info(
+                f"Snapshot {key}: {stats['row_count']} rows, "
+                f"{len(stats['files'])} files, {elapsed:.1f}s"
+            )
+
+    with filesystem.open_output_stream(f"{root}/{MANIFEST_NAME}") as out:
+        out.write(json.dumps(manifest, indent=2).encode("utf-8"))
+
+    return manifest
+
+
+@task(name="Export view snapshots", retries=1, retry_delay_seconds=30)
+def export_view_snapshots_task(
+    output_uri: Optional[str] = None,
+    etl_run_id: Optional[str] = None,
+    meters_per_pixel: Optional[float] = None,
+) -> dict:
+    """Writes Parquet/GeoParquet snapshots of all materialized views after a refresh."""
+    from ca_biositing.pipeline.utils.engine import get_engine
+
+    logger = get_run_logger()
+    output_uri = output_uri or VIEW_SNAPSHOT_URI
+    if meters_per_pixel is None and VIEW_SNAPSHOT_METERS_PER_PIXEL:
+        meters_per_pixel = float(VIEW_SNAPSHOT_METERS_PER_PIXEL)
+    logger.info(f"Exporting materialized view snapshots to {output_uri}...")
+    engine = get_engine()
+    try:
+        manifest = export_view_snapshots(
+            engine, output_uri, etl_run_id=etl_run_id, logger=logger, meters_per_pixel=meters_per_pixel
+        )
+    finally:
+        engine.dispose()
+    logger.info(f"Exported {len(manifest['views'])} view snapshots.")
+    return manifest
@@ -0,0 +1,22 @@
+"""
+ETL Extract: Aim 1 analysis worksheets (batched)
+
+Fetches the Proximate, Ultimate, Compositional, ICP, XRF, Calorimetry and XRD
+tabs of the Aim 1 workbook in a single request.
+"""
+
+from . import calorimetry, cmpana, icp, proximate, ultimate, xrd, xrf
+from .factory import create_workbook_extractor
+
+GSHEET_NAME = "Aim 1-Feedstock Collection and Processing Data-BioCirV"
+WORKSHEET_NAMES = [
+    proximate.WORKSHEET_NAME,
+    ultimate.WORKSHEET_NAME,
+    cmpana.WORKSHEET_NAME,
+    icp.WORKSHEET_NAME,
+    xrf.WORKSHEET_NAME,
+    calorimetry.WORKSHEET_NAME,
+    xrd.WORKSHEET_NAME,
+]
+
+extract = create_workbook_extractor(GSHEET_NAME, WORKSHEET_NAMES)
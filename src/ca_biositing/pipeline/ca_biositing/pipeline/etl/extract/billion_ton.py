@@ -1,10 +1,52 @@
 from typing import Optional
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 import os
 import tempfile
 
+# Columns of the national download used by the transform, with their types.
+# Everything else (class, usdaregion, ...) is skipped while reading.
+COLUMN_TYPES = {
+    "subclass": "string",
+    "resource": "string",
+    "fips": "string",
+    "county": "string",
+    "state_name": "string",
+    "County Square Miles": "float64",
+    "model_name": "string",
+    "scenario_name": "string",
+    "price_offered": "float64",
+    "production": "float64",
+    "production_unit": "string",
+    "btu_ton": "float64",
+    "production_energy_content": "float64",
+    "energy_content_unit": "string",
+    "production_density_dtpersqmi": "float64",
+    "landsource": "string",
+}
+
+# Rows kept while reading; the transform only loads California counties.
+STATE_FILTER = {"state_name": ["california"]}
+
+
+def read_billion_ton_csv(path: str, logger=None) -> pd.DataFrame:
+    """Stream the Billion Ton CSV, keeping only the needed columns and California rows."""
+    import pyarrow as pa
+    from ca_biositing.pipeline.utils.columnar_reader import stream_csv
+
+    df, stats = stream_csv(
+        path,
+        columns=COLUMN_TYPES,
+        column_types={c: pa.type_for_alias(t) for c, t in COLUMN_TYPES.items()},
+        filters=STATE_FILTER,
+    )
+    if logger is not None:
+        logger.info(f"Read Billion Ton CSV: {stats.summary()}")
+    return df
+
 @task
+@task_metrics("extract")
 def extract(
     file_id: str = "11xLy_kPTHvoqciUMy3SYA3DLCDIjkOGa",
     file_name: str = "billionton_23_agri_download.csv",
@@ -14,6 +56,9 @@ def extract(
     """
     Extracts raw Billion Ton data from a file on Google Drive.
 
+    The national CSV is streamed in record batches; only the columns in
+    ``COLUMN_TYPES`` are parsed and only California rows are kept.
+
     Args:
         file_id: The Google Drive File ID.
         file_name: The local filename to save as.
@@ -46,7 +91,9 @@ def extract(
                 mime_type=mime_type,
                 credentials_path=credentials_path,
                 dataset_folder=temp_dir,
-                file_id=file_id
+                file_id=file_id,
+                csv_reader=lambda path: read_billion_ton_csv(path, logger),
+                cache_variant="california"
             )
 
             if raw_df is None or raw_df.empty:
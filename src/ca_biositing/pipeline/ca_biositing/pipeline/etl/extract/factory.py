@@ -2,21 +2,24 @@
 Extractor Factory for GSheet-based ETL tasks.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
 import os
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 def create_extractor(gsheet_name: str, worksheet_name: str, task_name: Optional[str] = None):
     """
     Creates a Prefect task for extracting data from a specific GSheet worksheet.
     """
+    name = task_name or f"extract_{worksheet_name.lower().replace('.', '_').replace('-', '_')}"
 
     @task(
-        name=task_name or f"extract_{worksheet_name.lower().replace('.', '_').replace('-', '_')}",
+        name=name,
         retries=3,
         retry_delay_seconds=10
     )
+    @task_metrics("extract", name=name)
     def extract(project_root: Optional[str] = None) -> pd.DataFrame:
         from ca_biositing.pipeline.utils.gsheet_to_pandas import gsheet_to_df
         logger = get_run_logger()
@@ -42,3 +45,45 @@ def create_extractor(gsheet_name: str, worksheet_name: str, task_name: Optional[
         return raw_df
 
     return extract
+
+
+def create_workbook_extractor(gsheet_name: str, worksheet_names: List[str], task_name: Optional[str] = None):
+    """
+    Creates a Prefect task extracting several worksheets of one GSheet at once.
+
+    The task authenticates once, opens the spreadsheet once and fetches all
+    tabs with a single batched request, returning a dict of DataFrames keyed
+    by worksheet name (None for tabs that do not exist).
+    """
+    name = task_name or f"extract_workbook_{gsheet_name.lower().split('-')[0].strip().replace(' ', '_')}"
+
+    @task(
+        name=name,
+        retries=3,
+        retry_delay_seconds=10
+    )
+    @task_metrics("extract", name=name)
+    def extract(project_root: Optional[str] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        from ca_biositing.pipeline.utils.gsheet_workbook import gsheet_workbook_to_dfs
+        logger = get_run_logger()
+        logger.info(f"Extracting {len(worksheet_names)} worksheets from '{gsheet_name}'...")
+
+        credentials_path = os.getenv("CREDENTIALS_PATH", "credentials.json")
+        if project_root:
+            credentials_path = os.path.join(project_root, credentials_path)
+
+        try:
+            frames = gsheet_workbook_to_dfs(gsheet_name, worksheet_names, credentials_path)
+        except Exception as e:
+            msg = f"Failed to extract worksheets from {gsheet_name}: {e}"
+            logger.error(msg)
+            raise RuntimeError(msg) from e
+
+        missing = [name for name, df in frames.items() if df is None]
+        if missing:
+            logger.warning(f"Worksheets not found in {gsheet_name}: {missing}")
+
+        logger.info(f"Successfully extracted {len(frames) - len(missing)} worksheets from {gsheet_name}.")
+        return frames
+
+    return extract
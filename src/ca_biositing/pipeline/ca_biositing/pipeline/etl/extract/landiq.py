@@ -13,6 +13,7 @@ import zipfile
 from typing import Optional
 import geopandas as gpd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 # --- CONFIGURATION ---
 # Default path within the repository
@@ -91,6 +92,7 @@ def download_shapefile(url: str, logger) -> Optional[tuple[str, str]]:
 
 
 @task
+@task_metrics("extract")
 def extract(shapefile_path: Optional[str] = None) -> Optional[gpd.GeoDataFrame]:
     """
     Extracts raw data from a Land IQ shapefile.
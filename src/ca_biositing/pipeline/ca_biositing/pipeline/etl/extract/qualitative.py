@@ -4,6 +4,7 @@ from typing import Optional
 
 import pandas as pd
 from prefect import task
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 from .factory import create_extractor
 
@@ -21,6 +22,7 @@ qualitative_data = create_extractor(GSHEET_NAME, QUALITATIVE_DATA_WORKSHEET)
 
 
 @task(name="extract_qualitative_sheets")
+@task_metrics("extract")
 def extract_qualitative_sheets(project_root: Optional[str] = None) -> dict[str, pd.DataFrame]:
     """Extract all qualitative ETL sheets and return them keyed by sheet purpose."""
     return {
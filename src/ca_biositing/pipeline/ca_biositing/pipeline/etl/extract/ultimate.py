@@ -15,6 +15,7 @@ from typing import Optional
 import os
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ...utils.gsheet_to_pandas import gsheet_to_df
 
 # --- CONFIGURATION ---
@@ -29,6 +30,7 @@ CREDENTIALS_PATH = os.getenv("CREDENTIALS_PATH", "credentials.json")
 
 
 @task
+@task_metrics("extract")
 def extract(project_root: Optional[str] = None) -> Optional[pd.DataFrame]:
     """
     Extracts raw data from the specified Google Sheet worksheet.
@@ -15,6 +15,7 @@ from typing import Optional
 import os
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 # Use absolute imports that work both locally and in Docker
 try:
@@ -54,6 +55,7 @@ PRIORITY_COUNTIES = {
 
 
 @task
+@task_metrics("extract")
 def extract() -> Optional[pd.DataFrame]:
     """
     Extracts USDA data ONLY for commodities mapped in resource_usda_commodity_map
@@ -2,11 +2,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
 
 @task(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_compositional_record(df: pd.DataFrame):
     """
     Upserts Compositional records into the database.
@@ -22,11 +25,12 @@ def load_compositional_record(df: pd.DataFrame):
         from ca_biositing.datamodels.models import CompositionalRecord
         now = datetime.now(timezone.utc)
         table_columns = {c.name for c in CompositionalRecord.__table__.columns}
-        records = df.replace({np.nan: None}).to_dict(orient='records')
-
         engine = get_engine()
         with engine.connect() as conn:
             with Session(bind=conn) as session:
+                # Only new rows and rows whose content changed are written
+                changes = diff_rows(session, CompositionalRecord.__table__, df, ['record_id'])
+                records = changes.rows.replace({np.nan: None}).to_dict(orient='records')
                 for record in records:
                     clean_record = {k: v for k, v in record.items() if k in table_columns}
                     clean_record['updated_at'] = now
@@ -44,8 +48,9 @@ def load_compositional_record(df: pd.DataFrame):
                         set_=update_dict
                     )
                     session.execute(upsert_stmt)
+                save_changes(session, changes)
                 session.commit()
-        logger.info("Successfully upserted Compositional records.")
+        logger.info(f"Successfully upserted Compositional records ({changes.summary()}).")
     except Exception as e:
         logger.error(f"Failed to load Compositional records: {e}")
         raise
@@ -9,12 +9,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
 
 
 @task
+@task_metrics("load")
 def load_county_ag_datasets(df: pd.DataFrame):
     """
     Upserts dataset records into the database.
@@ -9,12 +9,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
 
 
 @task
+@task_metrics("load")
 def load_county_ag_report_records(df: pd.DataFrame):
     """
     Upserts county ag report records into the database.
@@ -9,6 +9,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -16,6 +17,7 @@ from ca_biositing.pipeline.utils.engine import get_engine
 
 
 @task
+@task_metrics("load")
 def load_data_sources(df: pd.DataFrame):
     """
     Upserts data source records into the database.
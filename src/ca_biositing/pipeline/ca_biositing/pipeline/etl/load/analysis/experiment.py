@@ -2,10 +2,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 @task
+@task_metrics("load")
 def load_experiment(df: pd.DataFrame):
     """
     Upserts Experiment records into the database.
@@ -2,10 +2,13 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
 
 @task(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_fermentation_record(df: pd.DataFrame):
     """
     Upserts Fermentation records into the database.
@@ -21,37 +24,31 @@ def load_fermentation_record(df: pd.DataFrame):
         from ca_biositing.datamodels.models import FermentationRecord
         now = datetime.now(timezone.utc)
         table_columns = {c.name for c in FermentationRecord.__table__.columns}
-        records = df.replace({np.nan: None}).to_dict(orient='records')
-
-        # Deduplicate records by record_id to avoid CardinalityViolation in bulk upsert
-        seen_ids = set()
-        clean_records = []
-
         # Log duplicates for debugging
-        all_ids = [r.get('record_id') for r in records if r.get('record_id') is not None]
-        id_counts = pd.Series(all_ids).value_counts()
+        id_counts = df['record_id'].dropna().value_counts()
         duplicates = id_counts[id_counts > 1]
         if not duplicates.empty:
             logger.warning(f"Found duplicate record_ids in input data: {duplicates.to_dict()}")
 
-        for record in records:
-            rid = record.get('record_id')
-            if rid is None or rid in seen_ids:
-                if rid in seen_ids:
-                    logger.debug(f"Skipping duplicate record_id: {rid}")
-                continue
-            seen_ids.add(rid)
+        # Deduplicate records by record_id to avoid CardinalityViolation in bulk upsert
+        df = df[df['record_id'].notna()].drop_duplicates(subset='record_id', keep='first')
+
+        from ca_biositing.pipeline.utils.engine import engine
+        with engine.connect() as conn:
+            with Session(bind=conn) as session:
+                # Only new rows and rows whose content changed are written
+                changes = diff_rows(session, FermentationRecord.__table__, df, ['record_id'])
+                records = changes.rows.replace({np.nan: None}).to_dict(orient='records')
 
-            clean_record = {k: v for k, v in record.items() if k in table_columns}
-            clean_record['updated_at'] = now
-            if clean_record.get('created_at') is None:
-                clean_record['created_at'] = now
-            clean_records.append(clean_record)
+                clean_records = []
+                for record in records:
+                    clean_record = {k: v for k, v in record.items() if k in table_columns}
+                    clean_record['updated_at'] = now
+                    if clean_record.get('created_at') is None:
+                        clean_record['created_at'] = now
+                    clean_records.append(clean_record)
 
-        if clean_records:
-            from ca_biositing.pipeline.utils.engine import engine
-            with engine.connect() as conn:
-                with Session(bind=conn) as session:
+                if clean_records:
                     stmt = insert(FermentationRecord).values(clean_records)
                     update_dict = {
                         c.name: stmt.excluded[c.name]
@@ -63,9 +60,10 @@ def load_fermentation_record(df: pd.DataFrame):
                         set_=update_dict
                     )
                     session.execute(upsert_stmt)
-                    session.commit()
+                save_changes(session, changes)
+                session.commit()
 
-        logger.info("Successfully upserted Fermentation records.")
+        logger.info(f"Successfully upserted Fermentation records ({changes.summary()}).")
     except Exception:
         logger.exception("Failed to load Fermentation records")
         raise
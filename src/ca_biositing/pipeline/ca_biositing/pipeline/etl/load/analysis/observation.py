@@ -2,11 +2,17 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
+
+# Natural key of an observation (matches the table's unique constraint).
+OBSERVATION_KEY = ['record_id', 'record_type', 'parameter_id', 'unit_id']
 
 @task(retries=3, retry_delay_seconds=10)(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_observation(df: pd.DataFrame):
     """
     Upserts observations into the database.
@@ -20,12 +26,13 @@ def load_observation(df: pd.DataFrame):
 
     try:
         now = datetime.now(timezone.utc)
-        records = df.replace({np.nan: None}).to_dict(orient='records')
-
         from ca_biositing.datamodels.models import Observation
         engine = get_engine()
         with engine.connect() as conn:
             with Session(bind=conn) as session:
+                # Only new rows and rows whose content changed are written
+                changes = diff_rows(session, Observation.__table__, df, OBSERVATION_KEY)
+                records = changes.rows.replace({np.nan: None}).to_dict(orient='records')
                 for i, record in enumerate(records):
                     record['updated_at'] = now
                     if record.get('created_at') is None:
@@ -38,12 +45,13 @@ def load_observation(df: pd.DataFrame):
                         if c.name not in ['id', 'created_at', 'record_id']
                     }
                     upsert_stmt = stmt.on_conflict_do_update(
-                        index_elements=['record_id', 'record_type', 'parameter_id', 'unit_id'],
+                        index_elements=OBSERVATION_KEY,
                         set_=update_dict
                     )
                     session.execute(upsert_stmt)
+                save_changes(session, changes)
                 session.commit()
-        logger.info("Successfully upserted observations.")
+        logger.info(f"Successfully upserted observations ({changes.summary()}).")
     except Exception as e:
         logger.error(f"Failed to load observations: {e}")
         raise
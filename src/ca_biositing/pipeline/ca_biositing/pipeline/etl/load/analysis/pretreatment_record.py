@@ -5,10 +5,13 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
 
 @task(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_pretreatment_record(df: pd.DataFrame):
     """
     Loads transformed Pretreatment record data into the database.
@@ -30,26 +33,28 @@ def load_pretreatment_record(df: pd.DataFrame):
 
         logger.info(f"PretreatmentRecord load: table columns are: {sorted(table_columns)}")
 
-        records = df.replace({np.nan: None}).to_dict(orient='records')
+        from ca_biositing.pipeline.utils.engine import engine
+        with Session(engine) as session:
+            # Only new rows and rows whose content changed are written
+            changes = diff_rows(session, PretreatmentRecord.__table__, df, ['record_id'])
+            records = changes.rows.replace({np.nan: None}).to_dict(orient='records')
 
-        logger.info(f"PretreatmentRecord load: processing {len(records)} records")
-        if records:
-            logger.info(f"PretreatmentRecord load: first record keys: {records[0].keys()}")
+            logger.info(f"PretreatmentRecord load: processing {len(records)} records ({changes.summary()})")
+            if records:
+                logger.info(f"PretreatmentRecord load: first record keys: {records[0].keys()}")
 
-        clean_records = []
-        for record in records:
-            clean_record = {k: v for k, v in record.items() if k in table_columns}
-            clean_record['updated_at'] = now
-            if clean_record.get('created_at') is None:
-                clean_record['created_at'] = now
-            clean_records.append(clean_record)
+            clean_records = []
+            for record in records:
+                clean_record = {k: v for k, v in record.items() if k in table_columns}
+                clean_record['updated_at'] = now
+                if clean_record.get('created_at') is None:
+                    clean_record['created_at'] = now
+                clean_records.append(clean_record)
 
-        if clean_records:
-            logger.info(f"PretreatmentRecord load: first clean record keys: {clean_records[0].keys()}")
-            logger.info(f"PretreatmentRecord load: sample record values: {clean_records[0]}")
+            if clean_records:
+                logger.info(f"PretreatmentRecord load: first clean record keys: {clean_records[0].keys()}")
+                logger.info(f"PretreatmentRecord load: sample record values: {clean_records[0]}")
 
-            from ca_biositing.pipeline.utils.engine import engine
-            with Session(engine) as session:
                 stmt = insert(PretreatmentRecord).values(clean_records)
                 update_dict = {
                     c.name: stmt.excluded[c.name]
@@ -61,7 +66,8 @@ def load_pretreatment_record(df: pd.DataFrame):
                     set_=update_dict
                 )
                 session.execute(upsert_stmt)
-                session.commit()
+            save_changes(session, changes)
+            session.commit()
 
         logger.info("Successfully upserted Pretreatment records.")
     except Exception as e:
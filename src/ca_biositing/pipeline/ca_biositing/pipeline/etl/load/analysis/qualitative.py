@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 import numpy as np
 import pandas as pd
 from prefect import get_run_logger, task
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 
@@ -133,6 +134,7 @@ def _upsert_lookup_like(
 
 
 @task
+@task_metrics("load")
 def load_qualitative_payloads(
     transformed_payloads: Dict[str, Any],
 ) -> Dict[str, int]:
@@ -380,6 +382,14 @@ def load_qualitative_payloads(
         if isinstance(place_df, pd.DataFrame) and not place_df.empty:
             row = _row_to_dict(place_df.iloc[0])
             geoid = row.get("geoid")
+            # static_resource_info and billion_ton insert Place rows at the same
+            # time, so claim the geoid with ON CONFLICT rather than select-then-add.
+            place_columns = {c.name for c in Place.__table__.columns}
+            place_stmt = insert(Place.__table__).values(
+                **{k: v for k, v in row.items() if k in place_columns}
+            ).on_conflict_do_nothing(index_elements=["geoid"])
+            if session.execute(place_stmt).rowcount:
+                counts["place"] += 1
             place_record = session.exec(select(Place).where(Place.geoid == geoid)).first()
             if place_record:
                 place_record.state_name = row.get("state_name")
@@ -392,10 +402,6 @@ def load_qualitative_payloads(
                 if hasattr(place_record, "lineage_group_id"):
                     place_record.lineage_group_id = row.get("lineage_group_id")
                 session.add(place_record)
-            else:
-                place_record = Place(**row)
-                session.add(place_record)
-                counts["place"] += 1
             session.flush()
 
         dataset_id = getattr(dataset_record, "id", None)
@@ -2,10 +2,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 @task(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_strain(df: pd.DataFrame):
     """
     Upserts strain records into the database.
@@ -2,11 +2,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
 
 @task(retries=3, retry_delay_seconds=10)
+@task_metrics("load")
 def load_xrd_record(df: pd.DataFrame):
     """
     Upserts XRD records into the database.
@@ -22,19 +25,21 @@ def load_xrd_record(df: pd.DataFrame):
         from ca_biositing.datamodels.models import XrdRecord
         now = datetime.now(timezone.utc)
         table_columns = {c.name for c in XrdRecord.__table__.columns}
-        records = df.replace({np.nan: None}).to_dict(orient='records')
+        with engine.connect() as conn:
+            with Session(bind=conn) as session:
+                # Only new rows and rows whose content changed are written
+                changes = diff_rows(session, XrdRecord.__table__, df, ['record_id'])
+                records = changes.rows.replace({np.nan: None}).to_dict(orient='records')
 
-        clean_records = []
-        for record in records:
-            clean_record = {k: v for k, v in record.items() if k in table_columns}
-            clean_record['updated_at'] = now
-            if clean_record.get('created_at') is None:
-                clean_record['created_at'] = now
-            clean_records.append(clean_record)
+                clean_records = []
+                for record in records:
+                    clean_record = {k: v for k, v in record.items() if k in table_columns}
+                    clean_record['updated_at'] = now
+                    if clean_record.get('created_at') is None:
+                        clean_record['created_at'] = now
+                    clean_records.append(clean_record)
 
-        if clean_records:
-            with engine.connect() as conn:
-                with Session(bind=conn) as session:
+                if clean_records:
                     stmt = insert(XrdRecord).values(clean_records)
                     update_dict = {
                         c.name: stmt.excluded[c.name]
@@ -46,9 +51,10 @@ def load_xrd_record(df: pd.DataFrame):
                         set_=update_dict
                     )
                     session.execute(upsert_stmt)
-                    session.commit()
+                save_changes(session, changes)
+                session.commit()
 
-        logger.info("Successfully upserted XRD records.")
+        logger.info(f"Successfully upserted XRD records ({changes.summary()}).")
     except Exception:
         logger.exception("Failed to load XRD records")
         raise
@@ -2,16 +2,66 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
+
+# Rows per INSERT ... ON CONFLICT statement
+PAGE_SIZE = 1000
+
+INT_COLUMNS = ['production', 'btu_ton', 'production_energy_content']
+ID_COLUMNS = ['dataset_id', 'subclass_id', 'resource_id', 'production_unit_id',
+              'energy_content_unit_id', 'etl_run_id', 'lineage_group_id']
+
+
+def build_place_rows(df: pd.DataFrame) -> list[dict]:
+    """One Place row per distinct geoid, with state/county FIPS split from it."""
+    places = df[['geoid', 'county', 'state_name']].drop_duplicates('geoid')
+    places = places.rename(columns={'county': 'county_name'})
+    places['state_fips'] = places['geoid'].str[:2]
+    places['county_fips'] = places['geoid'].str[2:]
+    return places.astype(object).where(places.notna(), None).to_dict('records')
+
+
+def prepare_records(
+    df: pd.DataFrame, table_columns: set[str], key_columns: tuple[str, ...], now: datetime
+) -> pd.DataFrame:
+    """
+    Cast and select BillionTon2023Record columns column-wise.
+
+    Integer measures may arrive as floats or strings; they are rounded into
+    nullable integers. Foreign keys and lineage ids become nullable integers.
+    Natural-key columns missing from the input are added as NULL.
+    """
+    records = df[[c for c in df.columns if c in table_columns]].copy()
+    for col in key_columns:
+        if col not in records.columns:
+            records[col] = None
+    for col in INT_COLUMNS + ID_COLUMNS:
+        if col in records.columns:
+            records[col] = pd.to_numeric(records[col], errors='coerce').round().astype('Int64')
+    records['created_at'] = now
+    records['updated_at'] = now
+    return records
+
+
+def _to_rows(df: pd.DataFrame) -> list[dict]:
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
 
 @task
+@task_metrics("load")
 def load(df: pd.DataFrame):
     """
     Loads transformed Billion Ton data into the billion_ton2023_record table.
-    Ensures that Place records exist before loading.
+
+    Place rows are upserted in one statement first. Records are upserted in
+    pages on the table's natural key, so re-running a load updates rows in
+    place instead of duplicating them, and rows unchanged since the previous
+    load (see ``row_fingerprint``) are not sent at all.
     """
     try:
         logger = get_run_logger()
@@ -26,7 +76,10 @@ def load(df: pd.DataFrame):
     logger.info(f"Loading {len(df)} Billion Ton records...")
 
     # CRITICAL: Lazy import models inside the task to avoid Docker import hangs
-    from ca_biositing.datamodels.models.external_data.billion_ton import BillionTon2023Record
+    from ca_biositing.datamodels.models.external_data.billion_ton import (
+        BILLION_TON_NATURAL_KEY,
+        BillionTon2023Record,
+    )
     from ca_biositing.datamodels.models.places.place import Place
 
     engine = get_engine()
@@ -38,55 +91,37 @@ def load(df: pd.DataFrame):
                 # 1. Ensure Places exist (Billion Ton data has county info)
                 # Note: This is a simple implementation to avoid FK violations.
                 # Ideally, places would be pre-populated or managed by a dedicated ETL.
-                unique_geoids = df[['geoid', 'county', 'state_name']].drop_duplicates()
-
-                place_records = []
-                for _, row in unique_geoids.iterrows():
-                    place_records.append({
-                        'geoid': row['geoid'],
-                        'county_name': row['county'],
-                        'state_name': row['state_name'],
-                        'state_fips': row['geoid'][:2],
-                        'county_fips': row['geoid'][2:]
-                    })
-
-                if place_records:
-                    logger.info(f"Ensuring {len(place_records)} Place records exist...")
-                    place_stmt = insert(Place).values(place_records)
+                place_rows = build_place_rows(df)
+                if place_rows:
+                    logger.info(f"Ensuring {len(place_rows)} Place records exist...")
+                    place_stmt = insert(Place).values(place_rows)
                     place_stmt = place_stmt.on_conflict_do_nothing(index_elements=['geoid'])
                     session.execute(place_stmt)
                     session.flush()
 
-                # 2. Prepare records for bulk insert
+                # 2. Cast columns and keep only new or changed rows
                 table_columns = {c.name for c in BillionTon2023Record.__table__.columns if c.name != 'id'}
-                records = df.replace({np.nan: None}).to_dict('records')
-
-                etl_run_id = df['etl_run_id'].iloc[0] if 'etl_run_id' in df.columns else None
-                lineage_group_id = df['lineage_group_id'].iloc[0] if 'lineage_group_id' in df.columns else None
-
-                clean_records = []
-                for record in records:
-                    record['created_at'] = now
-                    record['updated_at'] = now
-                    if etl_run_id is not None:
-                        record['etl_run_id'] = int(etl_run_id)
-                    if lineage_group_id is not None:
-                        record['lineage_group_id'] = int(lineage_group_id)
-
-                    # Cast integer fields explicitly
-                    for int_col in ['production', 'btu_ton', 'production_energy_content']:
-                        if int_col in record and record[int_col] is not None:
-                            record[int_col] = int(float(record[int_col]))
-
-                    clean_record = {k: v for k, v in record.items() if k in table_columns}
-                    clean_records.append(clean_record)
-
-                if clean_records:
-                    stmt = insert(BillionTon2023Record).values(clean_records)
+                records = prepare_records(df, table_columns, BILLION_TON_NATURAL_KEY, now)
+                changes = diff_rows(session, BillionTon2023Record.__table__, records, BILLION_TON_NATURAL_KEY)
+
+                # 3. Paged upsert on the natural key
+                update_columns = [
+                    c for c in changes.rows.columns
+                    if c not in BILLION_TON_NATURAL_KEY and c != 'created_at'
+                ]
+                for start in range(0, len(changes.rows), PAGE_SIZE):
+                    page = _to_rows(changes.rows.iloc[start:start + PAGE_SIZE])
+                    stmt = insert(BillionTon2023Record).values(page)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=list(BILLION_TON_NATURAL_KEY),
+                        set_={c: stmt.excluded[c] for c in update_columns},
+                    )
                     session.execute(stmt)
-                    session.commit()
 
-        logger.info(f"Successfully loaded {len(clean_records)} records into BillionTon2023Record.")
+                save_changes(session, changes)
+                session.commit()
+
+        logger.info(f"Successfully loaded Billion Ton records ({changes.summary()}).")
 
     except Exception as e:
         logger.error(f"Failed to load Billion Ton records: {e}")
@@ -1,17 +1,36 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
+from typing import Dict, Optional
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
-from ca_biositing.pipeline.utils.geo_utils import get_geoid
+from ca_biositing.pipeline.utils.geo_utils import get_geoids
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column ``name`` as objects with missing values as None (all None when absent)."""
+    if name not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
+    values = df[name].astype(object)
+    return values.where(values.notna(), None)
+
 
 @task
-def load_field_sample(df: pd.DataFrame):
+@task_metrics("load")
+def load_field_sample(df: pd.DataFrame, address_ids: Optional[Dict[str, int]] = None):
     """
     Upserts FieldSample records into the database.
     Links sampling_location_id based on preserved location metadata.
+
+    Args:
+        df: transformed FieldSample records
+        address_ids: address_key -> LocationAddress id, as returned by
+            ``load_location_address``. Keys these samples reference that it
+            lacks (or all of them, when None) are looked up by their indexed
+            address_key in one query.
     """
     import logging
     import sys
@@ -32,55 +51,46 @@ def load_field_sample(df: pd.DataFrame):
 
     try:
         from ca_biositing.datamodels.models import FieldSample, LocationAddress, Place
+        from ca_biositing.datamodels.models.places.location_address import address_key
         now = datetime.now(timezone.utc)
         table_columns = {c.name for c in FieldSample.__table__.columns}
 
-        # Replace NaN with None for database compatibility
-        records = df.replace({np.nan: None}).to_dict(orient='records')
-
         with Session(get_engine()) as session:
-            # Prepare geography mapping and location mapping
+            # Resolve each sample's address key (geoid, street, city, zip)
             places = session.execute(select(Place.geoid, Place.county_name)).all()
             county_to_geoid = {p.county_name.lower(): p.geoid for p in places if p.county_name}
-
-            # Fetch all existing LocationAddress records into memory for bulk lookup
-            # Including ZIP in the lookup key as per plan
-            addresses = session.execute(
-                select(
-                    LocationAddress.id,
-                    LocationAddress.geography_id,
-                    LocationAddress.address_line1,
-                    LocationAddress.city,
-                    LocationAddress.zip
+            geoids = get_geoids(_column(df, 'sampling_location'), county_to_geoid)
+            location_keys = [
+                address_key(*parts)
+                for parts in zip(
+                    geoids,
+                    _column(df, 'sampling_street'),
+                    _column(df, 'sampling_city'),
+                    _column(df, 'sampling_zip'),
                 )
-            ).all()
-            addr_map = {}
-            for a in addresses:
-                key = (a.geography_id, a.address_line1, a.city, a.zip)
-                addr_map[key] = a.id
+            ]
+            address_ids = dict(address_ids or {})
+            missing_keys = set(location_keys) - address_ids.keys()
+            if missing_keys:
+                address_ids.update(session.execute(
+                    select(LocationAddress.address_key, LocationAddress.id)
+                    .where(LocationAddress.address_key.in_(missing_keys))
+                ).all())
+
+            # Replace NaN with None for database compatibility
+            records = df.replace({np.nan: None}).to_dict(orient='records')
 
             # Fetch all existing FieldSample names to avoid N+1 queries
             existing_samples = session.execute(select(FieldSample)).scalars().all()
             samples_map = {s.name: s for s in existing_samples}
 
-            for record in records:
+            for record, location_key in zip(records, location_keys):
                 name = record.get('name')
                 if not name:
                     logger.warning("Skipping record with missing 'name'.")
                     continue
 
-                # Determine sampling_location_id
-                geoid = get_geoid(record.get('sampling_location'), county_to_geoid)
-                addr1 = record.get('sampling_street')
-                city = record.get('sampling_city')
-                zip_code = record.get('sampling_zip')
-
-                # Standardize for lookup
-                addr1 = str(addr1).strip() if addr1 else None
-                city = str(city).strip() if city else None
-                zip_code = str(zip_code).strip() if zip_code else None
-
-                sampling_location_id = addr_map.get((geoid, addr1, city, zip_code))
+                sampling_location_id = address_ids.get(location_key)
 
                 # Check for existing record by name using in-memory map
                 existing_record = samples_map.get(name)
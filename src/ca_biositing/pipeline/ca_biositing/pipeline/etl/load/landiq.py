@@ -2,13 +2,16 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from geoalchemy2.elements import WKBElement, WKTElement
 from geoalchemy2.shape import to_shape
+import shapely
 from shapely import force_2d
 from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
 
 
 def _geom_to_wkt(geom) -> str:
@@ -17,6 +20,23 @@ def _geom_to_wkt(geom) -> str:
         return to_shape(geom).wkt
     return str(geom).strip()
 
+def simplify_geometry_tiers(geoms: list[str]) -> dict[str, list]:
+    """
+    Builds the pre-simplified geometry tiers for a list of WKT geometries.
+
+    Returns a mapping of tier column name (see GEOMETRY_TIERS) to a list of
+    WKT strings aligned with ``geoms``. Simplification is topology-preserving
+    and vectorized over the whole batch; unparseable or empty inputs yield None.
+    """
+    from ca_biositing.datamodels.models.external_data.polygon import GEOMETRY_TIERS
+
+    parsed = shapely.from_wkt(np.asarray(geoms, dtype=object), on_invalid="ignore")
+    tiers = {}
+    for column, tolerance in GEOMETRY_TIERS.items():
+        simplified = shapely.simplify(parsed, tolerance, preserve_topology=True)
+        tiers[column] = shapely.to_wkt(simplified, rounding_precision=-1).tolist()
+    return tiers
+
 def bulk_insert_polygons_ignore(session: Session, geoms: list[str], etl_run_id: str = None, lineage_group_id: str = None, dataset_id: int = None):
     """
     Inserts polygons in bulk, ignoring duplicates based on geom.
@@ -31,17 +51,20 @@ def bulk_insert_polygons_ignore(session: Session, geoms: list[str], etl_run_id:
     clean_etl_run_id = int(etl_run_id) if etl_run_id is not None else None
     clean_lineage_group_id = int(lineage_group_id) if lineage_group_id is not None else None
 
-    # Prepare data for bulk insert
+    # Prepare data for bulk insert, including the simplified geometry tiers
+    unique_geoms = [geom for geom in set(geoms) if geom]
+    tiers = simplify_geometry_tiers(unique_geoms)
     poly_data = [
         {
             'geom': geom,
+            **{column: values[i] for column, values in tiers.items()},
             'updated_at': now,
             'created_at': now,
             'etl_run_id': clean_etl_run_id,
             'lineage_group_id': clean_lineage_group_id,
             'dataset_id': dataset_id
         }
-        for geom in set(geoms) if geom
+        for i, geom in enumerate(unique_geoms)
     ]
 
     if not poly_data:
@@ -98,16 +121,28 @@ def fetch_polygon_ids_by_geoms(session: Session, geoms: list[str]) -> dict[str,
     print(f"DEBUG: Fetched {len(poly_map)} polygon IDs")
     return poly_map
 
-def bulk_upsert_landiq_records(session: Session, records: list[dict]) -> int:
+def bulk_upsert_landiq_records(session: Session, records: list[dict], logger=None) -> int:
     """
     Upserts LandiqRecords in bulk using ON CONFLICT (record_id) DO UPDATE.
-    Returns the number of records processed.
+
+    Records whose content is unchanged since the last load (see
+    ``row_fingerprint``) are skipped. Returns the number of records written.
     """
     if not records:
         return 0
+    if logger is None:
+        import logging
+        logger = logging.getLogger(__name__)
 
     from ca_biositing.datamodels.models import LandiqRecord
 
+    changes = diff_rows(session, LandiqRecord.__table__, pd.DataFrame(records), ['record_id'])
+    logger.info(f"LandiqRecord changes: {changes.summary()}")
+    records = changes.rows.replace({np.nan: None}).to_dict('records')
+    if not records:
+        save_changes(session, changes)
+        return 0
+
     stmt = insert(LandiqRecord).values(records)
 
     # Get columns to update (all except record_id and created_at)
@@ -124,6 +159,7 @@ def bulk_upsert_landiq_records(session: Session, records: list[dict]) -> int:
     print(f"DEBUG: Executing bulk LandiqRecord upsert for {len(records)} items")
     try:
         result = session.execute(stmt)
+        save_changes(session, changes)
         return result.rowcount
     except Exception as e:
         print(f"DEBUG: ERROR during LandiqRecord upsert: {str(e)}")
@@ -132,6 +168,7 @@ def bulk_upsert_landiq_records(session: Session, records: list[dict]) -> int:
         raise
 
 @task(persist_result=False)
+@task_metrics("load")
 def load_landiq_record(df: pd.DataFrame):
     """
     Upserts Land IQ records into the database using optimized bulk operations.
@@ -231,7 +268,7 @@ def load_landiq_record(df: pd.DataFrame):
                 records_to_upsert = prep_df[available_cols].replace({np.nan: None}).to_dict('records')
 
                 # 5. Bulk Upsert
-                upsert_count = bulk_upsert_landiq_records(session, records_to_upsert)
+                upsert_count = bulk_upsert_landiq_records(session, records_to_upsert, logger)
                 session.commit()
 
         logger.info(f"Successfully loaded {upsert_count} Land IQ records.")
@@ -1,17 +1,69 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
+from typing import Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from ca_biositing.pipeline.utils.engine import get_engine
-from ca_biositing.pipeline.utils.geo_utils import get_geoid
+from ca_biositing.pipeline.utils.geo_utils import get_geoids
+
+_CHUNK_SIZE = 1000
+
+
+def upsert_location_addresses(conn, records, now: datetime) -> Dict[str, int]:
+    """
+    Insert or update LocationAddress rows keyed on their stored ``address_key``.
+
+    Each chunk is one ``INSERT ... ON CONFLICT (address_key) DO UPDATE ...
+    RETURNING id, address_key`` statement, backed by the table's unique index.
+    Records sharing a key are collapsed first (the last one wins), since one
+    statement cannot update the same row twice.
+
+    Returns:
+        Dict mapping address_key to LocationAddress id.
+    """
+    from ca_biositing.datamodels.models import LocationAddress
+    from ca_biositing.datamodels.models.places.location_address import address_key
+
+    table = LocationAddress.__table__
+    writable = {c.name for c in table.columns if not c.primary_key and c.computed is None}
+
+    batch = {}
+    for record in records:
+        row = {k: v for k, v in record.items() if k in writable}
+        row['created_at'] = row.get('created_at') or now
+        row['updated_at'] = now
+        key = address_key(row.get('geography_id'), row.get('address_line1'), row.get('city'), row.get('zip'))
+        batch[key] = row
+
+    ids = {}
+    rows = list(batch.values())
+    for start in range(0, len(rows), _CHUNK_SIZE):
+        chunk = rows[start:start + _CHUNK_SIZE]
+        columns = sorted({c for row in chunk for c in row})
+        stmt = insert(table).values([{c: row.get(c) for c in columns} for row in chunk])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.address_key],
+            set_={c: stmt.excluded[c] for c in columns if c != 'created_at'},
+        )
+        ids.update(
+            (key, id_) for id_, key in conn.execute(stmt.returning(table.c.id, table.c.address_key))
+        )
+    return ids
+
 
 @task
-def load_location_address(df: pd.DataFrame):
+@task_metrics("load")
+def load_location_address(df: pd.DataFrame) -> Dict[str, int]:
     """
     Upserts LocationAddress records into the database.
     Maps generic location names (like counties) to geography_ids during load.
+
+    Returns:
+        Dict mapping each loaded address_key to its LocationAddress id, for
+        ``load_field_sample`` to link samples without reading the table again.
     """
     import logging
     import sys
@@ -26,71 +78,30 @@ def load_location_address(df: pd.DataFrame):
 
     if df is None or df.empty:
         logger.info("No LocationAddress record data to load.")
-        return
+        return {}
 
     logger.info(f"Upserting {len(df)} LocationAddress records...")
 
     try:
-        from ca_biositing.datamodels.models import LocationAddress, Place
+        from ca_biositing.datamodels.models import Place
         now = datetime.now(timezone.utc)
-        table_columns = {c.name for c in LocationAddress.__table__.columns}
 
-        # Replace NaN with None for database compatibility
-        records = df.replace({np.nan: None}).to_dict(orient='records')
-
-        with Session(get_engine()) as session:
+        with get_engine().begin() as conn:
             # Prepare geography mapping
-            places = session.execute(select(Place.geoid, Place.county_name)).all()
+            places = conn.execute(select(Place.geoid, Place.county_name)).all()
             county_to_geoid = {p.county_name.lower(): p.geoid for p in places if p.county_name}
 
-            # Fetch all existing LocationAddress records for bulk lookup
-            existing_addresses = session.execute(select(LocationAddress)).scalars().all()
-            addr_map = {}
-            for a in existing_addresses:
-                # Key includes ZIP as per plan
-                # Standardize existing record keys for lookup to ensure matching works
-                addr1_std = str(a.address_line1).strip().lower() if a.address_line1 else None
-                city_std = str(a.city).strip().lower() if a.city else None
-                zip_std = str(a.zip).strip() if a.zip else None
-                key = (a.geography_id, addr1_std, city_std, zip_std)
-                addr_map[key] = a
-
-            for record in records:
-                # Map raw sampling_location to geoid
-                raw_loc = record.get('sampling_location')
-                geography_id = get_geoid(raw_loc, county_to_geoid)
-
-                address_line1 = record.get('address_line1')
-                city = record.get('city')
-                zip_code = record.get('zip')
-
-                # Standardize for lookup
-                addr1_std = str(address_line1).strip().lower() if address_line1 else None
-                city_std = str(city).strip().lower() if city else None
-                zip_std = str(zip_code).strip() if zip_code else None
-
-                # Check for existing record using in-memory map
-                lookup_key = (geography_id, addr1_std, city_std, zip_std)
-                existing_record = addr_map.get(lookup_key)
-
-                clean_record = {k: v for k, v in record.items() if k in table_columns}
-                clean_record['geography_id'] = geography_id
-                clean_record['updated_at'] = now
-
-                if existing_record:
-                    # Update existing record
-                    for key, value in clean_record.items():
-                        if key not in ['id', 'created_at']:
-                            setattr(existing_record, key, value)
-                else:
-                    # Create new record
-                    if clean_record.get('created_at') is None:
-                        clean_record['created_at'] = now
-                    new_la = LocationAddress(**clean_record)
-                    session.add(new_la)
-
-            session.commit()
-        logger.info("Successfully upserted LocationAddress records.")
+            # Map raw sampling_location to geoid for the whole column at once
+            df = df.copy()
+            locations = df['sampling_location'] if 'sampling_location' in df.columns else pd.Series(None, index=df.index)
+            df['geography_id'] = get_geoids(locations, county_to_geoid)
+
+            # Replace NaN with None for database compatibility
+            records = df.replace({np.nan: None}).to_dict(orient='records')
+            address_ids = upsert_location_addresses(conn, records, now)
+
+        logger.info(f"Successfully upserted {len(address_ids)} LocationAddress records.")
+        return address_ids
     except Exception as e:
         logger.error(f"Failed to load LocationAddress records: {e}")
         import traceback
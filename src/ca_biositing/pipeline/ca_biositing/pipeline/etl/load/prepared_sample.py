@@ -2,11 +2,13 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
 
 @task
+@task_metrics("load")
 def load_prepared_sample(df: pd.DataFrame):
     """
     Upserts PreparedSample records into the database based on the 'name' column.
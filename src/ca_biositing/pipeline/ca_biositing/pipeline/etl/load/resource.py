@@ -2,11 +2,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.name_upsert import upsert_by_name
 
 @task
+@task_metrics("load")
 def load_resource(df: pd.DataFrame):
     """
     Upserts resource records into the database.
@@ -29,44 +30,15 @@ def load_resource(df: pd.DataFrame):
 
         now = datetime.now(timezone.utc)
 
-        # Filter columns to match the table schema
-        table_columns = {c.name for c in Resource.__table__.columns}
         records = df.replace({np.nan: None}).to_dict(orient='records')
 
+        # One prefetch by name_norm, one multi-row insert and one UPDATE for
+        # the changed rows (name_norm has a unique index).
         engine = get_engine()
         with engine.connect() as conn:
-            with Session(bind=conn) as session:
-                for i, record in enumerate(records):
-                    if i > 0 and i % 500 == 0:
-                        logger.info(f"Processed {i} records...")
-
-                    # Clean record to only include valid table columns
-                    clean_record = {k: v for k, v in record.items() if k in table_columns}
-
-                    # Handle timestamps
-                    clean_record['updated_at'] = now
-
-                    # Manual Check-and-Update (since 'name' lacks a unique constraint)
-                    # Use case-insensitive lookup to prevent duplicates
-                    from sqlalchemy import func
-                    existing_record = session.query(Resource).filter(
-                        func.lower(Resource.name) == clean_record['name'].lower()
-                    ).first()
-
-                    if existing_record:
-                        # Update existing record
-                        for key, value in clean_record.items():
-                            if key not in ['id', 'created_at']:
-                                setattr(existing_record, key, value)
-                    else:
-                        # Insert new record
-                        if clean_record.get('created_at') is None:
-                            clean_record['created_at'] = now
-                        new_resource = Resource(**clean_record)
-                        session.add(new_resource)
-
-                session.commit()
-        logger.info("Successfully upserted resource records.")
+            result = upsert_by_name(conn, Resource.__table__, records, now=now)
+            conn.commit()
+        logger.info(f"Successfully upserted resource records: {result.summary()}.")
     except Exception as e:
         logger.error(f"Failed to load resource records: {e}")
         raise
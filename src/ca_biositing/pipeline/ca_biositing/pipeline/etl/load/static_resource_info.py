@@ -3,6 +3,8 @@ import numpy as np
 from datetime import datetime, timezone
 from typing import Optional
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ca_biositing.pipeline.utils.engine import get_engine
 
@@ -37,6 +39,7 @@ def _get_place_metadata(geoid: str) -> dict:
 
 
 @task
+@task_metrics("load")
 def load_landiq_resource_mapping(df: pd.DataFrame):
     """
     Upserts LandiqResourceMapping records.
@@ -93,6 +96,7 @@ def load_landiq_resource_mapping(df: pd.DataFrame):
         raise
 
 @task
+@task_metrics("load")
 def load_resource_availability(df: pd.DataFrame):
     """
     Upserts ResourceAvailability records.
@@ -121,13 +125,13 @@ def load_resource_availability(df: pd.DataFrame):
             with Session(bind=conn) as session:
                 # Ensure referenced Place records exist before inserting availability.
                 # Place is a reference table with no dedicated ETL; records are
-                # upserted here so the FK constraint is satisfied.
+                # upserted here so the FK constraint is satisfied. Other flows
+                # insert Place rows concurrently, so skip geoids that already exist.
                 geoids = {r['geoid'] for r in records if r.get('geoid')}
-                for geoid in geoids:
-                    existing_place = session.query(Place).filter(Place.geoid == geoid).first()
-                    if not existing_place:
-                        place_data = _get_place_metadata(geoid)
-                        session.add(Place(**place_data))
+                for geoid in sorted(geoids):
+                    place_stmt = insert(Place).values(**_get_place_metadata(geoid))
+                    place_stmt = place_stmt.on_conflict_do_nothing(index_elements=['geoid'])
+                    if session.execute(place_stmt).rowcount:
                         logger.info(f"Created Place record for geoid={geoid}")
                 session.flush()
 
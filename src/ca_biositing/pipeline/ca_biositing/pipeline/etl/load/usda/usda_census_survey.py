@@ -9,12 +9,16 @@ from typing import Optional
 import pandas as pd
 from datetime import datetime, timezone
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from sqlalchemy import text, insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, save_changes
+from ca_biositing.pipeline.etl.load.analysis.observation import OBSERVATION_KEY
 
 
 @task
+@task_metrics("load")
 def load(
     transformed_df: Optional[pd.DataFrame],
     etl_run_id: int = None,
@@ -294,18 +298,6 @@ def _load_observations(engine, transformed_df, dataset_map, etl_run_id,
         for record_id, geoid, year, commodity_code in result:
             record_id_map[(geoid, year, commodity_code, 'SURVEY')] = record_id
 
-    # Level 1: Query existing observations
-    existing_obs_keys = set()
-    with engine.connect() as conn:
-        result = conn.execute(
-            text("""
-                SELECT record_id, record_type, parameter_id, unit_id
-                FROM observation
-            """)
-        )
-        for row in result:
-            existing_obs_keys.add((row[0], row[1], row[2], row[3]))
-
     # Build obs records with Level 2 dedup
     obs_records = []
     seen_obs_keys = set()
@@ -340,7 +332,7 @@ def _load_observations(engine, transformed_df, dataset_map, etl_run_id,
             continue
 
         obs_key = (parent_record_id, row['record_type'], parameter_id, unit_id)
-        if obs_key in existing_obs_keys or obs_key in seen_obs_keys:
+        if obs_key in seen_obs_keys:
             continue
 
         seen_obs_keys.add(obs_key)
@@ -372,14 +364,25 @@ def _load_observations(engine, transformed_df, dataset_map, etl_run_id,
 
         obs_records.append(obs_record)
 
+    # Level 1: compare with the stored row fingerprints so only new and
+    # changed observations are written (changed values used to be ignored).
     # Level 3: PostgreSQL ON CONFLICT
     if obs_records:
         with engine.begin() as conn:
-            stmt = pg_insert(Observation.__table__).values(obs_records).on_conflict_do_nothing(
-                index_elements=['record_id', 'record_type', 'parameter_id', 'unit_id']
-            )
-            result = conn.execute(stmt)
-            logger.info(f"  Inserted {result.rowcount} observations")
-            return result.rowcount
+            changes = diff_rows(conn, Observation.__table__, pd.DataFrame(obs_records), OBSERVATION_KEY)
+            rows = changes.rows.astype(object).where(changes.rows.notna(), None).to_dict('records')
+            if rows:
+                stmt = pg_insert(Observation.__table__).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=OBSERVATION_KEY,
+                    set_={
+                        c: stmt.excluded[c] for c in changes.rows.columns
+                        if c not in OBSERVATION_KEY and c != 'created_at'
+                    }
+                )
+                conn.execute(stmt)
+            save_changes(conn, changes)
+            logger.info(f"  Observations: {changes.summary()}")
+            return changes.inserted + changes.updated
 
     return 0
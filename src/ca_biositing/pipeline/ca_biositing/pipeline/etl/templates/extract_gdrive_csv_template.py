@@ -1,10 +1,12 @@
 from typing import Optional
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.gdrive_to_pandas import gdrive_to_df
 import os
 
 @task
+@task_metrics("extract")
 def extract(project_root: Optional[str] = None) -> Optional[pd.DataFrame]:
     """
     Extracts raw data from a .csv or .zip file.
@@ -1,11 +1,13 @@
 from typing import Optional
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.gdrive_to_pandas import gdrive_to_df
 import geopandas as gpd
 import os
 
 @task
+@task_metrics("extract")
 def extract(project_root: Optional[str] = None) -> Optional[gpd.GeoDataFrame]:
     """
     Extracts raw data from a .geojson file.
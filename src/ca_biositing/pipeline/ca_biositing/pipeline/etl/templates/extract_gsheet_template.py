@@ -14,6 +14,7 @@ To use this template:
 from typing import Optional
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from pipeline.utils.gsheet_to_pandas import gsheet_to_df
 
 # --- CONFIGURATION ---
@@ -28,6 +29,7 @@ CREDENTIALS_PATH = "credentials.json"
 
 
 @task
+@task_metrics("extract")
 def extract() -> Optional[pd.DataFrame]:
     """
     Extracts raw data from the specified Google Sheet worksheet.
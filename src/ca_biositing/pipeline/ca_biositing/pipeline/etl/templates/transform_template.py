@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
@@ -20,6 +21,7 @@ from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 EXTRACT_SOURCES: List[str] = ["source_one"]
 
 @task
+@task_metrics("transform")
 def transform(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: int = None,
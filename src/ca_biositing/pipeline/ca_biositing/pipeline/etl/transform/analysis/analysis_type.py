@@ -1,10 +1,12 @@
 from typing import Optional, Dict
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 EXTRACT_SOURCES = ["experiments"]
 
 @task
+@task_metrics("transform")
 def transform_analysis_analysis_type(data_sources: Dict[str, pd.DataFrame]) -> Optional[pd.DataFrame]:
     """
     Transforms the raw data to extract unique analysis names.
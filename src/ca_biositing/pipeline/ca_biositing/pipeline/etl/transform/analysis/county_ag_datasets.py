@@ -8,12 +8,14 @@ Each county ag report is treated as a distinct dataset.
 import pandas as pd
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 
 # List the names of the extract modules this transform depends on.
 EXTRACT_SOURCES: List[str] = ["pp_data_sources"]
 
 @task
+@task_metrics("transform")
 def transform_county_ag_datasets(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
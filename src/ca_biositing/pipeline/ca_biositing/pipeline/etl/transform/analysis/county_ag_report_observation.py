@@ -9,13 +9,26 @@ import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
+from ca_biositing.pipeline.etl.transform.analysis.county_ag_report_record import (
+    county_record_ids,
+    data_source_ids,
+    melt_county_metrics,
+)
 
 # List the names of the extract modules this transform depends on.
 EXTRACT_SOURCES: List[str] = ["pp_production_value"]
 
+# (parameter name, unit name) of each wide-column prefix
+OBSERVATION_METRICS = {
+    "prodn": ("production", "tons"),
+    "value_m": ("value", "$M"),
+}
+
 @task
+@task_metrics("transform")
 def transform_county_ag_report_observations(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -57,7 +70,9 @@ def transform_county_ag_report_observations(
     df_metrics = cleaning_mod.standard_clean(df_metrics)
 
     # 3. Melting Wide Format to Long Format
-    counties = ["Merced", "San Joaquin", "Stanislaus"]
+    # One observation per non-empty prodn_<county> / value_m_<county> cell,
+    # for every county column present in the sheet.
+    df_long = melt_county_metrics(df_metrics)
 
     # Mapping for dataset_id (lookup from database)
     from ca_biositing.pipeline.utils.engine import get_engine
@@ -68,78 +83,24 @@ def transform_county_ag_report_observations(
         res = conn.execute(text("SELECT id, source_id FROM dataset WHERE record_type = 'county_ag_report_record'"))
         dataset_map = {row[1]: row[0] for row in res.fetchall() if row[1] is not None}
 
-    # Data source mapping logic (same as record transform)
-    county_ds_map = {
-        ("merced", 2023): 1,
-        ("san joaquin", 2023): 2,
-        ("stanislaus", 2023): 3,
-        ("merced", 2024): 5,
-        ("san joaquin", 2024): 6,
-        ("stanislaus", 2024): 7,
-    }
-
-    observations = []
-
-    for _, row in df_metrics.iterrows():
-        prod_nbr = row.get("prod_nbr")
-        data_year = row.get("data_year")
-
-        if pd.isna(prod_nbr) or str(prod_nbr).strip() == "" or pd.isna(data_year):
-            continue
-
-        for county in counties:
-            county_slug = county.lower().replace(' ', '')
-
-            # Parent record_id matches the one generated in county_ag_report_record transform
-            parent_record_id = f"{prod_nbr}-{county_slug}-{int(data_year)}"
-
-            # Determine dataset_id
-            ds_id = county_ds_map.get((county_slug, int(data_year)))
-            dataset_id = dataset_map.get(ds_id)
-
-            # --- Production Observation ---
-            prodn_col = f"prodn_{county_slug}"
-            prodn_val = row.get(prodn_col)
-
-            # Clean numeric value (handle commas etc)
-            if pd.notna(prodn_val) and str(prodn_val).strip() != "":
-                try:
-                    # Remove commas and convert to float
-                    val_str = str(prodn_val).replace(',', '').strip()
-                    if val_str:
-                        observations.append({
-                            "record_id": parent_record_id,
-                            "record_type": "county_ag_report_record",
-                            "parameter_name": "production",
-                            "unit_name": "tons",
-                            "value": float(val_str),
-                            "dataset_id": dataset_id,
-                            "note": row.get("prodn_value_note")
-                        })
-                except ValueError:
-                    logger.warning(f"Could not convert production value '{prodn_val}' for {parent_record_id}")
-
-            # --- Value Observation ---
-            value_col = f"value_m_{county_slug}"
-            value_val = row.get(value_col)
-
-            if pd.notna(value_val) and str(value_val).strip() != "":
-                try:
-                    val_str = str(value_val).replace(',', '').strip()
-                    if val_str:
-                        observations.append({
-                            "record_id": parent_record_id,
-                            "record_type": "county_ag_report_record",
-                            "parameter_name": "value",
-                            "unit_name": "$M",
-                            "value": float(val_str),
-                            "dataset_id": dataset_id,
-                            "note": row.get("prodn_value_note")
-                        })
-                except ValueError:
-                    logger.warning(f"Could not convert value '{value_val}' for {parent_record_id}")
-
-    df_obs = pd.DataFrame(observations)
+    unparsed = df_long[df_long["value"].isna()]
+    for _, row in unparsed.head(20).iterrows():
+        logger.warning(f"Could not convert {row['metric']} value '{row['raw']}' for {row['prod_nbr']}-{row['county']}-{row['data_year']}")
+    if len(unparsed) > 20:
+        logger.warning(f"... {len(unparsed) - 20} more unconvertible values skipped.")
+    df_long = df_long[df_long["value"].notna()]
+
+    metric = df_long["metric"].map(OBSERVATION_METRICS)
+    df_obs = pd.DataFrame({
+        # Parent record_id matches the one generated in county_ag_report_record transform
+        "record_id": county_record_ids(df_long),
+        "record_type": "county_ag_report_record",
+        "parameter_name": metric.str[0],
+        "unit_name": metric.str[1],
+        "value": df_long["value"].astype(float),
+        "dataset_id": data_source_ids(df_long).map(dataset_map),
+        "note": df_long["prodn_value_note"],
+    })
 
     if df_obs.empty:
         logger.warning("No observations found after melting wide metrics.")
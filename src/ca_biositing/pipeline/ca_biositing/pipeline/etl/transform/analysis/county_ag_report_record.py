@@ -4,18 +4,112 @@ ETL Transform for County Ag Report Records.
 Transforms raw county ag report data from three worksheets into CountyAgReportRecord format.
 """
 
+import re
+
 import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
-from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 
 # List the names of the extract modules this transform depends on.
 EXTRACT_SOURCES: List[str] = ["primary_products", "pp_production_value"]
 
+# Sheet 07.7a is wide: one ``Prodn_<County>`` and one ``Value_$M_<County>``
+# column per county, which standard_clean turns into prodn_<county> and
+# value_$m_<county> (janitor keeps the "$"; value_m_<county> is accepted too).
+# The counties processed are whichever appear in the sheet.
+METRIC_COLUMN_PATTERN = r"^(prodn|value_\$?m)_([a-z_]+)$"
+ID_COLUMNS = ["prod_nbr", "data_year", "prodn_value_note"]
+
+# California county GEOIDs keyed by county slug (lowercase, no spaces).
+_CA_COUNTIES = [
+    "alameda", "alpine", "amador", "butte", "calaveras", "colusa", "contra costa",
+    "del norte", "el dorado", "fresno", "glenn", "humboldt", "imperial", "inyo",
+    "kern", "kings", "lake", "lassen", "los angeles", "madera", "marin", "mariposa",
+    "mendocino", "merced", "modoc", "mono", "monterey", "napa", "nevada", "orange",
+    "placer", "plumas", "riverside", "sacramento", "san benito", "san bernardino",
+    "san diego", "san francisco", "san joaquin", "san luis obispo", "san mateo",
+    "santa barbara", "santa clara", "santa cruz", "shasta", "sierra", "siskiyou",
+    "solano", "sonoma", "stanislaus", "sutter", "tehama", "trinity", "tulare",
+    "tuolumne", "ventura", "yolo", "yuba",
+]
+COUNTY_GEOIDS: Dict[str, str] = {
+    name.replace(" ", ""): f"06{2 * i + 1:03d}" for i, name in enumerate(_CA_COUNTIES)
+}
+
+# Sheet 07.7b index of the report each county/year was taken from
+# 001: Merced 2023, 002: SJ 2023, 003: Stan 2023
+# 005: Merced 2024, 006: SJ 2024, 007: Stan 2024
+DATA_SOURCE_BY_COUNTY_YEAR: Dict[tuple, int] = {
+    ("merced", 2023): 1,
+    ("sanjoaquin", 2023): 2,
+    ("stanislaus", 2023): 3,
+    ("merced", 2024): 5,
+    ("sanjoaquin", 2024): 6,
+    ("stanislaus", 2024): 7,
+}
+
+_BOOLEAN_VALUES = {
+    "yes": True, "true": True, "checked": True, "x": True,
+    "no": False, "false": False, "unchecked": False, "": False,
+}
+
+
+def melt_county_metrics(df_metrics: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reshape cleaned Sheet 07.7a from one column per county and metric to one row per cell.
+
+    Rows without a product number or year are dropped, as are empty cells.
+    Returns prod_nbr, data_year (int), prodn_value_note, county (slug),
+    metric ("prodn" or "value_m"), raw (the cell text) and value (the cell
+    parsed as a number, NA if it does not parse), ordered row by row.
+    """
+    metric_columns = [
+        c for c in df_metrics.columns
+        if c not in ID_COLUMNS and re.match(METRIC_COLUMN_PATTERN, c)
+    ]
+    df = df_metrics.reindex(columns=ID_COLUMNS + metric_columns).copy()
+    df["data_year"] = pd.to_numeric(df["data_year"], errors="coerce")
+    has_product = df["prod_nbr"].notna() & (df["prod_nbr"].astype("string").str.strip() != "")
+    df = df[has_product & df["data_year"].notna()]
+    df["data_year"] = df["data_year"].astype(int)
+    df["_row"] = np.arange(len(df))
+
+    long = df.melt(
+        id_vars=ID_COLUMNS + ["_row"], value_vars=metric_columns,
+        var_name="column", value_name="raw",
+    )
+    parts = long["column"].str.extract(METRIC_COLUMN_PATTERN)
+    long["metric"] = parts[0].str.replace("$", "", regex=False)
+    long["county"] = parts[1].str.replace("_", "", regex=False)
+
+    raw = long["raw"].astype("string").str.strip()
+    long = long[raw.notna() & (raw != "")].copy()
+    long["raw"] = raw[long.index]
+    long["value"] = pd.to_numeric(long["raw"].str.replace(",", "", regex=False), errors="coerce")
+
+    long = long.sort_values("_row", kind="stable")
+    return long.drop(columns=["column", "_row"]).reset_index(drop=True)
+
+
+def county_record_ids(df: pd.DataFrame) -> pd.Series:
+    """Record id ``{prod_nbr}-{county_slug}-{year}`` of each melted row."""
+    return (
+        df["prod_nbr"].astype(str) + "-" + df["county"] + "-" + df["data_year"].astype(str)
+    )
+
+
+def data_source_ids(df: pd.DataFrame) -> pd.Series:
+    """Sheet 07.7b data source index of each melted row, NA if unknown."""
+    keys = pd.Series(list(zip(df["county"], df["data_year"])), index=df.index)
+    return keys.map(DATA_SOURCE_BY_COUNTY_YEAR).astype("Int64")
+
+
 @task
+@task_metrics("transform")
 def transform_county_ag_report_records(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -60,49 +154,23 @@ def transform_county_ag_report_records(
     df_metrics = cleaning_mod.standard_clean(df_metrics)
 
     # 3. Melting Sheet 07.7a (Metrics) to Long Format for Records
-    # We need to create one record per product-county-year combination.
+    # One record per product-county-year that has a production or value cell.
     # The production and value will be observations, but the base record is for the combination.
-
-    # Counties to process
-    counties = ["Merced", "San Joaquin", "Stanislaus"]
-
-    # We only want to melt columns that indicate presence in a county.
-    # Looking at the wide format analysis, we have Prodn_Merced, Value_$M_Merced etc.
-    # If any of these have values, it means a record exists for that county/year/product.
-
-    melted_records = []
-
-    for _, row in df_metrics.iterrows():
-        prod_nbr = row.get("prod_nbr")
-        data_year = row.get("data_year")
-
-        if pd.isna(prod_nbr) or str(prod_nbr).strip() == "" or pd.isna(data_year):
-            continue
-
-        for county in counties:
-            # Check if there is any data for this county (production or value)
-            prodn_col = f"prodn_{county.lower().replace(' ', '')}"
-            value_col = f"value_m_{county.lower().replace(' ', '')}"
-
-            # Note: standard_clean converts Value_$M_Merced to value_m_merced
-            has_prodn = pd.notna(row.get(prodn_col)) and row.get(prodn_col) != ""
-            has_value = pd.notna(row.get(value_col)) and row.get(value_col) != ""
-
-            if has_prodn or has_value:
-                record = {
-                    "prod_nbr": prod_nbr,
-                    "data_year": int(data_year),
-                    "county": county,
-                    "prodn_value_note": row.get("prodn_value_note")
-                }
-                melted_records.append(record)
-
-    df_melted = pd.DataFrame(melted_records)
+    df_long = melt_county_metrics(df_metrics)
+    df_melted = df_long.drop_duplicates(["prod_nbr", "data_year", "county"])[
+        ["prod_nbr", "data_year", "county", "prodn_value_note"]
+    ]
 
     if df_melted.empty:
         logger.warning("No records found after melting wide format.")
         return pd.DataFrame()
 
+    counties = sorted(df_melted["county"].unique())
+    unknown = [c for c in counties if c not in COUNTY_GEOIDS]
+    if unknown:
+        logger.warning(f"No GEOID known for counties {unknown}; their records get no geoid.")
+    logger.info(f"Melted {len(df_melted)} records across counties {counties}.")
+
     # 4. Join with Metadata from Sheet 07.7
     # Match on prod_nbr
     df_combined = df_melted.merge(df_meta, on="prod_nbr", how="left")
@@ -110,59 +178,22 @@ def transform_county_ag_report_records(
     # 5. Type Coercion
     # Convert Produced_NSJV / Processed_NSJV to boolean
     # standard_clean makes them produced_nsjv / processed_nsjv
-    df_combined = coercion_mod.coerce_columns(
-        df_combined,
-        int_cols=["data_year"],
-        float_cols=[],
-        datetime_cols=[]
-    )
-
-    # Manual boolean coercion for Checkboxes/Yes/No
     for col in ["produced_nsjv", "processed_nsjv"]:
         if col in df_combined.columns:
-            def coerce_bool(val):
-                if pd.isna(val):
-                    return None
-                s = str(val).strip().lower()
-                if s in ['yes', 'true', 'checked', 'x']:
-                    return True
-                if s in ['no', 'false', 'unchecked', '']:
-                    return False
-                return None
-            df_combined[col] = df_combined[col].apply(coerce_bool)
+            values = df_combined[col].astype("string").str.strip().str.lower()
+            flags = values.map(_BOOLEAN_VALUES)
+            df_combined[col] = flags.astype(object).where(flags.notna(), None)
 
     # 6. Record ID Generation
     # Format: {prod_nbr}-{county_slug}-{year}
-    df_combined["record_id"] = df_combined.apply(
-        lambda x: f"{x['prod_nbr']}-{x['county'].lower().replace(' ', '')}-{x['data_year']}",
-        axis=1
-    )
+    df_combined["record_id"] = county_record_ids(df_combined)
 
     # 7. Data Source ID Mapping
-    # 001: Merced 2023, 002: SJ 2023, 003: Stan 2023
-    # 005: Merced 2024, 006: SJ 2024, 007: Stan 2024
-    county_ds_map = {
-        ("merced", 2023): 1,
-        ("san joaquin", 2023): 2,
-        ("stanislaus", 2023): 3,
-        ("merced", 2024): 5,
-        ("san joaquin", 2024): 6,
-        ("stanislaus", 2024): 7,
-    }
-
-    def get_ds_id(row):
-        return county_ds_map.get((row["county"].lower(), row["data_year"]))
-
-    df_combined["data_source_id"] = df_combined.apply(get_ds_id, axis=1)
+    df_combined["data_source_id"] = data_source_ids(df_combined)
 
     # 8. Normalization (Foreign Keys)
     # Institutionalize geoid mapping based on county (lowercase to match database convention)
-    geoid_map = {
-        "merced": "06047",
-        "san joaquin": "06077",
-        "stanislaus": "06099"
-    }
-    df_combined["geoid"] = df_combined["county"].str.lower().map(geoid_map)
+    df_combined["geoid"] = df_combined["county"].map(COUNTY_GEOIDS)
 
     # For PrimaryAgProduct, we still try normalize_dataframes
     normalize_columns = {
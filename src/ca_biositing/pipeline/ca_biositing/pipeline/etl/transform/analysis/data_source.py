@@ -7,6 +7,7 @@ Transforms raw data from Sheet 07.7b into DataSource format.
 import pandas as pd
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 
@@ -14,6 +15,7 @@ from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_
 EXTRACT_SOURCES: List[str] = ["pp_data_sources"]
 
 @task
+@task_metrics("transform")
 def transform_data_sources(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
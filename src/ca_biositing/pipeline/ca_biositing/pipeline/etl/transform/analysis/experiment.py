@@ -1,10 +1,12 @@
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from typing import List, Dict, Any, Optional
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 
 @task
+@task_metrics("transform")
 def transform_experiment(
     raw_dfs: List[pd.DataFrame],
     column_mapping: Optional[Dict[str, str | List[str]]] = None,
@@ -3,11 +3,13 @@ IcpRecord transformation module.
 """
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 
 @task
+@task_metrics("transform")
 def transform_icp_record(
     raw_df: pd.DataFrame,
     etl_run_id: str | None = None,
@@ -3,6 +3,7 @@ General observation transformation module.
 """
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from typing import List
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
@@ -10,6 +11,7 @@ from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 # from ca_biositing.datamodels.models import *
 
 @task
+@task_metrics("transform")
 def transform_observation(
     raw_dfs: List[pd.DataFrame],
     etl_run_id: str | None = None,
@@ -4,8 +4,10 @@ from decimal import Decimal, InvalidOperation
 import re
 from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 from prefect import get_run_logger, task
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
@@ -53,20 +55,16 @@ def _normalize_parameter_name(value: Any) -> str:
     return text
 
 
-def _normalize_use_case_name(value: Any) -> str:
-    if value is None or pd.isna(value):
-        return ""
-    text = str(value).strip().lower()
-    text = re.sub(r"\s+", " ", text)
-    return text
+def _normalize_use_case_names(values: pd.Series) -> pd.Series:
+    """Trimmed, lowercased use case names with single spaces; missing names become ""."""
+    text = values.astype("string").str.strip().str.lower().str.replace(r"\s+", " ", regex=True)
+    return text.fillna("").astype(object)
 
 
-def _canonicalize_resource_name(value: Any) -> Any:
-    if value is None or pd.isna(value):
-        return value
-    text = str(value).strip().lower()
-    text = re.sub(r"\s+", " ", text)
-    return _RESOURCE_CANONICAL_MAP.get(text, text)
+def _canonicalize_resource_names(values: pd.Series) -> pd.Series:
+    text = values.astype("string").str.strip().str.lower().str.replace(r"\s+", " ", regex=True)
+    text = text.replace(_RESOURCE_CANONICAL_MAP)
+    return text.astype(object).where(values.notna(), values)
 
 
 def _forward_fill_qualitative_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -98,104 +96,152 @@ def _parse_bool(value: Any) -> Optional[bool]:
     return None
 
 
+_TREND_VALUES = {
+    **dict.fromkeys(["up", "increase", "increasing", "rising"], Decimal("1")),
+    **dict.fromkeys(["down", "decrease", "decreasing", "falling"], Decimal("-1")),
+    **dict.fromkeys(["steady", "stable", "flat", "no change"], Decimal("0")),
+}
+
+
 def _map_trend_to_numeric(value: Any) -> Optional[Decimal]:
     if value is None or pd.isna(value):
         return None
-    text = str(value).strip().lower()
-    if text in {"up", "increase", "increasing", "rising"}:
-        return Decimal("1")
-    if text in {"down", "decrease", "decreasing", "falling"}:
-        return Decimal("-1")
-    if text in {"steady", "stable", "flat", "no change"}:
-        return Decimal("0")
-    return None
+    return _TREND_VALUES.get(str(value).strip().lower())
 
 
-def _to_decimal(value: str) -> Optional[Decimal]:
-    try:
-        return Decimal(value)
-    except (InvalidOperation, ValueError):
-        return None
+_DECIMAL_PATTERN = r"[+-]?\d+(?:\.\d+)?"
+_DASH_RANGE_PATTERN = r"^\s*(.+?)\s*-\s*(.+?)\s*$"
+_TO_SEPARATOR = r"(?i)\bto\b"
 
+# Cells written as "($0-$40)" are recorded as -40 to -10 USD/ton.
+_SPECIAL_RANGES = {"($0-$40)": (Decimal("-40"), Decimal("-10"))}
 
-def _parse_decimal_token(raw_token: str) -> Optional[Decimal]:
-    token = str(raw_token).strip()
-    if token == "":
-        return None
 
-    token = token.replace(",", "").replace("$", "").replace("%", "").strip()
-    if token == "":
-        return None
+def _parse_decimal_tokens(tokens: pd.Series) -> pd.Series:
+    """
+    Parse each token as a Decimal, or None.
 
-    is_accounting_negative = token.startswith("(") and token.endswith(")")
-    if is_accounting_negative:
-        token = token[1:-1].strip()
+    Commas, ``$`` and ``%`` are ignored and ``(n)`` is accounting notation
+    for ``-n``.
+    """
+    token = tokens.astype("string").str.replace(r"[,$%]", "", regex=True).str.strip()
+    accounting = (token.str.startswith("(") & token.str.endswith(")")).fillna(False)
+    token = token.where(~accounting, token.str.slice(1, -1).str.strip())
+    valid = token.str.fullmatch(_DECIMAL_PATTERN).fillna(False).astype(bool)
 
-    if token == "":
-        return None
+    parsed = pd.Series([None] * len(tokens), index=tokens.index, dtype=object)
+    parsed[valid] = token[valid].map(Decimal)
+    negate = valid & accounting & (parsed[valid] > 0).reindex(tokens.index, fill_value=False).astype(bool)
+    parsed[negate] = -parsed[negate]
+    return parsed
 
-    if not re.fullmatch(r"[+-]?\d+(?:\.\d+)?", token):
-        return None
 
-    parsed = _to_decimal(token)
-    if parsed is None:
-        return None
+def parse_decimal_ranges(values: pd.Series) -> pd.DataFrame:
+    """
+    Parse range cells such as ``"10-20"``, ``"$5 to $8"`` or ``"($10)"`` into low/high Decimals.
 
-    if is_accounting_negative and parsed > 0:
-        return -parsed
-    return parsed
+    A single number gives ``low == high``; reversed bounds are swapped. Cells
+    that are empty or do not parse give None for both.
+    """
+    text = values.astype("string").str.strip()
+    cleaned = text.str.replace(",", "", regex=False).str.replace("$", "", regex=False).str.strip()
+    normalized = cleaned.str.replace("[–—]", "-", regex=True)
+
+    # "a to b" first, then "a - b", else a single number
+    to_parts = normalized.str.split(_TO_SEPARATOR, regex=True)
+    is_to = (to_parts.str.len() == 2).fillna(False).astype(bool)
+    dash = normalized.str.extract(_DASH_RANGE_PATTERN)
+    is_dash = ~is_to & dash[0].notna()
+
+    low_token = normalized.where(~is_to, to_parts.str[0]).where(~is_dash, dash[0])
+    high_token = normalized.where(~is_to, to_parts.str[1]).where(~is_dash, dash[1])
+    low = _parse_decimal_tokens(low_token)
+    high = _parse_decimal_tokens(high_token)
+
+    is_range = is_to | is_dash
+    incomplete = is_range & (low.isna() | high.isna())
+    low[incomplete] = None
+    high[incomplete] = None
+    swap = (is_range & ~incomplete).to_numpy(dtype=bool)
+    swap[swap] = np.asarray(low[swap] > high[swap], dtype=bool)
+    low[swap], high[swap] = high[swap].to_numpy(), low[swap].to_numpy()
+
+    compact = text.str.replace(",", "", regex=False).str.replace(" ", "", regex=False).str.lower()
+    compact_cleaned = cleaned.str.replace(" ", "", regex=False).str.lower()
+    for pattern, (special_low, special_high) in _SPECIAL_RANGES.items():
+        special = ((compact == pattern) | (compact_cleaned == pattern.replace("$", ""))).fillna(False).astype(bool)
+        low[special] = special_low
+        high[special] = special_high
+
+    return pd.DataFrame({"low": low, "high": high}, index=values.index)
 
 
 def parse_decimal_range(raw: Any) -> tuple[Optional[Decimal], Optional[Decimal]]:
     if raw is None or pd.isna(raw):
         return None, None
+    parsed = parse_decimal_ranges(pd.Series([raw], dtype=object)).iloc[0]
+    return parsed["low"], parsed["high"]
 
-    text = str(raw).strip()
-    if text == "":
-        return None, None
 
-    compact_original = text.replace(",", "").replace(" ", "").lower()
-    cleaned = text.replace(",", "").replace("$", "").strip()
-
-    if compact_original == "($0-$40)" or cleaned.replace(" ", "").lower() == "(0-40)":
-        return Decimal("-40"), Decimal("-10")
-
-    normalized = cleaned.replace("–", "-").replace("—", "-")
-    to_split = re.split(r"(?i)\bto\b", normalized)
-    if len(to_split) == 2:
-        low = _parse_decimal_token(to_split[0])
-        high = _parse_decimal_token(to_split[1])
-        if low is None or high is None:
-            return None, None
-        return (low, high) if low <= high else (high, low)
-
-    dash_split = re.match(r"^\s*(.+?)\s*-\s*(.+?)\s*$", normalized)
-    if dash_split:
-        low = _parse_decimal_token(dash_split.group(1))
-        high = _parse_decimal_token(dash_split.group(2))
-        if low is None or high is None:
-            return None, None
-        return (low, high) if low <= high else (high, low)
-
-    single = _parse_decimal_token(normalized)
-    if single is None:
-        return None, None
-    return single, single
+def _end_use_record_keys(resource: Optional[pd.Series], use_case: Optional[pd.Series], index: pd.Index) -> pd.Series:
+    """``{resource}|{use_case}`` keys, lowercased; missing parts are empty."""
+    def _part(values: Optional[pd.Series]) -> pd.Series:
+        if values is None:
+            return pd.Series("", index=index, dtype=object)
+        return values.astype("string").str.strip().str.lower().fillna("").astype(object)
 
+    return _part(resource) + "|" + _part(use_case)
 
-def _build_end_use_record_key(resource: Any, use_case: Any) -> str:
-    resource_key = ""
-    if resource is not None and not pd.isna(resource):
-        resource_key = str(resource).strip().lower()
 
-    use_case_key = ""
-    if use_case is not None and not pd.isna(use_case):
-        use_case_key = str(use_case).strip().lower()
+def _use_case_map(data_sources: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    ``key -> use_case`` pairs from the use case enum sheet.
 
-    return f"{resource_key}|{use_case_key}"
+    Each canonical name maps to itself and its original spelling maps to it;
+    later rows win, as in the sheet.
+    """
+    empty = pd.DataFrame(columns=["key", "canonical"])
+    enum_df = data_sources.get("use_case_enum")
+    if not isinstance(enum_df, pd.DataFrame) or enum_df.empty:
+        return empty
+    cleaned_enum = cleaning_mod.standard_clean(enum_df.copy())
+    if cleaned_enum is None or cleaned_enum.empty:
+        return empty
+    original_col = _first_existing_column(
+        cleaned_enum,
+        [
+            "original_set_of_unique_use_case_names",
+            "original set of unique use case names",
+            "original_use_case_name",
+            "original_use_case",
+            "use_case",
+        ],
+    )
+    canonical_col = _first_existing_column(cleaned_enum, ["use_case_name"])
+    if canonical_col is None:
+        return empty
+
+    canonical = _normalize_use_case_names(cleaned_enum[canonical_col]).reset_index(drop=True)
+    pairs = [pd.DataFrame({"key": canonical, "canonical": canonical, "order": 2 * canonical.index})]
+    if original_col:
+        original = _normalize_use_case_names(cleaned_enum[original_col]).reset_index(drop=True)
+        pairs.append(pd.DataFrame({"key": original, "canonical": canonical, "order": 2 * canonical.index + 1}))
+    mapping = pd.concat(pairs).sort_values("order", kind="stable")
+    mapping = mapping[(mapping["canonical"] != "") & (mapping["key"] != "")]
+    return mapping.drop_duplicates("key", keep="last")[["key", "canonical"]]
+
+
+def _resolve_use_cases(values: pd.Series, use_case_map: pd.DataFrame) -> pd.Series:
+    """Normalize use case names and replace known spellings with their canonical name."""
+    normalized = _normalize_use_case_names(values)
+    resolved = pd.DataFrame({"key": normalized.to_numpy()}).merge(use_case_map, on="key", how="left")
+    return pd.Series(
+        resolved["canonical"].fillna(resolved["key"]).to_numpy(), index=values.index, dtype=object
+    )
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_data_source(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -258,6 +304,7 @@ def transform_qualitative_data_source(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_parameters(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -319,6 +366,7 @@ def transform_qualitative_parameters(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_use_case_enum(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -344,7 +392,7 @@ def transform_qualitative_use_case_enum(
     if use_case_name_col != "name":
         cleaned = cleaned.rename(columns={use_case_name_col: "name"})
 
-    cleaned["name"] = cleaned["name"].apply(_normalize_use_case_name)
+    cleaned["name"] = _normalize_use_case_names(cleaned["name"])
     cleaned = cleaned[cleaned["name"].astype(str).str.strip() != ""].copy()
     cleaned = cleaned.drop_duplicates(subset=["name"], keep="first")
     cleaned["use_case_dedupe_key"] = cleaned["name"].astype(str).str.strip().str.lower()
@@ -366,6 +414,7 @@ def transform_qualitative_use_case_enum(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_provenance_payloads(
     etl_run_id: str | None = None,
     lineage_group_id: str | None = None,
@@ -429,6 +478,7 @@ def transform_qualitative_provenance_payloads(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_records(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -441,38 +491,6 @@ def transform_qualitative_records(
 
     from ca_biositing.datamodels.models import Resource, UseCase
 
-    def _build_use_case_map() -> dict[str, str]:
-        enum_df = data_sources.get("use_case_enum")
-        if not isinstance(enum_df, pd.DataFrame) or enum_df.empty:
-            return {}
-        cleaned_enum = cleaning_mod.standard_clean(enum_df.copy())
-        if cleaned_enum is None or cleaned_enum.empty:
-            return {}
-        original_col = _first_existing_column(
-            cleaned_enum,
-            [
-                "original_set_of_unique_use_case_names",
-                "original set of unique use case names",
-                "original_use_case_name",
-                "original_use_case",
-                "use_case",
-            ],
-        )
-        canonical_col = _first_existing_column(cleaned_enum, ["use_case_name"])
-        if canonical_col is None:
-            return {}
-        mapping: dict[str, str] = {}
-        for _, row in cleaned_enum.iterrows():
-            canonical = _normalize_use_case_name(row.get(canonical_col))
-            if canonical == "":
-                continue
-            mapping[canonical] = canonical
-            if original_col:
-                original = _normalize_use_case_name(row.get(original_col))
-                if original:
-                    mapping[original] = canonical
-        return mapping
-
     raw_df = data_sources["qualitative_data"].copy()
     if raw_df.empty:
         return {
@@ -500,14 +518,13 @@ def transform_qualitative_records(
         cleaned = cleaned.rename(columns={use_case_col: "use_case"})
     cleaned = _forward_fill_qualitative_columns(cleaned)
     if "resource" in cleaned.columns:
-        cleaned["resource"] = cleaned["resource"].apply(_canonicalize_resource_name)
-
-    use_case_map = _build_use_case_map()
-    if use_case_map and "use_case" in cleaned.columns:
-        cleaned["use_case"] = cleaned["use_case"].apply(lambda value: use_case_map.get(_normalize_use_case_name(value), _normalize_use_case_name(value)))
-    cleaned["end_use_record_key"] = cleaned.apply(
-        lambda row: _build_end_use_record_key(row.get("resource"), row.get("use_case")),
-        axis=1,
+        cleaned["resource"] = _canonicalize_resource_names(cleaned["resource"])
+
+    use_case_map = _use_case_map(data_sources)
+    if not use_case_map.empty and "use_case" in cleaned.columns:
+        cleaned["use_case"] = _resolve_use_cases(cleaned["use_case"], use_case_map)
+    cleaned["end_use_record_key"] = _end_use_record_keys(
+        cleaned.get("resource"), cleaned.get("use_case"), cleaned.index
     )
     if storage_col and storage_col != "storage_description":
         cleaned = cleaned.rename(columns={storage_col: "storage_description"})
@@ -521,9 +538,8 @@ def transform_qualitative_records(
     normalized = normalize_dataframes(cleaned, normalize_columns)[0]
 
     if "end_use_record_key" not in normalized.columns:
-        normalized["end_use_record_key"] = normalized.apply(
-            lambda row: _build_end_use_record_key(row.get("resource"), row.get("use_case")),
-            axis=1,
+        normalized["end_use_record_key"] = _end_use_record_keys(
+            normalized.get("resource"), normalized.get("use_case"), normalized.index
         )
     normalized["etl_run_id"] = etl_run_id
     normalized["lineage_group_id"] = lineage_group_id
@@ -601,6 +617,7 @@ def transform_qualitative_records(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_observations(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -627,99 +644,75 @@ def transform_qualitative_observations(
         qualitative_df = qualitative_df.rename(columns={use_case_col: "use_case"})
     qualitative_df = _forward_fill_qualitative_columns(qualitative_df)
     if "resource" in qualitative_df.columns:
-        qualitative_df["resource"] = qualitative_df["resource"].apply(_canonicalize_resource_name)
+        qualitative_df["resource"] = _canonicalize_resource_names(qualitative_df["resource"])
 
-    use_case_map = {}
-    enum_df = data_sources.get("use_case_enum")
-    if isinstance(enum_df, pd.DataFrame) and not enum_df.empty:
-        cleaned_enum = cleaning_mod.standard_clean(enum_df.copy())
-        if cleaned_enum is not None and not cleaned_enum.empty:
-            original_col = _first_existing_column(
-                cleaned_enum,
-                [
-                    "original_set_of_unique_use_case_names",
-                    "original set of unique use case names",
-                    "original_use_case_name",
-                    "original_use_case",
-                    "use_case",
-                ],
-            )
-            canonical_col = _first_existing_column(cleaned_enum, ["use_case_name"])
-            if canonical_col is not None:
-                for _, row in cleaned_enum.iterrows():
-                    canonical = _normalize_use_case_name(row.get(canonical_col))
-                    if canonical:
-                        use_case_map[canonical] = canonical
-                        if original_col:
-                            original = _normalize_use_case_name(row.get(original_col))
-                            if original:
-                                use_case_map[original] = canonical
-    if use_case_map and "use_case" in qualitative_df.columns:
-        qualitative_df["use_case"] = qualitative_df["use_case"].apply(lambda value: use_case_map.get(_normalize_use_case_name(value), _normalize_use_case_name(value)))
-
-    parameter_to_unit: dict[str, Any] = {}
+    use_case_map = _use_case_map(data_sources)
+    if not use_case_map.empty and "use_case" in qualitative_df.columns:
+        qualitative_df["use_case"] = _resolve_use_cases(qualitative_df["use_case"], use_case_map)
+
+    parameter_units = pd.DataFrame(columns=["parameter_name", "unit"])
     if parameters_df is not None and not parameters_df.empty:
         param_name_col = _first_existing_column(parameters_df, ["name", "parameter", "parameter_name"])
         unit_col = _first_existing_column(parameters_df, ["standard_unit", "unit", "unit_name"])
         if param_name_col and unit_col:
-            for _, row in parameters_df.iterrows():
-                name_value = row.get(param_name_col)
-                unit_value = row.get(unit_col)
-                if pd.notna(name_value):
-                    parameter_to_unit[str(name_value).strip().lower()] = unit_value
-
-    records: list[dict[str, Any]] = []
-    for _, row in qualitative_df.iterrows():
-        record_key = _build_end_use_record_key(row.get("resource"), row.get("use_case"))
-
-        perc_low, perc_high = parse_decimal_range(row.get("resource_use_perc_range"))
-        value_low, value_high = parse_decimal_range(row.get("resource_value_usd_per_ton_delivered_range"))
-        mult_low, mult_high = parse_decimal_range(row.get("resource_value_multiplier"))
-        trend_value = row.get("resource_use_trend")
-
-        parsed_values = {
-            "resource_use_perc_low": perc_low,
-            "resource_use_perc_high": perc_high,
-            "resource_value_low": value_low,
-            "resource_value_high": value_high,
-            "resource_value_multiplier_low": mult_low,
-            "resource_value_multiplier_high": mult_high,
-        }
-
-        for parameter_name, numeric_value in parsed_values.items():
-            if numeric_value is None:
-                continue
-            unit_name = parameter_to_unit.get(parameter_name)
-            records.append(
-                {
-                    "end_use_record_key": record_key,
-                    "record_type": "resource_end_use_record",
-                    "record_id": pd.NA,
-                    "parameter_name": parameter_name,
-                    "parameter": parameter_name,
-                    "unit": unit_name,
-                    "value": numeric_value,
-                    "note": pd.NA,
-                }
-            )
-
-        if pd.notna(trend_value) and str(trend_value).strip() != "":
-            unit_name = parameter_to_unit.get("resource_use_trend")
-            trend_numeric = _map_trend_to_numeric(trend_value)
-            records.append(
-                {
-                    "end_use_record_key": record_key,
-                    "record_type": "resource_end_use_record",
-                    "record_id": pd.NA,
-                    "parameter_name": "resource_use_trend",
-                    "parameter": "resource_use_trend",
-                    "unit": unit_name,
-                    "value": trend_numeric,
-                    "note": str(trend_value),
-                }
-            )
-
-    obs_df = pd.DataFrame(records)
+            named = parameters_df[parameters_df[param_name_col].notna()]
+            parameter_units = pd.DataFrame({
+                "parameter_name": named[param_name_col].astype(str).str.strip().str.lower(),
+                "unit": named[unit_col],
+            }).drop_duplicates("parameter_name", keep="last")
+
+    # One column per observed parameter, in the order observations are emitted per row.
+    row_keys = _end_use_record_keys(qualitative_df.get("resource"), qualitative_df.get("use_case"), qualitative_df.index)
+    wide = pd.DataFrame({"end_use_record_key": row_keys, "row": range(len(qualitative_df))}, index=qualitative_df.index)
+    for source_col, prefix in [
+        ("resource_use_perc_range", "resource_use_perc"),
+        ("resource_value_usd_per_ton_delivered_range", "resource_value"),
+        ("resource_value_multiplier", "resource_value_multiplier"),
+    ]:
+        if source_col in qualitative_df.columns:
+            bounds = parse_decimal_ranges(qualitative_df[source_col])
+        else:
+            bounds = pd.DataFrame({"low": [None] * len(qualitative_df), "high": [None] * len(qualitative_df)},
+                                  index=qualitative_df.index, dtype=object)
+        wide[f"{prefix}_low"] = bounds["low"]
+        wide[f"{prefix}_high"] = bounds["high"]
+    range_parameters = [c for c in wide.columns if c not in ("end_use_record_key", "row")]
+
+    range_obs = wide.melt(
+        id_vars=["end_use_record_key", "row"], value_vars=range_parameters,
+        var_name="parameter_name", value_name="value",
+    )
+    range_obs = range_obs[range_obs["value"].notna()]
+    range_obs["note"] = pd.NA
+    range_obs["order"] = range_obs["parameter_name"].map({name: i for i, name in enumerate(range_parameters)})
+
+    trend_obs = pd.DataFrame(columns=["end_use_record_key", "row", "parameter_name", "value", "note", "order"])
+    if "resource_use_trend" in qualitative_df.columns:
+        trend = qualitative_df["resource_use_trend"]
+        has_trend = trend.notna() & (trend.astype("string").str.strip() != "").fillna(False)
+        trend = trend[has_trend]
+        trend_obs = pd.DataFrame({
+            "end_use_record_key": row_keys[has_trend],
+            "row": wide.loc[has_trend, "row"],
+            "parameter_name": "resource_use_trend",
+            "value": trend.astype("string").str.strip().str.lower().map(_TREND_VALUES).astype(object),
+            "note": trend.astype(str),
+            "order": len(range_parameters),
+        })
+        trend_obs["value"] = trend_obs["value"].where(trend_obs["value"].notna(), None)
+
+    frames = [df for df in (range_obs, trend_obs) if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    obs_df = pd.concat(frames, ignore_index=True).sort_values(["row", "order"], kind="stable")
+    obs_df = obs_df.merge(parameter_units, on="parameter_name", how="left")
+    obs_df["note"] = obs_df["note"].astype(object).where(obs_df["note"].notna(), pd.NA)
+    obs_df["record_type"] = "resource_end_use_record"
+    obs_df["record_id"] = pd.NA
+    obs_df["parameter"] = obs_df["parameter_name"]
+    obs_df = obs_df[
+        ["end_use_record_key", "record_type", "record_id", "parameter_name", "parameter", "unit", "value", "note"]
+    ]
     if obs_df.empty:
         return pd.DataFrame()
 
@@ -754,6 +747,7 @@ def transform_qualitative_observations(
 
 
 @task
+@task_metrics("transform")
 def transform_qualitative_payloads(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
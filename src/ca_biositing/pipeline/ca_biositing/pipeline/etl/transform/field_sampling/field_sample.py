@@ -13,6 +13,7 @@ Join strategy: Left-join all worksheets on 'sample_name' to preserve all records
 import pandas as pd
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
@@ -27,6 +28,7 @@ EXTRACT_SOURCES: List[str] = [
 
 
 @task
+@task_metrics("transform")
 def transform_field_sample(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -196,9 +198,9 @@ def transform_field_sample(
     # and provide a resilient lookup that defaults to state-level GEOID.
     from ca_biositing.pipeline.utils.geo_utils import get_geoid
     from sqlmodel import Session, select
-    from ca_biositing.pipeline.utils.engine import engine
+    from ca_biositing.pipeline.utils.engine import current_engine
 
-    with Session(engine) as session:
+    with Session(current_engine()) as session:
         places = session.exec(select(Place.geoid, Place.county_name)).all()
         county_to_geoid = {p.county_name.lower(): p.geoid for p in places if p.county_name}
 
@@ -215,9 +217,9 @@ def transform_field_sample(
     if 'county_id' in normalized_df.columns:
         logger.info("Bridging County (Place) to LocationAddress...")
         from sqlmodel import Session, select
-        from ca_biositing.pipeline.utils.engine import engine
+        from ca_biositing.pipeline.utils.engine import current_engine
 
-        with Session(engine) as session:
+        with Session(current_engine()) as session:
             county_ids = normalized_df['county_id'].dropna().unique()
             place_to_address_map = {}
 
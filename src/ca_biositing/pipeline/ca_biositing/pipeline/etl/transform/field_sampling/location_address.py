@@ -10,9 +10,11 @@ Handles two types of locations:
 import pandas as pd
 from typing import Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 
 @task
+@task_metrics("transform")
 def transform_location_address(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
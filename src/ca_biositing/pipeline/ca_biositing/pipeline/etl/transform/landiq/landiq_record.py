@@ -9,11 +9,13 @@ import os
 import pandas as pd
 import geopandas as gpd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 import ca_biositing.pipeline.utils.cleaning_functions.cleaning as cleaning_mod
 import ca_biositing.pipeline.utils.cleaning_functions.coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 
 @task(persist_result=False)
+@task_metrics("transform")
 def transform_landiq_record(
     gdf: gpd.GeoDataFrame,
     etl_run_id: str = None,
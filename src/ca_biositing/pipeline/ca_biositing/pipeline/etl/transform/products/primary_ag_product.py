@@ -1,10 +1,12 @@
 from typing import Optional, Dict
 import pandas as pd
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 
 EXTRACT_SOURCES = ["basic_sample_info"]
 
 @task
+@task_metrics("transform")
 def transform(data_sources: Dict[str, pd.DataFrame]) -> Optional[pd.DataFrame]:
     """
     Transforms the raw data to extract unique primary agricultural products.
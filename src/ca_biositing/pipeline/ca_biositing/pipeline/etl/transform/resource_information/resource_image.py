@@ -7,6 +7,7 @@ Transforms raw resource image data into ResourceImage table format.
 import pandas as pd
 from typing import List, Optional, Dict
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
 from ca_biositing.pipeline.utils.cleaning_functions import coercion as coercion_mod
 from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
@@ -15,6 +16,7 @@ from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
 EXTRACT_SOURCES: List[str] = ["resource_images"]
 
 @task
+@task_metrics("transform")
 def transform_resource_images(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: str | None = None,
@@ -9,10 +9,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 from prefect import task, get_run_logger
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
 from ca_biositing.pipeline.utils.engine import get_engine
 
 
 @task
+@task_metrics("transform")
 def transform(
     data_sources: Dict[str, pd.DataFrame],
     etl_run_id: int,
@@ -1,8 +1,10 @@
 from prefect import flow, task
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 import pandas as pd
 import numpy as np
 
 @flow(name="Aim 2 Bioconversion ETL", log_prints=True)
+@supports_dry_run
 def aim2_bioconversion_flow(*args, **kwargs):
     """
     Orchestrates the ETL process for Aim 2 Bioconversion data,
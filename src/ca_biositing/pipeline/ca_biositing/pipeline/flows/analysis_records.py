@@ -1,14 +1,73 @@
+import os
+import threading
+import time
+
 from prefect import flow, task
-# Move imports inside the flow to avoid module-level import hangs
+from prefect.task_runners import ThreadPoolTaskRunner
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
+
+# Maximum number of transform/load tasks running at once; 1 reproduces the serial path.
+ANALYSIS_ETL_MAX_WORKERS = int(os.getenv("ANALYSIS_ETL_MAX_WORKERS", "4"))
+
+
+class _StageTimer:
+    """Collects task run times through Prefect hooks to compare a stage with its serial time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.task_seconds = 0.0
+
+    def hook(self, task, task_run, state):
+        if task_run.total_run_time is not None:
+            with self._lock:
+                self.task_seconds += task_run.total_run_time.total_seconds()
 
-@flow(name="Analysis Records ETL", log_prints=True)
+    def submit(self, task_obj, *args, **kwargs):
+        timed = task_obj.with_options(on_completion=[self.hook], on_failure=[self.hook])
+        return timed.submit(*args, **kwargs)
+
+
+def _run_stage(logger, label, submissions):
+    """
+    Submit ``(name, task, args, kwargs)`` tuples concurrently and wait for them.
+
+    Returns a dict of results by name and logs the stage wall time against the
+    summed task run times (what the stage takes when run serially).
+    """
+    from prefect.futures import wait
+
+    timer = _StageTimer()
+    started = time.perf_counter()
+    futures = {name: timer.submit(task_obj, *args, **kwargs) for name, task_obj, args, kwargs in submissions}
+    wait(list(futures.values()))
+    wall = time.perf_counter() - started
+    logger.info(
+        f"{label}: {len(futures)} tasks in {wall:.2f}s wall vs {timer.task_seconds:.2f}s serial "
+        f"(max {ANALYSIS_ETL_MAX_WORKERS} concurrent)"
+    )
+    return {name: future.result() for name, future in futures.items()}
+
+
+@flow(
+    name="Analysis Records ETL",
+    log_prints=True,
+    task_runner=ThreadPoolTaskRunner(max_workers=ANALYSIS_ETL_MAX_WORKERS),
+)
+@supports_dry_run
 def analysis_records_flow(*args, **kwargs):
     """
     Orchestrates the ETL process for Proximate, Ultimate, Compositional,
     ICP, XRF, Calorimetry, and XRD records, including their associated observations.
+
+    The transforms are independent pandas work and run as concurrent tasks on a
+    thread task runner (reference-row creation inside them is serialized by
+    ``normalize_dataframes``). The loaded tables only reference rows committed
+    during the transforms, not each other, so all loads start once the
+    transforms are done and overlap up to ``ANALYSIS_ETL_MAX_WORKERS``.
     """
     from prefect import get_run_logger
     from ca_biositing.pipeline.etl.extract import proximate, ultimate, cmpana, icp, xrf, calorimetry, xrd
+    from ca_biositing.pipeline.etl.extract import aim1_analysis_workbook
     from ca_biositing.pipeline.etl.transform.analysis.observation import transform_observation
     from ca_biositing.pipeline.etl.transform.analysis.proximate_record import transform_proximate_record
     from ca_biositing.pipeline.etl.transform.analysis.ultimate_record import transform_ultimate_record
@@ -45,29 +104,36 @@ def analysis_records_flow(*args, **kwargs):
     logger.info(f"Lineage Group ID: {lineage_group_id}")
 
     # 1. Extract
+    # All seven tabs live in the Aim 1 workbook; fetch them in one batched request.
+    # Extraction failures (auth, network, missing workbook) surface from the
+    # extractor as RuntimeError; log them and continue with no analysis data.
+    try:
+        workbook = aim1_analysis_workbook.extract()
+    except (ValueError, IOError, RuntimeError):
+        logger.exception("Failed to extract Aim 1 analysis worksheets")
+        workbook = {}
+
+    from ca_biositing.pipeline.utils import extraction_cache
+    if extraction_cache.SKIP_UNCHANGED_SOURCES and extraction_cache.is_unchanged(*workbook.values()):
+        logger.info("Aim 1 analysis worksheets unchanged since the last successful load; skipping transform and load.")
+        return
+
     def safe_extract(extractor, name, analysis_type=None):
-        try:
-            logger.info(f"Extracting {name} data...")
-            df = extractor.extract()
-            if df is not None and analysis_type is not None:
-                df = df.copy()
-                # Drop existing analysis_type columns (including variations like "Analysis Type")
-                # to ensure our hard-coded value isn't dropped by later deduplication logic
-                cols_to_drop = [c for c in df.columns if str(c).lower().replace(' ', '_').replace('.', '_') == 'analysis_type']
-                if cols_to_drop:
-                    logger.info(f"Dropping existing analysis_type columns from {name}: {cols_to_drop}")
-                    df = df.drop(columns=cols_to_drop)
-                df['analysis_type'] = analysis_type
-                # Ensure dataset is present for normalization
-                if 'dataset' not in df.columns:
-                    df['dataset'] = 'biocirv'
-            return df
-        except (ValueError, IOError):
-            logger.exception(f"Failed to extract {name} data")
-            return None
-        except Exception:
-            logger.exception(f"Unexpected error extracting {name} data")
-            raise
+        logger.info(f"Extracting {name} data...")
+        df = workbook.get(extractor.WORKSHEET_NAME)
+        if df is not None and analysis_type is not None:
+            df = df.copy()
+            # Drop existing analysis_type columns (including variations like "Analysis Type")
+            # to ensure our hard-coded value isn't dropped by later deduplication logic
+            cols_to_drop = [c for c in df.columns if str(c).lower().replace(' ', '_').replace('.', '_') == 'analysis_type']
+            if cols_to_drop:
+                logger.info(f"Dropping existing analysis_type columns from {name}: {cols_to_drop}")
+                df = df.drop(columns=cols_to_drop)
+            df['analysis_type'] = analysis_type
+            # Ensure dataset is present for normalization
+            if 'dataset' not in df.columns:
+                df['dataset'] = 'biocirv'
+        return df
 
     prox_raw = safe_extract(proximate, "Proximate", "proximate analysis")
     ult_raw = safe_extract(ultimate, "Ultimate", "ultimate analysis")
@@ -81,41 +147,33 @@ def analysis_records_flow(*args, **kwargs):
 
     # 2. Transform (Now includes cleaning, coercion, and normalization)
     logger.info("Starting transformations...")
-
-    obs_df = transform_observation(raw_data, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming Proximate records...")
-    prox_rec_df = transform_proximate_record(prox_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming Ultimate records...")
-    ult_rec_df = transform_ultimate_record(ult_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming Compositional records...")
-    comp_rec_df = transform_compositional_record(cmpana_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming ICP records...")
-    icp_rec_df = transform_icp_record(icp_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming XRF records...")
-    xrf_rec_df = transform_xrf_record(xrf_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming Calorimetry records...")
-    cal_rec_df = transform_calorimetry_record(cal_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
-
-    logger.info("Transforming XRD records...")
-    xrd_rec_df = transform_xrd_record(xrd_raw, etl_run_id=etl_run_id, lineage_group_id=lineage_group_id)
+    lineage = {"etl_run_id": etl_run_id, "lineage_group_id": lineage_group_id}
+    transformed = _run_stage(logger, "Transform", [
+        ("observation", transform_observation, (raw_data,), lineage),
+        ("proximate", transform_proximate_record, (prox_raw,), lineage),
+        ("ultimate", transform_ultimate_record, (ult_raw,), lineage),
+        ("compositional", transform_compositional_record, (cmpana_raw,), lineage),
+        ("icp", transform_icp_record, (icp_raw,), lineage),
+        ("xrf", transform_xrf_record, (xrf_raw,), lineage),
+        ("calorimetry", transform_calorimetry_record, (cal_raw,), lineage),
+        ("xrd", transform_xrd_record, (xrd_raw,), lineage),
+    ])
 
     # 3. Load
     logger.info("Starting database load...")
-    # Using tasks normally allows for retries if defined on the tasks
-    load_observation(obs_df)
-    load_proximate_record(prox_rec_df)
-    load_ultimate_record(ult_rec_df)
-    load_compositional_record(comp_rec_df)
-    load_icp_record(icp_rec_df)
-    load_xrf_record(xrf_rec_df)
-    load_calorimetry_record(cal_rec_df)
-    load_xrd_record(xrd_rec_df)
+    # Loads keep their task retries; a failed load raises once the stage is done.
+    _run_stage(logger, "Load", [
+        ("observation", load_observation, (transformed["observation"],), {}),
+        ("proximate", load_proximate_record, (transformed["proximate"],), {}),
+        ("ultimate", load_ultimate_record, (transformed["ultimate"],), {}),
+        ("compositional", load_compositional_record, (transformed["compositional"],), {}),
+        ("icp", load_icp_record, (transformed["icp"],), {}),
+        ("xrf", load_xrf_record, (transformed["xrf"],), {}),
+        ("calorimetry", load_calorimetry_record, (transformed["calorimetry"],), {}),
+        ("xrd", load_xrd_record, (transformed["xrd"],), {}),
+    ])
+
+    extraction_cache.mark_loaded(*workbook.values())
 
     logger.info("Analysis Records ETL flow completed successfully.")
 
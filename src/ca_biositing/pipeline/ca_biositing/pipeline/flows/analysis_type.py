@@ -1,6 +1,8 @@
 from prefect import flow
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 @flow(name="Analysis Type ETL", log_prints=True)
+@supports_dry_run
 def analysis_type_flow():
     """
     ETL flow for processing analysis types.
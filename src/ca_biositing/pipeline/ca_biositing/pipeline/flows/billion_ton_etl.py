@@ -1,5 +1,6 @@
 import sys
 from prefect import flow, task
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 @task(name="Create ETL Run Record")
 def create_etl_run_record_task(pipeline_name: str):
@@ -12,6 +13,7 @@ def create_lineage_group_task(etl_run_id: str, note: str):
     return create_lineage_group(etl_run_id=etl_run_id, note=note)
 
 @flow(name="Billion Ton ETL", log_prints=True, persist_result=False)
+@supports_dry_run
 def billion_ton_etl_flow(
     file_id: str = "11xLy_kPTHvoqciUMy3SYA3DLCDIjkOGa",
     file_name: str = "billionton_23_agri_download.csv"
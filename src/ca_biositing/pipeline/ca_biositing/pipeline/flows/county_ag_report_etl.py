@@ -1,7 +1,9 @@
 from prefect import flow, get_run_logger
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.utils.lineage import create_etl_run_record, create_lineage_group
 
 @flow(name="County Ag Report ETL", log_prints=True)
+@supports_dry_run
 def county_ag_report_flow():
     """
     Orchestrates the ETL process for County Agricultural Reports.
@@ -1,4 +1,5 @@
 from prefect import flow, get_run_logger
+from ca_biositing.pipeline.utils.dry_run import active as active_dry_run, supports_dry_run
 from ca_biositing.pipeline.etl.extract.sample_ids import extract as extract_sample_ids
 from ca_biositing.pipeline.etl.extract.sample_desc import extract as extract_sample_desc
 from ca_biositing.pipeline.etl.extract.qty_field_storage import extract as extract_qty_field_storage
@@ -13,6 +14,7 @@ from ca_biositing.datamodels.views import refresh_all_views
 from ca_biositing.pipeline.utils.engine import engine
 
 @flow(name="Field Sample ETL")
+@supports_dry_run
 def field_sample_etl_flow():
     """
     Field Sample ETL Flow - v03 (SampleMetadata_v03-BioCirV multi-worksheet strategy)
@@ -65,9 +67,11 @@ def field_sample_etl_flow():
         lineage_group_id=lineage_group_id
     )
 
+    # Ids of the loaded addresses by address_key, used to link the samples
+    address_ids = None
     if location_df is not None and not location_df.empty:
         logger.info(f"Loading {len(location_df)} LocationAddress records into database...")
-        load_location_address(location_df)
+        address_ids = load_location_address(location_df)
     else:
         logger.warning("No LocationAddress data to load.")
 
@@ -82,11 +86,14 @@ def field_sample_etl_flow():
     # 5. Load FieldSample
     if transformed_df is not None and not transformed_df.empty:
         logger.info(f"Loading {len(transformed_df)} FieldSample records into database...")
-        load_field_sample(transformed_df)
+        load_field_sample(transformed_df, address_ids=address_ids)
     else:
         logger.warning("No FieldSample data to load.")
 
     # 6. Refresh Materialized Views
+    if active_dry_run() is not None:
+        logger.info("Dry run: skipping the materialized view refresh.")
+        return
     logger.info("Refreshing materialized views...")
     try:
         refresh_all_views(engine)
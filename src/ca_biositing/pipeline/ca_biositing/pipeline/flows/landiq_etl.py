@@ -1,6 +1,7 @@
 import sys
 import os
 from prefect import flow, task
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 # Force stdout to flush immediately
 sys.stdout.reconfigure(line_buffering=True)
@@ -19,6 +20,7 @@ def create_lineage_group_task(etl_run_id: str, note: str):
     return create_lineage_group.fn(etl_run_id=etl_run_id, note=note)
 
 @flow(name="Land IQ ETL", log_prints=True, persist_result=False)
+@supports_dry_run
 def landiq_etl_flow(shapefile_path: str = "", chunk_size: int = 10000):
     sys.stdout.flush()
     print(f"DEBUG: Flow function landiq_etl_flow started. Python: {sys.executable}")
@@ -1,10 +1,12 @@
 from prefect import flow, get_run_logger
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.etl.extract.preparation import extract as extract_preparation
 from ca_biositing.pipeline.etl.transform.prepared_sample import transform as transform_prepared_sample
 from ca_biositing.pipeline.etl.load.prepared_sample import load_prepared_sample
 from ca_biositing.pipeline.utils.lineage import create_lineage_group, create_etl_run_record
 
 @flow(name="Prepared Sample ETL")
+@supports_dry_run
 def prepared_sample_etl_flow():
     logger = get_run_logger()
     logger.info("Starting Prepared Sample ETL flow...")
@@ -1,9 +1,11 @@
 from prefect import flow
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.etl.extract.basic_sample_info import extract
 from ca_biositing.pipeline.etl.transform.products.primary_ag_product import transform
 from ca_biositing.pipeline.etl.load.products.primary_ag_product import load
 
 @flow(name="Primary Ag Product ETL", log_prints=True)
+@supports_dry_run
 def primary_ag_product_flow():
     """
     ETL flow for processing primary agricultural products data.
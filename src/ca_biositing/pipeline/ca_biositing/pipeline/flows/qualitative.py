@@ -1,7 +1,9 @@
 from prefect import flow
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 
 @flow(name="Qualitative ETL", log_prints=True)
+@supports_dry_run
 def qualitative_etl_flow():
     """Orchestrate the qualitative ETL pipeline."""
     from prefect import get_run_logger
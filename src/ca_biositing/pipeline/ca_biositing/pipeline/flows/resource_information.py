@@ -1,7 +1,9 @@
 from prefect import flow
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.utils.lineage import create_etl_run_record, create_lineage_group
 
 @flow(name="Resource Information ETL", log_prints=True)
+@supports_dry_run
 def resource_information_flow():
     """
     Orchestrates the ETL process for Resource information.
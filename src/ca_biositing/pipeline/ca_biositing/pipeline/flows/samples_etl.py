@@ -1,8 +1,10 @@
 from prefect import flow, get_run_logger
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.flows.field_sample_etl import field_sample_etl_flow
 from ca_biositing.pipeline.flows.prepared_sample_etl import prepared_sample_etl_flow
 
 @flow(name="Samples ETL")
+@supports_dry_run
 def samples_etl_flow():
     """
     Orchestrates the ETL process for both field samples and prepared samples.
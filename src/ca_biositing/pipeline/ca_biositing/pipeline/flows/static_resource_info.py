@@ -1,7 +1,9 @@
 from prefect import flow
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.utils.lineage import create_etl_run_record, create_lineage_group
 
 @flow(name="Static Resource Info ETL", log_prints=True)
+@supports_dry_run
 def static_resource_info_flow():
     """
     Orchestrates the ETL process for Static Resource Information (LandIQ Mapping & Availability).
@@ -1,6 +1,8 @@
 from prefect import flow, task
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 
 @flow(name="Thermochemical Conversion ETL", log_prints=True)
+@supports_dry_run
 def thermochem_etl_flow(*args, **kwargs):
     """
     Orchestrates the ETL process for Thermochemical Conversion data,
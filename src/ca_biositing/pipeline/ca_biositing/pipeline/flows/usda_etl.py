@@ -1,5 +1,6 @@
 # File: src/ca_biositing/pipeline/flows/usda_etl.py
 from prefect import flow, get_run_logger
+from ca_biositing.pipeline.utils.dry_run import supports_dry_run
 from ca_biositing.pipeline.etl.extract.usda_census_survey import extract
 from ca_biositing.pipeline.etl.transform.usda.usda_census_survey import transform
 from ca_biositing.pipeline.etl.load.usda.usda_census_survey import load
@@ -7,6 +8,7 @@ from ca_biositing.pipeline.utils.lineage import create_etl_run_record, create_li
 
 
 @flow(name="USDA Census Survey ETL", log_prints=True)
+@supports_dry_run
 def usda_etl_flow():
     """
     Orchestrates ETL for USDA agricultural data.
@@ -18,6 +18,8 @@ from .coercion import (
 
 from .geospatial import (
     detect_latlon_columns,
+    parse_coordinates,
+    parse_latlon_pairs,
     split_combined_latlon,
     standardize_latlon,
 )
@@ -30,6 +32,8 @@ __all__ = [
     "coerce_columns",
     "coerce_columns_list",
     "detect_latlon_columns",
+    "parse_coordinates",
+    "parse_latlon_pairs",
     "split_combined_latlon",
     "standardize_latlon",
 ]
@@ -1,16 +1,62 @@
 """Basic cleaning helpers: name normalization, empty->NA, lowercase, and a small composed pipeline.
 
 These functions are intended to be small, well-documented, and easy to test.
+
+Columns are handled one at a time by dtype: numeric, boolean and datetime
+columns cannot hold strings and skip the string steps, and columns holding
+only strings go straight to the pandas ``string`` dtype. Only object columns
+mixing strings with other values take the generic object path. With the
+default empty pattern, whitespace-only strings are found with a pyarrow
+string kernel instead of a per-value regex match.
 """
 from typing import Iterable, Optional
 import logging
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 # Import janitor to register the ``clean_names`` accessor on DataFrames
 import janitor  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+EMPTY_PATTERN = r"^\s*$"
+
+
+def _holds_no_strings(s: pd.Series) -> bool:
+    """True for numeric, boolean and datetime columns, which cannot contain strings."""
+    return (
+        pd.api.types.is_numeric_dtype(s)
+        or pd.api.types.is_bool_dtype(s)
+        or pd.api.types.is_datetime64_any_dtype(s)
+        or pd.api.types.is_timedelta64_dtype(s)
+    )
+
+
+def _holds_only_strings(s: pd.Series) -> bool:
+    """True for ``string`` columns and object columns whose non-missing values are all str."""
+    if isinstance(s.dtype, pd.StringDtype):
+        return True
+    return pd.api.types.is_object_dtype(s) and pd.api.types.infer_dtype(s, skipna=True) == "string"
+
+
+def _empty_mask(text: pd.Series, regex: str) -> np.ndarray:
+    """Boolean mask of the strings in ``text`` matching ``regex``; missing values never match."""
+    if regex != EMPTY_PATTERN:
+        return text.str.contains(regex, regex=True, na=False).to_numpy(dtype=bool)
+    arr = pa.array(text.to_numpy(dtype=object, na_value=None), type=pa.string())
+    blank = pc.equal(pc.utf8_trim_whitespace(arr), "")
+    return pc.fill_null(blank, False).to_numpy(zero_copy_only=False)
+
+
+def _replace_in_objects(s: pd.Series, regex: str) -> pd.Series:
+    """Replace matching strings in an object column, then re-infer its dtype (e.g. ints next to "")."""
+    values = s.to_numpy(dtype=object, copy=True)
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    positions = np.flatnonzero(is_str)
+    values[positions[_empty_mask(pd.Series(values[positions], dtype="string"), regex)]] = np.nan
+    return pd.Series(values, index=s.index, name=s.name).infer_objects()
+
 
 def clean_names_df(df: pd.DataFrame) -> pd.DataFrame:
     """Return a copy of `df` with cleaned column names using `janitor.clean_names()`.
@@ -24,9 +70,12 @@ def clean_names_df(df: pd.DataFrame) -> pd.DataFrame:
     return df.clean_names()
 
 
-def replace_empty_with_na(df: pd.DataFrame, columns: Optional[Iterable[str]] = None, regex: str = r"^\s*$") -> pd.DataFrame:
+def replace_empty_with_na(df: pd.DataFrame, columns: Optional[Iterable[str]] = None, regex: str = EMPTY_PATTERN) -> pd.DataFrame:
     """Replace empty/whitespace-only strings with `np.nan`.
 
+    Only columns that can hold strings are processed; numeric, boolean and
+    datetime columns are returned unchanged.
+
     Args:
         df: input DataFrame
         columns: optional iterable of column names to process; if None operate on whole frame
@@ -39,13 +88,21 @@ def replace_empty_with_na(df: pd.DataFrame, columns: Optional[Iterable[str]] = N
         logger.error("replace_empty_with_na: input is not a DataFrame")
         return df
     if columns is None:
-        return df.astype("object").replace(regex, np.nan, regex=True)
+        cols = list(df.columns)
+    else:
+        cols = [c for c in columns if c in df.columns]
+        if not cols:
+            logger.warning("replace_empty_with_na: no matching columns found; returning original DataFrame")
+            return df
     df = df.copy()
-    cols = [c for c in columns if c in df.columns]
-    if not cols:
-        logger.warning("replace_empty_with_na: no matching columns found; returning original DataFrame")
-        return df
-    df[cols] = df[cols].astype("object").replace(regex, np.nan, regex=True)
+    for c in cols:
+        s = df[c]
+        if _holds_no_strings(s):
+            continue
+        if _holds_only_strings(s):
+            df[c] = s.astype("object").mask(_empty_mask(s.astype("string"), regex), np.nan)
+        else:
+            df[c] = _replace_in_objects(s, regex)
     return df
 
 
@@ -68,6 +125,23 @@ def to_lowercase_df(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -
     return df
 
 
+def _clean_column(s: pd.Series, lowercase: bool, replace_empty: bool, regex: str = EMPTY_PATTERN) -> pd.Series:
+    """Apply the empty->NA, lowercase and nullable-dtype steps of `standard_clean` to one column."""
+    if _holds_no_strings(s):
+        return s.convert_dtypes()
+    if _holds_only_strings(s):
+        text = s.astype("string")
+        if replace_empty:
+            text = text.mask(_empty_mask(text, regex))
+        return text.str.lower() if lowercase else text
+    # Object columns mixing strings with other values
+    if replace_empty:
+        s = _replace_in_objects(s, regex)
+    if lowercase and s.dtype == "object":
+        s = s.astype("string").str.lower().where(s.notna(), s)
+    return s.convert_dtypes()
+
+
 def standard_clean(df: pd.DataFrame, lowercase: bool = True, replace_empty: bool = True) -> Optional[pd.DataFrame]:
     """Run a composed standard cleaning pipeline and return a cleaned DataFrame.
 
@@ -76,6 +150,8 @@ def standard_clean(df: pd.DataFrame, lowercase: bool = True, replace_empty: bool
       2. `replace_empty_with_na` (optional)
       3. `to_lowercase_df` (optional)
       4. `convert_dtypes()` to allow pandas to pick improved nullable dtypes
+
+    Steps 2-4 run column by column; see the module docstring.
     """
     if not isinstance(df, pd.DataFrame):
         logger.error("standard_clean: input is not a DataFrame")
@@ -85,9 +161,8 @@ def standard_clean(df: pd.DataFrame, lowercase: bool = True, replace_empty: bool
     if df.columns.duplicated().any():
         logger.warning(f"standard_clean: duplicate columns found after name cleaning: {df.columns[df.columns.duplicated()].unique().tolist()}. Keeping first occurrence.")
         df = df.loc[:, ~df.columns.duplicated()]
-    if replace_empty:
-        df = replace_empty_with_na(df)
-    if lowercase:
-        df = to_lowercase_df(df)
-    df = df.convert_dtypes()
-    return df
+    cleaned = pd.DataFrame(
+        {c: _clean_column(df[c], lowercase, replace_empty) for c in df.columns}, index=df.index
+    )
+    cleaned.attrs = dict(df.attrs)
+    return cleaned
@@ -3,6 +3,8 @@ from typing import Iterable, Optional
 import logging
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 logger = logging.getLogger(__name__)
 
@@ -14,21 +16,38 @@ def _coerce_int(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
     return df
 
 
+# A number once commas and whitespace are removed; anything else coerces to NaN
+_NUMBER_PATTERN = r"^[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|(?i:inf|infinity|nan))$"
+
+
+def _parse_float_strings(s: pd.Series) -> np.ndarray:
+    """Parse strings such as ``"1,234.5 "`` as floats with pyarrow compute kernels."""
+    is_text = (
+        pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+        if pd.api.types.is_object_dtype(s)
+        else pd.api.types.is_string_dtype(s)
+    )
+    if not is_text:
+        # Mixed objects, booleans, dates etc. are parsed through their str() form
+        s = s.astype(str)
+    text = pa.array(s.to_numpy(dtype=object, na_value=None), type=pa.string(), from_pandas=True)
+    text = pc.replace_substring_regex(text, r"[,\s]+", "")
+    valid = pc.fill_null(pc.match_substring_regex(text, _NUMBER_PATTERN), False)
+    numbers = pc.cast(pc.if_else(valid, text, pa.scalar(None, pa.string())), pa.float64())
+    return numbers.to_numpy(zero_copy_only=False)
+
+
 def _coerce_float(df: pd.DataFrame, cols: Iterable[str], float_dtype=np.float64) -> pd.DataFrame:
     for c in cols:
         if c in df.columns:
-            # Force conversion to string to handle any mixed types or weird objects
-            # Then remove commas and whitespace
-            s = df[c].astype(str)
-            # Remove commas
-            s = s.str.replace(",", "", regex=False)
-            # Remove all whitespace
-            s = s.str.replace(r"\s+", "", regex=True)
-            # Replace various null-like strings with actual NaN
-            s = s.replace(["", "nan", "None", "NaN", "null"], np.nan)
-
-            # Convert to numeric
-            df[c] = pd.to_numeric(s, errors="coerce").astype(float_dtype)
+            s = df[c]
+            if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+                # Already numeric: no string round trip
+                values = s.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                # Commas and whitespace are removed; empty and null-like strings become NaN
+                values = _parse_float_strings(s)
+            df[c] = pd.Series(values, index=df.index).astype(float_dtype)
     return df
 
 
@@ -54,6 +73,9 @@ def _coerce_bool(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
     }
     for c in cols:
         if c in df.columns:
+            if pd.api.types.is_bool_dtype(df[c]):
+                df[c] = df[c].astype("boolean")
+                continue
             # Convert to lowercase if string to match mapping
             if df[c].dtype == "object":
                 df[c] = df[c].str.lower()
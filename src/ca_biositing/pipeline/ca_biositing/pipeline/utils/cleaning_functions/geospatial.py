@@ -4,6 +4,8 @@ import logging
 import re
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 logger = logging.getLogger(__name__)
 
@@ -77,43 +79,172 @@ def detect_latlon_columns(df: pd.DataFrame) -> Dict[str, list]:
     return result
 
 
-def _parse_latlon_pair(value: str, sep: Optional[str] = None) -> Tuple[Optional[float], Optional[float]]:
-    """Parse a single lat/lon pair from a string.
+# One coordinate: an optional hemisphere prefix, signed decimal degrees, optional
+# minutes and seconds after a degree mark, and an optional hemisphere suffix.
+# ``{p}`` prefixes the group names so two coordinates fit in one pattern.
+_COORDINATE = (
+    r"(?P<{p}pre>[NSEWnsew])?\s*"
+    r"(?P<{p}deg>[+-]?(?:\d+\.?\d*|\.\d+))"
+    r"(?:\s*(?:°|º|deg|d)\s*"
+    r"(?:(?P<{p}min>\d+\.?\d*|\.\d+)\s*(?:'|′|min|m)\s*"
+    r"(?:(?P<{p}sec>\d+\.?\d*|\.\d+)\s*(?:\"|″|'')?\s*)?)?)?"
+    r"\s*(?P<{p}suf>[NSEWnsew])?"
+)
+# Delimiters tried when none is given; whitespace alone is the last resort
+_AUTO_SEPARATOR = r"\s*[,;|\t]\s*|\s+"
+# Plain signed decimal degrees, the common case
+_DECIMAL = r"[+-]?(?:\d+\.?\d*|\.\d+)"
 
-    Tries multiple delimiters if sep not specified: comma, space, semicolon, pipe.
-    Returns tuple (lat, lon) or (None, None) if parsing fails.
-    """
-    if not isinstance(value, str) or not value.strip():
-        return None, None
 
-    value = value.strip()
-    parts = None
+def _separator(sep: Optional[str]) -> str:
+    return rf"\s*{re.escape(sep)}\s*" if sep else _AUTO_SEPARATOR
 
-    # If separator specified, use it
-    if sep:
-        parts = [p.strip() for p in value.split(sep)]
-    else:
-        # Try common delimiters in order
-        for delimiter in [",", ";", "|", "\t"]:
-            if delimiter in value:
-                parts = [p.strip() for p in value.split(delimiter)]
-                break
 
-        # If no delimiter found, try space (last resort)
-        if parts is None or len(parts) == 1:
-            parts = value.split()
+def _pair_pattern(sep: Optional[str]) -> str:
+    """Two coordinates separated by ``sep``; anything after a further separator is ignored."""
+    separator = _separator(sep)
+    return (
+        rf"^\s*{_COORDINATE.format(p='a_')}(?:{separator}){_COORDINATE.format(p='b_')}"
+        rf"(?:(?:{separator}).*)?\s*$"
+    )
+
+
+_SINGLE_PATTERN = rf"^\s*{_COORDINATE.format(p='a_')}\s*$"
+
 
-    # Extract lat and lon
-    if len(parts) >= 2:
-        try:
-            lat = float(parts[0])
-            lon = float(parts[1])
-            return lat, lon
-        except (ValueError, IndexError):
-            logger.warning(f"Could not parse lat/lon from: '{value}'")
-            return None, None
+def _to_float(parts: pd.DataFrame, col: str) -> np.ndarray:
+    """A captured group as float64; unmatched groups (null or empty) become NaN."""
+    text = pa.array(parts[col])
+    text = pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+    return pc.cast(text, pa.float64()).to_numpy(zero_copy_only=False)
 
-    return None, None
+
+def _coordinate_values(parts: pd.DataFrame, p: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Decimal degrees and upper-cased hemisphere letters ('' when absent) for prefix ``p``."""
+    degrees = _to_float(parts, f"{p}deg")
+    minutes = np.nan_to_num(_to_float(parts, f"{p}min"))
+    seconds = np.nan_to_num(_to_float(parts, f"{p}sec"))
+    hemisphere = pc.utf8_upper(pc.binary_join_element_wise(
+        pc.fill_null(pa.array(parts[f"{p}pre"]), ""), pc.fill_null(pa.array(parts[f"{p}suf"]), ""), ""
+    )).to_numpy(zero_copy_only=False)
+    negative = np.signbit(degrees) | (hemisphere == "S") | (hemisphere == "W")
+    values = np.abs(degrees) + minutes / 60.0 + seconds / 3600.0
+    values[(minutes >= 60) | (seconds >= 60)] = np.nan
+    return np.where(negative, -values, values), hemisphere
+
+
+def _as_text(values: Iterable) -> pd.Series:
+    """Arrow-backed strings, so ``str.extract`` runs in pyarrow's RE2 kernel.
+
+    Non-string values become missing, as they did in the per-value parser.
+    """
+    s = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if pd.api.types.is_object_dtype(s):
+        if pd.api.types.infer_dtype(s, skipna=True) not in ("string", "empty"):
+            s = s.where(s.map(type) == str)
+    elif not pd.api.types.is_string_dtype(s):
+        s = pd.Series(None, index=s.index, dtype=object)
+    return s.astype(pd.ArrowDtype(pa.string()))
+
+
+def _fix_order_and_range(
+    lat: np.ndarray, lon: np.ndarray, lat_hemi: np.ndarray, lon_hemi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Swap reversed pairs and blank out-of-range ones, in place on float64 arrays.
+
+    Hemisphere letters decide the order when present (E/W on the latitude
+    side, or N/S on the longitude side). Otherwise a pair is reversed when only
+    the swapped order is in range, and when those pairs outnumber the ones
+    that are only in range as given, the whole batch is taken to be lon/lat
+    and every ambiguous pair is swapped as well.
+    """
+    explicit = np.isin(lat_hemi, ("E", "W")) | np.isin(lon_hemi, ("N", "S"))
+    lat_ok = np.abs(lat) <= 90
+    lon_as_lat_ok = np.abs(lon) <= 90
+    as_given = lat_ok & (np.abs(lon) <= 180)
+    as_swapped = lon_as_lat_ok & (np.abs(lat) <= 180)
+    unhinted = ~explicit & ~np.isin(lat_hemi, ("N", "S")) & ~np.isin(lon_hemi, ("E", "W"))
+    only_swapped = unhinted & as_swapped & ~as_given
+    only_given = unhinted & as_given & ~as_swapped
+    swap = explicit | only_swapped
+    if only_swapped.sum() > only_given.sum():
+        logger.info(
+            f"{int(only_swapped.sum())} of {int((only_swapped | only_given).sum())} unambiguous "
+            "coordinate pairs are in lon/lat order; swapping the ambiguous pairs too"
+        )
+        swap |= unhinted & as_given & as_swapped
+    if swap.any():
+        logger.info(f"Swapped {int(swap.sum())} reversed lat/lon pairs")
+        lat[swap], lon[swap] = lon[swap], lat[swap].copy()
+
+    out_of_range = (np.abs(lat) > 90) | (np.abs(lon) > 180)
+    if out_of_range.any():
+        logger.warning(f"{int(out_of_range.sum())} lat/lon pairs are out of range; setting them to NaN")
+    # A pair with one unparseable half is dropped whole
+    invalid = out_of_range | np.isnan(lat) | np.isnan(lon)
+    lat[invalid] = np.nan
+    lon[invalid] = np.nan
+    return lat, lon
+
+
+def parse_latlon_pairs(values: Iterable, sep: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse combined coordinate strings into float64 latitude and longitude arrays.
+
+    Plain decimal pairs (``"38.54, -121.74"``) are split and cast by pyarrow
+    kernels; the other values are matched once against a pattern also
+    accepting degrees/minutes/seconds (``"38°32'24\"N 121°44'24\"W"``) and
+    hemisphere prefixes or suffixes (``"N38.54 W121.74"``). The conversion,
+    order check and range validation are NumPy array operations, with no
+    per-value Python calls. Unparseable values give NaN.
+
+    Args:
+        values: strings such as a DataFrame column
+        sep: delimiter between the coordinates; if None, tries comma,
+            semicolon, pipe and tab, then whitespace
+
+    Returns:
+        Tuple of (latitude, longitude) float64 arrays
+    """
+    text = _as_text(values)
+    strings = pa.array(text)
+    separator = _separator(sep)
+    lat = np.full(len(text), np.nan)
+    lon = np.full(len(text), np.nan)
+    lat_hemi = np.full(len(text), "", dtype=object)
+    lon_hemi = np.full(len(text), "", dtype=object)
+
+    # Plain decimal pairs skip the capture groups: a DFA match selects them,
+    # their delimiter becomes a space and a whitespace split hands the two
+    # halves straight to the float cast.
+    decimal = pc.fill_null(
+        pc.match_substring_regex(strings, rf"^\s*{_DECIMAL}(?:{separator}){_DECIMAL}\s*$"), False
+    )
+    is_decimal = decimal.to_numpy(zero_copy_only=False)
+    if is_decimal.any():
+        pairs = pc.filter(strings, decimal)
+        for delimiter in [sep] if sep else [",", ";", "|", "\t"]:
+            if pc.any(pc.match_substring(pairs, delimiter)).as_py():
+                pairs = pc.replace_substring(pairs, delimiter, " ")
+        halves = pc.utf8_split_whitespace(pc.utf8_trim_whitespace(pairs))
+        lat[is_decimal] = pc.cast(pc.list_element(halves, 0), pa.float64()).to_numpy(zero_copy_only=False)
+        lon[is_decimal] = pc.cast(pc.list_element(halves, 1), pa.float64()).to_numpy(zero_copy_only=False)
+
+    # Everything else goes through the full pattern once
+    rest = ~is_decimal & text.notna().to_numpy()
+    if rest.any():
+        parts = text[rest].str.extract(_pair_pattern(sep))
+        lat[rest], lat_hemi[rest] = _coordinate_values(parts, "a_")
+        lon[rest], lon_hemi[rest] = _coordinate_values(parts, "b_")
+    return _fix_order_and_range(lat, lon, lat_hemi, lon_hemi)
+
+
+def parse_coordinates(values: Iterable) -> np.ndarray:
+    """Parse single coordinates (decimal, DMS or hemisphere-suffixed) into a float64 array."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        return s.to_numpy(dtype=np.float64, na_value=np.nan)
+    parts = _as_text(s).str.extract(_SINGLE_PATTERN)
+    return _coordinate_values(parts, "a_")[0]
 
 
 def split_combined_latlon(
@@ -127,7 +258,8 @@ def split_combined_latlon(
     """Split a combined lat/lon column into two separate columns.
 
     Handles multiple separators: comma, space, semicolon, pipe, tab.
-    Auto-detects delimiter if not specified.
+    Auto-detects delimiter if not specified. Decimal, DMS and
+    hemisphere-suffixed values are parsed by ``parse_latlon_pairs``.
 
     Args:
         df: input DataFrame
@@ -147,26 +279,17 @@ def split_combined_latlon(
     df = df.copy()
     logger.info(f"Splitting combined lat/lon column '{col}' into '{lat_col}' and '{lon_col}'")
 
-    # Parse each value
-    lats = []
-    lons = []
-    for idx, value in enumerate(df[col]):
-        lat, lon = _parse_latlon_pair(value, sep=sep)
-        lats.append(lat)
-        lons.append(lon)
-        if lat is None or lon is None:
-            logger.debug(f"Row {idx}: could not parse '{value}'")
-
-    # Create new columns
-    df[lat_col] = pd.array(lats, dtype="float64")
-    df[lon_col] = pd.array(lons, dtype="float64")
+    # Parse the whole column at once
+    lats, lons = parse_latlon_pairs(df[col], sep=sep)
+    df[lat_col] = lats
+    df[lon_col] = lons
 
     # Optionally remove original
     if not keep_original:
         df = df.drop(columns=[col])
         logger.info(f"Dropped original column '{col}'")
 
-    non_null_count = sum(1 for lat, lon in zip(lats, lons) if lat is not None and lon is not None)
+    non_null_count = int((~np.isnan(lats) & ~np.isnan(lons)).sum())
     logger.info(f"Successfully parsed {non_null_count}/{len(lats)} lat/lon pairs")
 
     return df
@@ -189,7 +312,7 @@ def standardize_latlon(
     1. Auto-detect lat/lon columns if enabled
     2. Split any combined lat/lon columns
     3. Rename detected separate columns to output names
-    4. Optionally coerce to float with error handling
+    4. Optionally coerce to float with error handling (see ``parse_coordinates``)
 
     Args:
         df: input DataFrame
@@ -258,7 +381,8 @@ def standardize_latlon(
         for col in [output_lat, output_lon]:
             if col in df.columns and df[col] is not None:
                 try:
-                    df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+                    # Vectorized: numeric columns pass through, strings may be DMS or hemisphere-suffixed
+                    df[col] = parse_coordinates(df[col])
                     null_count = df[col].isnull().sum()
                     if null_count > 0:
                         logger.warning(f"Column '{col}': {null_count} values could not be coerced to float")
@@ -0,0 +1,304 @@
+"""
+Indexed fuzzy matching of resource names against USDA commodities.
+
+``interactive_commodity_mapper.find_best_matches`` used to compute two
+``SequenceMatcher`` ratios and several word-set overlaps against every
+commodity for every resource. ``CommodityMatchIndex`` is built once per
+commodity list and answers each resource with three steps:
+
+1. Candidates: commodities sharing at least one character trigram (or whole
+   word) with the resource name, through inverted indexes over the commodity
+   names and descriptions. Trigrams follow ``pg_trgm``: each alphanumeric word
+   is padded with two leading spaces and one trailing space.
+2. Cheap scores: the word-overlap and key-word parts of the score are exact
+   set operations, and ``SequenceMatcher.real_quick_ratio`` bounds the two
+   ratio parts from above.
+3. Exact scores: candidates are visited in descending order of that bound and
+   the ratios are computed only while the bound can still reach the top N.
+
+The score is the same weighted combination as before (0.4 name ratio, 0.2
+description ratio, 0.3 name word overlap, 0.1 key-word match, floor of 0.75
+when a long resource word appears in the commodity name), so a candidate
+scores exactly what the full scan gave it. Commodities sharing no trigram
+can only score on the two ratios; they are checked against a length bound
+and scored only when it could still reach the top N, so the matches are the
+ones the full scan returned.
+
+``pg_trgm_candidates`` optionally runs step 1 in Postgres with ``pg_trgm``
+(enabled by migration 97a23076c0d9) for a whole batch of resource names,
+through GIN trigram indexes and a similarity threshold.
+"""
+
+import heapq
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import Integer, Text, text
+
+try:
+    from .staging_table import staging_table
+except ImportError:
+    from staging_table import staging_table  # type: ignore[import]  # run as a script
+
+# Words ignored by the key-word match, for the resource and commodity sides
+RESOURCE_STOP_WORDS = frozenset({'for', 'and', 'the', 'of', 'all', '-', 'processing'})
+COMMODITY_STOP_WORDS = frozenset({'for', 'and', 'the', 'of', 'all', '-'})
+# Resource words too generic to trigger the containment boost
+BOOST_EXCLUDED_WORDS = frozenset({'hulls', 'shells', 'straw', 'processing', 'waste'})
+BOOST_FLOOR = 0.75
+# pg_trgm.similarity_threshold for the ``%`` operator in pg_trgm_candidates;
+# low, since the candidates are re-scored and only need to contain the top N
+TRGM_SIMILARITY_THRESHOLD = 0.1
+
+_ALNUM_WORD = re.compile(r"[0-9a-z]+")
+
+
+def words(value: str) -> set:
+    """Lower-cased words split on whitespace, hyphens and underscores."""
+    return set(value.lower().replace('-', ' ').replace('_', ' ').split())
+
+
+def trigrams(value: str) -> set:
+    """``pg_trgm``-style trigrams of the alphanumeric words in ``value``."""
+    grams = set()
+    for word in _ALNUM_WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _length_bound(left: int, right: int) -> float:
+    """``SequenceMatcher.real_quick_ratio`` from the two lengths: an upper bound on ``ratio``."""
+    total = left + right
+    return 2.0 * min(left, right) / total if total else 1.0
+
+
+def _jaccard(left: set, right: set) -> float:
+    return len(left & right) / len(left | right) if left and right else 0
+
+
+class _Entry:
+    """Per-commodity values that do not depend on the resource being matched."""
+
+    __slots__ = (
+        "commodity", "name_lower", "words", "key_words",
+        "name_matcher", "desc_matcher", "name_length", "desc_length",
+    )
+
+    def __init__(self, commodity: Dict):
+        name = commodity['name']
+        description = commodity.get('description', name) or name
+        self.commodity = commodity
+        self.name_lower = name.lower()
+        self.words = words(name)
+        self.key_words = self.words - COMMODITY_STOP_WORDS
+        # seq2 carries the expensive index in SequenceMatcher, so it is built
+        # once per commodity; each resource only swaps seq1.
+        self.name_matcher = SequenceMatcher(None, '', name.lower().strip())
+        self.desc_matcher = SequenceMatcher(None, '', description.lower().strip())
+        self.name_length = len(self.name_matcher.b)
+        self.desc_length = len(self.desc_matcher.b)
+
+
+class CommodityMatchIndex:
+    """Token and trigram inverted indexes over a list of commodity dicts (code, name, description)."""
+
+    def __init__(self, commodities: Iterable[Dict]):
+        self.entries = [_Entry(c) for c in commodities]
+        self.by_trigram: Dict[str, List[int]] = defaultdict(list)
+        self.by_word: Dict[str, List[int]] = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            commodity = entry.commodity
+            description = commodity.get('description', commodity['name']) or commodity['name']
+            for gram in trigrams(commodity['name']) | trigrams(description):
+                self.by_trigram[gram].append(i)
+            for word in entry.words | words(description):
+                self.by_word[word].append(i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def candidates(self, resource_name: str) -> List[int]:
+        """Positions of the commodities sharing a trigram or a word with ``resource_name``."""
+        found = set()
+        for gram in trigrams(resource_name):
+            found.update(self.by_trigram.get(gram, ()))
+        for word in words(resource_name):
+            found.update(self.by_word.get(word, ()))
+        return sorted(found)
+
+    def find_best_matches(
+        self, resource_name: str, top_n: int = 8, candidates: Optional[Iterable[int]] = None
+    ) -> List[Dict]:
+        """
+        Top ``top_n`` commodities for ``resource_name``.
+
+        Args:
+            resource_name: The resource or primary_ag_product name.
+            top_n: Number of matches to return.
+            candidates: Positions to score, e.g. from ``pg_trgm_candidates``;
+                defaults to the trigram and word candidates. With fewer than
+                ``top_n`` positions the default is used instead.
+
+        Returns:
+            List of {code, name, description, score, source, debug_scores}
+            sorted by score descending, ties in commodity-list order.
+        """
+        positions = None if candidates is None else sorted(set(candidates))
+        # Too few given candidates: use the index, whose result is exact
+        sweep = positions is None or len(positions) < top_n
+        if sweep:
+            positions = self.candidates(resource_name)
+
+        resource_clean = resource_name.lower().strip()
+        resource_words = words(resource_name)
+        key_words = resource_words - RESOURCE_STOP_WORDS
+        boost_words = [w for w in resource_words if len(w) > 3 and w not in BOOST_EXCLUDED_WORDS]
+
+        # Exact cheap parts and an upper bound on the ratio parts
+        pending = []
+        for i in positions:
+            entry = self.entries[i]
+            entry.name_matcher.set_seq1(resource_clean)
+            entry.desc_matcher.set_seq1(resource_clean)
+            word_overlap = _jaccard(resource_words, entry.words)
+            if key_words and entry.key_words:
+                key_word_match = len(key_words & entry.key_words) / len(key_words)
+            else:
+                key_word_match = 0
+            boosted = any(
+                w in entry.name_lower or any(w in cw for cw in entry.words) for w in boost_words
+            )
+            # Same summation order as the score, so rounding keeps it a bound
+            bound = (
+                entry.name_matcher.real_quick_ratio() * 0.4
+                + entry.desc_matcher.real_quick_ratio() * 0.2
+                + word_overlap * 0.3
+                + key_word_match * 0.1
+            )
+            if boosted:
+                bound = max(bound, BOOST_FLOOR)
+            pending.append((-bound, i, word_overlap, key_word_match, boosted))
+        pending.sort()
+
+        best = []  # min-heap of (score, -position, match)
+
+        def cannot_rank(bound: float) -> bool:
+            return len(best) == top_n and bound < best[0][0]
+
+        for neg_bound, i, word_overlap, key_word_match, boosted in pending:
+            if cannot_rank(-neg_bound):
+                break
+            self._push(best, top_n, i, word_overlap, key_word_match, boosted)
+
+        if sweep:
+            # A commodity sharing no trigram shares no word and cannot be
+            # boosted, so only its ratios count; their length bound rarely
+            # reaches the top N, which keeps the result identical to a full scan.
+            seen = set(positions)
+            length = len(resource_clean)
+            for i, entry in enumerate(self.entries):
+                if i in seen:
+                    continue
+                bound = (
+                    _length_bound(length, entry.name_length) * 0.4
+                    + _length_bound(length, entry.desc_length) * 0.2
+                )
+                if cannot_rank(bound):
+                    continue
+                entry.name_matcher.set_seq1(resource_clean)
+                entry.desc_matcher.set_seq1(resource_clean)
+                self._push(best, top_n, i, 0, 0, False)
+
+        return [match for _, _, match in sorted(best, key=lambda item: item[:2], reverse=True)]
+
+    def _push(self, best: list, top_n: int, i: int, word_overlap: float,
+              key_word_match: float, boosted: bool) -> None:
+        """Score commodity ``i`` exactly and keep it if it ranks in the top ``top_n``."""
+        entry = self.entries[i]
+        full_name_score = entry.name_matcher.ratio()
+        full_desc_score = entry.desc_matcher.ratio()
+        # Summed in the original order so scores are bit-identical
+        score = full_name_score * 0.4 + full_desc_score * 0.2 + word_overlap * 0.3 + key_word_match * 0.1
+        if boosted:
+            score = max(score, BOOST_FLOOR)
+        item = (score, -i)
+        if len(best) == top_n and item <= best[0][:2]:
+            return
+        commodity = entry.commodity
+        match = {
+            'code': commodity['code'],
+            'name': commodity['name'],
+            'description': commodity.get('description', commodity['name']),
+            'score': score,
+            'source': commodity.get('source', 'NASS'),
+            'debug_scores': {
+                'full_name': full_name_score,
+                'word_overlap': word_overlap,
+                'key_word_match': key_word_match,
+            },
+        }
+        if len(best) < top_n:
+            heapq.heappush(best, (score, -i, match))
+        else:
+            heapq.heapreplace(best, (score, -i, match))
+
+    def pg_trgm_candidates(
+        self, conn, resource_names: Iterable[str], limit: int = 50,
+        threshold: float = TRGM_SIMILARITY_THRESHOLD,
+    ) -> Dict[str, List[int]]:
+        """
+        Candidate positions for each resource name, found with ``pg_trgm``.
+
+        The commodities and names are staged in temporary tables, with GIN
+        ``gin_trgm_ops`` indexes on the commodity name and description. One
+        query keeps, per name, the ``limit`` commodities whose name or
+        description is ``%``-similar to it (similarity above ``threshold``),
+        highest similarity first. The ``%`` operator is what lets Postgres
+        answer each name from the indexes instead of scoring every pair.
+        """
+        commodities = [
+            {
+                'position': i,
+                'name': e.commodity['name'].lower(),
+                'description': (e.commodity.get('description', e.commodity['name']) or e.commodity['name']).lower(),
+            }
+            for i, e in enumerate(self.entries)
+        ]
+        names = [{'name': name} for name in dict.fromkeys(resource_names)]
+        found: Dict[str, List[int]] = {n['name']: [] for n in names}
+        commodity_columns = {'position': Integer(), 'name': Text(), 'description': Text()}
+        with staging_table(conn, "match_commodities", commodity_columns, commodities), \
+                staging_table(conn, "match_resources", {'name': Text()}, names):
+            conn.execute(text(
+                "CREATE INDEX ON match_commodities USING GIN (name gin_trgm_ops)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX ON match_commodities USING GIN (description gin_trgm_ops)"
+            ))
+            # Temporary tables are never auto-analyzed
+            conn.execute(text("ANALYZE match_commodities"))
+            # Local to the transaction, like SET LOCAL
+            conn.execute(
+                text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+                {'threshold': str(threshold)},
+            )
+            rows = conn.execute(text("""
+                SELECT r.name, c.position
+                FROM match_resources AS r
+                CROSS JOIN LATERAL (
+                    SELECT c.position
+                    FROM match_commodities AS c
+                    WHERE c.name % lower(r.name)
+                       OR c.description % lower(r.name)
+                    ORDER BY greatest(similarity(c.name, lower(r.name)),
+                                      similarity(c.description, lower(r.name))) DESC,
+                             c.position
+                    LIMIT :limit
+                ) AS c
+            """), {'limit': limit})
+            for name, position in rows:
+                found[name].append(position)
+        return found
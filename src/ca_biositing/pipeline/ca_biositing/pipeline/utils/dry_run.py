@@ -0,0 +1,356 @@
+"""
+Transform-only dry runs that materialize every stage to Parquet.
+
+Profiling or debugging a flow used to need a live database: transforms look
+up and create reference rows through ``normalize_dataframes`` and every flow
+ends in load tasks. Inside ``dry_run_mode``:
+
+- every database access of the pipeline (``get_engine``/``current_engine``)
+  goes to an in-memory SQLite database holding a snapshot of the reference
+  tables, loaded from ``<reference_dir>/<table>.parquet`` (see
+  ``snapshot_reference_tables``). Reference rows a transform creates only
+  land in that throwaway copy;
+- load tasks are skipped;
+- the result of every extract and transform task (a DataFrame, or a dict or
+  list of them) is written to ``materialize_dir`` as Parquet, and
+  ``stats.json`` lists each task run with its wall and CPU time, peak RSS
+  growth, rows and in-memory size of its frames;
+- with ``replay_dir`` (the ``materialize_dir`` of an earlier dry run),
+  extract tasks return the frames materialized then instead of reaching
+  Google Sheets or Drive, so transforms can be benchmarked offline.
+
+Flows decorated with ``supports_dry_run`` accept ``dry_run``,
+``materialize_dir``, ``reference_dir`` and ``replay_dir`` parameters. The
+dry-run state is process-wide, so sub-flows running in threads share it.
+"""
+
+import contextlib
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+from sqlalchemy import MetaData, Table, Text, create_engine, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+logger = logging.getLogger(__name__)
+
+DRY_RUN_DIR = os.getenv("DRY_RUN_DIR", "data/dry_run")
+REFERENCE_SNAPSHOT_DIR = os.getenv("REFERENCE_SNAPSHOT_DIR", "data/reference_snapshot")
+
+# Foreign-key targets that are run bookkeeping or too large to snapshot
+_NOT_REFERENCE_TABLES = frozenset({"etl_run", "lineage_group", "api_user", "polygon"})
+_CHUNK_SIZE = 1000
+STATS_FILE = "stats.json"
+
+_active: Optional["DryRun"] = None
+_active_lock = threading.Lock()
+
+
+@dataclass
+class StageRecord:
+    """One materialized task run, as listed in ``stats.json``."""
+
+    task_name: str
+    stage: Optional[str]
+    occurrence: int
+    status: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    frame_bytes: int = 0
+    kind: str = "none"
+    files: Dict[str, str] = field(default_factory=dict)
+
+
+def _file_stem(task_name: str, occurrence: int) -> str:
+    return f"{re.sub(r'[^A-Za-z0-9._-]+', '_', task_name)}-{occurrence}"
+
+
+def _write_parquet(df: pd.DataFrame, path: str) -> None:
+    """Write ``df``; object columns pyarrow cannot type are written as strings."""
+    try:
+        df.to_parquet(path, index=False)
+        return
+    except Exception:
+        pass
+    df = df.copy()
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+    df.to_parquet(path, index=False)
+
+
+class DryRun:
+    """State of one dry run: the snapshot engine, output directory and stage records."""
+
+    def __init__(
+        self,
+        materialize_dir: str,
+        reference_dir: Optional[str] = None,
+        replay_dir: Optional[str] = None,
+    ):
+        self.materialize_dir = materialize_dir
+        self.reference_dir = reference_dir or REFERENCE_SNAPSHOT_DIR
+        self.replay_dir = replay_dir
+        self.engine = reference_engine(self.reference_dir)
+        self.records: List[StageRecord] = []
+        self._occurrences: Counter = Counter()
+        self._lock = threading.Lock()
+        self._replay = _read_stats(replay_dir) if replay_dir else {}
+        os.makedirs(materialize_dir, exist_ok=True)
+
+    def next_occurrence(self, task_name: str) -> int:
+        with self._lock:
+            self._occurrences[task_name] += 1
+            return self._occurrences[task_name]
+
+    def replayed(self, task_name: str, occurrence: int) -> Any:
+        """The result materialized for this task run by the replayed dry run, or None."""
+        record = self._replay.get((task_name, occurrence))
+        if record is None:
+            return None
+        frames = {
+            key: pd.read_parquet(os.path.join(self.replay_dir, path))
+            for key, path in record["files"].items()
+        }
+        if record["kind"] == "frame":
+            return frames[""]
+        if record["kind"] == "dict":
+            return frames
+        if record["kind"] == "list":
+            return [frames[str(i)] for i in range(len(frames))]
+        return None
+
+    def materialize(self, metrics, occurrence: int, result: Any) -> StageRecord:
+        """Write the DataFrames in ``result`` and record the task run's stats."""
+        record = StageRecord(
+            task_name=metrics.task_name,
+            stage=metrics.stage,
+            occurrence=occurrence,
+            status=metrics.status,
+            wall_seconds=metrics.wall_seconds,
+            cpu_seconds=metrics.cpu_seconds,
+            peak_rss_delta_bytes=metrics.peak_rss_delta_bytes,
+            rows_in=metrics.rows_in,
+            rows_out=metrics.rows_out,
+        )
+        if isinstance(result, pd.DataFrame):
+            record.kind, frames = "frame", {"": result}
+        elif isinstance(result, dict) and result and all(isinstance(v, pd.DataFrame) for v in result.values()):
+            record.kind, frames = "dict", {str(k): v for k, v in result.items()}
+        elif isinstance(result, (list, tuple)) and result and all(isinstance(v, pd.DataFrame) for v in result):
+            record.kind, frames = "list", {str(i): v for i, v in enumerate(result)}
+        else:
+            frames = {}
+
+        stem = _file_stem(metrics.task_name, occurrence)
+        for key, df in frames.items():
+            name = f"{stem}.{re.sub(r'[^A-Za-z0-9._-]+', '_', key)}.parquet" if key else f"{stem}.parquet"
+            _write_parquet(df, os.path.join(self.materialize_dir, name))
+            record.files[key] = name
+            record.frame_bytes += int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    def skip(self, metrics, occurrence: int) -> None:
+        with self._lock:
+            self.records.append(StageRecord(
+                task_name=metrics.task_name, stage=metrics.stage, occurrence=occurrence,
+                status="skipped", rows_in=metrics.rows_in,
+            ))
+
+    def write_stats(self) -> str:
+        """Write ``stats.json`` to the materialize directory and return its path."""
+        path = os.path.join(self.materialize_dir, STATS_FILE)
+        with self._lock:
+            stages = [asdict(r) for r in self.records]
+        with open(path, "w") as f:
+            json.dump({
+                "written_at": datetime.now(timezone.utc).isoformat(),
+                "reference_dir": self.reference_dir,
+                "replay_dir": self.replay_dir,
+                "stages": stages,
+            }, f, indent=2)
+        return path
+
+
+def _read_stats(materialize_dir: str) -> Dict[tuple, dict]:
+    with open(os.path.join(materialize_dir, STATS_FILE)) as f:
+        stages = json.load(f)["stages"]
+    return {(s["task_name"], s["occurrence"]): s for s in stages if s["files"]}
+
+
+def active() -> Optional[DryRun]:
+    """The dry run in progress in this process, if any."""
+    return _active
+
+
+def _sqlite_copy(table: Table, metadata: MetaData) -> Table:
+    """``table`` in ``metadata`` without indexes and with SQLite-compatible column types."""
+    copy = table.to_metadata(metadata)
+    copy.indexes.clear()
+    for column in copy.columns:
+        try:
+            if type(column.type).__module__.startswith("geoalchemy2"):
+                raise TypeError("spatial type")
+            column.type.compile(dialect=sqlite.dialect())
+        except Exception:
+            column.type = Text()
+    return copy
+
+
+def reference_engine(reference_dir: Optional[str] = None) -> Engine:
+    """
+    In-memory SQLite engine with every model table, filled from the Parquet
+    files in ``reference_dir`` (one ``<table>.parquet`` per table; others stay empty).
+    """
+    from sqlmodel import SQLModel
+    import ca_biositing.datamodels.models  # noqa: F401  (registers every table)
+
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        _sqlite_copy(table, metadata)
+    metadata.create_all(engine)
+
+    reference_dir = reference_dir or REFERENCE_SNAPSHOT_DIR
+    if not os.path.isdir(reference_dir):
+        logger.warning(f"No reference snapshot at {reference_dir}; reference tables start empty")
+        return engine
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            path = os.path.join(reference_dir, f"{table.name}.parquet")
+            if not os.path.exists(path):
+                continue
+            df = pd.read_parquet(path)
+            columns = [c.name for c in table.columns if c.name in df.columns and c.computed is None]
+            records = df[columns].astype(object).where(df[columns].notna(), None).to_dict(orient="records")
+            for start in range(0, len(records), _CHUNK_SIZE):
+                conn.execute(table.insert(), records[start:start + _CHUNK_SIZE])
+            logger.info(f"Loaded {len(records)} {table.name} rows from the reference snapshot")
+    return engine
+
+
+def reference_tables() -> List[str]:
+    """Tables other tables point at with foreign keys: the lookups transforms resolve names against."""
+    from sqlmodel import SQLModel
+    import ca_biositing.datamodels.models  # noqa: F401
+
+    targets = {
+        fk.column.table.name
+        for table in SQLModel.metadata.tables.values()
+        for fk in table.foreign_keys
+    }
+    return sorted(targets - _NOT_REFERENCE_TABLES)
+
+
+def snapshot_reference_tables(
+    engine: Engine, reference_dir: Optional[str] = None, tables: Optional[Iterable[str]] = None
+) -> List[str]:
+    """
+    Write ``tables`` (default: ``reference_tables()``) from ``engine`` to
+    ``<reference_dir>/<table>.parquet`` for later dry runs. Spatial and
+    generated columns are left out. Returns the written paths.
+    """
+    from sqlmodel import SQLModel
+    import ca_biositing.datamodels.models  # noqa: F401
+
+    reference_dir = reference_dir or REFERENCE_SNAPSHOT_DIR
+    os.makedirs(reference_dir, exist_ok=True)
+    paths = []
+    with engine.connect() as conn:
+        for name in tables or reference_tables():
+            table = SQLModel.metadata.tables[name]
+            columns = [
+                c for c in table.columns
+                if c.computed is None and not type(c.type).__module__.startswith("geoalchemy2")
+            ]
+            df = pd.DataFrame(conn.execute(select(*columns)).mappings().all(), columns=[c.name for c in columns])
+            path = os.path.join(reference_dir, f"{name}.parquet")
+            _write_parquet(df, path)
+            paths.append(path)
+    return paths
+
+
+@contextlib.contextmanager
+def dry_run_mode(
+    materialize_dir: Optional[str] = None,
+    reference_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+) -> Iterator[DryRun]:
+    """
+    Run the enclosed flow(s) as a dry run (see the module docstring).
+
+    ``materialize_dir`` defaults to a timestamped directory under
+    ``DRY_RUN_DIR``. ``stats.json`` is written there on exit, also when the
+    block fails. A dry run already in progress is reused.
+    """
+    global _active
+    with _active_lock:
+        if _active is not None:
+            outer = _active
+        else:
+            outer = None
+            materialize_dir = materialize_dir or os.path.join(
+                DRY_RUN_DIR, datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            )
+            _active = DryRun(materialize_dir, reference_dir, replay_dir)
+    if outer is not None:
+        yield outer
+        return
+
+    run = _active
+    logger.info(f"Dry run: materializing stages to {run.materialize_dir}")
+    try:
+        yield run
+    finally:
+        with _active_lock:
+            _active = None
+        path = run.write_stats()
+        run.engine.dispose()
+        logger.info(f"Dry run: {len(run.records)} task runs recorded in {path}")
+
+
+def supports_dry_run(fn: Callable) -> Callable:
+    """
+    Give a flow function keyword-only ``dry_run``, ``materialize_dir``,
+    ``reference_dir`` and ``replay_dir`` parameters. Place it under ``@flow``.
+
+    A run with ``dry_run=True`` or a ``materialize_dir`` executes inside
+    ``dry_run_mode``; otherwise the flow runs unchanged.
+    """
+    signature = inspect.signature(fn)
+    extra = [
+        inspect.Parameter("dry_run", inspect.Parameter.KEYWORD_ONLY, default=False, annotation=bool),
+        inspect.Parameter("materialize_dir", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[str]),
+        inspect.Parameter("reference_dir", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[str]),
+        inspect.Parameter("replay_dir", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[str]),
+    ]
+
+    @functools.wraps(fn)
+    def wrapper(*args, dry_run=False, materialize_dir=None, reference_dir=None, replay_dir=None, **kwargs):
+        if not (dry_run or materialize_dir or replay_dir):
+            return fn(*args, **kwargs)
+        with dry_run_mode(materialize_dir, reference_dir, replay_dir):
+            return fn(*args, **kwargs)
+
+    params = list(signature.parameters.values())
+    # Keyword-only parameters go before a **kwargs parameter
+    at = len(params) - int(bool(params) and params[-1].kind is inspect.Parameter.VAR_KEYWORD)
+    wrapper.__signature__ = signature.replace(parameters=[*params[:at], *extra, *params[at:]])
+    return wrapper
@@ -27,8 +27,25 @@ DATABASE_URL = _get_database_url()
 engine = create_engine(DATABASE_URL)
 
 
+def current_engine():
+    """The module engine, or the reference snapshot engine during a dry run."""
+    from ca_biositing.pipeline.utils.dry_run import active
+
+    run = active()
+    return run.engine if run is not None else engine
+
+
 def get_engine():
-    """Return a SQLAlchemy engine with connection pool settings for ETL tasks."""
+    """Return a SQLAlchemy engine with connection pool settings for ETL tasks.
+
+    During a dry run (see ``utils/dry_run.py``) this is the in-memory
+    reference snapshot engine instead.
+    """
+    from ca_biositing.pipeline.utils.dry_run import active
+
+    run = active()
+    if run is not None:
+        return run.engine
     return create_engine(
         _get_database_url(),
         pool_size=5,
@@ -0,0 +1,175 @@
+"""
+Persistent, revision-aware cache of extracted source frames.
+
+Extracted Google Sheets tabs and Drive files are stored as Parquet under
+``EXTRACT_CACHE_DIR``, one file per source, next to a JSON sidecar recording
+the source revision they were extracted at (the Drive ``modifiedTime`` of a
+spreadsheet, or the ``md5Checksum`` of a Drive file). Extractors compare that
+revision with one cheap metadata call and return the cached frame instead of
+downloading again when it is unchanged.
+
+Frames returned by cache-aware extractors carry their source id and revision
+in ``DataFrame.attrs``. After a successful load a flow can call
+``mark_loaded`` on them; on the next run ``is_unchanged`` tells it whether the
+transform and load can be skipped (opt-in via ``ETL_SKIP_UNCHANGED_SOURCES``,
+since a reset database still needs a full load).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+EXTRACT_CACHE_DIR = os.getenv("EXTRACT_CACHE_DIR", "data/extract_cache")
+EXTRACT_CACHE_ENABLED = os.getenv("EXTRACT_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+SKIP_UNCHANGED_SOURCES = os.getenv("ETL_SKIP_UNCHANGED_SOURCES", "false").lower() in ("1", "true", "yes")
+
+SOURCE_ATTR = "extract_source"
+
+
+def _paths(source_id: str, cache_dir: Optional[str] = None) -> tuple[str, str]:
+    cache_dir = cache_dir or EXTRACT_CACHE_DIR
+    readable = re.sub(r"[^A-Za-z0-9._-]+", "_", source_id)[:80]
+    digest = hashlib.sha1(source_id.encode("utf-8")).hexdigest()[:12]
+    base = os.path.join(cache_dir, f"{readable}-{digest}")
+    return base + ".parquet", base + ".json"
+
+
+def read_entry(source_id: str, cache_dir: Optional[str] = None) -> Optional[dict]:
+    """Return the sidecar metadata of a cached source, or None."""
+    _, meta_path = _paths(source_id, cache_dir)
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_entry(meta_path: str, entry: dict) -> None:
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def _tag(df: pd.DataFrame, source_id: str, revision: str) -> pd.DataFrame:
+    df.attrs[SOURCE_ATTR] = {"source_id": source_id, "revision": revision}
+    return df
+
+
+def load_frame(source_id: str, revision: Optional[str], cache_dir: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Return the cached frame for ``source_id`` if it was stored at ``revision``.
+
+    Returns None on a cache miss, a stale revision, or when caching is disabled.
+    """
+    if not EXTRACT_CACHE_ENABLED or revision is None:
+        return None
+    entry = read_entry(source_id, cache_dir)
+    if entry is None or entry.get("revision") != revision:
+        return None
+
+    data_path, _ = _paths(source_id, cache_dir)
+    try:
+        if entry.get("geo"):
+            import geopandas as gpd
+
+            df = gpd.read_parquet(data_path)
+        else:
+            df = pd.read_parquet(data_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry for {source_id}: {e}")
+        return None
+    return _tag(df, source_id, revision)
+
+
+def store_frame(
+    source_id: str,
+    revision: Optional[str],
+    df: Optional[pd.DataFrame],
+    cache_dir: Optional[str] = None,
+    **extra,
+) -> Optional[pd.DataFrame]:
+    """
+    Store ``df`` as the cached frame of ``source_id`` at ``revision``.
+
+    Extra keyword arguments are kept in the sidecar (e.g. the spreadsheet key).
+    Frames that cannot be written as Parquet are returned uncached. Returns
+    ``df`` tagged with its source.
+    """
+    if df is None or revision is None:
+        return df
+    _tag(df, source_id, revision)
+    if not EXTRACT_CACHE_ENABLED:
+        return df
+
+    data_path, meta_path = _paths(source_id, cache_dir)
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    geo = type(df).__name__ == "GeoDataFrame"
+    tmp_path = data_path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, data_path)
+    except Exception as e:
+        logger.warning(f"Not caching {source_id}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return df
+
+    previous = read_entry(source_id, cache_dir) or {}
+    _write_entry(meta_path, {
+        **extra,
+        "source_id": source_id,
+        "revision": revision,
+        "rows": len(df),
+        "geo": geo,
+        "cached_at": datetime.now(timezone.utc).isoformat(),
+        "loaded_revision": previous.get("loaded_revision"),
+    })
+    return df
+
+
+def source_of(df: Optional[pd.DataFrame]) -> Optional[dict]:
+    """Return the ``{"source_id", "revision"}`` a frame was extracted from, if known."""
+    if df is None:
+        return None
+    return df.attrs.get(SOURCE_ATTR)
+
+
+def is_unchanged(*frames: Optional[pd.DataFrame], cache_dir: Optional[str] = None) -> bool:
+    """
+    True if every frame comes from a source revision that was already loaded.
+
+    Frames without source information (or None) count as changed.
+    """
+    if not frames:
+        return False
+    for df in frames:
+        source = source_of(df)
+        if source is None:
+            return False
+        entry = read_entry(source["source_id"], cache_dir)
+        if entry is None or entry.get("loaded_revision") != source["revision"]:
+            return False
+    return True
+
+
+def mark_loaded(*frames: Optional[pd.DataFrame], cache_dir: Optional[str] = None) -> None:
+    """Record that the source revisions of ``frames`` were loaded successfully."""
+    for df in frames:
+        source = source_of(df)
+        if source is None:
+            continue
+        _, meta_path = _paths(source["source_id"], cache_dir)
+        entry = read_entry(source["source_id"], cache_dir)
+        if entry is None or entry.get("revision") != source["revision"]:
+            continue
+        entry["loaded_revision"] = source["revision"]
+        _write_entry(meta_path, entry)
@@ -0,0 +1,189 @@
+"""
+Dependency-aware execution of ETL sub-flows.
+
+The master flow used to run every sub-flow one after another. Here each flow
+declares the flows it depends on; ``run_dag`` starts a flow as soon as all of
+its upstream flows have completed, running up to ``max_workers`` flows at a
+time. A failing flow only stops the flows downstream of it; unrelated
+branches keep running.
+
+``summarize_runs`` reports the wall time, the serial time (sum of flow
+durations), the time saved by running concurrently and the critical path —
+the chain of dependent flows that bounds the wall time.
+"""
+
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "completed"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class FlowRun:
+    """Outcome of one node of the DAG."""
+
+    name: str
+    status: str
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+def topological_order(
+    names: Iterable[str], dependencies: Mapping[str, Iterable[str]]
+) -> List[str]:
+    """
+    Order ``names`` so every flow comes after its dependencies.
+
+    Ties keep the order of ``names``. Dependencies on flows that are not in
+    ``names`` (e.g. commented-out flows) are ignored.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle.
+    """
+    names = list(names)
+    known = set(names)
+    pending = {n: {d for d in dependencies.get(n, ()) if d in known} for n in names}
+    order: List[str] = []
+    while pending:
+        ready = [n for n in names if n in pending and not pending[n]]
+        if not ready:
+            raise ValueError(f"Flow dependencies contain a cycle among: {sorted(pending)}")
+        for name in ready:
+            order.append(name)
+            del pending[name]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return order
+
+
+def _downstream(name: str, dependencies: Mapping[str, Iterable[str]]) -> set:
+    """All flows that depend on ``name`` directly or transitively."""
+    found = set()
+    frontier = [name]
+    while frontier:
+        current = frontier.pop()
+        for node, deps in dependencies.items():
+            if current in deps and node not in found:
+                found.add(node)
+                frontier.append(node)
+    return found
+
+
+def run_dag(
+    flows: Mapping[str, Callable[[], Any]],
+    dependencies: Mapping[str, Iterable[str]],
+    max_workers: int = 4,
+) -> Dict[str, FlowRun]:
+    """
+    Run ``flows`` respecting ``dependencies`` with bounded concurrency.
+
+    Args:
+        flows: Flow name -> zero-argument callable, in preferred start order.
+        dependencies: Flow name -> names of the flows it must run after.
+        max_workers: Maximum number of flows running at once (1 runs serially
+            in dependency order).
+
+    Returns:
+        A ``FlowRun`` per flow, in the order the flows finished (or were skipped).
+    """
+    order = topological_order(flows, dependencies)
+    deps = {n: [d for d in dependencies.get(n, ()) if d in flows] for n in order}
+    runs: Dict[str, FlowRun] = {}
+    running = {}
+
+    def _run(name: str) -> FlowRun:
+        run = FlowRun(name=name, status=COMPLETED, started=time.perf_counter())
+        try:
+            flows[name]()
+        except Exception as e:
+            logger.exception(f"Flow '{name}' failed")
+            run.status = FAILED
+            run.error = f"{type(e).__name__}: {e}"
+        run.finished = time.perf_counter()
+        return run
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="etl-flow") as pool:
+        while len(runs) < len(order):
+            for name in order:
+                if len(running) >= max(1, max_workers):
+                    break
+                if name in runs or name in running.values():
+                    continue
+                if all(runs.get(d) and runs[d].status == COMPLETED for d in deps[name]):
+                    # Copy the context so Prefect links the sub-flow to the master flow run.
+                    ctx = contextvars.copy_context()
+                    running[pool.submit(ctx.run, _run, name)] = name
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                run = future.result()
+                runs[name] = run
+                if run.status == FAILED:
+                    for child in _downstream(name, deps):
+                        if child not in runs:
+                            runs[child] = FlowRun(
+                                name=child, status=SKIPPED, error=f"upstream flow '{name}' failed"
+                            )
+    return runs
+
+
+def critical_path(
+    runs: Mapping[str, FlowRun], dependencies: Mapping[str, Iterable[str]]
+) -> tuple[List[str], float]:
+    """Longest chain of dependent flows by duration, and its total duration."""
+    order = topological_order(runs, dependencies)
+    best: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for name in order:
+        upstream = [d for d in dependencies.get(name, ()) if d in best]
+        parent = max(upstream, key=lambda d: best[d], default=None)
+        previous[name] = parent
+        best[name] = runs[name].duration + (best[parent] if parent else 0.0)
+
+    if not best:
+        return [], 0.0
+    node: Optional[str] = max(best, key=lambda n: best[n])
+    total = best[node]
+    path = []
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    return path[::-1], total
+
+
+def summarize_runs(
+    runs: Mapping[str, FlowRun],
+    dependencies: Mapping[str, Iterable[str]],
+    wall_seconds: float,
+) -> dict:
+    """Wall time, serial time, time saved and critical path of a DAG run."""
+    serial = sum(run.duration for run in runs.values())
+    path, path_seconds = critical_path(runs, dependencies)
+    return {
+        "wall_seconds": wall_seconds,
+        "serial_seconds": serial,
+        "saved_seconds": serial - wall_seconds,
+        "critical_path": path,
+        "critical_path_seconds": path_seconds,
+        "completed": [n for n, r in runs.items() if r.status == COMPLETED],
+        "failed": [n for n, r in runs.items() if r.status == FAILED],
+        "skipped": [n for n, r in runs.items() if r.status == SKIPPED],
+    }
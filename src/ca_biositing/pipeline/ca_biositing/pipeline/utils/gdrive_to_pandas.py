@@ -1,4 +1,6 @@
+import logging
 import os
+from typing import Callable
 import pyproj
 # CRITICAL: Set PROJ_LIB before importing any geospatial libraries to avoid macOS version conflicts
 os.environ['PROJ_LIB'] = pyproj.datadir.get_data_dir()
@@ -10,12 +12,19 @@ from pydrive2.files import ApiRequestError
 import zipfile
 import geopandas as gpd
 
+from . import extraction_cache
+from .task_metrics import note_bytes_read
+
+logger = logging.getLogger(__name__)
+
 def gdrive_to_df(
     file_name: str,
     mime_type: str,
     credentials_path: str,
     dataset_folder: str,
-    file_id: str | None = None
+    file_id: str | None = None,
+    csv_reader: Callable[[str], pd.DataFrame] | None = None,
+    cache_variant: str | None = None
 ) -> pd.DataFrame | gpd.GeoDataFrame:
     """
     Extracts data from a CSV, ZIP, or GEOJSON file into a pandas DataFrame.
@@ -26,9 +35,15 @@ def gdrive_to_df(
         credentials_path: The path to the Google Cloud service account credentials JSON file.
         dataset_folder: the folder where the extracted file is stored.
         file_id: Optional Google Drive File ID. If provided, used instead of searching by name.
+        csv_reader: Optional function reading a CSV path into a DataFrame, used instead of
+            ``pd.read_csv`` (e.g. a projecting, filtering ``columnar_reader.stream_csv``).
+        cache_variant: Suffix of the cache key, required when ``csv_reader`` returns a
+            subset of the file so it is not served to callers expecting all of it.
 
     Returns:
         A pandas DataFrame containing the data from the specified worksheet, or None on error.
+        Files whose md5Checksum (or modifiedDate) matches the extraction cache are not
+        downloaded again; the cached frame is returned instead.
     """
     try:
         settings = {
@@ -53,19 +68,31 @@ def gdrive_to_df(
                     raise FileNotFoundError(f"Error: File '{file_name}' not found. \n Please make sure the name and mimeType is correct and that you have shared it with the service account email.")
                 file_entry = file_entries[0]
 
+            # The file metadata is already fetched; skip the download if unchanged.
+            source_id = f"gdrive:{file_entry['id']}"
+            if cache_variant:
+                source_id += f":{cache_variant}"
+            revision = file_entry.get("md5Checksum") or file_entry.get("modifiedDate")
+            cached = extraction_cache.load_frame(source_id, revision)
+            if cached is not None:
+                logger.info(f"{file_name} unchanged ({revision}); using cached extraction")
+                return cached
+
             # Ensure dataset_folder ends with a slash
             if not dataset_folder.endswith(os.path.sep):
                 dataset_folder += os.path.sep
 
             download_path = os.path.join(dataset_folder, file_name)
             file_entry.GetContentFile(download_path) # Download file
+            note_bytes_read(os.path.getsize(download_path))
         except ApiRequestError as e:
             print(f"An unexpected error occurred: {e}")
             return None
 
         # read csv if file is csv
+        read_csv = csv_reader or pd.read_csv
         if mime_type == "text/csv":
-            df = pd.read_csv(download_path)
+            df = read_csv(download_path)
 
         # extract from zip if file is zip
         # note: THIS CODE ASSUMES THAT THE ZIP ONLY CONTAINS ONE CSV FILE
@@ -76,7 +103,7 @@ def gdrive_to_df(
 
             with zipfile.ZipFile(download_path, "r") as zip_ref:
                 zip_ref.extractall(dataset_folder)
-            df = pd.read_csv(os.path.join(dataset_folder, csv_name))
+            df = read_csv(os.path.join(dataset_folder, csv_name))
 
         elif mime_type == "application/geo+json":
             df = gpd.read_file(download_path)
@@ -86,7 +113,7 @@ def gdrive_to_df(
         # De-duplicate columns, keeping the first occurrence
         df = df.loc[:, ~df.columns.duplicated()]
 
-        return df
+        return extraction_cache.store_frame(source_id, revision, df, file_name=file_name)
 
     except AuthenticationError as e:
         print(f"Google Authentication Error: {e}")
@@ -12,3 +12,13 @@ def get_geoid(val, county_to_geoid):
     if f"{val_clean} county" in county_to_geoid:
         return county_to_geoid[f"{val_clean} county"]
     return "06000"
+
+
+def get_geoids(values: pd.Series, county_to_geoid) -> pd.Series:
+    """
+    Vectorized ``get_geoid`` over a column of county names or strings.
+    """
+    cleaned = values.astype("string").str.strip().str.lower()
+    geoids = cleaned.map(county_to_geoid)
+    geoids = geoids.fillna((cleaned + " county").map(county_to_geoid))
+    return geoids.fillna("06000").astype(object)
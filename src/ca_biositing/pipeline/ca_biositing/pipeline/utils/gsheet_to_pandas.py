@@ -1,8 +1,7 @@
-import re
-
-import gspread
 import pandas as pd
-from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound, APIError
+from gspread.exceptions import SpreadsheetNotFound, APIError
+
+from .gsheet_workbook import gsheet_workbook_to_dfs
 
 def gsheet_to_df(gsheet_name: str, worksheet_name: str, credentials_path: str) -> pd.DataFrame:
     """
@@ -18,50 +17,22 @@ def gsheet_to_df(gsheet_name: str, worksheet_name: str, credentials_path: str) -
     """
     print(f"DEBUG: gsheet_to_df called for {gsheet_name} / {worksheet_name}")
     try:
-        print(f"DEBUG: Authenticating with {credentials_path}")
-        gc = gspread.service_account(filename=credentials_path)
-
         try:
-            print(f"DEBUG: Opening spreadsheet {gsheet_name}")
-            spreadsheet = gc.open(gsheet_name)
+            # Shares the authenticated client, title -> key lookup and the
+            # revision-aware extraction cache with workbook extraction.
+            frames = gsheet_workbook_to_dfs(gsheet_name, [worksheet_name], credentials_path)
         except SpreadsheetNotFound:
-            # Fallback: allow passing a Google Sheet key directly.
-            # Keys are typically URL-safe tokens (often 44 chars) containing letters, digits, _ and -.
-            if re.fullmatch(r"[A-Za-z0-9_-]{20,}", gsheet_name):
-                try:
-                    print(f"DEBUG: Spreadsheet not found by title; trying open_by_key for {gsheet_name}")
-                    spreadsheet = gc.open_by_key(gsheet_name)
-                except SpreadsheetNotFound:
-                    print(f"Error: Spreadsheet '{gsheet_name}' not found by title or key.")
-                    print("Please make sure the spreadsheet name/key is correct and that you have shared it with the service account email.")
-                    return None
-            else:
-                print(f"Error: Spreadsheet '{gsheet_name}' not found.")
-                print("Please make sure the spreadsheet name is correct and that you have shared it with the service account email.")
-                return None
+            print(f"Error: Spreadsheet '{gsheet_name}' not found by title or key.")
+            print("Please make sure the spreadsheet name/key is correct and that you have shared it with the service account email.")
+            return None
 
-        try:
-            print(f"DEBUG: Opening worksheet {worksheet_name}")
-            worksheet = spreadsheet.worksheet(worksheet_name)
-        except WorksheetNotFound:
+        df = frames[worksheet_name]
+        if df is None:
             print(f"Error: Worksheet '{worksheet_name}' not found in the spreadsheet.")
             print("Please make sure the worksheet name is correct.")
             return None
 
-        # Get values directly to ensure we get calculated values, not formulas.
-        # 'FORMATTED_VALUE' gets the value as you see it in the sheet.
-        print(f"DEBUG: Fetching all values from {worksheet_name}")
-        all_values = worksheet.get_all_values(value_render_option='FORMATTED_VALUE')
-        print(f"DEBUG: Successfully fetched {len(all_values)} rows")
-        if not all_values:
-            return pd.DataFrame() # Return empty DataFrame if sheet is empty
-
-        # Use the first row as header and the rest as data
-        df = pd.DataFrame(all_values[1:], columns=all_values[0])
-
-        # De-duplicate columns, keeping the first occurrence
-        df = df.loc[:, ~df.columns.duplicated()]
-
+        print(f"DEBUG: Successfully fetched {len(df)} rows")
         return df
 
     except APIError as e:
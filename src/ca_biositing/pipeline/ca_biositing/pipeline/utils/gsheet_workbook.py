@@ -0,0 +1,198 @@
+"""
+Workbook-level Google Sheets extraction.
+
+``gsheet_to_df`` authenticates, opens a spreadsheet by title (a Drive search)
+and fetches one worksheet per call, so a flow reading N tabs of the same
+workbook pays for N authentications, N Drive searches and N value requests.
+
+This module authenticates once per credentials file, resolves each spreadsheet
+title to its key once per process, and fetches every requested tab with a
+single ``values:batchGet`` request. Tabs are kept in the extraction cache
+(see ``extraction_cache``) keyed on the spreadsheet's Drive ``modifiedTime``,
+so an unchanged workbook costs one metadata request and no value downloads.
+"""
+
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import gspread
+import pandas as pd
+from gspread.exceptions import APIError, SpreadsheetNotFound
+
+from . import extraction_cache
+
+logger = logging.getLogger(__name__)
+
+# Spreadsheet keys are URL-safe tokens (often 44 chars) of letters, digits, _ and -.
+_SPREADSHEET_KEY_RE = re.compile(r"[A-Za-z0-9_-]{20,}")
+
+# Spreadsheet title -> key, filled the first time a title is opened so later
+# opens skip the Drive search.
+_SPREADSHEET_KEYS: Dict[str, str] = {}
+
+
+@lru_cache(maxsize=None)
+def get_gspread_client(credentials_path: str) -> gspread.Client:
+    """Return a service-account client, authenticating once per credentials file."""
+    return gspread.service_account(filename=credentials_path)
+
+
+def open_spreadsheet(client: gspread.Client, gsheet_name: str) -> Tuple[gspread.Spreadsheet, int]:
+    """
+    Open a spreadsheet by title or key, remembering the key of each title.
+
+    Titles are tried first (as ``gsheet_to_df`` always did); a name that looks
+    like a key is opened directly if no spreadsheet has that title.
+
+    Returns:
+        The spreadsheet and the number of API requests it took to open it.
+
+    Raises:
+        gspread.exceptions.SpreadsheetNotFound: If no spreadsheet matches.
+    """
+    key = _SPREADSHEET_KEYS.get(gsheet_name)
+    if key is not None:
+        return client.open_by_key(key), 1
+
+    try:
+        spreadsheet = client.open(gsheet_name)
+        requests = 2
+    except SpreadsheetNotFound:
+        if not _SPREADSHEET_KEY_RE.fullmatch(gsheet_name):
+            raise
+        spreadsheet = client.open_by_key(gsheet_name)
+        requests = 2
+    _SPREADSHEET_KEYS[gsheet_name] = spreadsheet.id
+    return spreadsheet, requests
+
+
+def values_to_df(values: List[List[str]]) -> pd.DataFrame:
+    """
+    Convert worksheet values (first row is the header) into a DataFrame.
+
+    The Sheets API drops trailing empty cells, so rows are padded to a common
+    width first. Duplicate column names keep their first occurrence.
+    """
+    if not values:
+        return pd.DataFrame()
+
+    width = max(len(row) for row in values)
+    rows = [list(row) + [""] * (width - len(row)) for row in values]
+    df = pd.DataFrame(rows[1:], columns=rows[0])
+    return df.loc[:, ~df.columns.duplicated()]
+
+
+def _source_id(gsheet_name: str, worksheet_name: str) -> str:
+    return f"gsheet:{gsheet_name}:{worksheet_name}"
+
+
+def _known_spreadsheet_key(gsheet_name: str, worksheet_names: List[str]) -> Optional[str]:
+    """Key of a spreadsheet resolved earlier in this process or in a cached extraction."""
+    if gsheet_name in _SPREADSHEET_KEYS:
+        return _SPREADSHEET_KEYS[gsheet_name]
+    for name in worksheet_names:
+        entry = extraction_cache.read_entry(_source_id(gsheet_name, name))
+        if entry and entry.get("spreadsheet_id"):
+            return entry["spreadsheet_id"]
+    return None
+
+
+def spreadsheet_revision(client: gspread.Client, key: str) -> str:
+    """Drive ``modifiedTime`` of a spreadsheet (one metadata request)."""
+    return client.get_file_drive_metadata(key)["modifiedTime"]
+
+
+def _a1_range(worksheet_name: str) -> str:
+    """A1 range covering a whole worksheet."""
+    return "'" + worksheet_name.replace("'", "''") + "'"
+
+
+def gsheet_workbook_to_dfs(
+    gsheet_name: str,
+    worksheet_names: Iterable[str],
+    credentials_path: str,
+    client: Optional[gspread.Client] = None,
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Extract several tabs of one Google Sheet with a single batched request.
+
+    Args:
+        gsheet_name: The name (or key) of the Google Sheet.
+        worksheet_names: The worksheets/tabs to fetch.
+        credentials_path: The path to the Google Cloud service account credentials JSON file.
+        client: Optional pre-built client (e.g. a fake in tests).
+
+    Returns:
+        A dict mapping each requested worksheet name to its DataFrame, or to
+        None if the worksheet does not exist. Frames carry their source
+        revision in ``attrs`` (see ``extraction_cache``).
+    """
+    worksheet_names = list(dict.fromkeys(worksheet_names))
+    started = time.perf_counter()
+
+    if client is None:
+        client = get_gspread_client(credentials_path)
+
+    requests = 0
+    revision = None
+    if extraction_cache.EXTRACT_CACHE_ENABLED:
+        key = _known_spreadsheet_key(gsheet_name, worksheet_names)
+        if key is not None:
+            revision = spreadsheet_revision(client, key)
+            requests += 1
+            cached = {
+                name: extraction_cache.load_frame(_source_id(gsheet_name, name), revision)
+                for name in worksheet_names
+            }
+            if all(df is not None for df in cached.values()):
+                logger.info(
+                    f"'{gsheet_name}' unchanged since {revision}; using {len(cached)} cached tabs "
+                    f"({requests} API request in {time.perf_counter() - started:.2f}s)"
+                )
+                return cached
+
+    spreadsheet, opened = open_spreadsheet(client, gsheet_name)
+    requests += opened
+    if revision is None and extraction_cache.EXTRACT_CACHE_ENABLED:
+        revision = spreadsheet_revision(client, spreadsheet.id)
+        requests += 1
+
+    params = {"valueRenderOption": "FORMATTED_VALUE"}
+    present = worksheet_names
+    try:
+        requests += 1
+        response = spreadsheet.values_batch_get([_a1_range(n) for n in present], params=params)
+    except APIError:
+        # One unknown tab fails the whole batch; retry with the tabs that exist.
+        requests += 1
+        titles = {ws.title for ws in spreadsheet.worksheets()}
+        present = [n for n in worksheet_names if n in titles]
+        missing = [n for n in worksheet_names if n not in titles]
+        if not missing:
+            raise
+        logger.warning(f"Worksheets not found in '{gsheet_name}': {missing}")
+        response = {"valueRanges": []}
+        if present:
+            requests += 1
+            response = spreadsheet.values_batch_get([_a1_range(n) for n in present], params=params)
+
+    value_ranges = response.get("valueRanges", [])
+    frames: Dict[str, Optional[pd.DataFrame]] = {name: None for name in worksheet_names}
+    for name, value_range in zip(present, value_ranges):
+        frames[name] = extraction_cache.store_frame(
+            _source_id(gsheet_name, name),
+            revision,
+            values_to_df(value_range.get("values", [])),
+            spreadsheet_id=spreadsheet.id,
+        )
+
+    elapsed = time.perf_counter() - started
+    rows = sum(len(df) for df in frames.values() if df is not None)
+    logger.info(
+        f"Fetched {len(present)}/{len(worksheet_names)} tabs ({rows} rows) from "
+        f"'{gsheet_name}' with {requests} API requests in {elapsed:.2f}s"
+    )
+    return frames
@@ -15,6 +15,9 @@ Usage:
     # Auto-match resources with >90% similarity confidence
     python interactive_commodity_mapper.py --auto-match
 
+    # Same, finding candidate commodities with Postgres pg_trgm
+    python interactive_commodity_mapper.py --auto-match --pg-trgm
+
     # Interactive review of fuzzy matches (50-90% similarity)
     python interactive_commodity_mapper.py --review
 
@@ -67,6 +70,12 @@ from sqlmodel import Session
 
 load_dotenv()
 
+# Trigram/token index used by find_best_matches (same utils directory).
+try:
+    from .commodity_match_index import CommodityMatchIndex
+except ImportError:
+    from commodity_match_index import CommodityMatchIndex  # type: ignore[import]
+
 # Import api_name lookup from the pre-reviewed static reference.
 # Falls back to identity (name unchanged) if the file is not importable.
 try:
@@ -501,100 +510,47 @@ def lookup_manual_commodity_code(commodity_code: str) -> Optional[Dict]:
     return None
 
 
+_MATCH_INDEX_CACHE: Tuple[Optional[List[Dict]], Optional[CommodityMatchIndex]] = (None, None)
+
+
+def get_match_index(usda_commodities: List[Dict]) -> CommodityMatchIndex:
+    """Matching index over ``usda_commodities``, reused while the same list is passed."""
+    global _MATCH_INDEX_CACHE
+    cached_list, cached_index = _MATCH_INDEX_CACHE
+    if cached_list is not usda_commodities:
+        cached_index = CommodityMatchIndex(usda_commodities)
+        _MATCH_INDEX_CACHE = (usda_commodities, cached_index)
+    return cached_index
+
+
 def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: int = 8) -> List[Dict]:
     """
     Find top N best matching USDA commodities for a resource name.
     Uses improved matching logic that considers partial word matches.
 
+    Scoring is a weighted combination of full-string similarity to the name
+    (0.4) and description (0.2), word overlap with the name (0.3) and a key
+    word match bonus (0.1); a resource word longer than 3 characters found in
+    the commodity name lifts the score to at least 0.75. Only commodities
+    sharing a trigram or word with the resource are scored, through a
+    CommodityMatchIndex built once per commodity list.
+
     Returns:
         List of {code, name, description, score} sorted by score descending
     """
-    matches = []
-
-    # Clean resource name for better matching
-    resource_clean = resource_name.lower().strip()
-    resource_words = set(resource_clean.replace('-', ' ').replace('_', ' ').split())
-
-    for commodity in usda_commodities:
-        commodity_name = commodity['name']
-        commodity_desc = commodity.get('description', commodity_name)
-
-        # Calculate multiple similarity scores
-
-        # 1. Full string similarity (original method)
-        full_name_score = calculate_similarity(resource_name, commodity_name)
-        full_desc_score = calculate_similarity(resource_name, commodity_desc)
-
-        # 2. Word-based similarity (new method for better partial matches)
-        commodity_words = set(commodity_name.lower().replace('-', ' ').replace('_', ' ').split())
-        desc_words = set(commodity_desc.lower().replace('-', ' ').replace('_', ' ').split())
-
-        # Calculate word overlap scores
-        if resource_words and commodity_words:
-            word_overlap_name = len(resource_words & commodity_words) / len(resource_words | commodity_words)
-        else:
-            word_overlap_name = 0
-
-        if resource_words and desc_words:
-            word_overlap_desc = len(resource_words & desc_words) / len(resource_words | desc_words)
-        else:
-            word_overlap_desc = 0
-
-        # 3. Key word match (exact word matches get bonus)
-        key_words = resource_words - {'for', 'and', 'the', 'of', 'all', '-', 'processing'}  # Remove common words
-        commodity_key_words = commodity_words - {'for', 'and', 'the', 'of', 'all', '-'}
-
-        if key_words and commodity_key_words:
-            key_word_match = len(key_words & commodity_key_words) / len(key_words)
-        else:
-            key_word_match = 0
-
-        # Calculate final score as weighted combination
-        scores = [
-            full_name_score * 0.4,      # Original method
-            full_desc_score * 0.2,      # Description match
-            word_overlap_name * 0.3,    # Word overlap (important for partial matches)
-            key_word_match * 0.1        # Exact key word match bonus
-        ]
-
-        final_score = sum(scores)
-
-        # Special boost: If any resource word (>3 chars) appears in commodity name, ensure it's considered
-        # This handles cases like "almond shells" → "ALMONDS"
-        resource_key_words = [w for w in resource_words if len(w) > 3 and w not in {'hulls', 'shells', 'straw', 'processing', 'waste'}]
-        commodity_name_lower = commodity_name.lower()
-
-        for word in resource_key_words:
-            # Check if resource word is contained in commodity name (handles plural, etc.)
-            if word in commodity_name_lower or any(word in cw for cw in commodity_words):
-                final_score = max(final_score, 0.75)  # Ensure it gets into top candidates
-                break
-
-        matches.append({
-            'code': commodity['code'],
-            'name': commodity['name'],
-            'description': commodity.get('description', commodity['name']),
-            'score': final_score,
-            'source': commodity.get('source', 'NASS'),
-            'debug_scores': {
-                'full_name': full_name_score,
-                'word_overlap': word_overlap_name,
-                'key_word_match': key_word_match
-            }
-        })
-
-    # Sort by score descending
-    matches.sort(key=lambda x: x['score'], reverse=True)
-
-    return matches[:top_n]
+    return get_match_index(usda_commodities).find_best_matches(resource_name, top_n)
 
 # ============================================================================
 # STEP 4: Auto-match high-confidence matches
 # ============================================================================
 
-def auto_match_clear_matches(resources: List[Dict], usda_commodities: List[Dict], threshold: float = 0.90):
+def auto_match_clear_matches(resources: List[Dict], usda_commodities: List[Dict], threshold: float = 0.90,
+                             use_pg_trgm: bool = False):
     """
     Automatically match resources with USDA commodities when similarity > threshold.
+
+    With ``use_pg_trgm``, candidate commodities for all resources are found in
+    one Postgres pg_trgm query instead of the in-memory trigram index.
     """
     print("\n" + "=" * 80)
     print(f"STEP 3: Auto-Matching Clear Matches (>{threshold:.0%} similarity)")
@@ -603,8 +559,16 @@ def auto_match_clear_matches(resources: List[Dict], usda_commodities: List[Dict]
     auto_matches = []
     pending_review = []
 
+    index = get_match_index(usda_commodities)
+    candidates = {}
+    if use_pg_trgm:
+        engine = create_engine(os.getenv('DATABASE_URL'))
+        with engine.connect() as conn:
+            candidates = index.pg_trgm_candidates(conn, [r['name'] for r in resources])
+        print(f"  → pg_trgm candidates found for {len(candidates)} resources")
+
     for resource in resources:
-        matches = find_best_matches(resource['name'], usda_commodities, top_n=8)
+        matches = index.find_best_matches(resource['name'], top_n=8, candidates=candidates.get(resource['name']))
 
         if not matches:
             continue
@@ -1659,6 +1623,8 @@ def main():
                        help='Fetch all CA USDA commodities from NASS API')
     parser.add_argument('--auto-match', action='store_true',
                        help='Auto-match clear matches (>90%% similarity)')
+    parser.add_argument('--pg-trgm', action='store_true',
+                       help='With --auto-match, find candidates with Postgres pg_trgm')
     parser.add_argument('--review', action='store_true',
                        help='Interactively review fuzzy matches')
     parser.add_argument('--save-to-db', action='store_true',
@@ -1702,7 +1668,7 @@ def main():
     if args.auto_match or args.full_workflow:
         commodities = load_ca_commodities()
         resources = get_project_resources()
-        auto_match_clear_matches(resources, commodities)
+        auto_match_clear_matches(resources, commodities, use_pg_trgm=args.pg_trgm)
 
     if args.review or args.full_workflow:
         interactive_review()
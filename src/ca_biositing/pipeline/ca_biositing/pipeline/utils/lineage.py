@@ -3,7 +3,7 @@ from typing import Optional
 from prefect import task, get_run_logger
 from prefect.context import FlowRunContext
 from sqlalchemy.orm import Session
-from ca_biositing.pipeline.utils.engine import engine
+from ca_biositing.pipeline.utils.engine import current_engine
 
 @task
 def create_etl_run_record(pipeline_name: str) -> str:
@@ -11,6 +11,7 @@ def create_etl_run_record(pipeline_name: str) -> str:
     Creates an EtlRun record in the database using the Prefect run_id.
     """
     from ca_biositing.datamodels.models import EtlRun
+    from ca_biositing.pipeline.utils.task_metrics import attach_metrics_to_run
 
     ctx = FlowRunContext.get()
     if not ctx:
@@ -19,7 +20,7 @@ def create_etl_run_record(pipeline_name: str) -> str:
     run_id_str = str(ctx.flow_run.id)
     logger = get_run_logger()
 
-    with Session(engine) as session:
+    with Session(current_engine()) as session:
         # Check if it already exists by run_id
         existing = session.query(EtlRun).filter(EtlRun.run_id == run_id_str).first()
         if existing:
@@ -32,6 +33,9 @@ def create_etl_run_record(pipeline_name: str) -> str:
             status="RUNNING"
         )
         session.add(etl_run)
+        session.flush()
+        # Tasks tracked before the run record existed (e.g. the extract)
+        attach_metrics_to_run(session, run_id_str, etl_run.id)
         session.commit()
         session.refresh(etl_run)
         logger.info(f"Created EtlRun record: {etl_run.id} for Prefect run {run_id_str}")
@@ -48,7 +52,7 @@ def create_lineage_group(etl_run_id: str, note: Optional[str] = None) -> int:
 
     logger = get_run_logger()
 
-    with Session(engine) as session:
+    with Session(current_engine()) as session:
         lineage_group = LineageGroup(
             etl_run_id=etl_run_id,
             note=note
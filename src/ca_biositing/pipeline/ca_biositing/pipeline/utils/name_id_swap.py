@@ -1,3 +1,4 @@
+import threading
 from typing import Type, TypeVar, Any
 
 import pandas as pd
@@ -5,9 +6,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 import logging
 
+from . import dry_run
+
 ModelType = TypeVar("ModelType", bound=Any)
 logger = logging.getLogger(__name__)
 
+# Transforms running concurrently on a thread task runner would otherwise race
+# to create the same missing reference rows (e.g. a new parameter or unit).
+_NORMALIZE_LOCK = threading.Lock()
+
 def replace_id_with_name_df(
     db: Session,
     df: pd.DataFrame,
@@ -52,11 +59,12 @@ def replace_name_with_id_df(
   """
 
   # If using the SQLite fallback, skip DB lookups and return a column of NA.
+  # A dry run's reference snapshot is SQLite too, but holds real lookup rows.
   try:
       driver_name = db.bind.url.drivername  # type: ignore[attr-defined]
   except Exception:
       driver_name = None
-  if driver_name == "sqlite":
+  if driver_name == "sqlite" and dry_run.active() is None:
       logger.warning("SQLite fallback active; skipping name‑id replacement.")
       df_copy = df.copy()
       df_copy[final_column_name] = pd.NA
@@ -80,8 +88,9 @@ def replace_name_with_id_df(
     return df_copy, 0
 
   # Build a case-insensitive lookup map.
-  # We lowercase the keys to ensure matches regardless of DB casing.
-  name_to_id_map = {str(name).lower(): id_ for name, id_ in rows if name is not None}
+  # Keys are lowercased and stripped, the same form new rows are inserted in,
+  # so a name is found regardless of DB casing or surrounding whitespace.
+  name_to_id_map = {str(name).lower().strip(): id_ for name, id_ in rows if name is not None}
 
   df_copy = df.copy()
 
@@ -90,23 +99,23 @@ def replace_name_with_id_df(
   series = df_copy[df_name_column]
   unique_names = set(series[series.notna() & (series.astype(str).str.strip() != "")].unique())
 
-  # Check against lowercased keys in the map to prevent duplicates
-  new_names = {name for name in unique_names if str(name).lower() not in name_to_id_map}
+  # Check the cleaned (lowercased, stripped) names against the map, so
+  # "Corn", "corn " and "corn" are one name and never inserted twice
+  new_names = {str(name).lower().strip() for name in unique_names} - name_to_id_map.keys()
   num_new_records = len(new_names)
 
   # 3. Insert missing reference rows
   if new_names:
-    for name in new_names:
+    for clean_name in new_names:
       # Enforce lowercase on creation for consistency in reference tables
-      clean_name = str(name).lower().strip()
       new_record = ref_model(**{model_name_attr: clean_name})
       db.add(new_record)
 
     # Flush to get IDs without ending the transaction
     db.flush()
 
-    # Re-query just-created rows using lowercased names to match what we inserted
-    clean_new_names = [str(name).lower().strip() for name in new_names]
+    # Re-query just-created rows using the cleaned names we inserted
+    clean_new_names = list(new_names)
     refreshed = db.execute(
       select(ref_model).where(
         getattr(ref_model, model_name_attr).in_(clean_new_names)
@@ -116,12 +125,12 @@ def replace_name_with_id_df(
     for record in refreshed:
       # Use lowercased keys for the map to ensure matches
       name_to_id_map[
-        str(getattr(record, model_name_attr)).lower()
+        str(getattr(record, model_name_attr)).lower().strip()
       ] = getattr(record, id_column_name)
 
   # 4. Replace name column with ID column using case-insensitive mapping
-  # We lowercase the lookup keys from the DataFrame to match our map.
-  df_copy[final_column_name] = df_copy[df_name_column].astype(str).str.lower().map(name_to_id_map)
+  # We lowercase and strip the lookup keys from the DataFrame to match our map.
+  df_copy[final_column_name] = df_copy[df_name_column].astype(str).str.lower().str.strip().map(name_to_id_map)
 
   # If the final column name matches the original, don't drop it (this happens if col is already raw_data_id)
   if final_column_name != df_name_column:
@@ -141,6 +150,9 @@ def normalize_dataframes(
     empty dictionary is used by default, allowing callers to supply a custom
     mapping when needed.
 
+    Lookups and inserts of reference rows are serialized across threads in
+    this process, so concurrent transforms cannot create duplicate rows.
+
     Returns:
         Always returns a list of DataFrames, even if a single DataFrame was passed.
     """
@@ -154,10 +166,10 @@ def normalize_dataframes(
 
     logger.debug(f"Starting normalization for {len(dataframes)} DataFrames.")
     normalized_dfs: list[pd.DataFrame] = []
-    from .engine import engine
+    from .engine import current_engine
     try:
         logger.debug("Opening database session...")
-        with Session(engine) as db:
+        with _NORMALIZE_LOCK, Session(current_engine()) as db:
             logger.debug("Database session opened")
             for i, df in enumerate(dataframes):
                 if not isinstance(df, pd.DataFrame):
@@ -0,0 +1,192 @@
+"""
+Set-based upsert for tables keyed by a normalized name.
+
+``resource`` and lookup tables such as ``primary_ag_product`` have no natural
+key besides ``name``, so loaders used to look up every incoming row with
+``lower(name) = ...`` and insert or update it through the ORM: at least two
+round trips per row. ``upsert_by_name`` writes a batch in three statements
+(per chunk of ``_CHUNK_SIZE`` rows) whatever its size:
+
+1. one SELECT of the existing rows whose ``name_norm`` is in the batch,
+2. one multi-row ``INSERT ... ON CONFLICT (name_norm) DO NOTHING RETURNING``
+   for new names,
+3. one ``UPDATE ... FROM (VALUES ...)`` for existing rows whose values changed.
+
+Rows whose business columns are unchanged are not written, so ``updated_at``
+only moves when the content does. ``name_norm`` is the generated
+``normalized_text(name)`` column with a unique index, which keeps concurrent
+loads from inserting a name twice.
+
+Databases other than PostgreSQL (SQLite in tests) run step 3 as one
+executemany UPDATE by id, since they lack ``VALUES`` column aliases.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, Table, bindparam, cast, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+
+from ca_biositing.pipeline.utils.row_fingerprint import NON_BUSINESS_COLUMNS
+
+_CHUNK_SIZE = 1000
+
+
+@dataclass
+class NameUpsert:
+    """Outcome of ``upsert_by_name``: ids by normalized name and per-row counts."""
+
+    ids: dict[str, int] = field(default_factory=dict)
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+    def summary(self) -> str:
+        text = f"{self.inserted} inserted, {self.updated} updated, {self.unchanged} unchanged"
+        return f"{text}, {self.skipped} skipped without a name" if self.skipped else text
+
+
+def name_key(name) -> Optional[str]:
+    """The key a name is matched on, mirroring ``normalized_text(name)``; None for blank names."""
+    if name is None or not isinstance(name, str) or not name.strip():
+        return None
+    key = name.replace("_", " ")
+    for _ in range(3):
+        key = key.replace("  ", " ")
+    return key.strip(" ").lower() or None
+
+
+def _writable_columns(table: Table) -> list[str]:
+    """Columns a loader may set: everything but the primary key and generated columns."""
+    return [c.name for c in table.columns if not c.primary_key and c.computed is None]
+
+
+def _latest_by_name(
+    records: Iterable[dict], table: Table, name_column: str, result: NameUpsert
+) -> dict[str, dict]:
+    """Incoming rows restricted to writable columns; a name repeated in the batch keeps its last row."""
+    writable = set(_writable_columns(table))
+    latest: dict[str, dict] = {}
+    for record in records:
+        key = name_key(record.get(name_column))
+        if key is None:
+            result.skipped += 1
+            continue
+        latest.pop(key, None)
+        latest[key] = {k: v for k, v in record.items() if k in writable}
+    return latest
+
+
+def _update_from_values(conn, table: Table, columns: list[str], rows: list[dict]) -> None:
+    """Write ``rows`` (each holding ``id`` and ``columns``) in one UPDATE."""
+    if conn.dialect.name == "postgresql":
+        incoming = values(
+            column("id", Integer),
+            *[column(c, table.c[c].type) for c in columns],
+            name="incoming",
+        ).data([(row["id"], *[row[c] for c in columns]) for row in rows])
+        # Casts keep all-NULL VALUES columns (typed text by Postgres) assignable.
+        stmt = (
+            update(table)
+            .where(table.c.id == incoming.c.id)
+            .values({c: cast(incoming.c[c], table.c[c].type) for c in columns})
+        )
+        conn.execute(stmt)
+        return
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values({c: bindparam(f"_{c}") for c in columns})
+    )
+    conn.execute(stmt, [{"_id": row["id"], **{f"_{c}": row[c] for c in columns}} for row in rows])
+
+
+def _upsert_chunk(
+    conn, table: Table, key_column: str, batch: dict[str, dict], now: datetime, result: NameUpsert
+) -> None:
+    columns = sorted({c for row in batch.values() for c in row} - {"created_at"})
+    key = table.c[key_column]
+    existing = {
+        row._mapping["_key"]: row._mapping
+        for row in conn.execute(
+            select(table.c.id, key.label("_key"), *[table.c[c] for c in columns])
+            .where(key.in_(list(batch)))
+        )
+    }
+
+    new_rows, changed_rows = [], []
+    for name, incoming in batch.items():
+        current = existing.get(name)
+        if current is None:
+            row = {c: incoming.get(c) for c in columns}
+            if "created_at" in table.c:
+                row["created_at"] = incoming.get("created_at") or now
+            if "updated_at" in table.c:
+                row["updated_at"] = now
+            new_rows.append(row)
+            continue
+        result.ids[name] = current["id"]
+        compared = [c for c in incoming if c not in NON_BUSINESS_COLUMNS]
+        if all(current[c] == incoming[c] for c in compared):
+            result.unchanged += 1
+            continue
+        row = {"id": current["id"], **{c: incoming.get(c, current[c]) for c in columns}}
+        if "updated_at" in table.c:
+            row["updated_at"] = now
+        changed_rows.append(row)
+
+    if new_rows:
+        stmt = insert(table).values(new_rows).on_conflict_do_nothing(index_elements=[key])
+        returned = conn.execute(stmt.returning(table.c.id, key)).all()
+        for id_, inserted_key in returned:
+            result.ids[inserted_key] = id_
+        result.inserted += len(returned)
+        # Rows lost to a concurrent insert of the same name only need their ids.
+        missing = [k for k in batch if k not in result.ids]
+        if missing:
+            for id_, existing_key in conn.execute(select(table.c.id, key).where(key.in_(missing))):
+                result.ids[existing_key] = id_
+                result.unchanged += 1
+
+    if changed_rows:
+        update_columns = sorted(set(columns) | ({"updated_at"} & set(table.c.keys())))
+        _update_from_values(conn, table, update_columns, changed_rows)
+        result.updated += len(changed_rows)
+
+
+def upsert_by_name(
+    conn,
+    table: Table,
+    records: Iterable[dict],
+    name_column: str = "name",
+    now: Optional[datetime] = None,
+    key_column: str = "name_norm",
+) -> NameUpsert:
+    """
+    Insert or update ``records`` in ``table``, matching rows on ``name_norm``.
+
+    Args:
+        conn: A Connection or Session; the caller commits.
+        table: The target table, e.g. ``Resource.__table__``.
+        records: Incoming rows as dicts. Keys that are not writable columns
+            are ignored, rows without a name are skipped, and a name repeated
+            in the batch keeps its last row.
+        name_column: The name column of the incoming rows.
+        now: Timestamp for ``created_at``/``updated_at``; defaults to the current UTC time.
+        key_column: The generated ``normalized_text(name_column)`` column
+            with a unique index, matched and used as the conflict target.
+
+    Returns:
+        A NameUpsert with the id of every named row and the inserted, updated,
+        unchanged and skipped counts.
+    """
+    now = now or datetime.now(timezone.utc)
+    result = NameUpsert()
+    batch = _latest_by_name(records, table, name_column, result)
+    keys = list(batch)
+    for start in range(0, len(keys), _CHUNK_SIZE):
+        chunk = {k: batch[k] for k in keys[start:start + _CHUNK_SIZE]}
+        _upsert_chunk(conn, table, key_column, chunk, now, result)
+    return result
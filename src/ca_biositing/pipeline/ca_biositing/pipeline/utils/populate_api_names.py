@@ -22,9 +22,12 @@ The source of truth for api_name values is reviewed_api_mappings.py
 """
 
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import Integer, Text, create_engine, text
 from datetime import datetime, UTC
 from .reviewed_api_mappings import get_api_name
+from .staging_table import staging_table
+
+_STAGING_COLUMNS = {'id': Integer(), 'api_name': Text()}
 
 def populate_api_names(engine=None, dry_run=False):
     """
@@ -101,21 +104,23 @@ def populate_api_names(engine=None, dry_run=False):
                     updates.append({
                         'id': commodity_id,
                         'api_name': api_name,
-                        'updated_at': current_time
                     })
 
             # Perform updates if not dry run
             if not dry_run and updates:
                 print(f"\nExecuting {len(updates)} updates...")
 
-                with conn.begin():  # Transaction
-                    for update in updates:
-                        conn.execute(text("""
-                            UPDATE usda_commodity
-                            SET api_name = :api_name,
-                                updated_at = :updated_at
-                            WHERE id = :id
-                        """), update)
+                # One set-based UPDATE joined against the staged (id, api_name)
+                # pairs, committed in the transaction the SELECT above began.
+                with staging_table(conn, "usda_commodity_api_names", _STAGING_COLUMNS, updates):
+                    conn.execute(text("""
+                        UPDATE usda_commodity
+                        SET api_name = s.api_name,
+                            updated_at = :updated_at
+                        FROM usda_commodity_api_names AS s
+                        WHERE usda_commodity.id = s.id
+                    """), {'updated_at': current_time})
+                conn.commit()
 
                 stats['updated_commodities'] = len(updates)
                 print(f"✅ Updated {len(updates)} commodity records")
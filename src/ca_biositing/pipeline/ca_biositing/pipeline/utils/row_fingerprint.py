@@ -0,0 +1,183 @@
+"""
+Content-hash change detection for upserting loaders.
+
+Loaders used to upsert every incoming row and stamp ``updated_at = now`` even
+when nothing had changed, rewriting whole tables on every run. Here each row's
+business columns (everything but ids, timestamps and lineage ids) are hashed
+with a vectorized pandas hash and stored in ``row_fingerprint`` under the
+table name and the row's natural key. ``diff_rows`` compares an incoming frame
+with the stored hashes and returns only the inserted and changed rows;
+``save_changes`` stores the new hashes in the same transaction as the upsert
+and records the per-table inserted/updated/unchanged counts in
+``lineage_table_change``.
+
+Set ``ETL_FORCE_FULL_UPSERT=true`` to send every row regardless (e.g. after
+rows were deleted by hand); fingerprints and counts are still recorded.
+"""
+
+import functools
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import pandas as pd
+from sqlalchemy import Table, select
+from sqlalchemy.dialects.postgresql import insert
+
+FORCE_FULL_UPSERT = os.getenv("ETL_FORCE_FULL_UPSERT", "false").lower() in ("1", "true", "yes")
+
+# Columns that change on every load without the row's content changing.
+NON_BUSINESS_COLUMNS = frozenset({"id", "created_at", "updated_at", "etl_run_id", "lineage_group_id"})
+
+_NULL = "\x00"
+_CHUNK_SIZE = 5000
+
+
+@dataclass
+class ChangeSet:
+    """Result of diffing an incoming frame against stored fingerprints."""
+
+    table_name: str
+    rows: pd.DataFrame
+    row_keys: pd.Series
+    row_hashes: pd.Series
+    inserted: int
+    updated: int
+    unchanged: int
+    etl_run_id: Optional[int] = None
+    lineage_group_id: Optional[int] = None
+
+    def summary(self) -> str:
+        return f"{self.inserted} inserted, {self.updated} updated, {self.unchanged} unchanged"
+
+
+def row_keys(df: pd.DataFrame, key_columns: Iterable[str]) -> pd.Series:
+    """Natural key of each row as a single ``|``-joined string."""
+    parts = [df[c].astype("string").fillna(_NULL) for c in key_columns]
+    return functools.reduce(lambda left, right: left + "|" + right, parts)
+
+
+def row_hashes(df: pd.DataFrame, columns: Iterable[str]) -> pd.Series:
+    """
+    64-bit content hash of ``columns`` for every row.
+
+    Values are hashed through their string form, so a column whose dtype drifts
+    between runs (e.g. int vs. object) hashes the same for the same values.
+    Column order does not matter.
+    """
+    normalized = pd.DataFrame(
+        {c: df[c].astype("string").fillna(_NULL) for c in sorted(columns)},
+        index=df.index,
+    )
+    hashes = pd.util.hash_pandas_object(normalized, index=False)
+    return pd.Series(hashes.to_numpy().view("int64"), index=df.index)
+
+
+def _first_id(df: pd.DataFrame, column: str) -> Optional[int]:
+    if column not in df.columns:
+        return None
+    values = df[column].dropna()
+    return int(values.iloc[0]) if len(values) else None
+
+
+def diff_rows(
+    session,
+    table: Table,
+    df: pd.DataFrame,
+    key_columns: Iterable[str],
+) -> ChangeSet:
+    """
+    Split ``df`` into rows to write and rows unchanged since the last load.
+
+    Args:
+        session: A Session or Connection used to read stored fingerprints.
+        table: The target table; only its business columns are hashed.
+        df: Incoming rows. Rows repeating a key keep the last occurrence.
+        key_columns: The natural key of the table.
+
+    Returns:
+        A ChangeSet whose ``rows`` holds the inserted and changed rows.
+    """
+    from ca_biositing.datamodels.models import RowFingerprint
+
+    key_columns = list(key_columns)
+    hash_columns = [
+        c.name for c in table.columns
+        if c.name in df.columns and c.name not in NON_BUSINESS_COLUMNS and c.name not in key_columns
+    ]
+
+    keys = row_keys(df, key_columns)
+    unique = ~keys.duplicated(keep="last")
+    df, keys = df[unique], keys[unique]
+    hashes = row_hashes(df, hash_columns + key_columns)
+
+    stored = pd.DataFrame(
+        session.execute(
+            select(RowFingerprint.row_key, RowFingerprint.row_hash)
+            .where(RowFingerprint.table_name == table.name)
+        ).all(),
+        columns=["row_key", "row_hash"],
+    )
+    # A left merge keeps the incoming order; Int64 keeps the hashes exact next to NA.
+    stored["row_hash"] = stored["row_hash"].astype("Int64")
+    merged = pd.DataFrame({"row_key": keys.to_numpy()}).merge(stored, on="row_key", how="left")
+    previous = pd.Series(merged["row_hash"].array, index=keys.index)
+
+    is_new = previous.isna()
+    is_changed = ~is_new & (previous != hashes).fillna(False)
+    to_write = is_new | is_changed if not FORCE_FULL_UPSERT else pd.Series(True, index=df.index)
+
+    return ChangeSet(
+        table_name=table.name,
+        rows=df[to_write],
+        row_keys=keys[to_write],
+        row_hashes=hashes[to_write],
+        inserted=int(is_new.sum()),
+        updated=int(is_changed.sum()),
+        unchanged=int((~is_new & ~is_changed).sum()),
+        etl_run_id=_first_id(df, "etl_run_id"),
+        lineage_group_id=_first_id(df, "lineage_group_id"),
+    )
+
+
+def save_changes(session, changes: ChangeSet) -> None:
+    """
+    Store the fingerprints of the written rows and the load's change counts.
+
+    Call within the transaction that wrote ``changes.rows`` so the stored
+    hashes never get ahead of the table.
+    """
+    from ca_biositing.datamodels.models import LineageTableChange, RowFingerprint
+
+    now = datetime.now(timezone.utc)
+    fingerprints = [
+        {
+            "table_name": changes.table_name,
+            "row_key": key,
+            "row_hash": int(row_hash),
+            "etl_run_id": changes.etl_run_id,
+            "updated_at": now,
+        }
+        for key, row_hash in zip(changes.row_keys.tolist(), changes.row_hashes.tolist())
+    ]
+    for start in range(0, len(fingerprints), _CHUNK_SIZE):
+        stmt = insert(RowFingerprint).values(fingerprints[start:start + _CHUNK_SIZE])
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=["table_name", "row_key"],
+            set_={
+                "row_hash": stmt.excluded.row_hash,
+                "etl_run_id": stmt.excluded.etl_run_id,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ))
+
+    session.execute(insert(LineageTableChange).values(
+        etl_run_id=changes.etl_run_id,
+        lineage_group_id=changes.lineage_group_id,
+        table_name=changes.table_name,
+        inserted=changes.inserted,
+        updated=changes.updated,
+        unchanged=changes.unchanged,
+        created_at=now,
+    ))
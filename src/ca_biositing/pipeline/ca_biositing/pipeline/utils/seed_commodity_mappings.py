@@ -5,15 +5,22 @@ This module seeds the usda_commodity and resource_usda_commodity_map tables
 using the CSV mapping file. It assumes that the primary_ag_product and resource
 tables are already populated by previous flows.
 
+The CSV rows are loaded into temporary staging tables and written with a few
+set-based statements; the mapping table is diffed against the CSV rather than
+truncated, so downstream views only see rows that actually changed.
+
 api_name values come from reviewed_api_mappings.py (OFFICIAL_API_MAPPINGS),
 which covers all ~400 NASS commodity codes. Run --apply-api-names after seeding
 to backfill any rows that were inserted before the mapping dict was complete.
 """
 
 import os
+from datetime import datetime, timezone
+
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import Text, text
 from ca_biositing.pipeline.utils.engine import get_engine
+from ca_biositing.pipeline.utils.staging_table import staging_table
 
 # reviewed_api_mappings.py lives in the same utils directory.
 # Use a relative import when loaded as part of the package (normal pipeline
@@ -31,6 +38,166 @@ except ImportError:
         ) from e
 
 
+# Constant metadata for all NASS-sourced commodities
+NASS_URI = (
+    "https://www.nass.usda.gov/Data_and_Statistics/"
+    "County_Data_Files/Frequently_Asked_Questions/commcodes.php"
+)
+NASS_SOURCE = "NASS_WEB"
+
+_COMMODITY_STAGING_COLUMNS = {
+    'name': Text(),
+    'api_name': Text(),
+    'usda_code': Text(),
+    'usda_source': Text(),
+    'description': Text(),
+    'uri': Text(),
+}
+_MAPPING_STAGING_COLUMNS = {
+    'resource_name': Text(),
+    'commodity_name': Text(),
+    'match_tier': Text(),
+    'note': Text(),
+}
+
+
+def _upsert_usda_commodities(conn, rows: list[dict], now: datetime) -> tuple[int, int]:
+    """
+    Insert new usda_commodity rows and update changed ones from a staging table.
+
+    ``name`` has no unique constraint (see interactive_commodity_mapper), so
+    instead of ON CONFLICT the update joins on name and the insert skips names
+    already present. Existing rows keep non-NULL usda_source/description/uri,
+    and rows whose values would not change are not touched.
+
+    Returns:
+        (inserted, updated) row counts.
+    """
+    with staging_table(conn, "usda_commodity_staging", _COMMODITY_STAGING_COLUMNS, rows):
+        updated = conn.execute(text("""
+            UPDATE usda_commodity
+            SET api_name    = s.api_name,
+                usda_code   = s.usda_code,
+                usda_source = COALESCE(usda_commodity.usda_source, s.usda_source),
+                description = COALESCE(usda_commodity.description, s.description),
+                uri         = COALESCE(usda_commodity.uri, s.uri),
+                updated_at  = :now
+            FROM usda_commodity_staging AS s
+            WHERE usda_commodity.name = s.name
+              AND (usda_commodity.api_name IS DISTINCT FROM s.api_name
+                   OR usda_commodity.usda_code IS DISTINCT FROM s.usda_code
+                   OR usda_commodity.usda_source IS NULL
+                   OR usda_commodity.description IS NULL
+                   OR usda_commodity.uri IS NULL)
+        """), {'now': now}).rowcount
+        inserted = conn.execute(text("""
+            INSERT INTO usda_commodity
+                (name, api_name, usda_code, usda_source, description, uri,
+                 created_at, updated_at)
+            SELECT s.name, s.api_name, s.usda_code, s.usda_source, s.description, s.uri,
+                   :now, :now
+            FROM usda_commodity_staging AS s
+            WHERE NOT EXISTS (SELECT 1 FROM usda_commodity uc WHERE uc.name = s.name)
+        """), {'now': now}).rowcount
+    return inserted, updated
+
+
+def _sync_commodity_map(conn, rows: list[dict], now: datetime) -> dict:
+    """
+    Make resource_usda_commodity_map match the mapped CSV rows.
+
+    Resource names are resolved against resource first and primary_ag_product
+    second, and commodity names against usda_commodity, in one joined SELECT.
+    The table is then diffed on (resource_id, primary_ag_product_id,
+    usda_commodity_id) instead of truncated: stale mappings are deleted,
+    changed match_tier/note values updated and new mappings inserted, so rows
+    that did not change keep their ids and timestamps.
+
+    Returns:
+        Counts of mapped CSV rows and of inserted, updated and deleted mappings.
+    """
+    same_key = """
+        resource_usda_commodity_map.resource_id IS NOT DISTINCT FROM r.resource_id
+        AND resource_usda_commodity_map.primary_ag_product_id IS NOT DISTINCT FROM r.primary_ag_product_id
+        AND resource_usda_commodity_map.usda_commodity_id = r.usda_commodity_id
+    """
+    with staging_table(conn, "commodity_mapping_staging", _MAPPING_STAGING_COLUMNS, rows):
+        conn.execute(text("DROP TABLE IF EXISTS commodity_mapping_resolved"))
+        # Lookup resource_id by name — try resource table first, fall back to
+        # primary_ag_product. Both map to the same resource_usda_commodity_map
+        # table; the type is encoded by which FK column is non-null.
+        conn.execute(text("""
+            CREATE TEMPORARY TABLE commodity_mapping_resolved AS
+            SELECT s.resource_name,
+                   s.commodity_name,
+                   r.id AS resource_id,
+                   CASE WHEN r.id IS NULL THEN p.id END AS primary_ag_product_id,
+                   c.id AS usda_commodity_id,
+                   s.match_tier,
+                   s.note
+            FROM commodity_mapping_staging AS s
+            LEFT JOIN resource AS r ON r.name = s.resource_name
+            LEFT JOIN primary_ag_product AS p ON p.name = s.resource_name
+            LEFT JOIN (
+                SELECT name, MIN(id) AS id FROM usda_commodity GROUP BY name
+            ) AS c ON c.name = s.commodity_name
+        """))
+
+        unresolved = conn.execute(text("""
+            SELECT resource_name, commodity_name, resource_id, primary_ag_product_id
+            FROM commodity_mapping_resolved
+            WHERE (resource_id IS NULL AND primary_ag_product_id IS NULL)
+               OR usda_commodity_id IS NULL
+        """)).all()
+        for resource_name, commodity_name, resource_id, pap_id in unresolved:
+            if resource_id is None and pap_id is None:
+                print(f"⚠️  '{resource_name}' not found in resource or primary_ag_product - skipping")
+            else:
+                print(f"⚠️  Commodity '{commodity_name}' not found - skipping")
+        conn.execute(text("""
+            DELETE FROM commodity_mapping_resolved
+            WHERE (resource_id IS NULL AND primary_ag_product_id IS NULL)
+               OR usda_commodity_id IS NULL
+        """))
+
+        deleted = conn.execute(text(f"""
+            DELETE FROM resource_usda_commodity_map
+            WHERE NOT EXISTS (
+                SELECT 1 FROM commodity_mapping_resolved AS r WHERE {same_key}
+            )
+        """)).rowcount
+        updated = conn.execute(text(f"""
+            UPDATE resource_usda_commodity_map
+            SET match_tier = r.match_tier,
+                note       = r.note,
+                updated_at = :now
+            FROM commodity_mapping_resolved AS r
+            WHERE {same_key}
+              AND (resource_usda_commodity_map.match_tier IS DISTINCT FROM r.match_tier
+                   OR resource_usda_commodity_map.note IS DISTINCT FROM r.note)
+        """), {'now': now}).rowcount
+        inserted = conn.execute(text(f"""
+            INSERT INTO resource_usda_commodity_map (
+                resource_id, primary_ag_product_id, usda_commodity_id,
+                match_tier, note, created_at, updated_at
+            )
+            SELECT r.resource_id, r.primary_ag_product_id, r.usda_commodity_id,
+                   r.match_tier, r.note, :now, :now
+            FROM commodity_mapping_resolved AS r
+            WHERE NOT EXISTS (
+                SELECT 1 FROM resource_usda_commodity_map WHERE {same_key}
+            )
+        """), {'now': now}).rowcount
+        conn.execute(text("DROP TABLE commodity_mapping_resolved"))
+
+    return {
+        'mapped': len(rows) - len(unresolved),
+        'inserted': inserted,
+        'updated': updated,
+        'deleted': deleted,
+    }
+
+
 def seed_commodity_mappings_from_csv(csv_path: str = None, engine=None) -> bool:
     """
     Seed usda_commodity and resource_usda_commodity_map tables from CSV mapping file.
@@ -75,145 +242,60 @@ def seed_commodity_mappings_from_csv(csv_path: str = None, engine=None) -> bool:
         mapped_df = df[df['match_tier'] != 'UNMAPPED'].copy()
         print(f"📊 Found {len(mapped_df)} mapped commodities (excluding {len(df) - len(mapped_df)} unmapped)")
 
+        # Exclude NO_MATCH rows whose commodity_name is None/NaN.
+        # Compute api_name from reviewed_api_mappings.py — that is the
+        # authoritative source; the CSV api_name column is advisory only.
+        valid_df = mapped_df[mapped_df['commodity_name'].notna()]
+        unique_commodities = (
+            valid_df
+            .drop_duplicates('commodity_name')[['commodity_name', 'usda_code']]
+            .copy()
+        )
+        # Use a list comprehension so Python None (DISABLED entries) is
+        # stored as a proper None object, not NaN, for safe SQL binding.
+        unique_commodities['api_name'] = [
+            _get_api_name(n)
+            for n in unique_commodities['commodity_name'].str.upper()
+        ]
+        commodity_rows = [
+            {
+                'name': name,
+                'api_name': api_name,
+                'usda_code': str(int(code)),
+                'usda_source': NASS_SOURCE,
+                'description': name,
+                'uri': NASS_URI,
+            }
+            for name, code, api_name in unique_commodities[
+                ['commodity_name', 'usda_code', 'api_name']
+            ].itertuples(index=False)
+        ]
+        mappings = mapped_df[list(_MAPPING_STAGING_COLUMNS)].astype(object)
+        mapping_rows = mappings.where(mappings.notna(), None).to_dict(orient='records')
+
         with engine.connect() as conn:
             # Start transaction
             trans = conn.begin()
 
             try:
+                now = datetime.now(timezone.utc)
+
                 # 1. Seed usda_commodity table (unique commodities only)
                 print("🌱 Seeding usda_commodity table...")
-                # Exclude NO_MATCH rows whose commodity_name is None/NaN.
-                # Compute api_name from reviewed_api_mappings.py — that is the
-                # authoritative source; the CSV api_name column is advisory only.
-                valid_df = mapped_df[mapped_df['commodity_name'].notna()]
-                unique_commodities = (
-                    valid_df
-                    .drop_duplicates('commodity_name')[['commodity_name', 'usda_code']]
-                    .copy()
+                inserted, updated = _upsert_usda_commodities(conn, commodity_rows, now)
+                print(
+                    f"✅ Seeded {len(unique_commodities)} USDA commodities "
+                    f"({inserted} inserted, {updated} updated)"
                 )
-                # Use a list comprehension so Python None (DISABLED entries) is
-                # stored as a proper None object, not NaN, for safe SQL binding.
-                unique_commodities['api_name'] = [
-                    _get_api_name(n)
-                    for n in unique_commodities['commodity_name'].str.upper()
-                ]
-
-                # Constant metadata for all NASS-sourced commodities
-                NASS_URI = (
-                    "https://www.nass.usda.gov/Data_and_Statistics/"
-                    "County_Data_Files/Frequently_Asked_Questions/commcodes.php"
-                )
-                NASS_SOURCE = "NASS_WEB"
-
-                for _, row in unique_commodities.iterrows():
-                    # First check if commodity already exists
-                    existing_result = conn.execute(text(
-                        "SELECT id FROM usda_commodity WHERE name = :name"
-                    ), {'name': row['commodity_name']})
-                    existing_row = existing_result.fetchone()
-
-                    if existing_row:
-                        # Update existing record — fill in metadata that may be NULL
-                        conn.execute(text("""
-                            UPDATE usda_commodity
-                            SET api_name    = :api_name,
-                                usda_code   = :usda_code,
-                                usda_source = COALESCE(usda_source, :usda_source),
-                                description = COALESCE(description, :description),
-                                uri         = COALESCE(uri, :uri),
-                                updated_at  = NOW()
-                            WHERE name = :name
-                        """), {
-                            'name': row['commodity_name'],
-                            'api_name': row['api_name'],
-                            'usda_code': int(row['usda_code']),
-                            'usda_source': NASS_SOURCE,
-                            'description': row['commodity_name'],
-                            'uri': NASS_URI,
-                        })
-                    else:
-                        # Insert new record with full metadata
-                        conn.execute(text("""
-                            INSERT INTO usda_commodity
-                                (name, api_name, usda_code, usda_source, description, uri,
-                                 created_at, updated_at)
-                            VALUES
-                                (:name, :api_name, :usda_code, :usda_source, :description, :uri,
-                                 NOW(), NOW())
-                        """), {
-                            'name': row['commodity_name'],
-                            'api_name': row['api_name'],
-                            'usda_code': int(row['usda_code']),
-                            'usda_source': NASS_SOURCE,
-                            'description': row['commodity_name'],
-                            'uri': NASS_URI,
-                        })
-
-                print(f"✅ Seeded {len(unique_commodities)} USDA commodities")
 
                 # 2. Seed resource_usda_commodity_map table (name-based lookups)
                 print("🌱 Seeding resource_usda_commodity_map table...")
-
-                # Clear existing mappings first
-                conn.execute(text("DELETE FROM resource_usda_commodity_map"))
-
-                for _, row in mapped_df.iterrows():
-                    # Lookup resource_id by name — try resource table first,
-                    # fall back to primary_ag_product. Both map to the same
-                    # resource_usda_commodity_map table; the type is encoded by
-                    # which FK column is non-null.
-                    resource_result = conn.execute(text(
-                        "SELECT id FROM resource WHERE name = :name"
-                    ), {'name': row['resource_name']})
-                    resource_row = resource_result.fetchone()
-
-                    if resource_row:
-                        resource_id = resource_row[0]
-                        pap_id = None
-                    else:
-                        pap_result = conn.execute(text(
-                            "SELECT id FROM primary_ag_product WHERE name = :name"
-                        ), {'name': row['resource_name']})
-                        pap_row = pap_result.fetchone()
-
-                        if not pap_row:
-                            print(f"⚠️  '{row['resource_name']}' not found in resource or primary_ag_product - skipping")
-                            continue
-
-                        resource_id = None
-                        pap_id = pap_row[0]
-
-                    # Lookup commodity_id by name
-                    commodity_result = conn.execute(text(
-                        "SELECT id FROM usda_commodity WHERE name = :commodity_name"
-                    ), {'commodity_name': row['commodity_name']})
-                    commodity_row = commodity_result.fetchone()
-
-                    if not commodity_row:
-                        print(f"⚠️  Commodity '{row['commodity_name']}' not found - skipping")
-                        continue
-
-                    commodity_id = commodity_row[0]
-
-                    # Insert mapping with runtime-resolved IDs
-                    conn.execute(text("""
-                        INSERT INTO resource_usda_commodity_map (
-                            resource_id, primary_ag_product_id, usda_commodity_id,
-                            match_tier, note, created_at, updated_at
-                        )
-                        VALUES (
-                            :resource_id, :pap_id, :usda_commodity_id,
-                            :match_tier, :note, NOW(), NOW()
-                        )
-                    """), {
-                        'resource_id': resource_id,
-                        'pap_id': pap_id,
-                        'usda_commodity_id': commodity_id,
-                        'match_tier': row['match_tier'],
-                        'note': row['note']
-                    })
-
-                print(f"✅ Seeded {len(mapped_df)} resource-commodity mappings")
+                changes = _sync_commodity_map(conn, mapping_rows, now)
+                print(
+                    f"✅ Seeded {changes['mapped']} resource-commodity mappings "
+                    f"({changes['inserted']} inserted, {changes['updated']} updated, "
+                    f"{changes['deleted']} deleted)"
+                )
 
                 # Commit transaction
                 trans.commit()
@@ -254,12 +336,6 @@ def backfill_usda_commodity_metadata(engine=None, csv_path: str = None) -> int:
             print(f"Warning: backfill_usda_commodity_metadata: CSV not found at {csv_path}")
             return 0
 
-        NASS_URI = (
-            "https://www.nass.usda.gov/Data_and_Statistics/"
-            "County_Data_Files/Frequently_Asked_Questions/commcodes.php"
-        )
-        NASS_SOURCE = "NASS_WEB"
-
         df = pd.read_csv(csv_path)
         df['commodity_name'] = df['commodity_name'].astype(str).str.strip().str.lower()
         df['commodity_name'] = df['commodity_name'].where(df['commodity_name'] != 'nan', other=None)
@@ -269,37 +345,40 @@ def backfill_usda_commodity_metadata(engine=None, csv_path: str = None) -> int:
             .tolist()
         )
 
-        updated = 0
+        rows = [
+            {
+                'name': name,
+                'api_name': _get_api_name(name.upper()),  # None for DISABLED entries
+                'usda_source': NASS_SOURCE,
+                'description': name,
+                'uri': NASS_URI,
+            }
+            for name in unique_names
+        ]
         with engine.connect() as conn:
-            for name in unique_names:
-                api_name = _get_api_name(name.upper())  # None for DISABLED entries
-                result = conn.execute(text("""
+            with staging_table(conn, "usda_commodity_backfill", _COMMODITY_STAGING_COLUMNS, rows):
+                updated = conn.execute(text("""
                     UPDATE usda_commodity
                     SET
                         api_name    = CASE
-                                          WHEN api_name IS NULL OR api_name IN ('', 'nan')
-                                          THEN :api_name
-                                          ELSE api_name
+                                          WHEN usda_commodity.api_name IS NULL
+                                               OR usda_commodity.api_name IN ('', 'nan')
+                                          THEN s.api_name
+                                          ELSE usda_commodity.api_name
                                       END,
-                        usda_source = COALESCE(usda_source, :usda_source),
-                        description = COALESCE(description, :description),
-                        uri         = COALESCE(uri, :uri),
-                        created_at  = COALESCE(created_at, NOW()),
-                        updated_at  = NOW()
-                    WHERE LOWER(name) = :name
-                      AND (api_name IS NULL OR api_name IN ('', 'nan')
-                           OR usda_source IS NULL
-                           OR description IS NULL
-                           OR uri IS NULL
-                           OR created_at IS NULL)
-                """), {
-                    'name': name,
-                    'api_name': api_name,
-                    'usda_source': NASS_SOURCE,
-                    'description': name,
-                    'uri': NASS_URI,
-                })
-                updated += result.rowcount
+                        usda_source = COALESCE(usda_commodity.usda_source, s.usda_source),
+                        description = COALESCE(usda_commodity.description, s.description),
+                        uri         = COALESCE(usda_commodity.uri, s.uri),
+                        created_at  = COALESCE(usda_commodity.created_at, :now),
+                        updated_at  = :now
+                    FROM usda_commodity_backfill AS s
+                    WHERE LOWER(usda_commodity.name) = s.name
+                      AND (usda_commodity.api_name IS NULL OR usda_commodity.api_name IN ('', 'nan')
+                           OR usda_commodity.usda_source IS NULL
+                           OR usda_commodity.description IS NULL
+                           OR usda_commodity.uri IS NULL
+                           OR usda_commodity.created_at IS NULL)
+                """), {'now': datetime.now(timezone.utc)}).rowcount
             conn.commit()
 
         if updated:
@@ -0,0 +1,43 @@
+"""
+Temporary staging tables for set-based loads.
+
+Seeders that used to issue a SELECT/INSERT/UPDATE per CSV row instead load
+the rows into a temporary table with multi-row INSERTs and then write the
+target with a handful of ``INSERT ... SELECT`` / ``UPDATE ... FROM`` /
+``DELETE ... WHERE NOT EXISTS`` statements joined against it.
+
+The table lives on the caller's connection only and is dropped on exit.
+"""
+
+import contextlib
+from typing import Iterable, Iterator, Mapping
+
+from sqlalchemy import Column, MetaData, Table, text
+from sqlalchemy.types import TypeEngine
+
+_CHUNK_SIZE = 1000
+
+
+@contextlib.contextmanager
+def staging_table(
+    conn, name: str, columns: Mapping[str, TypeEngine], rows: Iterable[dict]
+) -> Iterator[Table]:
+    """
+    Create the temporary table ``name`` with ``columns``, fill it with ``rows``
+    and yield it; the table is dropped when the block completes.
+
+    A table of the same name left on a pooled connection by an earlier run is
+    dropped first.
+    """
+    table = Table(
+        name, MetaData(), *[Column(c, type_) for c, type_ in columns.items()], prefixes=["TEMPORARY"]
+    )
+    conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    table.create(conn)
+    rows = [{c: row.get(c) for c in columns} for row in rows]
+    for start in range(0, len(rows), _CHUNK_SIZE):
+        conn.execute(table.insert().values(rows[start:start + _CHUNK_SIZE]))
+    yield table
+    # Not in a finally: after a failed statement Postgres rejects everything but
+    # a rollback, which also drops a table created in the transaction.
+    conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
@@ -0,0 +1,384 @@
+"""
+Per-task performance metrics for extract, transform and load tasks.
+
+``track_task`` is a context manager (and ``task_metrics`` a decorator around
+it) that records, for one task run: wall time, CPU time of the running
+thread, growth of the process's peak RSS, rows in and out, bytes read,
+database round trips and rows written. Database traffic is counted with
+SQLAlchemy cursor events on every engine and attributed to the task running
+in the current thread (sub-flows run concurrently in threads).
+
+Inside a Prefect flow run each task run is stored as an ``etl_task_metric``
+row under the flow run id and, once it exists, the run's ``etl_run`` id;
+``create_etl_run_record`` attaches metrics of tasks that ran before the
+EtlRun row was created (usually the extract). Every task run is also kept in
+memory so ``master_flow`` can log a summary, compared with the previous run
+of each task, at the end of a run.
+
+With ``ETL_QUERY_PROFILE=true`` each task's statements are also profiled
+(see ``ca_biositing.datamodels.query_profiler``) and the report is logged,
+as a warning when a statement repeats often enough to be a likely N+1.
+
+During a dry run, load tasks are skipped and the other tasks' results are
+written to Parquet with their metrics; nothing is stored in the database.
+
+Peak RSS is process-wide: with concurrent sub-flows, a task's delta includes
+memory allocated by whatever ran next to it.
+"""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+from sqlalchemy import event, select, update
+from sqlalchemy.engine import Engine
+
+from ca_biositing.datamodels.query_profiler import profile_queries
+from ca_biositing.pipeline.utils import dry_run
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Wall-time ratio against the previous run of a task that is flagged as a regression
+REGRESSION_RATIO = 1.5
+
+# Also profile each task's SQL statements and log them, flagging likely N+1 loops
+QUERY_PROFILE = os.getenv("ETL_QUERY_PROFILE", "false").lower() in ("1", "true", "yes")
+
+_active: contextvars.ContextVar[Optional["TaskMetrics"]] = contextvars.ContextVar(
+    "etl_task_metrics", default=None
+)
+_recorded: List["TaskMetrics"] = []
+_WRITE_STATEMENT = re.compile(r"\s*(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+_recorded_lock = threading.Lock()
+
+
+@dataclass
+class TaskMetrics:
+    """Measurements of one task run; mirrors the ``etl_task_metric`` columns."""
+
+    task_name: str
+    stage: Optional[str] = None
+    status: Optional[str] = None
+    run_id: Optional[str] = None
+    etl_run_id: Optional[int] = None
+    started_at: Optional[datetime] = None
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_read: int = 0
+    db_round_trips: int = 0
+    rows_written: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counts: int) -> None:
+        """Add to counters, e.g. ``metrics.add(bytes_read=n)``; safe across threads."""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, (getattr(self, name) or 0) + value)
+
+    def as_row(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+
+    def summary(self) -> str:
+        rows = f"{self.rows_in if self.rows_in is not None else '-'} -> {self.rows_out if self.rows_out is not None else '-'}"
+        return (
+            f"{self.wall_seconds:.1f}s wall, {self.cpu_seconds:.1f}s CPU, "
+            f"+{self.peak_rss_delta_bytes / 2**20:.0f} MiB peak RSS, rows {rows}, "
+            f"{self.bytes_read / 2**20:.1f} MiB read, {self.db_round_trips} DB round trips, "
+            f"{self.rows_written} rows written"
+        )
+
+
+def current_metrics() -> Optional[TaskMetrics]:
+    """Metrics of the task running in this thread, if it is tracked."""
+    return _active.get()
+
+
+def note_bytes_read(n: int) -> None:
+    """Attribute ``n`` bytes read from a source to the current task, if tracked."""
+    metrics = _active.get()
+    if metrics is not None and n:
+        metrics.add(bytes_read=int(n))
+
+
+def recorded_metrics() -> List[TaskMetrics]:
+    """All task runs tracked in this process, oldest first."""
+    with _recorded_lock:
+        return list(_recorded)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_round_trip(conn, cursor, statement, parameters, context, executemany):
+    metrics = _active.get()
+    if metrics is not None:
+        metrics.add(db_round_trips=1)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count_rows_written(conn, cursor, statement, parameters, context, executemany):
+    metrics = _active.get()
+    if metrics is None:
+        return
+    if _WRITE_STATEMENT.match(statement):
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount and rowcount > 0:
+            metrics.add(rows_written=rowcount)
+
+
+def _log_query_profile(profile) -> None:
+    try:
+        from prefect import get_run_logger
+        run_logger = get_run_logger()
+    except Exception:
+        run_logger = logger
+    if profile.n_plus_one():
+        run_logger.warning(f"Likely N+1 queries in task {profile.report()}")
+    else:
+        run_logger.info(f"Queries of task {profile.report()}")
+
+
+def _peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _flow_run_id() -> Optional[str]:
+    try:
+        from prefect.context import FlowRunContext
+
+        ctx = FlowRunContext.get()
+    except Exception:
+        return None
+    return str(ctx.flow_run.id) if ctx and ctx.flow_run else None
+
+
+def _as_id(value: Any) -> Optional[int]:
+    # etl_run_id is passed around as a string by create_etl_run_record
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def count_rows(value: Any) -> Optional[int]:
+    """Rows in a DataFrame, or summed over a dict/list/tuple of DataFrames; None otherwise."""
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        counts = [count_rows(v) for v in value]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+def _persist(metrics: TaskMetrics) -> None:
+    """Store one ``etl_task_metric`` row; failures are logged, never raised."""
+    from sqlalchemy.orm import Session
+    from ca_biositing.datamodels.models import EtlRun, EtlTaskMetric
+    from ca_biositing.pipeline.utils.engine import engine
+
+    try:
+        with Session(engine) as session:
+            if metrics.etl_run_id is None:
+                metrics.etl_run_id = session.execute(
+                    select(EtlRun.id).where(EtlRun.run_id == metrics.run_id)
+                ).scalar()
+            session.add(EtlTaskMetric(**metrics.as_row()))
+            session.commit()
+    except Exception as e:
+        logger.warning(f"Could not store metrics of task {metrics.task_name}: {e}")
+
+
+@contextlib.contextmanager
+def track_task(
+    task_name: str,
+    stage: Optional[str] = None,
+    etl_run_id: Optional[int] = None,
+    persist: bool = True,
+) -> Iterator[TaskMetrics]:
+    """
+    Measure the enclosed block as one run of ``task_name``.
+
+    Yields the TaskMetrics being filled in; set ``rows_in``/``rows_out`` on it
+    or call ``add(...)`` for counts the block knows best. The row is stored
+    only inside a Prefect flow run and when ``persist`` is true.
+    """
+    metrics = TaskMetrics(
+        task_name=task_name,
+        stage=stage,
+        run_id=_flow_run_id(),
+        etl_run_id=_as_id(etl_run_id),
+        started_at=datetime.now(timezone.utc),
+    )
+    token = _active.set(metrics)
+    queries = contextlib.ExitStack()
+    profile = queries.enter_context(profile_queries(task_name)) if QUERY_PROFILE else None
+    rss_before = _peak_rss_bytes()
+    cpu_before = time.thread_time()
+    wall_before = time.perf_counter()
+    try:
+        yield metrics
+        metrics.status = COMPLETED
+    except BaseException:
+        metrics.status = FAILED
+        raise
+    finally:
+        metrics.wall_seconds = time.perf_counter() - wall_before
+        metrics.cpu_seconds = time.thread_time() - cpu_before
+        metrics.peak_rss_delta_bytes = _peak_rss_bytes() - rss_before
+        queries.close()
+        _active.reset(token)
+        if profile is not None:
+            _log_query_profile(profile)
+        with _recorded_lock:
+            _recorded.append(metrics)
+        if persist and metrics.run_id is not None:
+            # The metric's own insert is not counted against an enclosing task
+            outer = _active.set(None)
+            try:
+                _persist(metrics)
+            finally:
+                _active.reset(outer)
+
+
+def _dry_run_call(run, fn: Callable, task_name: str, stage: str, args, kwargs, arguments) -> Any:
+    """
+    One task call during a dry run (see ``utils/dry_run.py``): loads are
+    skipped, extracts are replayed when the run has a ``replay_dir``, and the
+    result is materialized once the task's measurements are final.
+    """
+    occurrence = run.next_occurrence(task_name)
+    if stage == "load":
+        with track_task(task_name, stage, persist=False) as metrics:
+            metrics.rows_in = count_rows(list(arguments.values()))
+        run.skip(metrics, occurrence)
+        return None
+
+    with track_task(task_name, stage, persist=False) as metrics:
+        metrics.rows_in = count_rows(list(arguments.values()))
+        result = run.replayed(task_name, occurrence) if stage == "extract" else None
+        if result is None:
+            result = fn(*args, **kwargs)
+        metrics.rows_out = count_rows(result)
+    run.materialize(metrics, occurrence, result)
+    return result
+
+
+def task_metrics(stage: str, name: Optional[str] = None) -> Callable:
+    """
+    Decorator tracking each call of an ETL task function with ``track_task``.
+
+    Place it under ``@task``. Rows in are counted from DataFrame arguments
+    (also inside dicts and lists), rows out from the return value, and an
+    ``etl_run_id`` keyword argument attributes the run to that EtlRun.
+    """
+
+    def decorate(fn: Callable) -> Callable:
+        task_name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Prefect may pass keyword parameters positionally
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            run = dry_run.active()
+            if run is not None:
+                return _dry_run_call(run, fn, task_name, stage, args, kwargs, arguments)
+            with track_task(task_name, stage, etl_run_id=arguments.get("etl_run_id")) as metrics:
+                metrics.rows_in = count_rows(list(arguments.values()))
+                result = fn(*args, **kwargs)
+                metrics.rows_out = count_rows(result)
+                return result
+
+        return wrapper
+
+    return decorate
+
+
+def attach_metrics_to_run(session, run_id: str, etl_run_id: int) -> None:
+    """Point metrics stored under flow run ``run_id`` before its EtlRun existed at ``etl_run_id``."""
+    from ca_biositing.datamodels.models import EtlTaskMetric
+
+    session.execute(
+        update(EtlTaskMetric)
+        .where(EtlTaskMetric.run_id == run_id, EtlTaskMetric.etl_run_id.is_(None))
+        .values(etl_run_id=etl_run_id)
+    )
+    with _recorded_lock:
+        for metrics in _recorded:
+            if metrics.run_id == run_id and metrics.etl_run_id is None:
+                metrics.etl_run_id = etl_run_id
+
+
+def previous_wall_seconds(session, task_names: Iterable[str], exclude_run_ids: Iterable[str]) -> Dict[str, float]:
+    """Wall time of the latest stored run of each task outside ``exclude_run_ids``."""
+    from ca_biositing.datamodels.models import EtlTaskMetric
+
+    task_names = list(task_names)
+    if not task_names:
+        return {}
+    exclude_run_ids = [r for r in exclude_run_ids if r is not None]
+    query = (
+        select(EtlTaskMetric.task_name, EtlTaskMetric.wall_seconds)
+        .where(EtlTaskMetric.task_name.in_(task_names), EtlTaskMetric.status == COMPLETED)
+        .order_by(EtlTaskMetric.started_at)
+    )
+    if exclude_run_ids:
+        query = query.where(EtlTaskMetric.run_id.not_in(exclude_run_ids))
+    # Later runs overwrite earlier ones
+    return {task_name: seconds for task_name, seconds in session.execute(query)}
+
+
+def summarize_task_metrics(
+    metrics: Iterable[TaskMetrics], previous: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """
+    One line per task run, slowest first, plus a totals line.
+
+    With ``previous`` wall times, each line shows the change against the
+    previous run and runs over ``REGRESSION_RATIO`` times slower are flagged.
+    """
+    metrics = sorted(metrics, key=lambda m: m.wall_seconds, reverse=True)
+    previous = previous or {}
+    lines = []
+    for m in metrics:
+        line = f"{m.task_name} [{m.stage or '-'}] {m.status}: {m.summary()}"
+        before = previous.get(m.task_name)
+        if before:
+            ratio = m.wall_seconds / before
+            line += f" (previous {before:.1f}s, x{ratio:.2f}{', REGRESSION' if ratio >= REGRESSION_RATIO else ''})"
+        lines.append(line)
+    if metrics:
+        lines.append(
+            f"{len(metrics)} tasks: {sum(m.wall_seconds for m in metrics):.1f}s wall, "
+            f"{sum(m.cpu_seconds for m in metrics):.1f}s CPU, "
+            f"{sum(m.db_round_trips for m in metrics)} DB round trips, "
+            f"{sum(m.rows_written for m in metrics)} rows written"
+        )
+    return lines
@@ -0,0 +1,157 @@
+"""Tests for the synthetic ETL inputs and the benchmark baseline comparison."""
+
+import contextlib
+import inspect
+import json
+import multiprocessing
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pyogrio
+import pytest
+from sqlmodel import Session
+
+from ca_biositing.pipeline.benchmarks import synthetic
+from ca_biositing.pipeline.benchmarks.suite import (
+    Scale,
+    _Stages,
+    _wait_for_result,
+    compare_to_baseline,
+    generate_inputs,
+)
+from ca_biositing.pipeline.utils.dry_run import dry_run_mode
+
+
+def _results(wall=1.0, queries=100, rss=200 * 2**20, status="completed", scale=None):
+    return {
+        "scale": scale or {"landiq_polygons": 10},
+        "benchmarks": {
+            "landiq": {
+                "status": status,
+                "error": None if status == "completed" else "boom",
+                "peak_rss_bytes": rss,
+                "stages": {"load": {"wall_seconds": wall, "db_seconds": 0.1, "db_queries": queries}},
+            }
+        },
+    }
+
+
+def test_generated_inputs_are_deterministic(tmp_path):
+    scale = Scale(landiq_polygons=50, usda_records=40, aim1_samples=3, billion_ton_rows=200)
+    first = generate_inputs("usda", scale, str(tmp_path / "a"))
+    second = generate_inputs("usda", scale, str(tmp_path / "b"))
+    with open(first["path"]) as f, open(second["path"]) as g:
+        assert json.load(f) == json.load(g)
+
+    landiq = generate_inputs("landiq", scale, str(tmp_path))
+    gdf = pyogrio.read_dataframe(landiq["path"])
+    assert len(gdf) == 50 and gdf.crs.to_epsg() == 3310
+    assert gdf.geometry.is_valid.all()
+    assert set(gdf["MAIN_CROP"]) <= set(synthetic.LANDIQ_CROPS)
+
+    sheets = generate_inputs("aim1", scale, str(tmp_path))["paths"]
+    prox = pd.read_csv(sheets["proximate analysis"], dtype=str)
+    assert len(prox) == 3 * len(synthetic.AIM1_PARAMETERS["proximate analysis"]) * 3
+    assert prox["Record_ID"].is_unique
+
+
+def test_billion_ton_csv_streams_to_california_rows(tmp_path):
+    from ca_biositing.pipeline.etl.extract.billion_ton import read_billion_ton_csv
+
+    path = synthetic.billion_ton_csv(str(tmp_path / "bt.csv"), 1000, seed=1)
+    raw = pd.read_csv(path)
+    df = read_billion_ton_csv(path)
+    assert len(df) == (raw["state_name"] == "California").sum() > 0
+    assert df["fips"].str.len().isin([4]).all()
+
+
+def test_synthetic_inputs_pass_through_the_transforms(tmp_path):
+    from ca_biositing.datamodels.models import UsdaCommodity
+    from ca_biositing.pipeline.etl.transform.analysis.proximate_record import transform_proximate_record
+    from ca_biositing.pipeline.etl.transform.billion_ton import transform as transform_billion_ton
+    from ca_biositing.pipeline.etl.transform.landiq.landiq_record import transform_landiq_record
+    from ca_biositing.pipeline.etl.transform.usda.usda_census_survey import transform as transform_usda
+
+    scale = Scale(landiq_polygons=100, usda_records=200, aim1_samples=4, billion_ton_rows=500)
+    inputs = {name: generate_inputs(name, scale, str(tmp_path)) for name in ("landiq", "usda", "aim1", "billion_ton")}
+    transform_modules = ("landiq.landiq_record", "usda.usda_census_survey", "billion_ton", "analysis.proximate_record")
+    with contextlib.ExitStack() as stack:
+        for module in transform_modules:
+            stack.enter_context(patch(f"ca_biositing.pipeline.etl.transform.{module}.get_run_logger"))
+        # The dry-run snapshot engine stands in for Postgres lookups
+        run = stack.enter_context(dry_run_mode(str(tmp_path / "run"), reference_dir=str(tmp_path / "empty")))
+        with Session(run.engine) as session:
+            session.add_all(UsdaCommodity(name=n.lower(), api_name=n) for n in synthetic.USDA_COMMODITIES)
+            session.commit()
+
+        landiq = inspect.unwrap(transform_landiq_record.fn)(pyogrio.read_dataframe(inputs["landiq"]["path"]))
+        assert len(landiq) == 100
+        assert set(landiq["main_crop"]) & {"wheat", "rice"}
+
+        with open(inputs["usda"]["path"]) as f:
+            raw = pd.DataFrame(json.load(f)["data"])
+        usda = inspect.unwrap(transform_usda.fn)({"usda": raw}, etl_run_id=1, lineage_group_id=1)
+        # Only suppressed values are dropped
+        assert 0.9 * len(raw) < len(usda) < len(raw)
+        assert usda["geoid"].str.startswith("06").all()
+
+        from ca_biositing.pipeline.etl.extract.billion_ton import read_billion_ton_csv
+        billion_ton = inspect.unwrap(transform_billion_ton.fn)(
+            {"billion_ton": read_billion_ton_csv(inputs["billion_ton"]["path"])}
+        )
+        assert billion_ton["geoid"].str.startswith("06").all()
+        assert billion_ton["resource_id"].notna().all()
+
+        prox = pd.read_csv(inputs["aim1"]["paths"]["proximate analysis"], dtype=str, keep_default_na=False)
+        records = inspect.unwrap(transform_proximate_record.fn)(prox)
+        assert len(records) == len(prox)
+        assert records["prepared_sample_id"].nunique() == 4
+
+
+def test_stages_sum_calls_and_count_statements(engine):
+    from sqlalchemy import text
+
+    stages = _Stages("demo")
+    for rows in (10, 30):
+        with stages.stage("load") as m:
+            m.rows_in = rows
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+    [(stage, result)] = stages.as_dict().items()
+    assert stage == "load"
+    assert (result["calls"], result["rows_in"], result["db_queries"]) == (2, 40, 2)
+    assert result["rows_per_second"] == pytest.approx(40 / result["wall_seconds"])
+
+
+def test_compare_to_baseline_flags_regressions_above_noise():
+    baseline = _results()
+    assert compare_to_baseline(_results(wall=1.2), baseline) == []
+    assert compare_to_baseline(_results(queries=105), _results(queries=2)) != []
+    # Over the ratio but within the noise floor
+    assert compare_to_baseline(_results(queries=8), _results(queries=2)) == []
+
+    [line] = compare_to_baseline(_results(wall=2.0), baseline)
+    assert line.startswith("landiq.load wall_seconds: 2 vs baseline 1 (x2.00")
+    [line] = compare_to_baseline(_results(rss=400 * 2**20), baseline)
+    assert line.startswith("landiq peak_rss_bytes")
+    [line] = compare_to_baseline(_results(status="failed"), baseline)
+    assert line == "landiq: failed (boom)"
+    assert compare_to_baseline(_results(wall=2.0), baseline, threshold=2.5) == []
+
+    with pytest.raises(ValueError, match="scale"):
+        compare_to_baseline(_results(scale={"landiq_polygons": 20}), baseline)
+
+
+def test_dead_benchmark_process_reports_its_exit_code():
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    # Exits like an OOM-killed child: without putting a result
+    proc = ctx.Process(target=os._exit, args=(9,))
+    proc.start()
+
+    result = _wait_for_result(proc, queue, poll_seconds=0.1)
+    proc.join()
+
+    assert result["status"] == "failed"
+    assert "exit code 9" in result["error"]
@@ -68,6 +68,31 @@ def test_extract_failure(mock_temp_dir, mock_gdrive_to_df, mock_logger):
     result = extract.fn(file_id="invalid_id")
     assert result is None
 
+def test_read_billion_ton_csv_projects_and_filters(tmp_path, sample_billion_ton_df):
+    from ca_biositing.pipeline.etl.extract.billion_ton import COLUMN_TYPES, read_billion_ton_csv
+    from ca_biositing.pipeline.utils.columnar_reader import stream_csv
+
+    texas = sample_billion_ton_df.iloc[[0]].assign(fips=48001, state_name="Texas")
+    raw = pd.concat([sample_billion_ton_df, texas] * 50, ignore_index=True)
+    raw.loc[0, "state_name"] = " CALIFORNIA "
+    path = tmp_path / "billion_ton.csv"
+    raw.to_csv(path, index=False)
+
+    # A tiny block size forces many record batches.
+    df, stats = stream_csv(
+        str(path), columns=["fips", "state_name"], filters={"state_name": ["california"]}, block_size=512
+    )
+    assert stats.batches > 1
+    assert (stats.rows_read, stats.rows_kept) == (150, 100)
+    assert list(df.columns) == ["fips", "state_name"]
+
+    df = read_billion_ton_csv(str(path))
+    assert len(df) == 100
+    assert list(df.columns) == list(COLUMN_TYPES)
+    assert "class" not in df.columns and "usdaregion" not in df.columns
+    assert df["production"].dtype == "float64"
+    assert df["fips"].iloc[0] == "6001"
+
 # --- Transform Tests ---
 
 @patch("ca_biositing.pipeline.etl.transform.billion_ton.get_run_logger")
@@ -215,3 +240,69 @@ def test_load_success(mock_session, mock_engine, mock_logger):
         params = stmt.compile().params
         assert "100" in str(params)
         assert "70.0" in str(params)
+
+
+def _loaded_frame(n_counties=40, n_resources=25):
+    geoids = [f"06{i:03d}" for i in range(1, 2 * n_counties, 2)]
+    rows = [
+        {
+            "dataset_id": 1, "geoid": geoid, "county": f"county {geoid}", "state_name": "california",
+            "resource_id": resource_id, "model_name": "POLYSYS", "scenario_name": "mature-market high",
+            "price_offered_usd": 70.0, "land_source": "Crop", "production": 100.4 + resource_id,
+            "btu_ton": 15722000.0, "etl_run_id": 1, "lineage_group_id": 1,
+        }
+        for geoid in geoids for resource_id in range(1, n_resources + 1)
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_load_is_idempotent(engine):
+    from sqlmodel import Session as SQLModelSession, select, func
+    from ca_biositing.datamodels.models import BillionTon2023Record, LineageTableChange, Place
+    from ca_biositing.datamodels.query_profiler import profile_queries
+
+    df = _loaded_frame()
+    profiles = []
+    with patch("ca_biositing.pipeline.etl.load.billion_ton.get_engine", return_value=engine), \
+         patch("ca_biositing.pipeline.etl.load.billion_ton.get_run_logger"):
+        for run in range(3):
+            with profile_queries(f"load {run + 1}") as profile:
+                load.fn(df.copy())
+            profiles.append(profile)
+
+        changed = df.copy()
+        changed.loc[0, "production"] = 9999
+        load.fn(changed)
+
+    # Re-runs read the stored fingerprints and write no records: the same
+    # bounded set of statements each time, fewer than the first load.
+    first_run, *reruns = profiles
+    for profile in reruns:
+        assert profile.stats.keys() == reruns[0].stats.keys()
+        assert profile.total_queries == reruns[0].total_queries
+        assert profile.total_queries < first_run.total_queries
+        assert profile.max_repeats == 1
+        assert not any(
+            f"INSERT INTO {BillionTon2023Record.__tablename__} " in key for key in profile.stats
+        ), profile.report()
+
+    with SQLModelSession(engine) as session:
+        changes = session.exec(
+            select(LineageTableChange.inserted, LineageTableChange.updated, LineageTableChange.unchanged)
+            .where(LineageTableChange.table_name == BillionTon2023Record.__tablename__)
+            .order_by(LineageTableChange.id)
+        ).all()
+        assert [tuple(c) for c in changes] == [
+            (len(df), 0, 0),
+            (0, 0, len(df)),
+            (0, 0, len(df)),
+            (0, 1, len(df) - 1),
+        ]
+        assert session.exec(select(func.count()).select_from(BillionTon2023Record)).one() == len(df)
+        assert session.exec(select(func.count()).select_from(Place)).one() == df["geoid"].nunique()
+        first = session.exec(
+            select(BillionTon2023Record)
+            .where(BillionTon2023Record.geoid == "06001", BillionTon2023Record.resource_id == 1)
+        ).one()
+        assert first.production == 9999
+        assert first.btu_ton == 15722000
@@ -0,0 +1,169 @@
+"""Tests for the cleaning and coercion helpers."""
+
+import numpy as np
+import pandas as pd
+
+from ca_biositing.pipeline.utils.cleaning_functions import (
+    coerce_columns,
+    parse_latlon_pairs,
+    replace_empty_with_na,
+    split_combined_latlon,
+    standard_clean,
+    standardize_latlon,
+)
+
+
+def test_standard_clean_handles_each_column_by_dtype():
+    df = pd.DataFrame({
+        "Resource Name": ["Almond Hulls", "  ", None, "WALNUT"],
+        "Moisture": [1.5, np.nan, 3.0, 4.25],
+        "Count": [1, 2, 3, 4],
+        "Mixed": [1, "", " ", 2],
+        "Flag": [True, False, True, True],
+    })
+    df.attrs["sheet"] = "Aim 1"
+
+    out = standard_clean(df)
+
+    assert list(out.columns) == ["resource_name", "moisture", "count", "mixed", "flag"]
+    assert out["resource_name"].dtype == "string"
+    assert out["resource_name"].tolist()[0] == "almond hulls"
+    assert out["resource_name"].isna().tolist() == [False, True, True, False]
+    assert out["moisture"].dtype == "Float64"
+    assert out["count"].dtype == "Int64"
+    assert out["mixed"].dtype == "Int64"
+    assert out["mixed"].isna().tolist() == [False, True, True, False]
+    assert out["flag"].dtype == "boolean"
+    assert out.attrs == {"sheet": "Aim 1"}
+
+
+def test_replace_empty_with_na_skips_non_string_columns():
+    df = pd.DataFrame({"a": ["x", "", "\t"], "b": [1, 2, 3], "c": [None, " ", "y"]})
+
+    out = replace_empty_with_na(df)
+
+    assert out["a"].isna().tolist() == [False, True, True]
+    assert out["b"].tolist() == [1, 2, 3]
+    assert out["c"].isna().tolist() == [True, True, False]
+    # A custom pattern still goes through the regex engine
+    custom = replace_empty_with_na(df, columns=["a"], regex=r"^x$")
+    assert custom["a"].isna().tolist() == [True, False, False]
+
+
+def test_coerce_float_parses_strings_and_keeps_numeric_columns_exact():
+    df = pd.DataFrame({
+        "text": ["1,234.5", " 7 ", "", "n/a", "nan", "-2e3", None],
+        "exact": [0.1 + 0.2, 1 / 3, np.nan, 1e-17, 2.5, 3.0, 4.0],
+    })
+
+    out = coerce_columns(df, float_cols=["text", "exact"])
+
+    expected = [1234.5, 7.0, np.nan, np.nan, np.nan, -2000.0, np.nan]
+    np.testing.assert_array_equal(out["text"].to_numpy(), expected)
+    np.testing.assert_array_equal(out["exact"].to_numpy(), df["exact"].to_numpy())
+
+
+def test_coerce_bool_keeps_boolean_columns():
+    df = pd.DataFrame({"flag": [True, False], "answer": ["Yes", "n"]})
+
+    out = coerce_columns(df, bool_cols=["flag", "answer"])
+
+    assert out["flag"].dtype == "boolean"
+    assert out["flag"].tolist() == [True, False]
+    assert out["answer"].tolist() == [True, False]
+
+
+def test_wide_sheet_clean_and_coerce():
+    """A 5,000 x 120 Aim 1-shaped sheet keeps its dtypes and missing values."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    columns = {}
+    for i in range(40):
+        columns[f"Text {i}"] = rng.choice(["Almond Hulls", "  ", "Walnut", "", "Rice Straw"], n).astype(object)
+    for i in range(40):
+        values = pd.Series(rng.random(n) * 100).round(2).astype(object)
+        columns[f"Value {i}"] = values.where(rng.random(n) > 0.2, "")
+    for i in range(40):
+        columns[f"Count {i}"] = rng.integers(0, 100, n)
+    sheet = pd.DataFrame(columns)
+
+    cleaned = standard_clean(sheet)
+
+    value_cols = [c for c in cleaned.columns if c.startswith(("value", "count"))]
+    coerced = coerce_columns(cleaned, float_cols=value_cols)
+
+    assert cleaned["text_0"].dtype == "string"
+    assert cleaned["value_0"].dtype == "Float64"
+    assert coerced["count_0"].dtype == np.float64
+    assert coerced["value_0"].isna().sum() == cleaned["value_0"].isna().sum()
+
+
+def test_parse_latlon_pairs_reads_decimal_dms_and_hemisphere_formats():
+    values = [
+        "38.54, -121.74",
+        " 38.54 ;-121.74 ",
+        "38.54 -121.74",
+        "38°32'24\"N, 121°44'24\"W",
+        "N38.54 W121.74",
+        "121.74 W, 38.54 N",
+        "38.54|-121.74|12",
+        "38°32'75\"N, 121 W",
+        "95, 200",
+        "",
+        None,
+        38.54,
+        "not a coordinate",
+    ]
+
+    lat, lon = parse_latlon_pairs(values)
+
+    assert lat.dtype == lon.dtype == np.float64
+    np.testing.assert_allclose(lat[:7], 38.54)
+    np.testing.assert_allclose(lon[:7], -121.74)
+    # Seconds >= 60, out of range, empty and non-string values give NaN pairs
+    assert np.isnan(lat[7:]).all() and np.isnan(lon[7:]).all()
+
+
+def test_parse_latlon_pairs_swaps_reversed_batches():
+    # One pair is only valid swapped and two are ambiguous: swapped pairs are the majority
+    lat, lon = parse_latlon_pairs(["-121.74, 38.54", "10, 20", "-120.5 35.25"])
+    assert lat.tolist() == [38.54, 20.0, 35.25]
+    assert lon.tolist() == [-121.74, 10.0, -120.5]
+
+    # Mostly lat/lon order: only the pair that cannot be lat/lon is swapped
+    lat, lon = parse_latlon_pairs(["38.5, -121.5", "10, 20", "-121.5, 38.5", "36, -119"])
+    assert lat.tolist() == [38.5, 10.0, 38.5, 36.0]
+    assert lon.tolist() == [-121.5, 20.0, -121.5, -119.0]
+
+
+def test_standardize_latlon_splits_and_coerces_coordinates():
+    combined = standardize_latlon(pd.DataFrame({"coordinates": ["38.5,-121.7", "x"], "site": [1, 2]}))
+    assert list(combined.columns) == ["site", "desc_lat", "desc_lon"]
+    assert combined["desc_lat"].tolist()[0] == 38.5 and np.isnan(combined["desc_lon"].tolist()[1])
+
+    separate = standardize_latlon(pd.DataFrame({"lat": ["38.5", "38°30'N"], "lon": [-121.0, None]}))
+    assert separate["desc_lat"].tolist() == [38.5, 38.5]
+    assert separate["desc_lon"].dtype == np.float64
+
+
+def test_split_combined_latlon_matches_source_coordinates():
+    """Synthetic coordinate strings, a tenth of them DMS or hemisphere-suffixed."""
+    rng = np.random.default_rng(0)
+    n = 10_000
+    lat = rng.uniform(32.5, 42.0, n).round(5)
+    lon = rng.uniform(-124.4, -114.1, n).round(5)
+    text = pd.Series(lat).astype(str) + ", " + pd.Series(lon).astype(str)
+    dms = rng.random(n) < 0.05
+    text[dms] = "38°30'36\"N 121°15'18\"W"
+    suffixed = ~dms & (rng.random(n) < 0.05)
+    text[suffixed] = pd.Series(lon[suffixed]).abs().astype(str).to_numpy() + " W, " + pd.Series(
+        lat[suffixed]
+    ).astype(str).to_numpy() + " N"
+
+    out = split_combined_latlon(pd.DataFrame({"coordinates": text}), "coordinates")
+
+    plain = ~dms
+    np.testing.assert_array_equal(out["desc_lat"].to_numpy()[plain], lat[plain])
+    np.testing.assert_array_equal(out["desc_lon"].to_numpy()[plain], lon[plain])
+    np.testing.assert_allclose(out["desc_lat"].to_numpy()[dms], 38.51)
+    np.testing.assert_allclose(out["desc_lon"].to_numpy()[dms], -121.255)
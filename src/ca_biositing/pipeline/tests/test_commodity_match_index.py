@@ -0,0 +1,98 @@
+"""Tests for the indexed commodity matcher used by interactive_commodity_mapper."""
+
+import random
+from difflib import SequenceMatcher
+
+from ca_biositing.pipeline.utils.commodity_match_index import CommodityMatchIndex, trigrams
+
+COMMODITIES = [
+    {"code": "1", "name": "ALMONDS", "description": "ALMONDS, ALL"},
+    {"code": "2", "name": "HAY  ALFALFA (DRY)", "description": "HAY  ALFALFA (DRY)"},
+    {"code": "3", "name": "RICE"},
+    {"code": "4", "name": "WALNUTS ENGLISH", "description": "WALNUTS"},
+    {"code": "5", "name": "TOMATOES PROCESSING", "description": "TOMATOES FOR PROCESSING"},
+    {"code": "6", "name": "CORN GRAIN", "description": "CORN FOR GRAIN"},
+]
+
+
+def _full_scan(resource_name, commodities, top_n=8):
+    """The weighted score of every commodity, as computed before the index existed."""
+    def ratio(a, b):
+        return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+
+    def words(value):
+        return set(value.lower().replace("-", " ").replace("_", " ").split())
+
+    resource_words = words(resource_name)
+    key_words = resource_words - {"for", "and", "the", "of", "all", "-", "processing"}
+    boost_words = [
+        w for w in resource_words
+        if len(w) > 3 and w not in {"hulls", "shells", "straw", "processing", "waste"}
+    ]
+    scored = []
+    for c in commodities:
+        name, desc = c["name"], c.get("description", c["name"])
+        name_words = words(name)
+        overlap = len(resource_words & name_words) / len(resource_words | name_words) if name_words else 0
+        commodity_key_words = name_words - {"for", "and", "the", "of", "all", "-"}
+        key = len(key_words & commodity_key_words) / len(key_words) if key_words and commodity_key_words else 0
+        score = ratio(resource_name, name) * 0.4 + ratio(resource_name, desc) * 0.2 + overlap * 0.3 + key * 0.1
+        if any(w in name.lower() or any(w in cw for cw in name_words) for w in boost_words):
+            score = max(score, 0.75)
+        scored.append((c["code"], score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:top_n]
+
+
+def test_trigrams_follow_pg_trgm_padding():
+    assert trigrams("Rice") == {"  r", " ri", "ric", "ice", "ce "}
+    assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+
+
+def test_candidates_share_a_trigram_or_word():
+    index = CommodityMatchIndex(COMMODITIES)
+    assert [COMMODITIES[i]["code"] for i in index.candidates("rice straw")] == ["3"]
+    assert [COMMODITIES[i]["code"] for i in index.candidates("grain corn")] == ["6"]
+    assert index.candidates("xyz") == []
+
+
+def test_matches_keep_the_weighted_scores():
+    index = CommodityMatchIndex(COMMODITIES)
+    for resource in ["almond hulls", "alfalfa", "rice straw", "corn stover", "tomato pomace", "xyz"]:
+        matches = index.find_best_matches(resource, top_n=4)
+        assert [(m["code"], m["score"]) for m in matches] == _full_scan(resource, COMMODITIES, 4)
+
+    [best] = index.find_best_matches("almond hulls", top_n=1)
+    assert best["name"] == "ALMONDS" and best["score"] == 0.75
+    assert set(best["debug_scores"]) == {"full_name", "word_overlap", "key_word_match"}
+
+
+def test_given_candidates_limit_scoring():
+    index = CommodityMatchIndex(COMMODITIES)
+    assert [m["code"] for m in index.find_best_matches("rice", top_n=2, candidates=[2, 5])] == ["3", "6"]
+    # Too few candidates fall back to the index
+    assert len(index.find_best_matches("rice", top_n=3, candidates=[2])) == 3
+
+
+def test_large_commodity_list_matches_full_scan():
+    rng = random.Random(0)
+    vocab = [
+        "almonds", "walnuts", "hay", "alfalfa", "rice", "corn", "grain", "silage", "wheat",
+        "cotton", "tomatoes", "processing", "grapes", "wine", "oranges", "peaches", "barley",
+        "sorghum", "beans", "lettuce", "onions", "potatoes", "olives", "melons", "(dry)",
+    ]
+    commodities = [
+        {"code": str(i), "name": " ".join(rng.sample(vocab, rng.randint(1, 3))).upper()}
+        for i in range(600)
+    ]
+    resources = [
+        " ".join(rng.sample(vocab + ["hulls", "shells", "pits", "stover", "prunings"], rng.randint(1, 3)))
+        for _ in range(60)
+    ]
+
+    expected = [_full_scan(r, commodities) for r in resources]
+
+    index = CommodityMatchIndex(commodities)
+    actual = [[(m["code"], m["score"]) for m in index.find_best_matches(r)] for r in resources]
+
+    assert actual == expected
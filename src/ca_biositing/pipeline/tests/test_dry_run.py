@@ -0,0 +1,119 @@
+"""Tests for transform-only dry runs materializing each stage to Parquet."""
+
+import inspect
+import json
+import os
+
+import pandas as pd
+from sqlmodel import Session, select
+
+from ca_biositing.datamodels.models import Parameter, Unit
+from ca_biositing.pipeline.utils import dry_run
+from ca_biositing.pipeline.utils.dry_run import (
+    dry_run_mode,
+    reference_engine,
+    reference_tables,
+    snapshot_reference_tables,
+    supports_dry_run,
+)
+from ca_biositing.pipeline.utils.engine import current_engine, get_engine
+from ca_biositing.pipeline.utils.name_id_swap import normalize_dataframes
+from ca_biositing.pipeline.utils.task_metrics import task_metrics
+
+calls = []
+
+
+@task_metrics("extract")
+def extract():
+    calls.append("extract")
+    return {"observations": pd.DataFrame({"parameter": ["moisture", "ash"], "value": [5.0, 1.5]})}
+
+
+@task_metrics("transform")
+def transform(data_sources):
+    calls.append("transform")
+    df = data_sources["observations"]
+    return normalize_dataframes(df, {"parameter": (Parameter, "name")})[0]
+
+
+@task_metrics("load")
+def load(df):
+    calls.append("load")
+    raise AssertionError("loads do not run in a dry run")
+
+
+def _snapshot(engine, tmp_path):
+    with Session(engine) as session:
+        session.add(Parameter(name="moisture"))
+        session.add(Unit(name="%"))
+        session.commit()
+    return snapshot_reference_tables(engine, str(tmp_path / "reference"), ["parameter", "unit"])
+
+
+def test_reference_tables_are_lookup_targets():
+    tables = reference_tables()
+    assert {"parameter", "unit", "place"} <= set(tables)
+    assert "etl_run" not in tables and "polygon" not in tables
+
+
+def test_reference_engine_loads_the_snapshot(engine, tmp_path):
+    paths = _snapshot(engine, tmp_path)
+    assert [os.path.basename(p) for p in paths] == ["parameter.parquet", "unit.parquet"]
+
+    snapshot = reference_engine(str(tmp_path / "reference"))
+    with Session(snapshot) as session:
+        assert session.exec(select(Parameter.name)).all() == ["moisture"]
+        assert session.exec(select(Unit.name)).all() == ["%"]
+
+
+def test_dry_run_materializes_stages_and_skips_loads(engine, tmp_path):
+    _snapshot(engine, tmp_path)
+    calls.clear()
+    out = tmp_path / "run"
+
+    with dry_run_mode(str(out), reference_dir=str(tmp_path / "reference")) as run:
+        assert get_engine() is run.engine and current_engine() is run.engine
+        df = transform(extract())
+        assert load(df) is None
+    assert dry_run.active() is None
+    assert calls == ["extract", "transform"]
+
+    # moisture resolves to its snapshot id; ash is created in the throwaway copy only
+    assert df["parameter_id"].tolist() == [1, 2]
+    with Session(engine) as session:
+        assert session.exec(select(Parameter.name)).all() == ["moisture"]
+
+    stats = json.loads((out / "stats.json").read_text())
+    stages = {s["task_name"]: s for s in stats["stages"]}
+    assert stages["test_dry_run.extract"]["files"] == {"observations": "test_dry_run.extract-1.observations.parquet"}
+    assert stages["test_dry_run.transform"]["files"] == {"": "test_dry_run.transform-1.parquet"}
+    assert stages["test_dry_run.transform"]["rows_out"] == 2
+    assert stages["test_dry_run.transform"]["frame_bytes"] > 0
+    assert stages["test_dry_run.load"]["status"] == "skipped"
+    pd.testing.assert_frame_equal(pd.read_parquet(out / "test_dry_run.transform-1.parquet"), df)
+
+
+def test_replay_reuses_materialized_extracts(engine, tmp_path):
+    _snapshot(engine, tmp_path)
+    reference = str(tmp_path / "reference")
+    with dry_run_mode(str(tmp_path / "first"), reference_dir=reference):
+        expected = transform(extract())
+
+    calls.clear()
+    with dry_run_mode(str(tmp_path / "second"), reference_dir=reference, replay_dir=str(tmp_path / "first")):
+        replayed = transform(extract())
+    assert calls == ["transform"]
+    pd.testing.assert_frame_equal(replayed, expected)
+
+
+def test_supports_dry_run_adds_flow_parameters(tmp_path):
+    @supports_dry_run
+    def flow_fn(source: str = "a", **kwargs):
+        return dry_run.active()
+
+    params = inspect.signature(flow_fn).parameters
+    assert list(params) == ["source", "dry_run", "materialize_dir", "reference_dir", "replay_dir", "kwargs"]
+    assert flow_fn() is None
+    run = flow_fn(materialize_dir=str(tmp_path / "run"), reference_dir=str(tmp_path / "missing"))
+    assert run.materialize_dir == str(tmp_path / "run")
+    assert (tmp_path / "run" / "stats.json").exists()
@@ -0,0 +1,119 @@
+"""Tests for dependency-aware sub-flow scheduling."""
+
+import threading
+import time
+
+import pytest
+
+from ca_biositing.pipeline.utils.flow_dag import (
+    COMPLETED,
+    FAILED,
+    FlowRun,
+    SKIPPED,
+    critical_path,
+    run_dag,
+    summarize_runs,
+    topological_order,
+)
+
+DEPENDENCIES = {
+    "resource_information": [],
+    "samples": ["resource_information"],
+    "analysis_records": ["samples"],
+    "usda_etl": ["resource_information"],
+    "landiq": ["resource_information"],
+}
+
+
+def _sleeper(seconds, log, fail=False):
+    def _flow():
+        log.append(threading.current_thread().name)
+        time.sleep(seconds)
+        if fail:
+            raise RuntimeError("boom")
+    return _flow
+
+
+def test_topological_order_respects_dependencies_and_declared_order():
+    order = topological_order(["analysis_records", "landiq", "samples", "resource_information"], DEPENDENCIES)
+    assert order == ["resource_information", "landiq", "samples", "analysis_records"]
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order(["a", "b"], {"a": ["b"], "b": ["a"]})
+
+
+def test_independent_flows_run_concurrently():
+    log = []
+    flows = {name: _sleeper(0.01, log) for name in DEPENDENCIES}
+    # samples, usda_etl and landiq only depend on resource_information; the
+    # barrier breaks (and the flows fail) unless all three are running at once.
+    barrier = threading.Barrier(3, timeout=10)
+
+    def _meet():
+        barrier.wait()
+
+    for name in ("samples", "usda_etl", "landiq"):
+        flows[name] = _meet
+
+    runs = run_dag(flows, DEPENDENCIES, max_workers=4)
+
+    assert all(run.status == COMPLETED for run in runs.values())
+    assert runs["usda_etl"].started < runs["samples"].finished
+    assert runs["samples"].started < runs["usda_etl"].finished
+    assert runs["samples"].started >= runs["resource_information"].finished
+    assert runs["analysis_records"].started >= runs["samples"].finished
+
+
+def test_summary_reports_critical_path_and_saved_time():
+    durations = {"resource_information": 2, "samples": 3, "analysis_records": 4, "usda_etl": 5, "landiq": 1}
+    runs = {
+        name: FlowRun(name=name, status=COMPLETED, started=0.0, finished=float(seconds))
+        for name, seconds in durations.items()
+    }
+
+    summary = summarize_runs(runs, DEPENDENCIES, 10.0)
+
+    assert summary["critical_path"] == ["resource_information", "samples", "analysis_records"]
+    assert summary["critical_path_seconds"] == 9.0
+    assert summary["serial_seconds"] == 15.0
+    assert summary["saved_seconds"] == 5.0
+
+
+def test_failure_skips_only_downstream_flows():
+    log = []
+    flows = {name: _sleeper(0.01, log) for name in DEPENDENCIES}
+    flows["samples"] = _sleeper(0.01, log, fail=True)
+
+    runs = run_dag(flows, DEPENDENCIES, max_workers=2)
+
+    assert runs["samples"].status == FAILED
+    assert "boom" in runs["samples"].error
+    assert runs["analysis_records"].status == SKIPPED
+    assert runs["usda_etl"].status == COMPLETED
+    assert runs["landiq"].status == COMPLETED
+
+
+def test_single_worker_runs_serially():
+    active = []
+    peak = []
+
+    def _flow():
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.01)
+        active.pop()
+
+    runs = run_dag({name: _flow for name in DEPENDENCIES}, DEPENDENCIES, max_workers=1)
+
+    assert max(peak) == 1
+    assert len(runs) == len(DEPENDENCIES)
+
+
+def test_critical_path_ignores_unknown_dependencies():
+    log = []
+    runs = run_dag({"landiq": _sleeper(0.01, log)}, DEPENDENCIES)
+    path, seconds = critical_path(runs, DEPENDENCIES)
+    assert path == ["landiq"]
+    assert seconds > 0
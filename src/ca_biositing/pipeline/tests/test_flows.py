@@ -13,3 +13,33 @@ def test_analysis_type_flow_import():
     from ca_biositing.pipeline.flows.analysis_type import analysis_type_flow
     assert analysis_type_flow is not None
     assert callable(analysis_type_flow)
+
+
+def test_analysis_records_stage_runs_tasks_concurrently():
+    """Transform/load stages run their tasks at the same time."""
+    import logging
+    import threading
+
+    from prefect import flow, task
+    from prefect.task_runners import ThreadPoolTaskRunner
+    from ca_biositing.pipeline.flows.analysis_records import _run_stage
+
+    # Each task waits for the other three; the barrier breaks (failing the
+    # stage) unless all four are running at once.
+    barrier = threading.Barrier(4, timeout=30)
+
+    @task
+    def meet_and_double(x):
+        barrier.wait()
+        return 2 * x
+
+    @flow(task_runner=ThreadPoolTaskRunner(max_workers=4))
+    def stage_flow():
+        return _run_stage(logging.getLogger(__name__), "Transform", [
+            (name, meet_and_double, (i,), {}) for i, name in enumerate(["a", "b", "c", "d"])
+        ])
+
+    results = stage_flow()
+
+    assert results == {"a": 0, "b": 2, "c": 4, "d": 6}
+    assert not barrier.broken
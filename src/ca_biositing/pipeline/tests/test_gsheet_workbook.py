@@ -0,0 +1,154 @@
+"""Tests for batched workbook extraction against a recorded-response fake."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from gspread.exceptions import APIError, SpreadsheetNotFound
+
+from ca_biositing.pipeline.utils import extraction_cache, gsheet_workbook
+from ca_biositing.pipeline.utils.gsheet_workbook import gsheet_workbook_to_dfs
+
+# Recorded spreadsheets.values.batchGet response (trailing empty cells are
+# omitted by the API, and an empty tab has no "values" key).
+RECORDED_BATCH_GET = {
+    "spreadsheetId": "1AbCdEfGhIjKlMnOpQrStUvWxYz0123456789",
+    "valueRanges": [
+        {
+            "range": "'03.1-Proximate'!A1:D3",
+            "majorDimension": "ROWS",
+            "values": [
+                ["Record_ID", "Parameter", "Value", "Value"],
+                ["P-001", "Moisture", "7.1"],
+                ["P-002", "Ash", "3.4", "x"],
+            ],
+        },
+        {"range": "'03.5-ICP'!A1:Z1000", "majorDimension": "ROWS"},
+    ],
+}
+
+
+class FakeSpreadsheet:
+    def __init__(self, titles):
+        self.id = RECORDED_BATCH_GET["spreadsheetId"]
+        self.titles = titles
+        self.batch_calls = []
+
+    def values_batch_get(self, ranges, params=None):
+        self.batch_calls.append((ranges, params))
+        unknown = [r for r in ranges if r.strip("'") not in self.titles]
+        if unknown:
+            raise APIError(SimpleNamespace(json=lambda: {"error": {"code": 400, "message": "Unable to parse range"}}))
+        recorded = {vr["range"].split("!")[0]: vr for vr in RECORDED_BATCH_GET["valueRanges"]}
+        return {"valueRanges": [recorded[r] for r in ranges]}
+
+    def worksheets(self):
+        return [SimpleNamespace(title=t) for t in self.titles]
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.open_calls = []
+        self.open_by_key_calls = []
+        self.modified_time = "2026-05-01T10:00:00.000Z"
+        self.metadata_calls = 0
+
+    def get_file_drive_metadata(self, key):
+        self.metadata_calls += 1
+        return {"id": key, "modifiedTime": self.modified_time}
+
+    def open(self, title):
+        self.open_calls.append(title)
+        if title != "Aim 1":
+            raise SpreadsheetNotFound()
+        return self.spreadsheet
+
+    def open_by_key(self, key):
+        self.open_by_key_calls.append(key)
+        return self.spreadsheet
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(gsheet_workbook, "_SPREADSHEET_KEYS", {})
+    monkeypatch.setattr(extraction_cache, "EXTRACT_CACHE_DIR", str(tmp_path))
+
+
+def test_fetches_all_tabs_in_one_batch_request():
+    spreadsheet = FakeSpreadsheet({"03.1-Proximate", "03.5-ICP"})
+    client = FakeClient(spreadsheet)
+
+    frames = gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate", "03.5-ICP"], "unused.json", client=client)
+
+    assert len(spreadsheet.batch_calls) == 1
+    ranges, params = spreadsheet.batch_calls[0]
+    assert ranges == ["'03.1-Proximate'", "'03.5-ICP'"]
+    assert params == {"valueRenderOption": "FORMATTED_VALUE"}
+
+    prox = frames["03.1-Proximate"]
+    assert list(prox.columns) == ["Record_ID", "Parameter", "Value"]
+    assert prox.to_dict("records") == [
+        {"Record_ID": "P-001", "Parameter": "Moisture", "Value": "7.1"},
+        {"Record_ID": "P-002", "Parameter": "Ash", "Value": "3.4"},
+    ]
+    assert frames["03.5-ICP"].empty
+
+
+def test_title_is_resolved_to_key_once(monkeypatch):
+    monkeypatch.setattr(extraction_cache, "EXTRACT_CACHE_ENABLED", False)
+    spreadsheet = FakeSpreadsheet({"03.1-Proximate"})
+    client = FakeClient(spreadsheet)
+
+    gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate"], "unused.json", client=client)
+    gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate"], "unused.json", client=client)
+
+    assert client.open_calls == ["Aim 1"]
+    assert client.open_by_key_calls == [spreadsheet.id]
+
+
+def test_missing_tab_maps_to_none():
+    spreadsheet = FakeSpreadsheet({"03.1-Proximate"})
+    client = FakeClient(spreadsheet)
+
+    frames = gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate", "99-Missing"], "unused.json", client=client)
+
+    assert frames["99-Missing"] is None
+    assert len(frames["03.1-Proximate"]) == 2
+    assert spreadsheet.batch_calls[-1][0] == ["'03.1-Proximate'"]
+
+
+def test_unchanged_workbook_is_served_from_cache(monkeypatch):
+    spreadsheet = FakeSpreadsheet({"03.1-Proximate", "03.5-ICP"})
+    client = FakeClient(spreadsheet)
+    tabs = ["03.1-Proximate", "03.5-ICP"]
+
+    first = gsheet_workbook_to_dfs("Aim 1", tabs, "unused.json", client=client)
+    # A new process: the title -> key mapping comes from the cache sidecar
+    monkeypatch.setattr(gsheet_workbook, "_SPREADSHEET_KEYS", {})
+    second = gsheet_workbook_to_dfs("Aim 1", tabs, "unused.json", client=client)
+
+    assert len(spreadsheet.batch_calls) == 1
+    assert client.open_calls == ["Aim 1"]
+    assert client.metadata_calls == 2
+    pd.testing.assert_frame_equal(first["03.1-Proximate"], second["03.1-Proximate"])
+
+    client.modified_time = "2026-05-02T08:30:00.000Z"
+    gsheet_workbook_to_dfs("Aim 1", tabs, "unused.json", client=client)
+    assert len(spreadsheet.batch_calls) == 2
+
+
+def test_flows_can_skip_sources_already_loaded():
+    spreadsheet = FakeSpreadsheet({"03.1-Proximate"})
+    client = FakeClient(spreadsheet)
+
+    frames = gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate"], "unused.json", client=client)
+    assert not extraction_cache.is_unchanged(*frames.values())
+
+    extraction_cache.mark_loaded(*frames.values())
+    frames = gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate"], "unused.json", client=client)
+    assert extraction_cache.is_unchanged(*frames.values())
+
+    client.modified_time = "2026-05-03T00:00:00.000Z"
+    frames = gsheet_workbook_to_dfs("Aim 1", ["03.1-Proximate"], "unused.json", client=client)
+    assert not extraction_cache.is_unchanged(*frames.values())
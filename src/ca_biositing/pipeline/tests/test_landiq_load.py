@@ -7,7 +7,8 @@ from ca_biositing.pipeline.etl.load.landiq import (
     bulk_insert_polygons_ignore,
     fetch_polygon_ids_by_geoms,
     bulk_upsert_landiq_records,
-    load_landiq_record
+    load_landiq_record,
+    simplify_geometry_tiers,
 )
 from ca_biositing.pipeline.utils.lookup_utils import fetch_lookup_ids
 from ca_biositing.datamodels.models import LandiqRecord, Polygon, DataSource, PrimaryAgProduct
@@ -28,6 +29,22 @@ def test_fetch_polygon_ids_by_geoms(session):
     assert p1.id in returned_ids
     assert p2.id in returned_ids
 
+def test_simplify_geometry_tiers():
+    from shapely import wkt
+    # Square with a 0.5 m bump on the bottom edge and a 5 m notch on the top edge
+    field = "POLYGON((0 0, 50 0.5, 100 0, 100 100, 50 95, 0 100, 0 0))"
+
+    tiers = simplify_geometry_tiers([field, None])
+
+    assert set(tiers) == {"geom_1m", "geom_10m", "geom_100m"}
+    assert all(len(values) == 2 and values[1] is None for values in tiers.values())
+    # 1 m removes the bump but keeps the notch; 10 m removes both
+    assert len(wkt.loads(tiers["geom_1m"][0]).exterior.coords) == 6
+    assert len(wkt.loads(tiers["geom_10m"][0]).exterior.coords) == 5
+    # Topology-preserving simplification never collapses the polygon
+    assert wkt.loads(tiers["geom_100m"][0]).is_valid
+    assert not wkt.loads(tiers["geom_100m"][0]).is_empty
+
 @patch("ca_biositing.pipeline.etl.load.landiq.get_engine")
 def test_load_landiq_record_optimized(mock_get_engine, session, engine):
     mock_get_engine.return_value = engine
@@ -85,3 +85,68 @@ def test_load_location_address_update(mock_get_engine, session, engine):
     assert updated.is_anonymous is True
     from sqlalchemy import func
     assert session.exec(select(func.count(LocationAddress.id))).one() == 1
+
+
+@patch("ca_biositing.pipeline.etl.load.field_sample.get_engine")
+@patch("ca_biositing.pipeline.etl.load.location_address.get_engine")
+def test_load_location_address_returns_ids_for_field_samples(mock_address_engine, mock_sample_engine, session, engine):
+    from sqlmodel import select
+    from ca_biositing.datamodels.models import FieldSample
+    from ca_biositing.datamodels.query_profiler import query_budget
+    from ca_biositing.pipeline.etl.load.field_sample import load_field_sample
+
+    mock_address_engine.return_value = engine
+    mock_sample_engine.return_value = engine
+    session.add(Place(geoid="06077", county_name="San Joaquin"))
+    session.add(LocationAddress(geography_id="06077", address_line1="123 Main St", city="Stockton", zip="95202"))
+    session.commit()
+    existing_id = session.exec(select(LocationAddress.id)).one()
+
+    # Spacing and case differences share the natural key, including within the batch
+    df = pd.DataFrame({
+        'sampling_location': ['san joaquin', 'San Joaquin', None],
+        'address_line1': [' 123 MAIN ST', '123 main st', '9 Farm Rd'],
+        'city': ['stockton', 'Stockton', 'Davis'],
+        'zip': ['95202', '95202', np.nan],
+        'is_anonymous': [False, True, False],
+    })
+    with query_budget(max_queries=2, max_repeats=1):
+        address_ids = load_location_address.fn(df)
+
+    assert address_ids == {
+        "06077|123 main st|stockton|95202": existing_id,
+        "06000|9 farm rd|davis|": address_ids["06000|9 farm rd|davis|"],
+    }
+    assert session.exec(select(LocationAddress).where(LocationAddress.id == existing_id)).one().is_anonymous is True
+    assert len(session.exec(select(LocationAddress)).all()) == 2
+
+    samples = pd.DataFrame({
+        'name': ['S1', 'S2', 'S3'],
+        'sampling_location': ['San Joaquin', None, 'Fresno'],
+        'sampling_street': ['123 Main St', '9 Farm Rd', 'Elsewhere'],
+        'sampling_city': ['Stockton', 'Davis', None],
+        'sampling_zip': ['95202', None, None],
+    })
+    load_field_sample.fn(samples, address_ids=address_ids)
+    linked = {s.name: s.sampling_location_id for s in session.exec(select(FieldSample)).all()}
+    assert linked == {'S1': existing_id, 'S2': address_ids["06000|9 farm rd|davis|"], 'S3': None}
+
+    # Without the returned ids, only the referenced keys are looked up
+    load_field_sample.fn(samples.iloc[:1].assign(name='S4'))
+    s4 = session.exec(select(FieldSample).where(FieldSample.name == 'S4')).one()
+    assert s4.sampling_location_id == existing_id
+
+    # Keys missing from partial ids fall back to the address_key lookup
+    load_field_sample.fn(samples.iloc[:2].assign(name=['S5', 'S6']), address_ids={})
+    load_field_sample.fn(
+        samples.iloc[:2].assign(name=['S7', 'S8']),
+        address_ids={"06000|9 farm rd|davis|": address_ids["06000|9 farm rd|davis|"]},
+    )
+    linked = {
+        s.name: s.sampling_location_id
+        for s in session.exec(select(FieldSample).where(FieldSample.name.in_(['S5', 'S6', 'S7', 'S8']))).all()
+    }
+    assert linked == {
+        'S5': existing_id, 'S6': address_ids["06000|9 farm rd|davis|"],
+        'S7': existing_id, 'S8': address_ids["06000|9 farm rd|davis|"],
+    }
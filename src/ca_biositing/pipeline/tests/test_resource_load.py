@@ -1,40 +1,116 @@
 import pandas as pd
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from ca_biositing.datamodels.models import PrimaryAgProduct, Resource
+from ca_biositing.datamodels.query_profiler import profile_queries, query_budget
 from ca_biositing.pipeline.etl.load.resource import load_resource
+from ca_biositing.pipeline.utils import name_upsert
+from ca_biositing.pipeline.utils.name_upsert import upsert_by_name
+
+
+def _resources(engine):
+    with engine.connect() as conn:
+        return {
+            row.name: row for row in conn.execute(select(Resource.__table__)).all()
+        }
+
 
-@patch("ca_biositing.pipeline.etl.load.resource.get_engine")
-@patch("ca_biositing.pipeline.etl.load.resource.Session")
-def test_load_resource(mock_session_class, mock_get_engine):
+def test_load_resource(engine):
     # 1. Setup Mock Data (matching the output of resource transform)
     transformed_data = pd.DataFrame({
         "name": ["almond hulls", "corn stover"],
-        "resource_class_id": [1, 1],
-        "resource_subclass_id": [10, 11],
-        "primary_ag_product_id": [100, 101],
-        "note": ["test note 1", "test note 2"],
+        "resource_class_id": [None, None],
+        "description": ["test note 1", "test note 2"],
+        "note": ["not a column", "not a column"],
         "etl_run_id": [1, 1],
         "lineage_group_id": [10, 10]
     })
 
-    # 2. Setup Mocks
-    mock_engine = MagicMock()
-    mock_get_engine.return_value = mock_engine
+    # 2. Run Load Task twice: the second run updates one row and inserts one
+    with patch("ca_biositing.pipeline.etl.load.resource.get_engine", return_value=engine):
+        load_resource.fn(transformed_data)
+        first = _resources(engine)
+
+        changed = pd.DataFrame({
+            "name": ["Almond Hulls", "corn stover", "rice straw"],
+            "description": ["new note", "test note 2", None],
+            "etl_run_id": [2, 2, 2],
+        })
+        with query_budget(max_queries=3, max_repeats=1):
+            load_resource.fn(changed)
+
+    # 3. Assertions
+    second = _resources(engine)
+    assert sorted(second) == ["Almond Hulls", "corn stover", "rice straw"]
+    assert second["Almond Hulls"].id == first["almond hulls"].id
+    assert second["Almond Hulls"].description == "new note"
+    assert second["Almond Hulls"].created_at == first["almond hulls"].created_at
+    assert second["Almond Hulls"].updated_at > first["almond hulls"].updated_at
+    # Unchanged rows are not rewritten
+    assert second["corn stover"].updated_at == first["corn stover"].updated_at
+    assert second["corn stover"].etl_run_id == 1
+
+
+def test_upsert_by_name_returns_ids_and_counts(engine):
+    with engine.connect() as conn, profile_queries("upsert") as profile:
+        first = upsert_by_name(conn, PrimaryAgProduct.__table__, [
+            {"name": "almonds"}, {"name": "Walnuts"}, {"name": None}, {"name": "  "},
+        ])
+        second = upsert_by_name(conn, PrimaryAgProduct.__table__, [
+            {"name": "ALMONDS", "description": "tree nut"}, {"name": "walnuts"}, {"name": "walnuts"},
+        ])
+        conn.commit()
+        stored = dict(conn.execute(select(PrimaryAgProduct.name, PrimaryAgProduct.id)).all())
+
+    assert first.summary() == "2 inserted, 0 updated, 0 unchanged, 2 skipped without a name"
+    assert any("ON CONFLICT (name_norm) DO NOTHING" in sql for sql in profile.stats), profile.report()
+    assert second.summary() == "0 inserted, 2 updated, 0 unchanged"
+    assert first.ids == second.ids == {"almonds": stored["ALMONDS"], "walnuts": stored["walnuts"]}
+
+    with engine.connect() as conn:
+        third = upsert_by_name(conn, PrimaryAgProduct.__table__, [{"name": "  Almonds "}])
+    assert third.ids == {"almonds": stored["ALMONDS"]}
+
+
+def test_name_norm_index_rejects_case_and_spacing_duplicates(engine):
+    with engine.connect() as conn:
+        conn.execute(Resource.__table__.insert().values(name="Almond Hulls"))
+        conn.commit()
+    for duplicate in ("almond hulls", "almond_hulls", " Almond  Hulls"):
+        with engine.connect() as conn, pytest.raises(IntegrityError):
+            conn.execute(Resource.__table__.insert().values(name=duplicate))
+
+
+def test_name_key_mirrors_name_norm(engine):
+    names = ["Almond Hulls", "  corn__stover ", "Rice   Straw", "walnut\tshells"]
+    with engine.connect() as conn:
+        conn.execute(PrimaryAgProduct.__table__.insert(), [{"name": name} for name in names])
+        stored = dict(conn.execute(select(PrimaryAgProduct.name, PrimaryAgProduct.name_norm)).all())
+
+    assert {name: name_upsert.name_key(name) for name in names} == stored
+
 
-    mock_session = MagicMock()
-    mock_session_class.return_value.__enter__.return_value = mock_session
+def test_postgres_updates_changed_rows_from_values_list():
+    """On PostgreSQL the changed rows are written by one UPDATE ... FROM (VALUES ...)."""
+    statements = []
 
-    # Mock the connection context manager
-    mock_conn = MagicMock()
-    mock_engine.connect.return_value.__enter__.return_value = mock_conn
+    class RecordingConnection:
+        dialect = postgresql.dialect()
 
-    # Mock query behavior: first call returns None (insert), second call returns None (insert)
-    mock_session.query.return_value.filter.return_value.first.side_effect = [None, None]
+        def execute(self, stmt, *args):
+            statements.append(str(stmt.compile(dialect=self.dialect)))
 
-    # 3. Run Load Task
-    # Use .fn to bypass Prefect orchestration
-    load_resource.fn(transformed_data)
+    name_upsert._update_from_values(
+        RecordingConnection(), Resource.__table__, ["description", "updated_at"],
+        [{"id": 1, "description": "a", "updated_at": None}, {"id": 2, "description": None, "updated_at": None}],
+    )
 
-    # 4. Assertions
-    assert mock_session.add.call_count == 2
-    assert mock_session.commit.called
+    [sql] = statements
+    assert sql.startswith("UPDATE resource SET updated_at=CAST(incoming.updated_at AS TIMESTAMP WITH TIME ZONE)")
+    assert "description=CAST(incoming.description AS VARCHAR)" in sql
+    assert "FROM (VALUES (%(param_1)s, %(param_2)s, NULL), (%(param_3)s, NULL, NULL))" in sql
+    assert "AS incoming (id, description, updated_at) WHERE resource.id = incoming.id" in sql
@@ -67,3 +67,27 @@ def test_resource_transform(mock_session, mock_engine):
 
 if __name__ == "__main__":
     test_resource_transform()
+
+
+def test_replace_name_with_id_strips_names_before_lookup():
+    from ca_biositing.datamodels.models import PrimaryAgProduct
+    from ca_biositing.pipeline.utils.name_id_swap import replace_name_with_id_df
+
+    db = MagicMock()
+    db.bind.url.drivername = "postgresql"
+    inserted = MagicMock(id=102)
+    inserted.name = "wheat"
+    existing = MagicMock()
+    existing.all.return_value = [("corn", 101)]
+    refreshed = MagicMock()
+    refreshed.scalars.return_value.all.return_value = [inserted]
+    db.execute.side_effect = [existing, refreshed]
+
+    df = pd.DataFrame({"product": ["corn ", " Corn", "Wheat ", "wheat"]})
+    out, num_new = replace_name_with_id_df(db, df, PrimaryAgProduct, "product", "name", "id", "product_id")
+
+    # "corn " matches the stored "corn"; "Wheat " and "wheat" are one new row
+    assert num_new == 1
+    assert db.add.call_count == 1
+    assert db.add.call_args.args[0].name == "wheat"
+    assert out["product_id"].tolist() == [101, 101, 102, 102]
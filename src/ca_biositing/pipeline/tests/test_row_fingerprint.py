@@ -0,0 +1,60 @@
+"""Tests for content-hash change detection on upsert."""
+
+import pandas as pd
+from sqlmodel import select
+
+from ca_biositing.datamodels.models import LineageTableChange, ProximateRecord, RowFingerprint
+from ca_biositing.pipeline.utils.row_fingerprint import diff_rows, row_hashes, save_changes
+
+TABLE = ProximateRecord.__table__
+
+
+def _records(values, etl_run_id=1):
+    return pd.DataFrame({
+        "record_id": [f"P-{i:03d}" for i in range(len(values))],
+        "technical_replicate_no": [1] * len(values),
+        "note": values,
+        "etl_run_id": [etl_run_id] * len(values),
+        "updated_at": pd.Timestamp.now(),
+    })
+
+
+def test_hashes_ignore_dtype_and_column_order():
+    a = pd.DataFrame({"x": [1, 2], "y": ["a", None]})
+    b = pd.DataFrame({"y": ["a", pd.NA], "x": ["1", "2"]})
+    assert row_hashes(a, ["x", "y"]).tolist() == row_hashes(b, ["y", "x"]).tolist()
+    assert row_hashes(a, ["x", "y"]).nunique() == 2
+
+
+def test_only_new_and_changed_rows_are_written(session):
+    first = diff_rows(session, TABLE, _records(["a", "b", "c"]), ["record_id"])
+    assert (first.inserted, first.updated, first.unchanged) == (3, 0, 0)
+    assert len(first.rows) == 3
+    save_changes(session, first)
+    session.commit()
+
+    # Lineage columns and timestamps differ on every run and are not hashed.
+    second = diff_rows(session, TABLE, _records(["a", "B", "c", "d"], etl_run_id=2), ["record_id"])
+    assert (second.inserted, second.updated, second.unchanged) == (1, 1, 2)
+    assert second.rows["record_id"].tolist() == ["P-001", "P-003"]
+    save_changes(session, second)
+    session.commit()
+
+    third = diff_rows(session, TABLE, _records(["a", "B", "c", "d"], etl_run_id=3), ["record_id"])
+    assert third.rows.empty
+    assert third.unchanged == 4
+
+    counts = session.exec(
+        select(LineageTableChange.etl_run_id, LineageTableChange.inserted, LineageTableChange.updated)
+        .where(LineageTableChange.table_name == "proximate_record")
+        .order_by(LineageTableChange.id)
+    ).all()
+    assert [tuple(c) for c in counts] == [(1, 3, 0), (2, 1, 1)]
+    assert len(session.exec(select(RowFingerprint)).all()) == 4
+
+
+def test_duplicate_keys_keep_last_row(session):
+    df = pd.DataFrame({"record_id": ["P-1", "P-1"], "note": ["old", "new"]})
+    changes = diff_rows(session, TABLE, df, ["record_id"])
+    assert changes.rows["note"].tolist() == ["new"]
+    assert changes.inserted == 1
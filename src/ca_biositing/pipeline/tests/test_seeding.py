@@ -1,16 +1,18 @@
 """
-Tests for seed_commodity_mappings.py — specifically the dual resource/primary_ag_product
-lookup introduced in TODO 6.
+Tests for seed_commodity_mappings.py — the dual resource/primary_ag_product
+lookup introduced in TODO 6, and the set-based staging-table writes.
 
-These tests use mocks to avoid any database dependency, following the same pattern
-as tests/USDA/test_api_names.py.
+These tests run the seeder against the in-memory SQLite engine from conftest.py.
 
 Run with:
     pixi run test -- src/ca_biositing/pipeline/tests/test_seeding.py
 """
 
 import os
-from unittest.mock import MagicMock
+
+from sqlalchemy import text
+
+from ca_biositing.datamodels.query_profiler import query_budget
 
 # ── CSV helper ────────────────────────────────────────────────────────────────
 
@@ -27,70 +29,44 @@ def _write_csv(directory: str, rows: list[tuple]) -> str:
     return path
 
 
-# ── Mock DB helpers ───────────────────────────────────────────────────────────
+# ── DB helpers ────────────────────────────────────────────────────────────────
 
-def _make_mock_conn(
+def _seed_tables(
+    engine,
     resource_ids: dict[str, int],
     pap_ids: dict[str, int],
-    commodity_ids: dict[str, int],
-) -> tuple[MagicMock, list[dict]]:
+    commodity_ids: dict[str, int] = None,
+) -> None:
     """
-    Build a mock SQLAlchemy connection with scripted query results.
+    Insert reference rows with fixed ids.
 
     Args:
         resource_ids:   {lowercase_name: id} rows present in the resource table
         pap_ids:        {lowercase_name: id} rows present in the primary_ag_product table
         commodity_ids:  {lowercase_name: id} rows present in the usda_commodity table
-
-    Returns:
-        (mock_conn, inserted_maps) where inserted_maps is a list of param dicts
-        captured from INSERT INTO resource_usda_commodity_map calls.
     """
-    mock_conn = MagicMock()
-    inserted_maps: list[dict] = []
-
-    def _execute(query, params=None):
-        result = MagicMock()
-        qs = str(query)
-        p = params or {}
-
-        if "FROM resource WHERE" in qs:
-            row_id = resource_ids.get(p.get("name"))
-            result.fetchone.return_value = (row_id,) if row_id is not None else None
-
-        elif "FROM primary_ag_product WHERE" in qs:
-            row_id = pap_ids.get(p.get("name"))
-            result.fetchone.return_value = (row_id,) if row_id is not None else None
-
-        elif "FROM usda_commodity WHERE" in qs:
-            # The seeder uses :name on the first check, :commodity_name on the second
-            name = p.get("name") or p.get("commodity_name")
-            row_id = commodity_ids.get(name)
-            result.fetchone.return_value = (row_id,) if row_id is not None else None
-
-        elif "INSERT INTO resource_usda_commodity_map" in qs:
-            inserted_maps.append(dict(p))
-            result.fetchone.return_value = None
-
-        else:
-            # UPDATE usda_commodity, INSERT usda_commodity, DELETE …
-            result.fetchone.return_value = None
-            result.fetchall.return_value = []
-            result.scalar.return_value = 0
-
-        return result
-
-    mock_conn.execute.side_effect = _execute
-    mock_conn.begin.return_value = MagicMock()   # transaction mock — commit/rollback are no-ops
-    return mock_conn, inserted_maps
-
-
-def _make_mock_engine(mock_conn: MagicMock) -> MagicMock:
-    """Wrap a mock connection in a mock engine that supports `with engine.connect() as conn:`."""
-    engine = MagicMock()
-    engine.connect.return_value.__enter__.return_value = mock_conn
-    engine.connect.return_value.__exit__.return_value = False
-    return engine
+    with engine.begin() as conn:
+        for table, ids in (
+            ("resource", resource_ids),
+            ("primary_ag_product", pap_ids),
+            ("usda_commodity", commodity_ids or {}),
+        ):
+            for name, row_id in ids.items():
+                conn.execute(
+                    text(f"INSERT INTO {table} (id, name) VALUES (:id, :name)"),
+                    {"id": row_id, "name": name},
+                )
+
+
+def _mappings(engine) -> list[dict]:
+    with engine.connect() as conn:
+        return [
+            dict(row._mapping)
+            for row in conn.execute(text(
+                "SELECT id, resource_id, primary_ag_product_id AS pap_id, usda_commodity_id, "
+                "match_tier, note, updated_at FROM resource_usda_commodity_map ORDER BY id"
+            ))
+        ]
 
 
 # ── Tests ─────────────────────────────────────────────────────────────────────
@@ -99,34 +75,29 @@ class TestSeederDualLookup:
     """
     Verify the resource / primary_ag_product dual-lookup added in TODO 6.
 
-    Each test writes a minimal CSV, passes a scripted engine mock, then checks
-    the params that were passed to the INSERT INTO resource_usda_commodity_map
-    statement.
+    Each test writes a minimal CSV, seeds the reference tables, runs the seeder
+    and checks the rows written to resource_usda_commodity_map.
     """
 
-    def test_resource_row_sets_resource_id(self, tmp_path):
+    def test_resource_row_sets_resource_id(self, tmp_path, engine):
         """When resource_name exists in the resource table, resource_id is populated and pap_id is None."""
         from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
 
         csv_path = _write_csv(str(tmp_path), [
             ("alfalfa hay", "alfalfa", "ALFALFA", 12345, "EXACT", "test note"),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={"alfalfa hay": 42},
-            pap_ids={},
-            commodity_ids={"alfalfa": 99},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={"alfalfa hay": 42}, pap_ids={}, commodity_ids={"alfalfa": 99})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
+        inserted_maps = _mappings(engine)
         assert len(inserted_maps) == 1
         assert inserted_maps[0]["resource_id"] == 42
         assert inserted_maps[0]["pap_id"] is None
+        assert inserted_maps[0]["usda_commodity_id"] == 99
 
-    def test_pap_row_sets_pap_id_when_resource_missing(self, tmp_path):
+    def test_pap_row_sets_pap_id_when_resource_missing(self, tmp_path, engine):
         """
         When resource_name is NOT in resource but IS in primary_ag_product,
         primary_ag_product_id (pap_id) is populated and resource_id is None.
@@ -136,22 +107,17 @@ class TestSeederDualLookup:
         csv_path = _write_csv(str(tmp_path), [
             ("corn stover", "corn", "CORN", 11111, "EXACT", ""),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={},                    # name NOT in resource
-            pap_ids={"corn stover": 77},        # but IS in primary_ag_product
-            commodity_ids={"corn": 55},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={}, pap_ids={"corn stover": 77}, commodity_ids={"corn": 55})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
+        inserted_maps = _mappings(engine)
         assert len(inserted_maps) == 1
         assert inserted_maps[0]["pap_id"] == 77
         assert inserted_maps[0]["resource_id"] is None
 
-    def test_resource_lookup_takes_priority_over_pap(self, tmp_path):
+    def test_resource_lookup_takes_priority_over_pap(self, tmp_path, engine):
         """
         When resource_name exists in BOTH tables, the resource table wins
         (resource_id is set, pap_id remains None).
@@ -161,65 +127,51 @@ class TestSeederDualLookup:
         csv_path = _write_csv(str(tmp_path), [
             ("wheat straw", "wheat", "WHEAT", 22222, "EXACT", ""),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={"wheat straw": 10},   # found here first
-            pap_ids={"wheat straw": 20},        # would also match here
-            commodity_ids={"wheat": 5},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={"wheat straw": 10}, pap_ids={"wheat straw": 20}, commodity_ids={"wheat": 5})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
+        inserted_maps = _mappings(engine)
         assert len(inserted_maps) == 1
         assert inserted_maps[0]["resource_id"] == 10
         assert inserted_maps[0]["pap_id"] is None
 
-    def test_missing_row_is_skipped(self, tmp_path):
-        """When resource_name is in neither table, the row is skipped and no INSERT is emitted."""
+    def test_missing_row_is_skipped(self, tmp_path, engine, capsys):
+        """When resource_name is in neither table, the row is skipped and no mapping is written."""
         from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
 
         csv_path = _write_csv(str(tmp_path), [
             ("ghost crop", "wheat", "WHEAT", 22222, "MANUAL", ""),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={},
-            pap_ids={},
-            commodity_ids={"wheat": 11},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={}, pap_ids={}, commodity_ids={"wheat": 11})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
-        assert len(inserted_maps) == 0
+        assert _mappings(engine) == []
+        assert "'ghost crop' not found in resource or primary_ag_product" in capsys.readouterr().out
 
-    def test_unmapped_rows_excluded_before_db_lookups(self, tmp_path):
-        """Rows with match_tier == UNMAPPED must be filtered out before any DB queries are issued."""
+    def test_unmapped_rows_excluded_before_db_lookups(self, tmp_path, engine):
+        """Rows with match_tier == UNMAPPED must be filtered out before anything is written."""
         from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
 
         csv_path = _write_csv(str(tmp_path), [
             ("some resource", "some commodity", "NONE", 0, "UNMAPPED", ""),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={"some resource": 1},
-            pap_ids={},
-            commodity_ids={},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={"some resource": 1}, pap_ids={})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
-        assert len(inserted_maps) == 0
+        assert _mappings(engine) == []
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM usda_commodity")).scalar() == 0
 
-    def test_mixed_csv_handles_both_types_correctly(self, tmp_path):
+    def test_mixed_csv_handles_both_types_correctly(self, tmp_path, engine):
         """
         A CSV containing both a resource row and a primary_ag_product row produces
-        two correctly typed INSERTs.
+        two correctly typed mappings.
         """
         from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
 
@@ -227,17 +179,12 @@ class TestSeederDualLookup:
             ("alfalfa hay", "alfalfa", "ALFALFA", 12345, "EXACT", "resource type"),
             ("corn stover", "corn",    "CORN",    11111, "EXACT", "pap type"),
         ])
-
-        mock_conn, inserted_maps = _make_mock_conn(
-            resource_ids={"alfalfa hay": 10},
-            pap_ids={"corn stover": 20},
-            commodity_ids={"alfalfa": 1, "corn": 2},
-        )
-        engine = _make_mock_engine(mock_conn)
+        _seed_tables(engine, resource_ids={"alfalfa hay": 10}, pap_ids={"corn stover": 20})
 
         result = seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine)
 
         assert result is True
+        inserted_maps = _mappings(engine)
         assert len(inserted_maps) == 2
 
         resource_row = next(m for m in inserted_maps if m.get("resource_id") == 10)
@@ -245,3 +192,108 @@ class TestSeederDualLookup:
 
         assert resource_row["pap_id"] is None
         assert pap_row["resource_id"] is None
+
+
+class TestSetBasedSeeding:
+    """The seeder writes in a fixed number of statements and diffs the mapping table."""
+
+    def test_commodities_are_inserted_then_updated_in_place(self, tmp_path, engine):
+        from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
+
+        _seed_tables(engine, resource_ids={f"resource {i}": i for i in range(1, 41)}, pap_ids={})
+        rows = [(f"resource {i}", f"crop {i % 20}", "", 1000 + i % 20, "EXACT", "") for i in range(1, 41)]
+        csv_path = _write_csv(str(tmp_path), rows)
+
+        # The statement count does not grow with the number of CSV rows
+        with query_budget(max_queries=20, max_repeats=6):
+            assert seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine) is True
+
+        with engine.connect() as conn:
+            commodities = conn.execute(text(
+                "SELECT name, usda_code, usda_source, description FROM usda_commodity ORDER BY id"
+            )).all()
+        assert len(commodities) == 20
+        assert commodities[0] == ("crop 1", "1001", "NASS_WEB", "crop 1")
+
+        rows[0] = ("resource 1", "crop 1", "", 2001, "EXACT", "")
+        csv_path = _write_csv(str(tmp_path), rows)
+        assert seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine) is True
+        with engine.connect() as conn:
+            codes = dict(conn.execute(text("SELECT name, usda_code FROM usda_commodity")).all())
+        assert len(codes) == 20
+        assert codes["crop 1"] == "2001"
+
+    def test_mapping_table_is_diffed_not_truncated(self, tmp_path, engine):
+        from ca_biositing.pipeline.utils.seed_commodity_mappings import seed_commodity_mappings_from_csv
+
+        _seed_tables(
+            engine,
+            resource_ids={"alfalfa hay": 1, "rice straw": 2, "walnut shells": 3},
+            pap_ids={},
+            commodity_ids={"alfalfa": 10, "rice": 11, "walnuts": 12},
+        )
+        csv_path = _write_csv(str(tmp_path), [
+            ("alfalfa hay", "alfalfa", "", 1, "EXACT", "kept"),
+            ("rice straw", "rice", "", 2, "EXACT", "old note"),
+            ("walnut shells", "walnuts", "", 3, "EXACT", "dropped"),
+        ])
+        assert seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine) is True
+        before = {m["resource_id"]: m for m in _mappings(engine)}
+
+        csv_path = _write_csv(str(tmp_path), [
+            ("alfalfa hay", "alfalfa", "", 1, "EXACT", "kept"),
+            ("rice straw", "rice", "", 2, "CROP_FALLBACK", "new note"),
+            ("walnut shells", "alfalfa", "", 1, "EXACT", "remapped"),
+        ])
+        assert seed_commodity_mappings_from_csv(csv_path=csv_path, engine=engine) is True
+        after = {m["resource_id"]: m for m in _mappings(engine)}
+
+        # Unchanged rows keep their id and timestamp
+        assert after[1] == before[1]
+        # Changed rows are updated in place
+        assert after[2]["id"] == before[2]["id"]
+        assert (after[2]["match_tier"], after[2]["note"]) == ("CROP_FALLBACK", "new note")
+        assert after[2]["updated_at"] > before[2]["updated_at"]
+        # A remapped resource replaces its old mapping
+        assert (after[3]["usda_commodity_id"], after[3]["note"]) == (10, "remapped")
+        assert len(after) == 3
+
+    def test_backfill_fills_missing_metadata_in_one_update(self, tmp_path, engine):
+        from ca_biositing.pipeline.utils.seed_commodity_mappings import backfill_usda_commodity_metadata
+
+        _seed_tables(engine, resource_ids={}, pap_ids={}, commodity_ids={"ALMONDS": 1, "corn": 2})
+        with engine.begin() as conn:
+            conn.execute(text(
+                "UPDATE usda_commodity SET api_name = 'CORN', usda_source = 'NASS_WEB', "
+                "description = 'corn', uri = 'u', created_at = '2026-01-01' WHERE id = 2"
+            ))
+        csv_path = _write_csv(str(tmp_path), [
+            ("almonds", "ALMONDS", "", 1, "EXACT", ""),
+            ("corn stover", "CORN", "", 2, "EXACT", ""),
+        ])
+
+        with query_budget(max_queries=6, max_repeats=2):
+            assert backfill_usda_commodity_metadata(engine=engine, csv_path=csv_path) == 1
+
+        with engine.connect() as conn:
+            row = conn.execute(text(
+                "SELECT api_name, usda_source, description FROM usda_commodity WHERE id = 1"
+            )).one()
+        assert row == ("ALMONDS", "NASS_WEB", "almonds")
+
+
+def test_populate_api_names_updates_in_one_statement(engine):
+    from ca_biositing.pipeline.utils.populate_api_names import populate_api_names
+
+    _seed_tables(engine, resource_ids={}, pap_ids={}, commodity_ids={"ALMONDS": 1, "CORN": 2, "RICE": 3})
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE usda_commodity SET api_name = 'RICE' WHERE id = 3"))
+
+    with query_budget(max_queries=6, max_repeats=2):
+        stats = populate_api_names(engine=engine)
+
+    assert stats["errors"] == []
+    assert stats["updated_commodities"] == 2
+    with engine.connect() as conn:
+        api_names = dict(conn.execute(text("SELECT name, api_name FROM usda_commodity")).all())
+    assert api_names == {"ALMONDS": "ALMONDS", "CORN": "CORN", "RICE": "RICE"}
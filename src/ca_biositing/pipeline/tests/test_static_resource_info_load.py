@@ -1,6 +1,7 @@
 import pandas as pd
 import pytest
 from unittest.mock import MagicMock, patch
+from sqlalchemy.dialects import postgresql
 from ca_biositing.pipeline.etl.load.static_resource_info import (
     load_landiq_resource_mapping,
     load_resource_availability
@@ -74,6 +75,10 @@ def test_load_resource_availability(mock_session_class, mock_get_engine):
     # 4. Assertions
     assert mock_session.add.call_count == 2
     assert mock_session.commit.called
+    # Place rows are claimed with ON CONFLICT so concurrent flows cannot race
+    place_stmt = mock_session.execute.call_args_list[0].args[0]
+    compiled = str(place_stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (geoid) DO NOTHING" in compiled
 
 def test_load_empty_data():
     with patch("ca_biositing.pipeline.etl.load.static_resource_info.get_run_logger"):
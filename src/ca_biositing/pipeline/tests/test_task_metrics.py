@@ -0,0 +1,112 @@
+"""Tests for per-task ETL performance metrics."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from ca_biositing.datamodels.models import EtlRun, EtlTaskMetric
+from ca_biositing.pipeline.utils import task_metrics
+from ca_biositing.pipeline.utils.task_metrics import (
+    TaskMetrics,
+    attach_metrics_to_run,
+    note_bytes_read,
+    previous_wall_seconds,
+    summarize_task_metrics,
+    task_metrics as task_metrics_decorator,
+    track_task,
+)
+
+
+def test_track_task_counts_round_trips_and_rows_written(engine):
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        with track_task("demo.load", "load") as metrics:
+            conn.execute(text("INSERT INTO t (x) VALUES (1), (2), (3)"))
+            conn.execute(text("UPDATE t SET x = x + 1 WHERE x > 1"))
+            conn.execute(text("SELECT * FROM t")).fetchall()
+            note_bytes_read(2048)
+        # Statements after the block are not attributed to the task
+        conn.execute(text("DELETE FROM t"))
+
+    assert metrics.status == task_metrics.COMPLETED
+    assert metrics.db_round_trips == 3
+    assert metrics.rows_written == 5
+    assert metrics.bytes_read == 2048
+    assert metrics.wall_seconds > 0 and metrics.cpu_seconds >= 0
+    assert metrics in task_metrics.recorded_metrics()
+
+
+def test_decorator_counts_rows_and_records_failures():
+    @task_metrics_decorator("transform")
+    def transform(data_sources, etl_run_id=None):
+        if data_sources["a"].empty:
+            raise ValueError("no data")
+        return pd.concat(data_sources.values()).head(3)
+
+    frames = {"a": pd.DataFrame({"x": range(4)}), "b": pd.DataFrame({"x": range(2)})}
+    assert len(transform(frames, etl_run_id="7")) == 3
+    run = task_metrics.recorded_metrics()[-1]
+    assert run.task_name == "test_task_metrics.transform"
+    assert (run.stage, run.rows_in, run.rows_out, run.etl_run_id) == ("transform", 6, 3, 7)
+
+    with pytest.raises(ValueError):
+        transform({"a": pd.DataFrame()}, etl_run_id="not-an-id")
+    run = task_metrics.recorded_metrics()[-1]
+    assert (run.status, run.etl_run_id) == (task_metrics.FAILED, None)
+
+
+def test_metrics_are_stored_and_attached_to_the_etl_run(engine):
+    with patch.object(task_metrics, "_flow_run_id", return_value="flow-1"), \
+            patch("ca_biositing.pipeline.utils.engine.engine", engine):
+        with track_task("demo.extract", "extract"):
+            pass
+
+    with Session(engine) as session:
+        etl_run = EtlRun(run_id="flow-1", pipeline_name="Demo")
+        session.add(etl_run)
+        session.flush()
+        attach_metrics_to_run(session, "flow-1", etl_run.id)
+        session.commit()
+
+        stored = session.exec(select(EtlTaskMetric)).one()
+        assert (stored.task_name, stored.stage, stored.status) == ("demo.extract", "extract", "completed")
+        assert stored.etl_run_id == etl_run.id
+
+
+def test_summary_compares_with_the_previous_run(session):
+    for run_id, seconds in (("old", 10.0), ("older", 50.0)):
+        session.add(EtlTaskMetric(
+            task_name="demo.load", run_id=run_id, status="completed", wall_seconds=seconds,
+            started_at=pd.Timestamp("2026-01-02" if run_id == "old" else "2026-01-01", tz="UTC"),
+        ))
+    session.commit()
+
+    previous = previous_wall_seconds(session, ["demo.load"], exclude_run_ids=["now"])
+    assert previous == {"demo.load": 10.0}
+
+    lines = summarize_task_metrics(
+        [
+            TaskMetrics("demo.load", "load", "completed", run_id="now", wall_seconds=20.0),
+            TaskMetrics("demo.extract", "extract", "completed", run_id="now", wall_seconds=1.0),
+        ],
+        previous,
+    )
+    assert lines[0].startswith("demo.load [load] completed: 20.0s wall")
+    assert "x2.00, REGRESSION" in lines[0]
+    assert "previous" not in lines[1]
+    assert lines[2].startswith("2 tasks: 21.0s wall")
+
+
+def test_query_profile_logs_likely_n_plus_one(engine):
+    with patch.object(task_metrics, "QUERY_PROFILE", True), \
+            patch.object(task_metrics, "logger") as logger:
+        with engine.connect() as conn:
+            with track_task("demo.load_resource", "load"):
+                for name in [f"r{i}" for i in range(12)]:
+                    conn.execute(text("SELECT id FROM resource WHERE name = :name"), {"name": name})
+
+    [message] = [c.args[0] for c in logger.warning.call_args_list if "demo.load_resource" in c.args[0]]
+    assert "likely N+1 (12x" in message
@@ -0,0 +1,148 @@
+import json
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import create_engine, text
+
+from ca_biositing.pipeline.etl.export import view_snapshots
+from ca_biositing.pipeline.etl.export.view_snapshots import (
+    MANIFEST_NAME,
+    build_snapshot_query,
+    export_view_snapshots,
+    resolve_output,
+    schema_hash,
+    stream_view_batches,
+    write_view_snapshot,
+)
+
+COLUMNS = [
+    ("id", "integer"),
+    ("dataset_id", "integer"),
+    ("main_crop", "character varying"),
+    ("acres", "numeric"),
+    ("geom", "geometry"),
+]
+
+
+def test_build_snapshot_query_maps_types_and_geometry():
+    query, schema = build_snapshot_query("ca_biositing", "landiq_tileset_view", COLUMNS)
+
+    assert 'ST_AsBinary("geom") AS "geom"' in query
+    assert '"acres"::double precision AS "acres"' in query
+    assert query.endswith('FROM "ca_biositing"."landiq_tileset_view"')
+    assert [str(f.type) for f in schema] == ["int64", "int64", "string", "double", "binary"]
+
+    geo = json.loads(schema.metadata[b"geo"])
+    assert geo["primary_column"] == "geom"
+    assert geo["columns"]["geom"]["encoding"] == "WKB"
+
+
+def test_tiered_views_export_only_the_requested_geometry_tier():
+    tiered = COLUMNS + [("geom_1m", "geometry"), ("geom_10m", "geometry"), ("geom_100m", "geometry")]
+
+    query, schema = build_snapshot_query("ca_biositing", "landiq_tileset_view", tiered, "geom_10m")
+    assert 'ST_AsBinary("geom_10m") AS "geom"' in query
+    assert '"geom_1m"' not in query and '"geom_100m"' not in query
+    assert [f.name for f in schema if str(f.type) == "binary"] == ["geom"]
+
+    full, full_schema = build_snapshot_query("ca_biositing", "landiq_tileset_view", tiered)
+    assert 'ST_AsBinary("geom") AS "geom"' in full
+    assert schema_hash(full_schema) == schema_hash(schema)
+
+
+def test_schema_hash_ignores_metadata_but_not_types():
+    _, schema = build_snapshot_query("s", "v", COLUMNS)
+    _, same = build_snapshot_query("s", "other_view", COLUMNS)
+    _, changed = build_snapshot_query("s", "v", COLUMNS[:-1] + [("geom", "text")])
+
+    assert schema_hash(schema) == schema_hash(same)
+    assert schema_hash(schema) != schema_hash(changed)
+
+
+def test_write_view_snapshot_streams_partitions(tmp_path):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE v (id INTEGER, dataset_id INTEGER, main_crop TEXT, acres REAL, geom BLOB)"))
+        conn.execute(text(
+            "INSERT INTO v VALUES "
+            "(1, 1, 'Almonds', 10.5, x'01'), (2, 2, 'Walnuts', 3.0, NULL), "
+            "(3, NULL, 'Rice', 7.0, x'02'), (4, 1, 'Corn', 1.0, NULL)"
+        ))
+        _, schema = build_snapshot_query("s", "v", COLUMNS)
+        filesystem, root = resolve_output(str(tmp_path))
+
+        # A stale partition from a previous snapshot must not survive
+        (tmp_path / "s.v" / "dataset_id=99").mkdir(parents=True)
+
+        stats = write_view_snapshot(
+            stream_view_batches(conn, "SELECT * FROM v", schema, batch_size=2),
+            schema,
+            filesystem,
+            f"{root}/s.v",
+            "dataset_id",
+        )
+
+    assert stats["row_count"] == 4
+    # Unordered input: dataset_id=1 reappears after the writer rolled over
+    assert stats["files"] == [
+        "dataset_id=1/part-0.parquet",
+        "dataset_id=1/part-1.parquet",
+        "dataset_id=2/part-0.parquet",
+        "dataset_id=__HIVE_DEFAULT_PARTITION__/part-0.parquet",
+    ]
+    assert not (tmp_path / "s.v" / "dataset_id=99").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["s.v"]
+    assert pq.read_schema(tmp_path / "s.v" / stats["files"][0]).metadata[b"geo"]
+
+    table = ds.dataset(tmp_path / "s.v", partitioning="hive").to_table()
+    assert sorted(table.column("id").to_pylist()) == [1, 2, 3, 4]
+
+
+def test_failed_write_keeps_the_previous_snapshot(tmp_path):
+    _, schema = build_snapshot_query("s", "v", COLUMNS)
+    filesystem, root = resolve_output(str(tmp_path))
+    previous = tmp_path / "s.v" / "dataset_id=1" / "part-0.parquet"
+    previous.parent.mkdir(parents=True)
+    previous.write_bytes(b"previous snapshot")
+
+    def failing_batches():
+        yield pa.RecordBatch.from_pylist(
+            [{"id": 1, "dataset_id": 2, "main_crop": "Rice", "acres": 1.0, "geom": None}],
+            schema=schema,
+        )
+        raise RuntimeError("cursor lost")
+
+    with pytest.raises(RuntimeError, match="cursor lost"):
+        write_view_snapshot(failing_batches(), schema, filesystem, f"{root}/s.v", "dataset_id")
+
+    assert previous.read_bytes() == b"previous snapshot"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["s.v"]
+
+
+def test_manifest_records_run_and_lets_unchanged_views_be_skipped(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'views.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE v (id INTEGER, dataset_id INTEGER)"))
+        conn.execute(text("INSERT INTO v VALUES (1, 1), (2, 2)"))
+    # pg_matviews/pg_attribute lookups stand in for the Postgres catalog
+    monkeypatch.setattr(view_snapshots, "list_materialized_views", lambda conn, schemas: [("main", "v")])
+    monkeypatch.setattr(view_snapshots, "get_view_columns", lambda conn, schema, view: COLUMNS[:2])
+
+    first = export_view_snapshots(engine, str(tmp_path / "out"), etl_run_id="41")
+    second = export_view_snapshots(engine, str(tmp_path / "out"), etl_run_id="42")
+
+    written = json.loads((tmp_path / "out" / MANIFEST_NAME).read_text())
+    assert written["etl_run_id"] == "42"
+    assert written["views"]["main.v"]["etl_run_id"] == "42"
+    assert first["etl_run_id"] == "41"
+
+    # Unchanged data: same row count and schema hash, so consumers can skip it
+    for field in ("row_count", "schema_hash"):
+        assert first["views"]["main.v"][field] == second["views"]["main.v"][field]
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO v VALUES (3, 1)"))
+    third = export_view_snapshots(engine, str(tmp_path / "out"), etl_run_id="43")
+    assert third["views"]["main.v"]["row_count"] == 3
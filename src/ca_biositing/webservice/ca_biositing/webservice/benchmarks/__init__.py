@@ -0,0 +1,9 @@
+"""
+Webservice load tests on synthetic data.
+
+``seed`` fills a scratch PostgreSQL/PostGIS database with USDA census and
+survey, analysis and availability data at a configurable scale; ``load_test``
+drives every /v1/feedstocks endpoint with concurrent async clients and reports
+throughput, latency percentiles and SQL statements per request. Run it with
+``python -m ca_biositing.webservice.benchmarks``.
+"""
@@ -0,0 +1,323 @@
+"""Load test of the /v1/feedstocks endpoints.
+
+Seeds a scratch PostgreSQL/PostGIS database with synthetic feedstock data
+(see ``seed.py``), then drives every GET endpoint under ``/v1/feedstocks``
+with ``concurrency`` async clients, one route at a time, filling path
+parameters with random values that resolve to data. Per route it reports
+throughput, p50/p95/p99 latency, status codes and the number of SQL
+statements per request (the ``X-Query-Count`` header of the query profiling
+middleware). Results are written as JSON.
+
+By default the app runs in this process behind ``httpx.ASGITransport``, with
+query profiling switched on. With ``--base-url`` a running server is tested
+instead; start it against the same database with ``API_QUERY_PROFILE=true``
+to get query counts.
+
+The database is rebuilt on every seeded run, so never point
+``BENCHMARK_DATABASE_URL`` at real data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from urllib.parse import quote
+
+import httpx
+
+from ca_biositing.webservice.benchmarks.seed import ALEMBIC_CONFIG, Scale
+
+BENCHMARK_DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL")
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "data/benchmarks")
+
+FEEDSTOCKS_PREFIX = "/v1/feedstocks"
+
+# Path segment identifying the seeded dataset a route reads
+DATASETS = ("census", "survey", "analysis", "availability")
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+@dataclass
+class RouteResult:
+    """Measurements of one route."""
+
+    route: str
+    requests: int = 0
+    errors: int = 0
+    status_codes: dict[str, int] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    requests_per_second: float = 0.0
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    db_queries: Optional[dict[str, float]] = None
+
+
+def feedstock_routes(app) -> list[str]:
+    """Path templates of the app's GET endpoints under /v1/feedstocks."""
+    from fastapi.routing import APIRoute
+
+    return [
+        route.path
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path.startswith(FEEDSTOCKS_PREFIX)
+        and "GET" in route.methods
+    ]
+
+
+def route_dataset(route: str) -> str:
+    """The dataset (``census``, ``survey``, ``analysis``, ``availability``) a route reads."""
+    segments = route[len(FEEDSTOCKS_PREFIX):].strip("/").split("/")
+    for dataset in DATASETS:
+        if dataset in segments[:2]:
+            return dataset
+    raise ValueError(f"No seeded dataset for route {route}")
+
+
+def request_urls(route: str, entries: list[dict[str, str]], n: int, rng: random.Random) -> list[str]:
+    """``n`` URLs of ``route`` with path parameters drawn from ``entries``."""
+    if not _PATH_PARAM.search(route):
+        return [route] * n
+    urls = []
+    for _ in range(n):
+        entry = rng.choice(entries)
+        urls.append(_PATH_PARAM.sub(lambda m: quote(entry[m.group(1)], safe=""), route))
+    return urls
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank ``q``-th percentile of ascending ``sorted_values``."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def summarize_route(
+    route: str,
+    latencies: list[float],
+    statuses: list[str],
+    query_counts: list[int],
+    wall_seconds: float,
+) -> RouteResult:
+    """Aggregate the per-request measurements of one route."""
+    latencies_ms = sorted(seconds * 1000 for seconds in latencies)
+    result = RouteResult(
+        route=route,
+        requests=len(statuses),
+        errors=sum(1 for status in statuses if not status.startswith("2")),
+        status_codes=dict(sorted(Counter(statuses).items())),
+        wall_seconds=wall_seconds,
+        requests_per_second=len(statuses) / wall_seconds if wall_seconds else 0.0,
+    )
+    if latencies_ms:
+        result.latency_ms = {
+            "mean": sum(latencies_ms) / len(latencies_ms),
+            "p50": percentile(latencies_ms, 50),
+            "p95": percentile(latencies_ms, 95),
+            "p99": percentile(latencies_ms, 99),
+            "max": latencies_ms[-1],
+        }
+    if query_counts:
+        result.db_queries = {
+            "mean": sum(query_counts) / len(query_counts),
+            "min": min(query_counts),
+            "max": max(query_counts),
+        }
+    return result
+
+
+async def load_route(
+    client: httpx.AsyncClient, route: str, urls: list[str], concurrency: int
+) -> RouteResult:
+    """Request ``urls`` with ``concurrency`` concurrent clients and measure each request."""
+    latencies: list[float] = []
+    statuses: list[str] = []
+    query_counts: list[int] = []
+    pending = iter(urls)
+
+    async def worker() -> None:
+        for url in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError as e:
+                statuses.append(type(e).__name__)
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses.append(str(response.status_code))
+            count = response.headers.get("x-query-count")
+            if count is not None:
+                query_counts.append(int(count))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize_route(route, latencies, statuses, query_counts, time.perf_counter() - started)
+
+
+async def run_load_test(
+    client: httpx.AsyncClient,
+    routes: list[str],
+    catalog: dict[str, list[dict[str, str]]],
+    requests_per_route: int,
+    concurrency: int,
+    warmup: int = 5,
+    seed: int = 0,
+) -> list[RouteResult]:
+    """Load each route in turn after ``warmup`` unmeasured requests."""
+    rng = random.Random(seed)
+    results = []
+    for route in routes:
+        entries = catalog[route_dataset(route)]
+        for url in request_urls(route, entries, warmup, rng):
+            await client.get(url)
+        urls = request_urls(route, entries, requests_per_route, rng)
+        results.append(await load_route(client, route, urls, concurrency))
+    return results
+
+
+def _access_token(database_url: str) -> str:
+    """A JWT for the load test user, added to the database if missing."""
+    from sqlalchemy import create_engine
+
+    from ca_biositing.webservice.benchmarks.seed import create_load_test_user
+    from ca_biositing.webservice.config import config
+    from ca_biositing.webservice.services.auth_service import create_access_token
+
+    engine = create_engine(database_url)
+    try:
+        username = create_load_test_user(engine)
+    finally:
+        engine.dispose()
+    return create_access_token(
+        {"sub": username}, config.jwt_secret_key, config.jwt_algorithm, timedelta(hours=12)
+    )
+
+
+def summarize(results: dict[str, Any]) -> list[str]:
+    """One line per route and a total."""
+    lines = [
+        f"{'route':<80} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}"
+    ]
+    for route, r in results["routes"].items():
+        latency = r["latency_ms"] or {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        queries = f"{r['db_queries']['mean']:.1f}" if r["db_queries"] else "-"
+        lines.append(
+            f"{route:<80} {r['requests_per_second']:>8.1f} {latency['p50']:>8.1f} "
+            f"{latency['p95']:>8.1f} {latency['p99']:>8.1f} {queries:>8} {r['errors']:>7}"
+        )
+    total = results["total"]
+    lines.append(
+        f"total: {total['requests']} requests in {total['wall_seconds']:.1f}s "
+        f"({total['requests_per_second']:.1f} req/s), {total['errors']} errors"
+    )
+    return lines
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    defaults = Scale()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("routes", nargs="*", metavar="route",
+                        help="only test routes containing one of these substrings (default: all)")
+    parser.add_argument("--database-url", default=BENCHMARK_DATABASE_URL,
+                        help="scratch PostgreSQL/PostGIS database (default: $BENCHMARK_DATABASE_URL)")
+    parser.add_argument("--base-url", help="test a running server instead of the app in this process")
+    parser.add_argument("--skip-seed", action="store_true",
+                        help="reuse data seeded by an earlier run at the same scale")
+    parser.add_argument("--alembic-config", default=ALEMBIC_CONFIG)
+    for name, default in asdict(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients per route")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per route")
+    parser.add_argument("--warmup", type=int, default=5, help="unmeasured requests per route")
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "webservice_load_test.json"))
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("--database-url or BENCHMARK_DATABASE_URL is required")
+    if args.concurrency < 1 or args.requests < 1:
+        parser.error("--concurrency and --requests must be positive")
+
+    # Before the app builds its engine
+    os.environ["DATABASE_URL"] = args.database_url
+    from sqlalchemy import create_engine
+
+    from ca_biositing.webservice.benchmarks import seed
+    from ca_biositing.webservice.config import config
+    from ca_biositing.webservice.main import app
+
+    scale = Scale(**{name: getattr(args, name) for name in asdict(defaults)})
+    seeded_rows = None
+    if not args.skip_seed:
+        seed.prepare_database(args.database_url, args.alembic_config)
+        engine = create_engine(args.database_url)
+        try:
+            started = time.perf_counter()
+            seeded_rows = seed.seed_database(engine, scale)
+            print(f"Seeded {sum(seeded_rows.values())} rows in {time.perf_counter() - started:.1f}s")
+        finally:
+            engine.dispose()
+
+    routes = [r for r in feedstock_routes(app) if not args.routes or any(s in r for s in args.routes)]
+    if not routes:
+        parser.error("no /v1/feedstocks route matches")
+    headers = {"Authorization": f"Bearer {_access_token(args.database_url)}"}
+    if args.base_url:
+        client = httpx.AsyncClient(
+            base_url=args.base_url, headers=headers, timeout=60,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+    else:
+        config.query_profile = True
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load-test", headers=headers, timeout=60
+        )
+
+    async def run() -> list[RouteResult]:
+        async with client:
+            return await run_load_test(
+                client, routes, seed.catalog(scale), args.requests, args.concurrency, args.warmup, scale.seed
+            )
+
+    route_results = asyncio.run(run())
+    wall_seconds = sum(r.wall_seconds for r in route_results)
+    requests = sum(r.requests for r in route_results)
+    results: dict[str, Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.base_url or "in-process",
+        "scale": asdict(scale),
+        "seeded_rows": seeded_rows,
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "routes": {r.route: asdict(r) for r in route_results},
+        "total": {
+            "requests": requests,
+            "errors": sum(r.errors for r in route_results),
+            "wall_seconds": wall_seconds,
+            "requests_per_second": requests / wall_seconds if wall_seconds else 0.0,
+        },
+    }
+    for line in summarize(results):
+        print(line)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 1 if results["total"]["errors"] else 0
@@ -0,0 +1,376 @@
+"""Synthetic feedstock data for load tests.
+
+``prepare_database`` rebuilds a scratch PostgreSQL/PostGIS database with the
+Alembic migrations (tables and materialized views), ``seed_database`` fills
+it with USDA census and survey records, Aim 1 analysis records and resource
+availability at a configurable scale, then refreshes the views.
+
+The data is a regular grid (every commodity has records in every county), so
+``catalog`` can list the valid path parameters of each dataset from the
+``Scale`` alone, without querying the database.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Engine, make_url
+
+ALEMBIC_CONFIG = os.getenv("ALEMBIC_CONFIG", "alembic.ini")
+
+LOAD_TEST_USERNAME = "load-test"
+
+USDA_PARAMETERS = [
+    ("area harvested", "acres"),
+    ("area bearing", "acres"),
+    ("production", "tons"),
+    ("yield", "tons / acre"),
+    ("operations", "operations"),
+    ("sales", "$"),
+    ("area planted", "acres"),
+    ("price received", "$ / ton"),
+]
+
+ANALYSIS_PARAMETERS = {
+    "proximate analysis": [("moisture", "% total weight"), ("ash", "% dry weight"), ("volatile solids", "% dry weight"), ("fixed carbon", "% dry weight")],
+    "ultimate analysis": [("carbon", "% dry weight"), ("hydrogen", "% dry weight"), ("nitrogen", "% dry weight"), ("sulfur", "% dry weight"), ("oxygen", "% dry weight")],
+}
+
+# California has 58 counties, with odd FIPS codes 001-115
+MAX_COUNTIES = 58
+
+_INSERT_BATCH = 10_000
+
+
+@dataclass
+class Scale:
+    """Size of the seeded data.
+
+    Census and survey each hold ``commodities * counties * years`` records
+    with ``usda_parameters`` observations apiece; every commodity maps to one
+    resource. Each resource has ``samples_per_resource`` analysed samples
+    (three replicates of every analysis parameter) and availability in every
+    county.
+    """
+
+    commodities: int = 50
+    counties: int = MAX_COUNTIES
+    years: int = 4
+    usda_parameters: int = 6
+    samples_per_resource: int = 20
+    seed: int = 0
+
+    def __post_init__(self):
+        if not 1 <= self.counties <= MAX_COUNTIES:
+            raise ValueError(f"counties must be between 1 and {MAX_COUNTIES}")
+        if not 1 <= self.usda_parameters <= len(USDA_PARAMETERS):
+            raise ValueError(f"usda_parameters must be between 1 and {len(USDA_PARAMETERS)}")
+
+
+def geoids(scale: Scale) -> list[str]:
+    return [f"06{2 * i + 1:03d}" for i in range(scale.counties)]
+
+
+def crop_name(commodity: int) -> str:
+    return f"crop {commodity:03d}"
+
+
+def resource_name(commodity: int) -> str:
+    return f"crop_{commodity:03d}_residue"
+
+
+def _sample_geoid(scale: Scale, commodity: int, sample: int) -> str:
+    return geoids(scale)[(commodity * scale.samples_per_resource + sample) % scale.counties]
+
+
+def catalog(scale: Scale) -> dict[str, list[dict[str, str]]]:
+    """Valid path parameters of the seeded data, by dataset.
+
+    Returns:
+        Mapping of ``census``, ``survey``, ``analysis`` and ``availability``
+        to lists of path parameter values that resolve to data
+    """
+    counties = geoids(scale)
+    usda = [
+        {"crop": crop_name(c), "resource": resource_name(c), "geoid": geoid, "parameter": parameter}
+        for c in range(scale.commodities)
+        for geoid in counties
+        for parameter, _ in USDA_PARAMETERS[: scale.usda_parameters]
+    ]
+    analysis_parameters = [p for params in ANALYSIS_PARAMETERS.values() for p, _ in params]
+    analysis_geoids = sorted({
+        (c, _sample_geoid(scale, c, s))
+        for c in range(scale.commodities)
+        for s in range(scale.samples_per_resource)
+    })
+    return {
+        "census": usda,
+        "survey": usda,
+        "analysis": [
+            {"resource": resource_name(c), "geoid": geoid, "parameter": parameter}
+            for c, geoid in analysis_geoids
+            for parameter in analysis_parameters
+        ],
+        "availability": [
+            {"resource": resource_name(c), "geoid": geoid}
+            for c in range(scale.commodities)
+            for geoid in counties
+        ],
+    }
+
+
+def prepare_database(database_url: str, alembic_config: str = ALEMBIC_CONFIG) -> None:
+    """Create the database if missing and rebuild it with the Alembic migrations.
+
+    The ``public``, ``ca_biositing`` and ``data_portal`` schemas are dropped
+    first, so never point this at real data.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    url = make_url(database_url)
+    server = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with server.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    finally:
+        server.dispose()
+
+    engine = create_engine(url)
+    try:
+        with engine.begin() as conn:
+            for schema in ("data_portal", "ca_biositing", "public"):
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    finally:
+        engine.dispose()
+
+    # alembic/env.py takes the URL from DATABASE_URL
+    previous = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = database_url
+    try:
+        command.upgrade(Config(alembic_config), "head")
+    finally:
+        if previous is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = previous
+
+
+def _batches(rows: Iterable[dict]) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == _INSERT_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(conn, model, rows: Iterable[dict]) -> int:
+    count = 0
+    for batch in _batches(rows):
+        conn.execute(insert(model.__table__), batch)
+        count += len(batch)
+    return count
+
+
+def seed_database(engine: Engine, scale: Scale) -> dict[str, int]:
+    """Insert the synthetic feedstock data, then refresh and analyze the materialized views.
+
+    Returns:
+        Number of rows inserted per table
+    """
+    from ca_biositing.datamodels.views import refresh_all_views
+
+    counts = insert_synthetic_data(engine, scale)
+    refresh_all_views(engine)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+    return counts
+
+
+def insert_synthetic_data(engine: Engine, scale: Scale) -> dict[str, int]:
+    """Insert the synthetic feedstock rows in one transaction.
+
+    Returns:
+        Number of rows inserted per table
+    """
+    import numpy as np
+
+    from ca_biositing.datamodels.models import (
+        FieldSample,
+        LocationAddress,
+        Observation,
+        Parameter,
+        Place,
+        PreparedSample,
+        PrimaryAgProduct,
+        ProximateRecord,
+        Resource,
+        ResourceAvailability,
+        ResourceUsdaCommodityMap,
+        UltimateRecord,
+        Unit,
+        UsdaCensusRecord,
+        UsdaCommodity,
+        UsdaSurveyProgram,
+        UsdaSurveyRecord,
+    )
+
+    rng = np.random.default_rng(scale.seed)
+    counties = geoids(scale)
+    commodities = range(scale.commodities)
+    usda_parameters = USDA_PARAMETERS[: scale.usda_parameters]
+    analysis_parameters = [
+        (analysis_type, parameter, unit)
+        for analysis_type, params in ANALYSIS_PARAMETERS.items()
+        for parameter, unit in params
+    ]
+    unit_names = sorted({u for _, u in usda_parameters} | {u for _, _, u in analysis_parameters})
+    unit_ids = {name: i + 1 for i, name in enumerate(unit_names)}
+    parameter_ids = {
+        name: i + 1
+        for i, name in enumerate([p for p, _ in usda_parameters] + [p for _, p, _ in analysis_parameters])
+    }
+    years = range(2024 - scale.years, 2024)
+
+    counts: dict[str, int] = {}
+    with engine.begin() as conn:
+        def add(model, rows):
+            counts[model.__tablename__] = counts.get(model.__tablename__, 0) + _insert(conn, model, rows)
+
+        add(Unit, ({"id": i, "name": name} for name, i in unit_ids.items()))
+        add(Parameter, (
+            {"id": parameter_ids[p], "name": p, "standard_unit_id": unit_ids[u]}
+            for p, u in usda_parameters + [(p, u) for _, p, u in analysis_parameters]
+        ))
+        add(Place, (
+            {"geoid": geoid, "state_name": "California", "county_name": f"County {geoid[2:]}"}
+            for geoid in counties
+        ))
+        add(UsdaCommodity, (
+            {"id": c + 1, "name": crop_name(c).upper(), "api_name": crop_name(c), "usda_code": f"{c:05d}"}
+            for c in commodities
+        ))
+        add(PrimaryAgProduct, ({"id": c + 1, "name": crop_name(c).title()} for c in commodities))
+        add(Resource, (
+            {"id": c + 1, "name": resource_name(c), "primary_ag_product_id": c + 1} for c in commodities
+        ))
+        add(ResourceUsdaCommodityMap, (
+            {"id": c + 1, "resource_id": c + 1, "usda_commodity_id": c + 1, "match_tier": "exact"}
+            for c in commodities
+        ))
+        add(UsdaSurveyProgram, [{"id": 1, "name": "Synthetic Annual Survey"}])
+
+        # One census and one survey record per commodity x county x year
+        grid = [(c, geoid, year) for c in commodities for geoid in counties for year in years]
+        add(UsdaCensusRecord, (
+            {"id": i + 1, "geoid": geoid, "commodity_code": c + 1, "year": year}
+            for i, (c, geoid, year) in enumerate(grid)
+        ))
+        add(UsdaSurveyRecord, (
+            {
+                "id": i + 1, "geoid": geoid, "commodity_code": c + 1, "year": year,
+                "survey_program_id": 1, "survey_period": "YEAR", "reference_month": "January",
+                "seasonal_flag": False,
+            }
+            for i, (c, geoid, year) in enumerate(grid)
+        ))
+
+        observation_id = 0
+
+        def usda_observations(record_type):
+            nonlocal observation_id
+            values = rng.lognormal(8, 2, len(grid) * len(usda_parameters))
+            for i in range(len(grid)):
+                for p, (parameter, unit) in enumerate(usda_parameters):
+                    observation_id += 1
+                    yield {
+                        "id": observation_id, "record_id": str(i + 1), "record_type": record_type,
+                        "parameter_id": parameter_ids[parameter], "unit_id": unit_ids[unit],
+                        "value": float(values[i * len(usda_parameters) + p]),
+                    }
+
+        add(Observation, usda_observations("usda_census_record"))
+        add(Observation, usda_observations("usda_survey_record"))
+
+        # Aim 1 samples: field sample -> location -> county, three replicates per parameter
+        samples = [(c, s) for c in commodities for s in range(scale.samples_per_resource)]
+        add(LocationAddress, (
+            {"id": i + 1, "geography_id": _sample_geoid(scale, c, s), "city": f"Site {i + 1}"}
+            for i, (c, s) in enumerate(samples)
+        ))
+        add(FieldSample, (
+            {"id": i + 1, "name": f"FS-{i + 1:06d}", "resource_id": c + 1, "sampling_location_id": i + 1}
+            for i, (c, s) in enumerate(samples)
+        ))
+        add(PreparedSample, (
+            {"id": i + 1, "name": f"PS-{i + 1:06d}", "field_sample_id": i + 1}
+            for i in range(len(samples))
+        ))
+        analyses = [
+            (i, c, analysis_type, parameter, unit, repl)
+            for i, (c, _) in enumerate(samples)
+            for analysis_type, parameter, unit in analysis_parameters
+            for repl in range(1, 4)
+        ]
+        record_models = {"proximate analysis": ProximateRecord, "ultimate analysis": UltimateRecord}
+        for analysis_type, model in record_models.items():
+            add(model, (
+                {
+                    "id": n + 1, "record_id": f"{analysis_type[:4]}-{i:06d}-{parameter}-{repl}",
+                    "resource_id": c + 1, "prepared_sample_id": i + 1, "technical_replicate_no": repl,
+                }
+                for n, (i, c, _, parameter, _, repl) in enumerate(
+                    a for a in analyses if a[2] == analysis_type
+                )
+            ))
+        values = rng.uniform(0.1, 60, len(analyses))
+
+        def analysis_observations():
+            nonlocal observation_id
+            for n, (i, _, analysis_type, parameter, unit, repl) in enumerate(analyses):
+                observation_id += 1
+                yield {
+                    "id": observation_id, "record_id": f"{analysis_type[:4]}-{i:06d}-{parameter}-{repl}",
+                    "record_type": analysis_type, "parameter_id": parameter_ids[parameter],
+                    "unit_id": unit_ids[unit], "value": float(values[n]),
+                }
+
+        add(Observation, analysis_observations())
+
+        # One availability window per resource x county
+        pairs = [(c, geoid) for c in commodities for geoid in counties]
+        months = rng.integers(0, 12, len(pairs))
+        add(ResourceAvailability, (
+            {
+                "id": n + 1, "resource_id": c + 1, "geoid": geoid,
+                "from_month": int(months[n]) + 1, "to_month": (int(months[n]) + 3) % 12 + 1,
+            }
+            for n, (c, geoid) in enumerate(pairs)
+        ))
+    return counts
+
+
+def create_load_test_user(engine: Engine, username: str = LOAD_TEST_USERNAME) -> str:
+    """Add an API user for the load test clients; returns its username."""
+    from sqlmodel import Session, select
+
+    from ca_biositing.datamodels.models import ApiUser
+
+    with Session(engine) as session:
+        if session.exec(select(ApiUser).where(ApiUser.username == username)).first() is None:
+            # Clients authenticate with a minted JWT, never the password
+            session.add(ApiUser(username=username, hashed_password="!", is_admin=False))
+            session.commit()
+    return username
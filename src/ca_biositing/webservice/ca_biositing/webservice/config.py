@@ -24,6 +24,12 @@ class WebServiceConfig(BaseSettings):
         cors_allow_credentials: Whether to allow credentials in CORS
         cors_allow_methods: Allowed HTTP methods for CORS
         cors_allow_headers: Allowed headers for CORS
+        page_limit_default: Page size of list endpoints when no limit is given
+        page_limit_max: Largest page size for interactive (JWT) clients
+        api_key_page_limit_max: Largest page size for API-key clients
+        query_profile: Profile each request's SQL statements and log them
+        query_profile_n_plus_one: Executions of one statement per request
+            flagged as a likely N+1
     """
 
     model_config = SettingsConfigDict(
@@ -61,6 +67,17 @@ class WebServiceConfig(BaseSettings):
     # Defaults to False for local HTTP dev. Cloud Run must set API_JWT_COOKIE_SECURE=true.
     jwt_cookie_secure: bool = False
 
+    # Keyset pagination for list endpoints. API-key clients (bulk consumers)
+    # may request much larger pages than interactive sessions.
+    page_limit_default: int = Field(default=100, ge=1)
+    page_limit_max: int = Field(default=100, ge=1)
+    api_key_page_limit_max: int = Field(default=5000, ge=1)
+
+    # Opt-in per-request query profiling (API_QUERY_PROFILE=true); see
+    # ca_biositing.datamodels.query_profiler.
+    query_profile: bool = False
+    query_profile_n_plus_one: int = Field(default=10, ge=2)
+
 
 # Global configuration instance
 config = WebServiceConfig()
@@ -6,6 +6,7 @@ authentication, and common query parameters.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Annotated, Optional
 
 from fastapi import Depends, Header, HTTPException, Query, Request, status
@@ -15,6 +16,7 @@ from sqlmodel import Session, select
 from ca_biositing.datamodels.database import get_session
 from ca_biositing.datamodels.models import ApiUser
 from ca_biositing.webservice.config import config
+from ca_biositing.webservice.exceptions import ParameterErrorException
 from ca_biositing.webservice.services.auth_service import (
     check_and_increment_rate_limit,
     decode_access_token,
@@ -26,18 +28,6 @@ from ca_biositing.webservice.services.auth_service import (
 SessionDep = Annotated[Session, Depends(get_session)]
 
 
-def pagination_params(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
-):
-    """Common pagination parameters for list endpoints."""
-    return {"skip": skip, "limit": limit}
-
-
-# Pagination dependency
-PaginationDep = Annotated[dict, Depends(pagination_params)]
-
-
 # OAuth2 scheme — auto_error=False allows cookie fallback when Bearer is missing
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/token", auto_error=False)
 
@@ -133,6 +123,9 @@ def get_current_user(
                 detail="Rate limit exceeded",
                 headers={"Retry-After": "60"},
             )
+        # Lets request-scoped dependencies (e.g. page limits) tell API-key
+        # clients apart from interactive JWT sessions.
+        request.state.api_key = api_key
         return user
 
     raise credentials_exception
@@ -159,3 +152,47 @@ def get_current_admin_user(current_user: JWTCurrentUserDep) -> ApiUser:
 
 
 AdminUserDep = Annotated[ApiUser, Depends(get_current_admin_user)]
+
+
+@dataclass
+class Pagination:
+    """Keyset pagination request for list endpoints."""
+
+    cursor: Optional[str]
+    limit: int
+
+
+def pagination_params(
+    request: Request,
+    current_user: CurrentUserDep,
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor returned as next_cursor by the previous page"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        description=(
+            "Maximum number of records to return "
+            f"(default {config.page_limit_default}; up to {config.page_limit_max}, "
+            f"or {config.api_key_page_limit_max} for API-key clients)"
+        ),
+    ),
+) -> Pagination:
+    """Common keyset pagination parameters for list endpoints.
+
+    Raises 422 if the requested limit exceeds the caller's maximum page size.
+    """
+    max_limit = (
+        config.api_key_page_limit_max
+        if getattr(request.state, "api_key", None) is not None
+        else config.page_limit_max
+    )
+    if limit is None:
+        limit = min(config.page_limit_default, max_limit)
+    if limit > max_limit:
+        raise ParameterErrorException(f"limit must be at most {max_limit}")
+    return Pagination(cursor=cursor, limit=limit)
+
+
+# Pagination dependency
+PaginationDep = Annotated[Pagination, Depends(pagination_params)]
@@ -89,6 +89,21 @@ class ParameterErrorException(HTTPException):
         )
 
 
+class InvalidCursorException(HTTPException):
+    """Raised when a pagination cursor is malformed, tampered with, or reused.
+
+    Cursors are signed and bound to the query that issued them, so a cursor
+    from one list endpoint cannot be replayed against another.
+    """
+
+    def __init__(self):
+        """Initialize the exception with a fixed message."""
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
 class ServiceException(HTTPException):
     """Raised for generic server errors.
 
@@ -16,6 +16,7 @@ from sqlalchemy import text
 from ca_biositing.datamodels.database import get_engine
 
 from ca_biositing.webservice.config import config
+from ca_biositing.webservice.query_profiling import QueryProfileMiddleware
 from ca_biositing.webservice.v1 import router as v1_router
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,9 @@ app.add_middleware(
     allow_headers=config.cors_allow_headers,
 )
 
+# Opt-in SQL profiling of each request (API_QUERY_PROFILE=true)
+app.add_middleware(QueryProfileMiddleware)
+
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
@@ -0,0 +1,48 @@
+"""Per-request SQL query profiling middleware.
+
+When ``API_QUERY_PROFILE=true``, every HTTP request runs inside a
+``profile_queries`` profile. The response carries an ``X-Query-Count``
+header and the request's query report is logged, as a warning when a
+statement ran often enough to be a likely N+1.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ca_biositing.datamodels.query_profiler import profile_queries
+from ca_biositing.webservice.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfileMiddleware:
+    """ASGI middleware profiling the SQL statements of each request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Checked per request so the setting can be toggled without rebuilding the app
+        if scope["type"] != "http" or not config.query_profile:
+            await self.app(scope, receive, send)
+            return
+
+        name = f"{scope['method']} {scope['path']}"
+        with profile_queries(name, config.query_profile_n_plus_one) as profile:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Query-Count", str(profile.total_queries))
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
+
+        if profile.n_plus_one():
+            logger.warning("Likely N+1 queries in %s", profile.report())
+        else:
+            logger.info("Queries of %s", profile.report())
@@ -11,8 +11,10 @@ from sqlalchemy.orm import Session
 
 from ca_biositing.datamodels.views import (
     ANALYSIS_DATA_VIEW,
+    USDA_CENSUS_LATEST_VIEW,
     USDA_CENSUS_VIEW,
     USDA_RESOURCE_COMMODITY_VIEW,
+    USDA_SURVEY_LATEST_VIEW,
     USDA_SURVEY_VIEW,
     VIEW_SCHEMA,
 )
@@ -43,30 +45,64 @@ def get_analysis_data_view(session: Session):
             column("dimension", String),
             column("dimension_value", Float),
             column("dimension_unit", String),
+            column("parameter_norm", String),
         )
     return ANALYSIS_DATA_VIEW.subquery("analysis_data_view")
 
 
+def _usda_census_columns():
+    return (
+        column("id", Integer),
+        column("usda_crop", String),
+        column("geoid", String),
+        column("parameter", String),
+        column("value", Float),
+        column("unit", String),
+        column("dimension", String),
+        column("dimension_value", Float),
+        column("dimension_unit", String),
+        column("commodity_id", Integer),
+        column("source_record_id", Integer),
+        column("record_year", Integer),
+        column("parameter_norm", String),
+    )
+
+
+def _usda_survey_columns():
+    return (
+        column("id", Integer),
+        column("usda_crop", String),
+        column("geoid", String),
+        column("parameter", String),
+        column("value", Float),
+        column("unit", String),
+        column("dimension", String),
+        column("dimension_value", Float),
+        column("dimension_unit", String),
+        column("commodity_id", Integer),
+        column("source_record_id", Integer),
+        column("record_year", Integer),
+        column("survey_program_id", Integer),
+        column("survey_period", String),
+        column("reference_month", String),
+        column("seasonal_flag", Boolean),
+        column("parameter_norm", String),
+    )
+
+
 def get_usda_census_view(session: Session):
     if _uses_postgres(session):
-        return _postgres_view(
-            "usda_census_view",
-            column("id", Integer),
-            column("usda_crop", String),
-            column("geoid", String),
-            column("parameter", String),
-            column("value", Float),
-            column("unit", String),
-            column("dimension", String),
-            column("dimension_value", Float),
-            column("dimension_unit", String),
-            column("commodity_id", Integer),
-            column("source_record_id", Integer),
-            column("record_year", Integer),
-        )
+        return _postgres_view("usda_census_view", *_usda_census_columns())
     return USDA_CENSUS_VIEW.subquery("usda_census_view")
 
 
+def get_usda_census_latest_view(session: Session):
+    """Observations of the newest census record per commodity and geoid."""
+    if _uses_postgres(session):
+        return _postgres_view("usda_census_latest_view", *_usda_census_columns())
+    return USDA_CENSUS_LATEST_VIEW.subquery("usda_census_latest_view")
+
+
 def get_usda_resource_commodity_view(session: Session):
     if _uses_postgres(session):
         return _postgres_view(
@@ -79,23 +115,12 @@ def get_usda_resource_commodity_view(session: Session):
 
 def get_usda_survey_view(session: Session):
     if _uses_postgres(session):
-        return _postgres_view(
-            "usda_survey_view",
-            column("id", Integer),
-            column("usda_crop", String),
-            column("geoid", String),
-            column("parameter", String),
-            column("value", Float),
-            column("unit", String),
-            column("dimension", String),
-            column("dimension_value", Float),
-            column("dimension_unit", String),
-            column("commodity_id", Integer),
-            column("source_record_id", Integer),
-            column("record_year", Integer),
-            column("survey_program_id", Integer),
-            column("survey_period", String),
-            column("reference_month", String),
-            column("seasonal_flag", Boolean),
-        )
+        return _postgres_view("usda_survey_view", *_usda_survey_columns())
     return USDA_SURVEY_VIEW.subquery("usda_survey_view")
+
+
+def get_usda_survey_latest_view(session: Session):
+    """Observations of the newest survey record per commodity and geoid."""
+    if _uses_postgres(session):
+        return _postgres_view("usda_survey_latest_view", *_usda_survey_columns())
+    return USDA_SURVEY_LATEST_VIEW.subquery("usda_survey_latest_view")
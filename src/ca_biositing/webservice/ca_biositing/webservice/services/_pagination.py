@@ -0,0 +1,105 @@
+"""Keyset (cursor) pagination helpers for list endpoints.
+
+Pages are selected with ``WHERE key > :after ORDER BY key LIMIT :limit + 1``
+on a stable, unique key (view ids or distinct discovery values), so the cost
+of a page does not grow with its depth in the result set the way OFFSET does.
+
+Cursors are opaque to clients: the last key of a page is wrapped in a signed
+token together with a scope string identifying the query it belongs to, so a
+cursor cannot be forged or replayed against a different crop/resource/geoid.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+import jwt
+from sqlalchemy.orm import Session
+
+from ca_biositing.webservice.config import config
+from ca_biositing.webservice.exceptions import InvalidCursorException
+
+
+def encode_cursor(scope: str, after: Any) -> str:
+    """Create an opaque signed cursor pointing after ``after`` within ``scope``."""
+    return jwt.encode(
+        {"scope": scope, "after": after},
+        config.jwt_secret_key,
+        algorithm=config.jwt_algorithm,
+    )
+
+
+def decode_cursor(cursor: Optional[str], scope: str) -> Any:
+    """Return the keyset position stored in ``cursor``.
+
+    Returns None when no cursor is given.
+
+    Raises:
+        InvalidCursorException: If the cursor was tampered with or was issued
+            for a different query.
+    """
+    if not cursor:
+        return None
+    try:
+        payload = jwt.decode(
+            cursor, config.jwt_secret_key, algorithms=[config.jwt_algorithm]
+        )
+    except jwt.PyJWTError:
+        raise InvalidCursorException()
+    if payload.get("scope") != scope or "after" not in payload:
+        raise InvalidCursorException()
+    return payload["after"]
+
+
+def keyset_page(
+    session: Session,
+    stmt,
+    key_column,
+    scope: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    key_of: Callable[[Any], Any] = lambda row: row[0],
+) -> tuple[list, Optional[str]]:
+    """Execute one keyset page of ``stmt``.
+
+    Args:
+        session: Database session
+        stmt: Select statement, already filtered and ordered by ``key_column``
+        key_column: Unique, ascending sort key of ``stmt``
+        scope: Identifier of the query the cursor is bound to
+        cursor: Cursor returned with the previous page, if any
+        limit: Page size; None returns every remaining row
+        key_of: Extracts the key value from a result row
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    after = decode_cursor(cursor, scope)
+    if after is not None:
+        stmt = stmt.where(key_column > after)
+
+    if limit is None:
+        return session.execute(stmt).all(), None
+
+    rows = session.execute(stmt.limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(scope, key_of(rows[-1]))
+
+
+def discovery_page(
+    session: Session,
+    stmt,
+    key_column,
+    scope: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> dict:
+    """Execute one keyset page of a distinct-values discovery query.
+
+    Returns:
+        Dictionary with ``values`` and ``next_cursor``
+    """
+    rows, next_cursor = keyset_page(session, stmt, key_column, scope, cursor, limit)
+    return {"values": [value for (value,) in rows], "next_cursor": next_cursor}
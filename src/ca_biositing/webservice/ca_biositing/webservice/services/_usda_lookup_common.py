@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import case, func, select
+from sqlalchemy import case, select
 from sqlalchemy.orm import Session
 
 from ca_biositing.datamodels.models import UsdaCommodity
@@ -12,34 +12,22 @@ from ca_biositing.webservice.exceptions import CropNotFoundException
 
 
 def normalize_crop_name(crop_name: Optional[str]) -> str:
-    """Normalize crop names for case-, space-, and underscore-insensitive exact matching."""
+    """Normalize crop names for case-, space-, and underscore-insensitive exact matching.
+
+    Mirrors the stored ``*_norm`` columns (see ``normalized_text`` in the datamodels)
+    so lookups are indexed equality comparisons.
+    """
     if not crop_name:
         return ""
     return " ".join(crop_name.replace("_", " ").split()).lower()
 
 
-def normalized_sql_text(column):
-    """Normalize SQL text for case-, space-, and underscore-insensitive exact matching.
-
-    Three replace passes collapse whitespace runs up to 8 spaces while keeping
-    SQLite compatibility in tests.
-    """
-    normalized = func.replace(column, "_", " ")
-    for _ in range(3):
-        normalized = func.replace(normalized, "  ", " ")
-    return func.lower(func.trim(normalized))
-
-
 def get_commodity_by_name(session: Session, crop_name: str) -> UsdaCommodity:
     """Get USDA commodity by crop name, preferring api_name over name matches."""
     normalized_query = normalize_crop_name(crop_name)
 
-    api_name_match = UsdaCommodity.api_name.is_not(None) & (
-        normalized_sql_text(UsdaCommodity.api_name) == normalized_query
-    )
-    name_match = UsdaCommodity.name.is_not(None) & (
-        normalized_sql_text(UsdaCommodity.name) == normalized_query
-    )
+    api_name_match = UsdaCommodity.api_name_norm == normalized_query
+    name_match = UsdaCommodity.name_norm == normalized_query
 
     stmt = (
         select(UsdaCommodity)
@@ -17,9 +17,9 @@ from ca_biositing.webservice.exceptions import (
     ResourceNotFoundException,
 )
 from ca_biositing.webservice.services._canonical_views import get_analysis_data_view
+from ca_biositing.webservice.services._pagination import discovery_page, keyset_page
 from ca_biositing.webservice.services._usda_lookup_common import (
     normalize_crop_name,
-    normalized_sql_text,
 )
 
 
@@ -41,7 +41,7 @@ class AnalysisService:
             ResourceNotFoundException: If resource not found
         """
         normalized = normalize_crop_name(resource_name)
-        stmt = select(Resource).where(normalized_sql_text(Resource.name) == normalized)
+        stmt = select(Resource).where(Resource.name_norm == normalized)
         resource = session.execute(stmt).scalar_one_or_none()
 
         if not resource:
@@ -54,8 +54,10 @@ class AnalysisService:
         session: Session,
         resource_id: int,
         geoid: str,
-        parameter_name: Optional[str] = None
-    ) -> list[dict]:
+        parameter_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[list[dict], Optional[str]]:
         """Get observations for analysis records by resource and geoid.
 
         Queries all analysis types (proximate, ultimate, compositional) that match
@@ -67,9 +69,11 @@ class AnalysisService:
             resource_id: Resource ID
             geoid: Geographic identifier
             parameter_name: Optional parameter name filter
+            cursor: Keyset cursor from the previous page
+            limit: Page size (None returns all observations)
 
         Returns:
-            List of observation dictionaries with parameter/unit/dimension details
+            Tuple of (list of observation dictionaries, next page cursor)
         """
         analysis_view = get_analysis_data_view(session)
         stmt = (
@@ -89,12 +93,19 @@ class AnalysisService:
         )
 
         if parameter_name:
-            stmt = stmt.where(normalized_sql_text(analysis_view.c.parameter) == normalize_crop_name(parameter_name))
+            stmt = stmt.where(analysis_view.c.parameter_norm == normalize_crop_name(parameter_name))
 
-        # Order by observation ID for deterministic results
+        # Order by observation ID for deterministic results and keyset paging
         stmt = stmt.order_by(analysis_view.c.id)
 
-        results = session.execute(stmt).all()
+        results, next_cursor = keyset_page(
+            session,
+            stmt,
+            analysis_view.c.id,
+            scope=f"analysis:{resource_id}:{geoid}",
+            cursor=cursor,
+            limit=limit,
+        )
 
         observations = []
         for row in results:
@@ -108,7 +119,7 @@ class AnalysisService:
                 "dimension_unit": row.dimension_unit,
             })
 
-        return observations
+        return observations, next_cursor
 
     @staticmethod
     def get_by_resource(
@@ -136,7 +147,7 @@ class AnalysisService:
         resource_obj = AnalysisService._get_resource_by_name(session, resource)
 
         # Get observations for this resource
-        observations = AnalysisService._get_observations_for_analysis(
+        observations, _ = AnalysisService._get_observations_for_analysis(
             session,
             resource_obj.id,
             geoid,
@@ -160,17 +171,21 @@ class AnalysisService:
     def list_by_resource(
         session: Session,
         resource: str,
-        geoid: str
+        geoid: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> dict:
-        """List all analysis parameters for a resource.
+        """List analysis parameters for a resource, one keyset page at a time.
 
         Args:
             session: Database session
             resource: Resource name
             geoid: Geographic identifier
+            cursor: Cursor returned with the previous page
+            limit: Page size (None returns all parameters)
 
         Returns:
-            Dictionary with resource, geoid, and list of parameters
+            Dictionary with resource, geoid, list of parameters and next_cursor
 
         Raises:
             ResourceNotFoundException: If resource not found
@@ -178,11 +193,13 @@ class AnalysisService:
         # Validate resource exists
         resource_obj = AnalysisService._get_resource_by_name(session, resource)
 
-        # Get all observations for this resource
-        observations = AnalysisService._get_observations_for_analysis(
+        # Get one page of observations for this resource
+        observations, next_cursor = AnalysisService._get_observations_for_analysis(
             session,
             resource_obj.id,
-            geoid
+            geoid,
+            cursor=cursor,
+            limit=limit,
         )
 
         # Format as list of parameter data
@@ -202,11 +219,16 @@ class AnalysisService:
             "resource": resource,
             "geoid": geoid,
             "data": data_items,
+            "next_cursor": next_cursor,
         }
 
     @staticmethod
-    def list_resources(session: Session) -> list[str]:
-        """Return distinct non-NULL resource names from the analysis view."""
+    def list_resources(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL resource names from the analysis view."""
         view = get_analysis_data_view(session)
         stmt = (
             select(view.c.resource)
@@ -214,11 +236,17 @@ class AnalysisService:
             .distinct()
             .order_by(view.c.resource)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.resource, "analysis:list_resources", cursor, limit
+        )
 
     @staticmethod
-    def list_geoids(session: Session) -> list[str]:
-        """Return distinct non-NULL geoids from the analysis view.
+    def list_geoids(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL geoids from the analysis view.
 
         Returns [] currently (known analysis_data_view bug where geoids are NULL).
         Populates automatically once the view bug is resolved.
@@ -230,11 +258,17 @@ class AnalysisService:
             .distinct()
             .order_by(view.c.geoid)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.geoid, "analysis:list_geoids", cursor, limit
+        )
 
     @staticmethod
-    def list_parameters(session: Session) -> list[str]:
-        """Return distinct non-NULL parameter names from the analysis view."""
+    def list_parameters(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL parameter names from the analysis view."""
         view = get_analysis_data_view(session)
         stmt = (
             select(view.c.parameter)
@@ -242,4 +276,6 @@ class AnalysisService:
             .distinct()
             .order_by(view.c.parameter)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.parameter, "analysis:list_parameters", cursor, limit
+        )
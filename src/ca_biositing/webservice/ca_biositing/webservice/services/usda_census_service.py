@@ -21,13 +21,14 @@ from ca_biositing.webservice.exceptions import (
     ResourceNotFoundException,
 )
 from ca_biositing.webservice.services._canonical_views import (
+    get_usda_census_latest_view,
     get_usda_census_view,
     get_usda_resource_commodity_view,
 )
+from ca_biositing.webservice.services._pagination import discovery_page, keyset_page
 from ca_biositing.webservice.services._usda_lookup_common import (
     get_commodity_by_name,
     normalize_crop_name,
-    normalized_sql_text,
 )
 
 
@@ -67,7 +68,7 @@ class UsdaCensusService:
 
         # First find the resource (case-insensitive)
         normalized = normalize_crop_name(resource_name)
-        stmt = select(Resource).where(normalized_sql_text(Resource.name) == normalized)
+        stmt = select(Resource).where(Resource.name_norm == normalized)
         resource = session.execute(stmt).scalar_one_or_none()
 
         if not resource:
@@ -93,41 +94,28 @@ class UsdaCensusService:
         session: Session,
         commodity_id: int,
         geoid: str,
-        parameter_name: Optional[str] = None
-    ) -> list[dict]:
+        parameter_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[list[dict], Optional[str]]:
         """Get observations for a census record by commodity and geoid.
 
-        Since observations are stored separately with unique record_ids,
-        we query them by matching dataset + commodity + geoid criteria.
+        Only the newest census record for the commodity and geoid is used;
+        usda_census_latest_view holds just its observations, so this is a
+        single index lookup on (commodity_id, geoid, parameter_norm).
 
         Args:
             session: Database session
             commodity_id: USDA commodity ID
             geoid: Geographic identifier
             parameter_name: Optional parameter name filter
+            cursor: Keyset cursor from the previous page
+            limit: Page size (None returns all observations)
 
         Returns:
-            List of observation dictionaries with parameter/unit/dimension details
+            Tuple of (list of observation dictionaries, next page cursor)
         """
-        census_view = get_usda_census_view(session)
-
-        latest_record_stmt = (
-            select(census_view.c.source_record_id)
-            .where(and_(
-                census_view.c.commodity_id == commodity_id,
-                census_view.c.geoid == geoid,
-            ))
-            .order_by(
-                census_view.c.record_year.is_(None),
-                census_view.c.record_year.desc(),
-                census_view.c.source_record_id.desc(),
-            )
-            .limit(1)
-        )
-        latest_record_id = session.execute(latest_record_stmt).scalar_one_or_none()
-
-        if latest_record_id is None:
-            return []
+        census_view = get_usda_census_latest_view(session)
 
         stmt = (
             select(
@@ -142,17 +130,23 @@ class UsdaCensusService:
             .where(and_(
                 census_view.c.commodity_id == commodity_id,
                 census_view.c.geoid == geoid,
-                census_view.c.source_record_id == latest_record_id,
             ))
         )
 
         if parameter_name:
-            stmt = stmt.where(normalized_sql_text(census_view.c.parameter) == normalize_crop_name(parameter_name))
+            stmt = stmt.where(census_view.c.parameter_norm == normalize_crop_name(parameter_name))
 
-        # Order by observation ID for deterministic results
+        # Order by observation ID for deterministic results and keyset paging
         stmt = stmt.order_by(census_view.c.id)
 
-        results = session.execute(stmt).all()
+        results, next_cursor = keyset_page(
+            session,
+            stmt,
+            census_view.c.id,
+            scope=f"census:{commodity_id}:{geoid}",
+            cursor=cursor,
+            limit=limit,
+        )
 
         observations = []
         for row in results:
@@ -166,7 +160,7 @@ class UsdaCensusService:
                 "dimension_unit": row.dimension_unit,
             })
 
-        return observations
+        return observations, next_cursor
 
     @staticmethod
     def get_by_crop(
@@ -194,7 +188,7 @@ class UsdaCensusService:
         commodity = UsdaCensusService._get_commodity_by_name(session, usda_crop)
 
         # Get observations
-        observations = UsdaCensusService._get_observations_for_census_record(
+        observations, _ = UsdaCensusService._get_observations_for_census_record(
             session, commodity.id, geoid, parameter
         )
 
@@ -244,7 +238,7 @@ class UsdaCensusService:
         commodity = UsdaCensusService._get_commodity_by_resource(session, resource)
 
         # Get observations
-        observations = UsdaCensusService._get_observations_for_census_record(
+        observations, _ = UsdaCensusService._get_observations_for_census_record(
             session, commodity.id, geoid, parameter
         )
 
@@ -272,17 +266,21 @@ class UsdaCensusService:
     def list_by_crop(
         session: Session,
         usda_crop: str,
-        geoid: str
+        geoid: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> dict:
-        """List all census parameters for crop/geoid.
+        """List census parameters for crop/geoid, one keyset page at a time.
 
         Args:
             session: Database session
             usda_crop: USDA crop name
             geoid: Geographic identifier
+            cursor: Cursor returned with the previous page
+            limit: Page size (None returns all parameters)
 
         Returns:
-            Dictionary with list of all parameters (may be empty)
+            Dictionary with list of parameters (may be empty) and next_cursor
 
         Raises:
             CropNotFoundException: If crop not found
@@ -290,9 +288,9 @@ class UsdaCensusService:
         # Validate crop exists
         commodity = UsdaCensusService._get_commodity_by_name(session, usda_crop)
 
-        # Get all observations
-        observations = UsdaCensusService._get_observations_for_census_record(
-            session, commodity.id, geoid
+        # Get one page of observations
+        observations, next_cursor = UsdaCensusService._get_observations_for_census_record(
+            session, commodity.id, geoid, cursor=cursor, limit=limit
         )
 
         return {
@@ -300,23 +298,28 @@ class UsdaCensusService:
             "resource": None,
             "geoid": geoid,
             "data": observations,
+            "next_cursor": next_cursor,
         }
 
     @staticmethod
     def list_by_resource(
         session: Session,
         resource: str,
-        geoid: str
+        geoid: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> dict:
-        """List all census parameters for resource/geoid.
+        """List census parameters for resource/geoid, one keyset page at a time.
 
         Args:
             session: Database session
             resource: Resource name
             geoid: Geographic identifier
+            cursor: Cursor returned with the previous page
+            limit: Page size (None returns all parameters)
 
         Returns:
-            Dictionary with list of all parameters (may be empty)
+            Dictionary with list of parameters (may be empty) and next_cursor
 
         Raises:
             ResourceNotFoundException: If resource not found
@@ -324,9 +327,9 @@ class UsdaCensusService:
         # Convert resource to commodity
         commodity = UsdaCensusService._get_commodity_by_resource(session, resource)
 
-        # Get all observations
-        observations = UsdaCensusService._get_observations_for_census_record(
-            session, commodity.id, geoid
+        # Get one page of observations
+        observations, next_cursor = UsdaCensusService._get_observations_for_census_record(
+            session, commodity.id, geoid, cursor=cursor, limit=limit
         )
 
         return {
@@ -334,11 +337,16 @@ class UsdaCensusService:
             "resource": resource,
             "geoid": geoid,
             "data": observations,
+            "next_cursor": next_cursor,
         }
 
     @staticmethod
-    def list_crops(session: Session) -> list[str]:
-        """Return distinct non-NULL USDA crop names from the census view."""
+    def list_crops(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL USDA crop names from the census view."""
         view = get_usda_census_view(session)
         stmt = (
             select(view.c.usda_crop)
@@ -346,11 +354,17 @@ class UsdaCensusService:
             .distinct()
             .order_by(view.c.usda_crop)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.usda_crop, "census:list_crops", cursor, limit
+        )
 
     @staticmethod
-    def list_geoids(session: Session) -> list[str]:
-        """Return distinct non-NULL geoids from the census view."""
+    def list_geoids(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL geoids from the census view."""
         view = get_usda_census_view(session)
         stmt = (
             select(view.c.geoid)
@@ -358,11 +372,17 @@ class UsdaCensusService:
             .distinct()
             .order_by(view.c.geoid)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.geoid, "census:list_geoids", cursor, limit
+        )
 
     @staticmethod
-    def list_parameters(session: Session) -> list[str]:
-        """Return distinct non-NULL parameter names from the census view."""
+    def list_parameters(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL parameter names from the census view."""
         view = get_usda_census_view(session)
         stmt = (
             select(view.c.parameter)
@@ -370,11 +390,17 @@ class UsdaCensusService:
             .distinct()
             .order_by(view.c.parameter)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.parameter, "census:list_parameters", cursor, limit
+        )
 
     @staticmethod
-    def list_resources(session: Session) -> list[str]:
-        """Return distinct resource names whose commodities appear in the census view."""
+    def list_resources(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct resource names whose commodities appear in the census view."""
         census_view = get_usda_census_view(session)
         resource_commodity_view = get_usda_resource_commodity_view(session)
         commodity_ids_subq = (
@@ -388,4 +414,6 @@ class UsdaCensusService:
             .distinct()
             .order_by(resource_commodity_view.c.resource)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, resource_commodity_view.c.resource, "census:list_resources", cursor, limit
+        )
@@ -19,7 +19,6 @@ from ca_biositing.datamodels.models import (
 from ca_biositing.webservice.services._usda_lookup_common import (
     get_commodity_by_name,
     normalize_crop_name,
-    normalized_sql_text,
 )
 from ca_biositing.webservice.exceptions import (
     ParameterNotFoundException,
@@ -27,8 +26,10 @@ from ca_biositing.webservice.exceptions import (
 )
 from ca_biositing.webservice.services._canonical_views import (
     get_usda_resource_commodity_view,
+    get_usda_survey_latest_view,
     get_usda_survey_view,
 )
+from ca_biositing.webservice.services._pagination import discovery_page, keyset_page
 
 
 class UsdaSurveyService:
@@ -66,7 +67,7 @@ class UsdaSurveyService:
         """
         # First find the resource (case-insensitive)
         normalized = normalize_crop_name(resource_name)
-        stmt = select(Resource).where(normalized_sql_text(Resource.name) == normalized)
+        stmt = select(Resource).where(Resource.name_norm == normalized)
         resource = session.execute(stmt).scalar_one_or_none()
 
         if not resource:
@@ -92,38 +93,28 @@ class UsdaSurveyService:
         session: Session,
         commodity_id: int,
         geoid: str,
-        parameter_name: Optional[str] = None
-    ) -> tuple[list[dict], Optional[dict]]:
+        parameter_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[list[dict], Optional[dict], Optional[str]]:
         """Get observations for a survey record by commodity and geoid.
 
+        Only the newest survey record for the commodity and geoid is used;
+        usda_survey_latest_view holds just its observations.
+
         Args:
             session: Database session
             commodity_id: USDA commodity ID
             geoid: Geographic identifier
             parameter_name: Optional parameter name filter
+            cursor: Keyset cursor from the previous page
+            limit: Page size (None returns all observations)
 
         Returns:
-            Tuple of (list of observation dictionaries, survey metadata)
+            Tuple of (list of observation dictionaries, survey metadata,
+            next page cursor)
         """
-        survey_view = get_usda_survey_view(session)
-
-        latest_record_stmt = (
-            select(survey_view.c.source_record_id)
-            .where(and_(
-                survey_view.c.commodity_id == commodity_id,
-                survey_view.c.geoid == geoid,
-            ))
-            .order_by(
-                survey_view.c.record_year.is_(None),
-                survey_view.c.record_year.desc(),
-                survey_view.c.source_record_id.desc(),
-            )
-            .limit(1)
-        )
-        latest_record_id = session.execute(latest_record_stmt).scalar_one_or_none()
-
-        if latest_record_id is None:
-            return [], None
+        survey_view = get_usda_survey_latest_view(session)
 
         stmt = (
             select(
@@ -142,17 +133,23 @@ class UsdaSurveyService:
             .where(and_(
                 survey_view.c.commodity_id == commodity_id,
                 survey_view.c.geoid == geoid,
-                survey_view.c.source_record_id == latest_record_id,
             ))
         )
 
         if parameter_name:
-            stmt = stmt.where(normalized_sql_text(survey_view.c.parameter) == normalize_crop_name(parameter_name))
+            stmt = stmt.where(survey_view.c.parameter_norm == normalize_crop_name(parameter_name))
 
-        # Order by observation ID for deterministic results
+        # Order by observation ID for deterministic results and keyset paging
         stmt = stmt.order_by(survey_view.c.id)
 
-        results = session.execute(stmt).all()
+        results, next_cursor = keyset_page(
+            session,
+            stmt,
+            survey_view.c.id,
+            scope=f"survey:{commodity_id}:{geoid}",
+            cursor=cursor,
+            limit=limit,
+        )
 
         observations = []
         survey_metadata: Optional[dict] = None
@@ -174,7 +171,7 @@ class UsdaSurveyService:
                 "dimension_unit": row.dimension_unit,
             })
 
-        return observations, survey_metadata
+        return observations, survey_metadata, next_cursor
 
     @staticmethod
     def get_by_crop(
@@ -202,7 +199,7 @@ class UsdaSurveyService:
         commodity = UsdaSurveyService._get_commodity_by_name(session, usda_crop)
 
         # Get observations and survey record
-        observations, survey_metadata = UsdaSurveyService._get_observations_for_survey_record(
+        observations, survey_metadata, _ = UsdaSurveyService._get_observations_for_survey_record(
             session, commodity.id, geoid, parameter
         )
 
@@ -256,7 +253,7 @@ class UsdaSurveyService:
         commodity = UsdaSurveyService._get_commodity_by_resource(session, resource)
 
         # Get observations and survey record
-        observations, survey_metadata = UsdaSurveyService._get_observations_for_survey_record(
+        observations, survey_metadata, _ = UsdaSurveyService._get_observations_for_survey_record(
             session, commodity.id, geoid, parameter
         )
 
@@ -288,17 +285,21 @@ class UsdaSurveyService:
     def list_by_crop(
         session: Session,
         usda_crop: str,
-        geoid: str
+        geoid: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> dict:
-        """List all survey parameters for crop/geoid.
+        """List survey parameters for crop/geoid, one keyset page at a time.
 
         Args:
             session: Database session
             usda_crop: USDA crop name
             geoid: Geographic identifier
+            cursor: Cursor returned with the previous page
+            limit: Page size (None returns all parameters)
 
         Returns:
-            Dictionary with list of all parameters (may be empty)
+            Dictionary with list of parameters (may be empty) and next_cursor
 
         Raises:
             CropNotFoundException: If crop not found
@@ -306,9 +307,9 @@ class UsdaSurveyService:
         # Validate crop exists
         commodity = UsdaSurveyService._get_commodity_by_name(session, usda_crop)
 
-        # Get all observations and survey record
-        observations, survey_metadata = UsdaSurveyService._get_observations_for_survey_record(
-            session, commodity.id, geoid
+        # Get one page of observations and the survey record
+        observations, survey_metadata, next_cursor = UsdaSurveyService._get_observations_for_survey_record(
+            session, commodity.id, geoid, cursor=cursor, limit=limit
         )
 
         return {
@@ -320,23 +321,28 @@ class UsdaSurveyService:
             "survey_period": survey_metadata["survey_period"] if survey_metadata else None,
             "reference_month": survey_metadata["reference_month"] if survey_metadata else None,
             "seasonal_flag": survey_metadata["seasonal_flag"] if survey_metadata else None,
+            "next_cursor": next_cursor,
         }
 
     @staticmethod
     def list_by_resource(
         session: Session,
         resource: str,
-        geoid: str
+        geoid: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> dict:
-        """List all survey parameters for resource/geoid.
+        """List survey parameters for resource/geoid, one keyset page at a time.
 
         Args:
             session: Database session
             resource: Resource name
             geoid: Geographic identifier
+            cursor: Cursor returned with the previous page
+            limit: Page size (None returns all parameters)
 
         Returns:
-            Dictionary with list of all parameters (may be empty)
+            Dictionary with list of parameters (may be empty) and next_cursor
 
         Raises:
             ResourceNotFoundException: If resource not found
@@ -344,9 +350,9 @@ class UsdaSurveyService:
         # Convert resource to commodity
         commodity = UsdaSurveyService._get_commodity_by_resource(session, resource)
 
-        # Get all observations and survey record
-        observations, survey_metadata = UsdaSurveyService._get_observations_for_survey_record(
-            session, commodity.id, geoid
+        # Get one page of observations and the survey record
+        observations, survey_metadata, next_cursor = UsdaSurveyService._get_observations_for_survey_record(
+            session, commodity.id, geoid, cursor=cursor, limit=limit
         )
 
         return {
@@ -358,11 +364,16 @@ class UsdaSurveyService:
             "survey_period": survey_metadata["survey_period"] if survey_metadata else None,
             "reference_month": survey_metadata["reference_month"] if survey_metadata else None,
             "seasonal_flag": survey_metadata["seasonal_flag"] if survey_metadata else None,
+            "next_cursor": next_cursor,
         }
 
     @staticmethod
-    def list_crops(session: Session) -> list[str]:
-        """Return distinct non-NULL USDA crop names from the survey view."""
+    def list_crops(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL USDA crop names from the survey view."""
         view = get_usda_survey_view(session)
         stmt = (
             select(view.c.usda_crop)
@@ -370,11 +381,17 @@ class UsdaSurveyService:
             .distinct()
             .order_by(view.c.usda_crop)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.usda_crop, "survey:list_crops", cursor, limit
+        )
 
     @staticmethod
-    def list_geoids(session: Session) -> list[str]:
-        """Return distinct non-NULL geoids from the survey view."""
+    def list_geoids(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL geoids from the survey view."""
         view = get_usda_survey_view(session)
         stmt = (
             select(view.c.geoid)
@@ -382,11 +399,17 @@ class UsdaSurveyService:
             .distinct()
             .order_by(view.c.geoid)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.geoid, "survey:list_geoids", cursor, limit
+        )
 
     @staticmethod
-    def list_parameters(session: Session) -> list[str]:
-        """Return distinct non-NULL parameter names from the survey view."""
+    def list_parameters(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct non-NULL parameter names from the survey view."""
         view = get_usda_survey_view(session)
         stmt = (
             select(view.c.parameter)
@@ -394,11 +417,17 @@ class UsdaSurveyService:
             .distinct()
             .order_by(view.c.parameter)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, view.c.parameter, "survey:list_parameters", cursor, limit
+        )
 
     @staticmethod
-    def list_resources(session: Session) -> list[str]:
-        """Return distinct resource names whose commodities appear in the survey view."""
+    def list_resources(
+        session: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Return one page of distinct resource names whose commodities appear in the survey view."""
         survey_view = get_usda_survey_view(session)
         resource_commodity_view = get_usda_resource_commodity_view(session)
         commodity_ids_subq = (
@@ -412,4 +441,6 @@ class UsdaSurveyService:
             .distinct()
             .order_by(resource_commodity_view.c.resource)
         )
-        return [r for (r,) in session.execute(stmt).all()]
+        return discovery_page(
+            session, stmt, resource_commodity_view.c.resource, "survey:list_resources", cursor, limit
+        )
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Path
 
-from ca_biositing.webservice.dependencies import SessionDep
+from ca_biositing.webservice.dependencies import PaginationDep, SessionDep
 from ca_biositing.webservice.services.analysis_service import AnalysisService
 from ca_biositing.webservice.v1.feedstocks.schemas import (
     AnalysisDataResponse,
@@ -21,7 +21,7 @@ router = APIRouter(prefix="/analysis", tags=["Analysis"])
 
 
 @router.get("/resources", response_model=DiscoveryResponse)
-def list_analysis_resources(session: SessionDep) -> DiscoveryResponse:
+def list_analysis_resources(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct resource names available for analysis queries.
 
     Example:
@@ -30,11 +30,13 @@ def list_analysis_resources(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of resource name strings
     """
-    return DiscoveryResponse(values=AnalysisService.list_resources(session))
+    return DiscoveryResponse(
+        **AnalysisService.list_resources(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get("/geoids", response_model=DiscoveryResponse)
-def list_analysis_geoids(session: SessionDep) -> DiscoveryResponse:
+def list_analysis_geoids(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct geoids available for analysis queries.
 
     Returns an empty list until the known analysis_data_view geoid bug is resolved.
@@ -46,11 +48,13 @@ def list_analysis_geoids(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of geoid strings
     """
-    return DiscoveryResponse(values=AnalysisService.list_geoids(session))
+    return DiscoveryResponse(
+        **AnalysisService.list_geoids(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get("/parameters", response_model=DiscoveryResponse)
-def list_analysis_parameters(session: SessionDep) -> DiscoveryResponse:
+def list_analysis_parameters(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct parameter names available for analysis queries.
 
     Example:
@@ -59,7 +63,9 @@ def list_analysis_parameters(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of parameter name strings
     """
-    return DiscoveryResponse(values=AnalysisService.list_parameters(session))
+    return DiscoveryResponse(
+        **AnalysisService.list_parameters(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get(
@@ -121,6 +127,7 @@ def get_analysis_data_by_resource(
 )
 def list_analysis_data_by_resource(
     session: SessionDep,
+    pagination: PaginationDep,
     resource: str = Path(
         ...,
         description=(
@@ -146,6 +153,7 @@ def list_analysis_data_by_resource(
 
     Args:
         session: Database session (injected)
+        pagination: Keyset cursor and page size (injected)
         resource: Resource name
         geoid: Geographic identifier (county FIPS code)
 
@@ -155,5 +163,7 @@ def list_analysis_data_by_resource(
     Raises:
         ResourceNotFoundException: If resource not found in database
     """
-    data = AnalysisService.list_by_resource(session, resource, geoid)
+    data = AnalysisService.list_by_resource(
+        session, resource, geoid, pagination.cursor, pagination.limit
+    )
     return AnalysisListResponse(**data)
@@ -61,6 +61,9 @@ class CensusListResponse(BaseModel):
     resource: Optional[str] = Field(None, description="Resource name (if queried by resource)")
     geoid: str = Field(..., description="Geographic identifier")
     data: list[DataItemResponse] = Field(..., description="List of parameter data")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class SurveyDataResponse(BaseModel):
@@ -99,6 +102,9 @@ class SurveyListResponse(BaseModel):
     resource: Optional[str] = Field(None, description="Resource name (if queried by resource)")
     geoid: str = Field(..., description="Geographic identifier")
     data: list[DataItemResponse] = Field(..., description="List of parameter data")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
     survey_program_id: Optional[int] = Field(None, description="Survey program ID")
     survey_period: Optional[str] = Field(None, description="Survey period")
     reference_month: Optional[str] = Field(None, description="Reference month")
@@ -127,12 +133,18 @@ class AnalysisListResponse(BaseModel):
     resource: str = Field(..., description="Resource name")
     geoid: str = Field(..., description="Geographic identifier")
     data: list[DataItemResponse] = Field(..., description="List of parameter data")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class DiscoveryResponse(BaseModel):
     """List of distinct queryable values for a given field."""
 
     values: list[str] = Field(..., description="Distinct non-NULL values available for querying")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class AvailabilityResponse(BaseModel):
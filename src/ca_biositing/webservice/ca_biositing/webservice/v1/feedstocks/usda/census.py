@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Path
 
-from ca_biositing.webservice.dependencies import SessionDep
+from ca_biositing.webservice.dependencies import PaginationDep, SessionDep
 from ca_biositing.webservice.services.usda_census_service import UsdaCensusService
 from ca_biositing.webservice.v1.feedstocks.schemas import (
     CensusDataResponse,
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/census", tags=["Census"])
 
 
 @router.get("/crops", response_model=DiscoveryResponse)
-def list_census_crops(session: SessionDep) -> DiscoveryResponse:
+def list_census_crops(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct USDA crop names available for census queries.
 
     Example:
@@ -29,11 +29,13 @@ def list_census_crops(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of crop name strings
     """
-    return DiscoveryResponse(values=UsdaCensusService.list_crops(session))
+    return DiscoveryResponse(
+        **UsdaCensusService.list_crops(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get("/resources", response_model=DiscoveryResponse)
-def list_census_resources(session: SessionDep) -> DiscoveryResponse:
+def list_census_resources(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct resource names available for census queries.
 
     Example:
@@ -42,11 +44,13 @@ def list_census_resources(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of resource name strings
     """
-    return DiscoveryResponse(values=UsdaCensusService.list_resources(session))
+    return DiscoveryResponse(
+        **UsdaCensusService.list_resources(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get("/geoids", response_model=DiscoveryResponse)
-def list_census_geoids(session: SessionDep) -> DiscoveryResponse:
+def list_census_geoids(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct geoids available for census queries.
 
     Example:
@@ -55,11 +59,13 @@ def list_census_geoids(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of geoid strings
     """
-    return DiscoveryResponse(values=UsdaCensusService.list_geoids(session))
+    return DiscoveryResponse(
+        **UsdaCensusService.list_geoids(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get("/parameters", response_model=DiscoveryResponse)
-def list_census_parameters(session: SessionDep) -> DiscoveryResponse:
+def list_census_parameters(session: SessionDep, pagination: PaginationDep) -> DiscoveryResponse:
     """List all distinct parameter names available for census queries.
 
     Example:
@@ -68,7 +74,9 @@ def list_census_parameters(session: SessionDep) -> DiscoveryResponse:
     Returns:
         DiscoveryResponse with list of parameter name strings
     """
-    return DiscoveryResponse(values=UsdaCensusService.list_parameters(session))
+    return DiscoveryResponse(
+        **UsdaCensusService.list_parameters(session, pagination.cursor, pagination.limit)
+    )
 
 
 @router.get(
@@ -181,6 +189,7 @@ def get_census_data_by_resource(
 )
 def list_census_data_by_crop(
     session: SessionDep,
+    pagination: PaginationDep,
     crop: str = Path(
         ...,
         description=(
@@ -204,17 +213,20 @@ def list_census_data_by_crop(
 
     Args:
         session: Database session (injected)
+        pagination: Keyset cursor and page size (injected)
         crop: USDA crop name
         geoid: Geographic identifier (county FIPS code)
 
     Returns:
-        CensusListResponse with list of all parameters and their values
+        CensusListResponse with one page of parameters and the next_cursor
 
     Raises:
         CropNotFoundException: If crop not found in database
         ParameterNotFoundException: If no data found for crop/geoid
     """
-    data = UsdaCensusService.list_by_crop(session, crop, geoid)
+    data = UsdaCensusService.list_by_crop(
+        session, crop, geoid, pagination.cursor, pagination.limit
+    )
     return CensusListResponse(**data)
 
 
@@ -224,6 +236,7 @@ def list_census_data_by_crop(
 )
 def list_census_data_by_resource(
     session: SessionDep,
+    pagination: PaginationDep,
     resource: str = Path(
         ...,
         description=(
@@ -249,15 +262,18 @@ def list_census_data_by_resource(
 
     Args:
         session: Database session (injected)
+        pagination: Keyset cursor and page size (injected)
         resource: Resource name
         geoid: Geographic identifier (county FIPS code)
 
     Returns:
-        CensusListResponse with list of all parameters and their values
+        CensusListResponse with one page of parameters and the next_cursor
 
     Raises:
         ResourceNotFoundException: If resource not found in database
         ParameterNotFoundException: If no data found for resource/geoid
     """
-    data = UsdaCensusService.list_by_resource(session, resource, geoid)
+    data = UsdaCensusService.list_by_resource(
+        session, resource, geoid, pagination.cursor, pagination.limit
+    )
     return CensusListResponse(**data)
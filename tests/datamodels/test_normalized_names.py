@@ -0,0 +1,41 @@
+"""Tests for the stored normalized-name columns."""
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.postgresql import dialect as pg_dialect
+from sqlmodel import SQLModel
+
+from ca_biositing.datamodels.models import Parameter, Resource, UsdaCommodity
+from ca_biositing.datamodels.views import USDA_CENSUS_VIEW
+
+
+def test_normalized_columns_are_generated_on_insert():
+    """The database fills *_norm columns; loaders never write them."""
+    engine = create_engine("sqlite://")
+    tables = [Resource.__table__, Parameter.__table__, UsdaCommodity.__table__]
+    SQLModel.metadata.create_all(engine, tables=tables)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Resource), [{"name": "  Corn_Stover  "}, {"name": None}])
+        conn.execute(insert(UsdaCommodity), [{"name": "HAY  &  HAYLAGE", "api_name": "Hay_Alfalfa"}])
+
+        assert conn.execute(select(Resource.name_norm).order_by(Resource.id)).scalars().all() == [
+            "corn stover",
+            None,
+        ]
+        row = conn.execute(select(UsdaCommodity.name_norm, UsdaCommodity.api_name_norm)).one()
+        assert tuple(row) == ("hay & haylage", "hay alfalfa")
+
+
+def test_normalized_columns_are_indexed():
+    for table, column in (
+        (Resource.__table__, "name_norm"),
+        (Parameter.__table__, "name_norm"),
+        (UsdaCommodity.__table__, "api_name_norm"),
+    ):
+        assert any(list(index.columns.keys()) == [column] for index in table.indexes)
+        assert table.c[column].computed.persisted
+
+
+def test_usda_census_view_exposes_parameter_norm():
+    compiled = str(USDA_CENSUS_VIEW.compile(dialect=pg_dialect()))
+    assert "AS parameter_norm" in compiled
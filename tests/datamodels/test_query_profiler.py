@@ -0,0 +1,67 @@
+"""Tests for the SQL query profiler and its N+1 detection."""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from ca_biositing.datamodels.query_profiler import (
+    fingerprint,
+    profile_queries,
+    query_budget,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE resource (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO resource (name) VALUES ('a'), ('b'), ('c')"))
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_ignores_values():
+    assert fingerprint("SELECT * FROM t WHERE name = 'it''s' AND id IN (1, 2, 3)") == (
+        "SELECT * FROM t WHERE name = ? AND id IN (?...)"
+    )
+    assert fingerprint("SELECT id FROM t WHERE lower(name) = lower(%(lower_1)s)\n  LIMIT %(param_1)s") == (
+        "SELECT id FROM t WHERE lower(name) = lower(?) LIMIT ?"
+    )
+    assert fingerprint("INSERT INTO t (a) VALUES (?), (?), (?)") == fingerprint("INSERT INTO t (a) VALUES (?), (?)")
+    assert fingerprint("SELECT a::text FROM t WHERE b = :b") == "SELECT a::text FROM t WHERE b = ?"
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one(engine):
+    with profile_queries("per-name lookups", n_plus_one_threshold=3) as profile:
+        with engine.connect() as conn:
+            for name in ["a", "b", "c", "d"]:
+                conn.execute(text("SELECT id FROM resource WHERE name = :name"), {"name": name})
+            conn.execute(text("SELECT count(*) FROM resource")).scalar()
+
+    assert profile.total_queries == 5
+    assert profile.max_repeats == 4
+    [suspect] = profile.n_plus_one()
+    assert suspect.fingerprint == "SELECT id FROM resource WHERE name = ?"
+    assert "likely N+1 (4x" in profile.report()
+
+
+def test_profiles_nest_and_stop_at_exit(engine):
+    with engine.connect() as conn:
+        with profile_queries("outer") as outer:
+            conn.execute(text("SELECT 1"))
+            with profile_queries("inner") as inner:
+                conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+
+    assert (outer.total_queries, inner.total_queries) == (2, 1)
+
+
+def test_query_budget(engine):
+    with engine.connect() as conn:
+        with query_budget(max_queries=2, max_repeats=1):
+            conn.execute(text("SELECT name FROM resource")).all()
+
+        with pytest.raises(AssertionError, match="ran 2 times, over the limit of 1"):
+            with query_budget(max_queries=5, max_repeats=1):
+                for name in ["a", "b"]:
+                    conn.execute(text("SELECT id FROM resource WHERE name = :name"), {"name": name})
@@ -0,0 +1,50 @@
+"""Tests for LandIQ geometry tier selection and view definitions."""
+
+from sqlalchemy.dialects.postgresql import dialect as pg_dialect
+
+from ca_biositing.datamodels.views import (
+    LANDIQ_TILESET_VIEW,
+    LANDIQ_TILESET_VIEW_V1,
+    geometry_tier_for_resolution,
+    geometry_tier_for_zoom,
+    landiq_tileset_query,
+)
+
+
+def test_geometry_tier_for_resolution():
+    """The coarsest tier not exceeding one pixel is chosen."""
+    assert geometry_tier_for_resolution(0.5) == "geom"
+    assert geometry_tier_for_resolution(1.0) == "geom_1m"
+    assert geometry_tier_for_resolution(9.9) == "geom_1m"
+    assert geometry_tier_for_resolution(10.0) == "geom_10m"
+    assert geometry_tier_for_resolution(5000.0) == "geom_100m"
+
+
+def test_geometry_tier_for_zoom():
+    """State/county zooms use the coarse tier; street zooms use full resolution."""
+    assert geometry_tier_for_zoom(6) == "geom_100m"
+    assert geometry_tier_for_zoom(12) == "geom_10m"
+    assert geometry_tier_for_zoom(15) == "geom_1m"
+    assert geometry_tier_for_zoom(18) == "geom"
+
+
+def test_landiq_tileset_view_exposes_tiers():
+    """Only the current view definition carries the simplified tier columns."""
+    compiled = str(LANDIQ_TILESET_VIEW.compile(dialect=pg_dialect()))
+    compiled_v1 = str(LANDIQ_TILESET_VIEW_V1.compile(dialect=pg_dialect()))
+    for column in ("geom_1m", "geom_10m", "geom_100m"):
+        assert f"polygon.{column}" in compiled
+        assert f"polygon.{column}" not in compiled_v1
+
+
+def test_landiq_tileset_query_reads_only_the_zoom_tier():
+    """A tile build reads the tier for its zoom as geom and no other geometry."""
+    coarse = str(landiq_tileset_query(6).compile(dialect=pg_dialect()))
+    assert "landiq_tileset_view.geom_100m AS geom" in coarse
+    for column in ("landiq_tileset_view.geom,", "geom_1m", "geom_10m,"):
+        assert column not in coarse
+
+    detailed = str(landiq_tileset_query(18).compile(dialect=pg_dialect()))
+    assert "landiq_tileset_view.geom" in detailed
+    assert "geom_1m" not in detailed and "geom_100m" not in detailed
+    assert "ca_biositing.landiq_tileset_view" in detailed
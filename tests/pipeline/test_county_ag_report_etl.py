@@ -114,6 +114,65 @@ class TestCountyAgReportTransform:
             assert 'record_id' in result.columns
             assert 'value' in result.columns
 
+    def test_melt_county_metrics_takes_counties_from_columns(self):
+        """Every county column in the sheet is melted; empty cells are dropped and commas parsed."""
+        from ca_biositing.pipeline.utils.cleaning_functions import cleaning as cleaning_mod
+        from ca_biositing.pipeline.etl.transform.analysis.county_ag_report_record import (
+            COUNTY_GEOIDS, county_record_ids, data_source_ids, melt_county_metrics,
+        )
+
+        metrics_data = cleaning_mod.standard_clean(pd.DataFrame({
+            'Prod_Nbr': ['pc-001', 'pc-002', ''],
+            'Data_Year': [2023, '2024', 2023],
+            'Prodn_Merced': ['1,200', '', '5'],
+            'Value_$M_Merced': [50, None, 6],
+            'Prodn_SanJoaquin': [None, 'n/a', None],
+            'Prodn_Fresno': [7, 8, None],
+            'Prodn_Value_note': ['Note 1', None, None],
+        }))
+        long = melt_county_metrics(metrics_data)
+
+        assert list(zip(long['prod_nbr'], long['county'], long['metric'])) == [
+            ('pc-001', 'merced', 'prodn'),
+            ('pc-001', 'merced', 'value_m'),
+            ('pc-001', 'fresno', 'prodn'),
+            ('pc-002', 'sanjoaquin', 'prodn'),
+            ('pc-002', 'fresno', 'prodn'),
+        ]
+        assert long['value'].iloc[0] == 1200.0
+        assert pd.isna(long['value'].iloc[3])
+        assert county_record_ids(long).iloc[3] == 'pc-002-sanjoaquin-2024'
+        assert data_source_ids(long).tolist()[:4] == [1, 1, pd.NA, 6]
+        assert COUNTY_GEOIDS['fresno'] == '06019' and COUNTY_GEOIDS['yuba'] == '06115'
+        assert len(COUNTY_GEOIDS) == 58
+
+    def test_transform_observations_covers_all_counties(self):
+        """All 58 county column pairs become observations without code changes."""
+        from ca_biositing.pipeline.etl.transform.analysis import county_ag_report_observation
+        from ca_biositing.pipeline.etl.transform.analysis.county_ag_report_record import COUNTY_GEOIDS
+
+        n_products = 200
+        metrics_data = pd.DataFrame({
+            'Prod_Nbr': [f'pc-{i:03d}' for i in range(n_products)],
+            'Data_Year': 2023,
+        })
+        for county in COUNTY_GEOIDS:
+            metrics_data[f'Prodn_{county}'] = 1.0
+            metrics_data[f'Value_$M_{county}'] = '1,000'
+
+        with patch('ca_biositing.pipeline.etl.transform.analysis.county_ag_report_observation.normalize_dataframes',
+                   side_effect=lambda df, cols: [df]):
+            with patch('ca_biositing.pipeline.utils.engine.get_engine'):
+                result = county_ag_report_observation.transform_county_ag_report_observations.fn(
+                    data_sources={"pp_production_value": metrics_data},
+                    etl_run_id="test-run",
+                    lineage_group_id=1
+                )
+
+        assert len(result) == n_products * 58 * 2
+        assert result['record_id'].nunique() == n_products * 58
+        assert set(result.loc[result['value'] == 1000.0, 'record_id']) == set(result['record_id'])
+
     def test_transform_data_sources_filters_placeholder_rows(self):
         """Rows with an index but blank source metadata should be dropped."""
         from ca_biositing.pipeline.etl.transform.analysis import data_source as ds_transform
@@ -287,6 +287,89 @@ class TestQualitativeTransform:
         assert not trend_rows.empty
         assert str(trend_rows.iloc[0]["value"]) == "1"
 
+    def test_parse_decimal_ranges_parses_every_cell_form(self):
+        from ca_biositing.pipeline.etl.transform.analysis.qualitative import parse_decimal_ranges
+
+        expected = {
+            # ranges, reversed bounds and currency
+            "10-20": ("10", "20"),
+            "20-10": ("10", "20"),
+            "$5 to $8": ("5", "8"),
+            "1.5 TO 2.25": ("1.5", "2.25"),
+            "1,000-2,000": ("1000", "2000"),
+            "50 - 70 %": ("50", "70"),
+            # unicode dashes
+            "5–9": ("5", "9"),
+            "5 — 9": ("5", "9"),
+            "–5": ("-5", "-5"),
+            # negatives and accounting notation
+            "-5 - -3": ("-5", "-3"),
+            "-5": ("-5", "-5"),
+            "($10)": ("-10", "-10"),
+            "(0 - 40)": ("-40", "-10"),
+            # open-ended
+            "10+": ("None", "None"),
+            ">20": ("None", "None"),
+            "10-": ("None", "None"),
+            "up to 5": ("None", "None"),
+            "5 to": ("None", "None"),
+            # malformed
+            "10-20-30": ("None", "None"),
+            "1.2.3": ("None", "None"),
+            "x-10": ("None", "None"),
+            "abc": ("None", "None"),
+            "": ("None", "None"),
+        }
+        cells = list(expected) + [None]
+        parsed = parse_decimal_ranges(pd.Series(cells, dtype=object))
+
+        assert [(str(low), str(high)) for low, high in zip(parsed["low"], parsed["high"])] == (
+            list(expected.values()) + [("None", "None")]
+        )
+
+    def test_transform_observations_replicated_sheet(self):
+        """A qualitative sheet replicated 50x yields 50x the observations."""
+        from ca_biositing.pipeline.etl.transform.analysis import qualitative
+
+        sheet = pd.DataFrame(
+            {
+                "resource": ["Almond Hull", pd.NA, "Walnut Shells", pd.NA],
+                "use_case": ["Animal Feed", "Bioenergy/cogeneration", "Mulch", "compost"],
+                "resource_use_perc_range": ["10-20", "50 - 70 %", "n/a", "5"],
+                "resource_value_usd_per_ton_delivered_range": ["($0-$40)", "$5 to $8", "", "1,000-2,000"],
+                "resource_value_multiplier": ["1.2-1.8", "", "2", "x"],
+                "resource_use_trend": ["increasing", "steady", "", "unknown"],
+            }
+        )
+        enum_raw = pd.DataFrame(
+            {
+                "original_set_of_unique_use_case_names": ["Bioenergy/cogeneration"],
+                "use_case_name": ["Onsite Combined Heat and Power (CHP)"],
+            }
+        )
+
+        def run(df):
+            with patch(
+                "ca_biositing.pipeline.etl.transform.analysis.qualitative.normalize_dataframes",
+                side_effect=lambda frame, _cols: [frame.assign(parameter_id=1, unit_id=1)],
+            ):
+                return qualitative.transform_qualitative_observations.fn(
+                    {"qualitative_data": df, "use_case_enum": enum_raw}, "run-1", 9
+                )
+
+        single = run(sheet)
+        assert list(single["parameter_name"][:7]) == [
+            "resource_use_perc_low", "resource_use_perc_high", "resource_value_low",
+            "resource_value_high", "resource_value_multiplier_low", "resource_value_multiplier_high",
+            "resource_use_trend",
+        ]
+        assert single["end_use_record_key"].iloc[-1] == "walnut shells|compost"
+        assert "almond hulls|onsite combined heat and power (chp)" in set(single["end_use_record_key"])
+
+        replicated = run(pd.concat([sheet] * 50, ignore_index=True))
+
+        assert len(replicated) == 50 * len(single)
+
 
 class TestQualitativeSchemaFix:
     """Targeted tests for the interim schema model fix needed by Prompt B."""
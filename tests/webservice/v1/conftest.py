@@ -112,6 +112,19 @@ def session_fixture(engine):
     connection.close()
 
 
+@pytest.fixture(name="query_budget")
+def query_budget_fixture():
+    """Context manager asserting the number of SQL statements a block may run.
+
+    Usage:
+        with query_budget(max_queries=2, max_repeats=1):
+            AnalysisService.get_by_resource(session, ...)
+    """
+    from ca_biositing.datamodels.query_profiler import query_budget
+
+    return query_budget
+
+
 @pytest.fixture(name="client")
 def client_fixture(session):
     """Create test client with overridden database session.
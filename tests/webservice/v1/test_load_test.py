@@ -0,0 +1,97 @@
+"""Tests for the /v1/feedstocks load test harness and its synthetic data."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy.orm import Session
+
+from ca_biositing.datamodels.database import get_session
+from ca_biositing.datamodels.models import ApiUser
+from ca_biositing.webservice.benchmarks.load_test import (
+    feedstock_routes,
+    percentile,
+    request_urls,
+    route_dataset,
+    run_load_test,
+    summarize_route,
+)
+from ca_biositing.webservice.benchmarks.seed import Scale, catalog, insert_synthetic_data
+from ca_biositing.webservice.config import config
+from ca_biositing.webservice.dependencies import get_current_user
+from ca_biositing.webservice.main import app
+
+SCALE = Scale(commodities=3, counties=4, years=2, usda_parameters=3, samples_per_resource=2)
+
+
+@pytest.fixture(name="seeded_app")
+def seeded_app_fixture(engine):
+    """The app serving SCALE's synthetic data from the in-memory database."""
+    insert_synthetic_data(engine, SCALE)
+    connection = engine.connect()
+
+    def override_get_session():
+        with Session(bind=connection) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_current_user] = lambda: ApiUser(
+        id=1, username="load-test", hashed_password="", is_admin=False, disabled=False
+    )
+    yield app
+    app.dependency_overrides.clear()
+    connection.close()
+
+
+def test_every_feedstock_route_reads_a_seeded_dataset():
+    routes = feedstock_routes(app)
+    assert len(routes) == 24
+    assert {route_dataset(route) for route in routes} == {"census", "survey", "analysis", "availability"}
+    with pytest.raises(ValueError):
+        route_dataset("/v1/feedstocks/unknown/resources")
+
+
+def test_request_urls_quote_path_parameters():
+    entries = [{"crop": "crop 001", "geoid": "06001", "parameter": "area harvested"}]
+    route = "/v1/feedstocks/usda/census/crops/{crop}/geoid/{geoid}/parameters/{parameter}"
+    [url] = request_urls(route, entries, 1, random.Random(0))
+    assert url == "/v1/feedstocks/usda/census/crops/crop%20001/geoid/06001/parameters/area%20harvested"
+    assert request_urls("/v1/feedstocks/usda/census/crops", entries, 2, None) == [
+        "/v1/feedstocks/usda/census/crops"
+    ] * 2
+
+
+def test_summarize_route_percentiles():
+    assert percentile([], 50) == 0.0
+    values = [float(v) for v in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 95), percentile(values, 99)) == (50.0, 95.0, 99.0)
+
+    result = summarize_route("/r", [0.01, 0.02, 0.03, 0.04], ["200", "200", "200", "404"], [2, 3], 2.0)
+    assert (result.requests, result.errors, result.requests_per_second) == (4, 1, 2.0)
+    assert result.status_codes == {"200": 3, "404": 1}
+    assert result.latency_ms["p50"] == pytest.approx(20.0)
+    assert result.latency_ms["p99"] == pytest.approx(40.0)
+    assert result.db_queries == {"mean": 2.5, "min": 2, "max": 3}
+
+
+def test_catalog_entries_resolve_on_every_route(seeded_app):
+    async def run():
+        transport = httpx.ASGITransport(app=seeded_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+            return await run_load_test(
+                client, feedstock_routes(seeded_app), catalog(SCALE),
+                requests_per_route=4, concurrency=1, warmup=0,
+            )
+
+    with patch.object(config, "query_profile", True):
+        results = asyncio.run(run())
+
+    assert len(results) == len(feedstock_routes(seeded_app))
+    for result in results:
+        assert result.status_codes == {"200": 4}, result.route
+        assert result.db_queries["min"] >= 1
+        assert result.latency_ms["p50"] <= result.latency_ms["p99"]
@@ -0,0 +1,147 @@
+"""Tests for keyset pagination on list and discovery endpoints."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import patch
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from ca_biositing.datamodels.models import ApiUser, Observation, Parameter
+from ca_biositing.datamodels.query_profiler import profile_queries
+from ca_biositing.webservice.dependencies import get_current_user
+from ca_biositing.webservice.main import app
+from ca_biositing.webservice.services.usda_census_service import UsdaCensusService
+
+CENSUS_LIST_URL = "/v1/feedstocks/usda/census/crops/CORN/geoid/06001/parameters"
+
+
+def _walk(client: TestClient, url: str, limit: int) -> list[dict]:
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(body)
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestKeysetPagination:
+    """Cursor chaining, validation and page limits."""
+
+    def test_list_pages_cover_all_rows_once(self, client: TestClient, test_census_data):
+        pages = _walk(client, CENSUS_LIST_URL, limit=1)
+
+        assert [len(p["data"]) for p in pages] == [1, 1, 1]
+        params = [p["data"][0]["parameter"] for p in pages]
+        assert params == ["acres", "production", "yield_per_acre"]
+
+    def test_single_page_has_no_next_cursor(self, client: TestClient, test_census_data):
+        body = client.get(CENSUS_LIST_URL).json()
+        assert len(body["data"]) == 3
+        assert body["next_cursor"] is None
+
+    def test_discovery_pages(self, client: TestClient, test_census_data):
+        pages = _walk(client, "/v1/feedstocks/usda/census/crops", limit=1)
+        values = [v for p in pages for v in p["values"]]
+        assert values == sorted(values)
+        assert len(values) == len(set(values)) > 1
+
+    def test_tampered_cursor_rejected(self, client: TestClient, test_census_data):
+        cursor = client.get(CENSUS_LIST_URL, params={"limit": 1}).json()["next_cursor"]
+        response = client.get(CENSUS_LIST_URL, params={"limit": 1, "cursor": cursor[:-2] + "xx"})
+        assert response.status_code == 400
+
+    def test_cursor_bound_to_query(self, client: TestClient, test_census_data):
+        cursor = client.get(CENSUS_LIST_URL, params={"limit": 1}).json()["next_cursor"]
+        response = client.get(
+            "/v1/feedstocks/usda/census/crops/SOYBEANS/geoid/06001/parameters",
+            params={"limit": 1, "cursor": cursor},
+        )
+        assert response.status_code == 400
+
+    def test_limit_capped_for_jwt_clients(self, client: TestClient, test_census_data):
+        response = client.get(CENSUS_LIST_URL, params={"limit": 101})
+        assert response.status_code == 422
+
+    def test_api_key_clients_get_larger_pages(self, client: TestClient, test_census_data):
+        def override_api_key_user(request: Request):
+            request.state.api_key = object()
+            return ApiUser(id=2, username="bulk", hashed_password="", disabled=False)
+
+        app.dependency_overrides[get_current_user] = override_api_key_user
+        assert client.get(CENSUS_LIST_URL, params={"limit": 5000}).status_code == 200
+        assert client.get(CENSUS_LIST_URL, params={"limit": 5001}).status_code == 422
+
+
+def test_deep_pages_are_the_same_bounded_keyset_seek(session: Session, test_census_data):
+    """
+    Pages deep in a large result set run the same statements as the first
+    pages, so their cost does not grow with depth: each page is one seek past
+    the previous key (``id > ? ORDER BY id LIMIT ?``), never an OFFSET scan.
+    Following the cursors also returns every row exactly once.
+    """
+    total, page_size = 2_000, 100
+    session.add_all(
+        Parameter(id=1000 + i, name=f"synthetic_{i:05d}", standard_unit_id=1)
+        for i in range(total)
+    )
+    session.execute(
+        insert(Observation),
+        [
+            {
+                "id": 1000 + i,
+                "record_id": "1",
+                "dataset_id": 1,
+                "record_type": "usda_census_record",
+                "parameter_id": 1000 + i,
+                "value": float(i),
+                "unit_id": 1,
+            }
+            for i in range(total)
+        ],
+    )
+    session.commit()
+
+    seen = []
+    profiles = []
+    statements = []
+    cursor = None
+    while True:
+        with profile_queries(f"page {len(profiles) + 1}") as profile, \
+                patch.object(session, "execute", wraps=session.execute) as execute:
+            page = UsdaCensusService.list_by_crop(session, "corn", "06001", cursor, page_size)
+        profiles.append(profile)
+        statements.append([c.args[0] for c in execute.call_args_list])
+        assert len(page["data"]) <= page_size
+        seen.extend(row["parameter"] for row in page["data"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == total + 3
+    assert len(set(seen)) == len(seen)
+    assert {f"synthetic_{i:05d}" for i in range(total)} <= set(seen)
+
+    # Page 20 of 21 issues the same statements as page 1, each once
+    first, second, deep = profiles[0], profiles[1], profiles[19]
+    assert deep.total_queries == first.total_queries
+    assert deep.max_repeats == 1
+    assert all(set(p.stats) == set(second.stats) for p in profiles[1:])
+
+    # and its page query is a bounded seek past the cursor key, not an OFFSET
+    [page_stmt] = [stmt for stmt in statements[19] if getattr(stmt, "_limit_clause", None) is not None
+                   and "latest_view" in str(stmt)]
+    sql = " ".join(str(page_stmt.compile(dialect=postgresql.dialect())).split())
+    assert "OFFSET" not in sql
+    assert re.search(r"\.id > %\(\w+\)s ORDER BY \S+\.id LIMIT %\(\w+\)s$", sql), sql
@@ -0,0 +1,73 @@
+"""Query budgets of the feedstock service methods.
+
+Each service call should run a fixed number of statements regardless of how
+much data matches; a budget failure prints the profiled statements.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ca_biositing.webservice.config import config
+from ca_biositing.webservice.services.analysis_service import AnalysisService
+from ca_biositing.webservice.services.availability_service import AvailabilityService
+from ca_biositing.webservice.services.usda_census_service import UsdaCensusService
+from ca_biositing.webservice.services.usda_survey_service import UsdaSurveyService
+
+
+class TestAnalysisServiceBudget:
+    def test_get_by_resource(self, session, test_analysis_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            AnalysisService.get_by_resource(session, "almond_hulls", "06001", "ash")
+
+    def test_list_by_resource(self, session, test_analysis_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            AnalysisService.list_by_resource(session, "almond_hulls", "06001")
+
+    def test_list_resources(self, session, test_analysis_data, query_budget):
+        with query_budget(max_queries=1):
+            AnalysisService.list_resources(session)
+
+
+class TestAvailabilityServiceBudget:
+    def test_get_by_resource(self, session, test_availability_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            AvailabilityService.get_by_resource(session, "wheat_straw", "06067")
+
+    def test_list_resources(self, session, test_availability_data, query_budget):
+        with query_budget(max_queries=1):
+            AvailabilityService.list_resources(session)
+
+
+class TestUsdaServiceBudget:
+    def test_census_get_by_crop(self, session, test_census_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            UsdaCensusService.get_by_crop(session, "CORN", "06001", "acres")
+
+    def test_census_list_by_crop(self, session, test_census_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            UsdaCensusService.list_by_crop(session, "CORN", "06001")
+
+    def test_survey_list_by_crop(self, session, test_survey_data, query_budget):
+        with query_budget(max_queries=2, max_repeats=1):
+            UsdaSurveyService.list_by_crop(session, "CORN", "06001")
+
+
+def test_budget_failure_reports_the_statements(session, test_availability_data, query_budget):
+    with pytest.raises(AssertionError, match="2 queries over the budget of 1"):
+        with query_budget(max_queries=1):
+            AvailabilityService.get_by_resource(session, "wheat_straw", "06067")
+
+
+def test_profiled_requests_report_their_query_count(client: TestClient, test_availability_data):
+    url = "/v1/feedstocks/availability/resources/wheat_straw/geoid/06067"
+    assert "x-query-count" not in client.get(url).headers
+
+    with patch.object(config, "query_profile", True):
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.headers["x-query-count"] == "2"
@@ -11,9 +11,11 @@ from __future__ import annotations
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from ca_biositing.datamodels.models import Observation, UsdaCensusRecord, UsdaCommodity
+from ca_biositing.webservice.services.usda_census_service import UsdaCensusService
 
 
 class TestGetCensusByCrop:
@@ -360,6 +362,25 @@ class TestLatestRecordSelection:
         assert response.status_code == 200
         assert response.json()["value"] == 28000.0
 
+    def test_observations_fetched_in_one_query(self, session: Session, test_census_data):
+        """The latest record's observations come from a single view lookup."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            observations, _ = UsdaCensusService._get_observations_for_census_record(
+                session, commodity_id=1, geoid="06001", parameter_name="acres"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(observations) == 1
+        assert len(statements) == 1
+
 
 class TestCropNormalizationMatching:
     """Tests for exact, case- and space-insensitive crop matching."""